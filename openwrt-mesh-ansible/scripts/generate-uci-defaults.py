@@ -16,36 +16,34 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-# Node-specific configuration
-NODE_CONFIG = {
-    "node1": {
-        "hostname": "mesh-node1",
-        "lan_ip": "10.11.12.1",
-        "batman_ip": "10.11.12.1",
-        "mgmt_ip": "10.11.10.1",
-        "guest_ip": "10.11.30.1",
-        "dhcp_start": 100,
-        "gw_mode": "server",
-    },
-    "node2": {
-        "hostname": "mesh-node2",
-        "lan_ip": "10.11.12.2",
-        "batman_ip": "10.11.12.2",
-        "mgmt_ip": "10.11.10.2",
-        "guest_ip": "10.11.30.2",
-        "dhcp_start": 150,
-        "gw_mode": "client",
-    },
-    "node3": {
-        "hostname": "mesh-node3",
-        "lan_ip": "10.11.12.3",
-        "batman_ip": "10.11.12.3",
-        "mgmt_ip": "10.11.10.3",
-        "guest_ip": "10.11.30.3",
-        "dhcp_start": 200,
-        "gw_mode": "server",  # node3 also gateway
-    },
-}
+# Node definitions come from the Ansible inventory via the validate package
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from validate.inventory import load_inventory  # noqa: E402
+
+
+def get_node_config(node: str) -> dict:  # type: ignore[type-arg]
+    """
+    Build the substitution values for a node from the inventory.
+
+    Raises:
+        ValueError: If the node is not in the inventory.
+    """
+    info = load_inventory().get(node)
+    if info is None:
+        raise ValueError(f"Unknown node: {node}")
+
+    octet = info.ip.split(".")[-1]
+    iot_prefix = str(info.hostvars.get("iot_network", "10.11.30.0")).split(".")[:3]
+    pool = (info.hostvars.get("dhcp_pools") or {}).get(node) or {}
+    return {
+        "hostname": info.name,
+        "lan_ip": info.ip,
+        "batman_ip": info.ip,
+        "mgmt_ip": info.mgmt_ip,
+        "guest_ip": ".".join(iot_prefix + [octet]),
+        "dhcp_start": pool.get("start", 100),
+        "gw_mode": info.gw_mode,
+    }
 
 
 def parse_uci_export(uci_text: str) -> dict:  # type: ignore[type-arg] # noqa: C901
@@ -181,9 +179,7 @@ def apply_substitutions(
 
 def generate_script(snapshot_path: Path, node: str, source_hostname: str) -> str:
     """Generate complete UCI defaults script."""
-    node_config = NODE_CONFIG.get(node)
-    if not node_config:
-        raise ValueError(f"Unknown node: {node}")
+    node_config = get_node_config(node)
 
     uci_file = snapshot_path / "config" / "uci_export.txt"
     if not uci_file.exists():
@@ -258,7 +254,7 @@ def main() -> None:
     parser.add_argument(
         "--node",
         required=True,
-        choices=["node1", "node2", "node3"],
+        choices=list(load_inventory()),
         help="Target node name",
     )
     parser.add_argument(
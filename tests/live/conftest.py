@@ -6,52 +6,13 @@ Provides SSH connections, node execution helpers, and network configuration.
 
 import os
 import subprocess
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
 
 import pytest
 
-
-@dataclass
-class NodeInfo:
-    """Information about a mesh node."""
-
-    name: str
-    ip: str
-    node_num: int
-    gw_mode: str  # "server" or "client"
-    lan3_peer: str  # Node connected to LAN3
-    lan4_peer: str  # Node connected to LAN4
-
-
-# Node configuration matching the actual deployment
-NODES = {
-    "node1": NodeInfo(
-        name="mesh-node1",
-        ip="10.11.12.1",
-        node_num=1,
-        gw_mode="server",
-        lan3_peer="node2",
-        lan4_peer="node3",
-    ),
-    "node2": NodeInfo(
-        name="mesh-node2",
-        ip="10.11.12.2",
-        node_num=2,
-        gw_mode="server",  # All nodes are gateways in this deployment
-        lan3_peer="node1",
-        lan4_peer="node3",
-    ),
-    "node3": NodeInfo(
-        name="mesh-node3",
-        ip="10.11.12.3",
-        node_num=3,
-        gw_mode="server",
-        lan3_peer="node2",
-        lan4_peer="node1",
-    ),
-}
+from validate.config import NODES  # Mesh nodes, from the Ansible inventory
+from validate.inventory import NodeInfo
 
 # Network configuration
 NETWORK_CONFIG = {
@@ -166,7 +127,7 @@ def run_local(command: str, timeout: int = 30) -> Tuple[int, str, str]:
 
 
 @pytest.fixture(scope="session")
-def nodes() -> Dict[str, NodeInfo]:
+def nodes() -> MutableMapping[str, NodeInfo]:
     """Provide node information dictionary."""
     return NODES
 
@@ -180,7 +141,7 @@ def network_config() -> Dict[str, Any]:
 @pytest.fixture(scope="session")
 def node_ips() -> List[str]:
     """Provide list of node IP addresses."""
-    return [NODES["node1"].ip, NODES["node2"].ip, NODES["node3"].ip]
+    return [info.ip for info in NODES.values()]
 
 
 @pytest.fixture(scope="session")
@@ -295,4 +256,4 @@ def node3() -> NodeExecutor:
 @pytest.fixture
 def all_node_executors() -> List[NodeExecutor]:
     """Provide executors for all nodes."""
-    return [NodeExecutor("node1"), NodeExecutor("node2"), NodeExecutor("node3")]
+    return [NodeExecutor(node) for node in NODES]
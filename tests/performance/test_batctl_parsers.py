@@ -0,0 +1,129 @@
+"""
+Micro-benchmarks for the batctl table parsers.
+
+Large synthetic tables (the originator table grows with the square of the
+mesh size across a validation run) are parsed in both text and JSON form.
+No nodes are required; the time budgets are generous and only catch
+pathological regressions.
+"""
+
+import json
+import time
+from typing import Callable, Dict, List
+
+import pytest
+
+from validate.parsers.batctl import (
+    parse_gateways,
+    parse_neighbors,
+    parse_originators,
+)
+
+HEADER = (
+    "[B.A.T.M.A.N. adv 2023.1, MainIF/MAC: mesh0/02:ba:00:01:00:01 "
+    "(bat0/02:ba:00:01:00:00 BATMAN_IV)]"
+)
+
+TABLE_SIZES = [100, 1000, 5000]
+
+
+def _mac(num: int, iface: int = 1) -> str:
+    """Unique MAC for a node and interface."""
+    return f"02:ba:{num >> 8:02x}:{num & 0xFF:02x}:00:{iface:02x}"
+
+
+def _originator_rows(size: int) -> List[Dict[str, object]]:
+    """Two routes per originator, like a ring with wired and wireless links."""
+    rows: List[Dict[str, object]] = []
+    for num in range(2, size + 2):
+        for iface, tq, best in (("lan3.100", 250, True), ("mesh0", 200, False)):
+            row: Dict[str, object] = {
+                "orig_address": _mac(num),
+                "neigh_address": _mac(num % 7 + 2, 3),
+                "hard_ifname": iface,
+                "last_seen_msecs": num % 1000,
+                "tq": tq,
+            }
+            if best:
+                row["best"] = True
+            rows.append(row)
+    return rows
+
+
+def _originator_text(rows: List[Dict[str, object]]) -> str:
+    """Render originator rows as batctl o prints them."""
+    lines = [HEADER, "   Originator        last-seen (#/255) Nexthop           [outgoingIF]"]
+    for row in rows:
+        msecs = int(str(row["last_seen_msecs"]))
+        lines.append(
+            f"{' *' if row.get('best') else '  '} {row['orig_address']} "
+            f"{msecs // 1000:4d}.{msecs % 1000:03d}s   ({row['tq']:3d}) "
+            f"{row['neigh_address']} [{row['hard_ifname']:>10}]"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _timed(func: Callable[[str], object], output: str, rounds: int = 3) -> float:
+    """Best-of-N wall time for one parse, in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(output)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", TABLE_SIZES)
+def test_originators_text(size: int) -> None:
+    """Parse a text originator table with two routes per originator."""
+    output = _originator_text(_originator_rows(size))
+    assert len(parse_originators(output).originators) == size
+
+    elapsed = _timed(parse_originators, output)
+    print(f"\n  batctl o, {size} originators: {elapsed * 1000:.1f} ms")
+    assert elapsed < size * 50e-6 + 0.05
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", TABLE_SIZES)
+def test_originators_json(size: int) -> None:
+    """Parse a JSON originator table with two routes per originator."""
+    output = json.dumps(_originator_rows(size))
+    assert len(parse_originators(output).originators) == size
+
+    elapsed = _timed(parse_originators, output)
+    print(f"\n  batctl oj, {size} originators: {elapsed * 1000:.1f} ms")
+    assert elapsed < size * 50e-6 + 0.05
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", TABLE_SIZES)
+def test_neighbors_text(size: int) -> None:
+    """Parse a text neighbor table."""
+    lines = [HEADER, "IF             Neighbor              last-seen"]
+    lines += [f"{'mesh0':>15}\t  {_mac(num)}    0.{num % 1000:03d}s" for num in range(size)]
+    output = "\n".join(lines) + "\n"
+    assert len(parse_neighbors(output).entries) == size
+
+    elapsed = _timed(parse_neighbors, output)
+    print(f"\n  batctl n, {size} neighbors: {elapsed * 1000:.1f} ms")
+    assert elapsed < size * 50e-6 + 0.05
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", TABLE_SIZES)
+def test_gateways_text(size: int) -> None:
+    """Parse a text gateway list."""
+    lines = [HEADER, "  Router            ( TQ) Next Hop          [outgoingIf]  Bandwidth"]
+    lines += [
+        f"{'*' if num == 0 else ' '} {_mac(num)} (200) {_mac(num, 3)} [  lan3.100]: "
+        "100.0/20.0 MBit"
+        for num in range(size)
+    ]
+    output = "\n".join(lines) + "\n"
+    assert len(parse_gateways(output).entries) == size
+
+    elapsed = _timed(parse_gateways, output)
+    print(f"\n  batctl gwl, {size} gateways: {elapsed * 1000:.1f} ms")
+    assert elapsed < size * 50e-6 + 0.05
@@ -0,0 +1,223 @@
+"""
+Unit tests for check time budgets and tier SLOs.
+"""
+
+import asyncio
+import io
+import time
+from typing import Generator, List
+
+import pytest
+
+from validate.core import budget, health, snapshot
+from validate.core.executor import run_on_node
+from validate.core.fanout import fan_out
+from validate.core.results import (
+    CheckResult,
+    CheckStatus,
+    NodeResult,
+    PhaseResult,
+    Tier,
+    ValidationResult,
+)
+from validate.core.runner import DISRUPTIVE, ValidationRunner
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.reporters.console import ConsoleReporter
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test closed circuits."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+def _polling_check(seen: List[str], polls: int = 40) -> CheckResult:
+    """A sync check that keeps running commands until one is refused."""
+    for _ in range(polls):
+        rc, _, stderr = run_on_node("node1", "echo hi")
+        seen.append(stderr)
+        if rc == -1:
+            break
+        time.sleep(0.05)
+    return CheckResult("slow", CheckStatus.PASS)
+
+
+def _nap(seconds: float) -> CheckResult:
+    """A sync check that just takes its time."""
+    time.sleep(seconds)
+    return CheckResult("nap", CheckStatus.PASS)
+
+
+class TestCheckBudget:
+    """Tests for preempting checks that overrun their budget."""
+
+    def test_sync_check_times_out_and_is_starved(self) -> None:
+        seen: List[str] = []
+        with simulate(SimulatedMesh(size=3)):
+            runner = ValidationRunner(Tier.SMOKE, slo_s=0, check_budget_s=0.3)
+            runner.register_check(1, "slow", lambda: _polling_check(seen))
+            start = time.monotonic()
+            result = runner.run()
+            elapsed = time.monotonic() - start
+        check = result.all_checks[0]
+        assert check.status == CheckStatus.TIMEOUT
+        assert check.message == "Timed out after 0.3s"
+        assert elapsed < 1.5 and not result.passed
+        # The abandoned worker's next command was refused, so it wound down
+        assert seen[-1] == budget.BUDGET_EXHAUSTED
+
+    def test_async_check_is_cancelled(self) -> None:
+        cancelled = []
+
+        async def hang() -> CheckResult:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return CheckResult("hang", CheckStatus.PASS)
+
+        runner = ValidationRunner(Tier.SMOKE, slo_s=0, check_budget_s=0.2)
+        runner.register_check(1, "hang", hang)
+        result = runner.run()
+        assert result.all_checks[0].status == CheckStatus.TIMEOUT and cancelled
+
+    def test_own_timeout_is_an_error(self) -> None:
+        def fails() -> CheckResult:
+            raise TimeoutError("socket")
+
+        runner = ValidationRunner(Tier.SMOKE, slo_s=0)
+        runner.register_check(1, "fails", fails)
+        assert runner.run().all_checks[0].status == CheckStatus.ERROR
+
+    def test_registered_budget_overrides_default(self) -> None:
+        runner = ValidationRunner(Tier.SMOKE, slo_s=0, check_budget_s=0.1)
+        runner.register_check(1, "nap", lambda: _nap(0.3), budget_s=0)
+        assert runner.run().all_checks[0].status == CheckStatus.PASS
+
+    def test_disruptive_check_keeps_its_commands(self) -> None:
+        seen: List[str] = []
+        with simulate(SimulatedMesh(size=3)):
+            runner = ValidationRunner(Tier.SMOKE, slo_s=0, check_budget_s=0.2)
+            runner.register_check(
+                1, "fail", lambda: _polling_check(seen, 8), resources=[DISRUPTIVE]
+            )
+            result = runner.run()
+        assert result.all_checks[0].status == CheckStatus.TIMEOUT
+        assert len(seen) == 8 and budget.BUDGET_EXHAUSTED not in seen
+
+    def test_disruptive_overrun_holds_the_mesh(self) -> None:
+        events: List[str] = []
+
+        def disrupt() -> CheckResult:
+            events.append("link down")
+            time.sleep(0.4)
+            events.append("link restored")
+            return CheckResult("disrupt", CheckStatus.PASS)
+
+        def later() -> CheckResult:
+            events.append("later")
+            return CheckResult("later", CheckStatus.PASS)
+
+        runner = ValidationRunner(Tier.SMOKE, slo_s=0, check_budget_s=0.1)
+        runner.register_check(1, "disrupt", disrupt, resources=[DISRUPTIVE])
+        runner.register_check(1, "later", later)
+        checks = {c.category: c for c in runner.run().all_checks}
+        assert events == ["link down", "link restored", "later"]
+        assert checks["disrupt"].status == CheckStatus.TIMEOUT
+        assert checks["disrupt"].message.startswith("Overran its 0.1s budget")
+        assert checks["later"].status == CheckStatus.PASS
+
+
+class TestTierSlo:
+    """Tests for the run-wide SLO."""
+
+    def test_exhausted_slo_skips_remaining_checks(self) -> None:
+        runner = ValidationRunner(Tier.SMOKE, slo_s=0.2)
+        runner.register_check(2, "nap", lambda: _nap(0.3))
+        runner.register_check(3, "later", lambda: CheckResult("later", CheckStatus.PASS))
+        result = runner.run()
+        nap, later = result.all_checks
+        assert nap.status == later.status == CheckStatus.TIMEOUT
+        assert later.message == "Not run: smoke SLO of 0.2s used up"
+        assert result.slo_exceeded and not result.passed
+        pct = result.phases[0].budget_pct
+        assert pct is not None and pct >= 100
+
+    def test_passing_run_within_slo(self) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            result = ValidationRunner(Tier.SMOKE, slo_s=30).run()
+        data = result.to_dict()
+        assert (data["slo_s"], data["slo_exceeded"]) == (30, False)
+        assert result.passed
+
+    def test_slo_exceeded_fails_passing_checks(self) -> None:
+        result = ValidationResult(tier=Tier.SMOKE, slo_s=1.0, duration_ms=1500)
+        phase = PhaseResult(phase=1, name="Only", duration_ms=250, budget_s=1.0)
+        phase.checks.append(CheckResult("a", CheckStatus.PASS))
+        result.phases.append(phase)
+        assert result.slo_exceeded and not result.passed
+        assert phase.to_dict()["budget_pct"] == 25.0
+        assert PhaseResult(phase=1, name="Free").budget_pct is None
+
+    def test_footer_reports_slo(self) -> None:
+        result = ValidationResult(tier=Tier.SMOKE, slo_s=1.0, duration_ms=1500)
+        result.phases.append(PhaseResult(phase=1, name="Only", duration_ms=1500, budget_s=1.0))
+        output = io.StringIO()
+        ConsoleReporter(output=output, color=False).footer(result)
+        assert " SLO: 1.5s of 1s (phase 1 150%) - EXCEEDED" in output.getvalue()
+
+
+class TestStatus:
+    """Tests for the TIMEOUT status."""
+
+    def test_aggregate_order(self) -> None:
+        result = CheckResult("a", CheckStatus.PASS)
+        result.add_node_result("node1", CheckStatus.FAIL)
+        result.add_node_result("node2", CheckStatus.TIMEOUT)
+        result.aggregate_status()
+        assert result.status == CheckStatus.TIMEOUT and result.failed
+        result.add_node_result("node3", CheckStatus.ERROR)
+        result.aggregate_status()
+        assert result.status == CheckStatus.ERROR
+
+
+class TestCommandTimeout:
+    """Tests for capping command timeouts to the deadline."""
+
+    def test_without_deadline(self) -> None:
+        assert budget.remaining() is None
+        assert budget.command_timeout(30) == 30
+
+    def test_capped_and_refused(self) -> None:
+        with budget.deadline(2.5):
+            assert budget.command_timeout(30) == 3
+            assert budget.command_timeout(1) == 1
+        with budget.deadline(-1):
+            assert budget.command_timeout(30) is None
+        assert budget.remaining() is None
+
+    def test_deadline_follows_fan_out(self) -> None:
+        def check_node(node: str) -> NodeResult:
+            left = budget.remaining()
+            rc, _, stderr = run_on_node(node, "echo hi")
+            return NodeResult(node, CheckStatus.PASS, stderr, data={"left": left, "rc": rc})
+
+        result = CheckResult("fan", CheckStatus.PASS)
+        with simulate(SimulatedMesh(size=3)), budget.deadline(-1):
+            fan_out(result, check_node)
+        assert [n.data["rc"] for n in result.nodes.values()] == [-1, -1, -1]
+        assert {n.message for n in result.nodes.values()} == {budget.BUDGET_EXHAUSTED}
+        assert all(n.data["left"] < 0 for n in result.nodes.values())
+
+    def test_shared_snapshot_ignores_deadline(self) -> None:
+        snapshot.clear_snapshots()
+        with simulate(SimulatedMesh(size=3)):
+            with budget.deadline(-1):
+                first = snapshot.get_snapshot("node1")
+                assert budget.remaining() is not None  # Restored afterwards
+            assert snapshot.get_snapshot("node1") is first
+        snapshot.clear_snapshots()
+        assert all(rc == 0 for rc, _, _ in first.outputs.values())
@@ -0,0 +1,126 @@
+"""
+Unit tests for link-failover convergence measurement.
+
+Probe output is synthesized or produced by the simulated mesh; no network
+access is required.
+"""
+
+from typing import Generator, Iterable
+
+import pytest
+
+from validate.checks import failover
+from validate.core import health
+from validate.core.convergence import ProbePlan, analyze, build_probe_script, parse_probe_output
+from validate.core.results import CheckStatus
+from validate.core.simulator import SimulatedMesh, simulate
+
+PLAN = ProbePlan(iface="lan3.100", target_ip="10.11.12.2", pps=100, lead_s=1, hold_s=5, tail_s=4)
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+def _output(lost: Iterable[int], rejoined: bool = True, iputils: bool = False) -> str:
+    """Probe output for a 1000-packet run with the given sequence numbers lost."""
+    missing = set(lost)
+    lines = ["EVENT start 500.00", "EVENT down 501.00", "EVENT up 506.00"]
+    if rejoined:
+        lines.append("EVENT rejoined 507.25")
+    field = "icmp_seq" if iputils else "seq"
+    offset = 1 if iputils else 0
+    lines += [
+        f"64 bytes from 10.11.12.2: {field}={seq + offset} ttl=64 time=0.5 ms"
+        for seq in range(PLAN.count)
+        if seq not in missing
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class TestAnalyze:
+    """Tests for deriving convergence figures from sequence gaps."""
+
+    def test_reroute_and_failback(self) -> None:
+        measured = analyze(_output(list(range(100, 142)) + list(range(600, 605))), PLAN)
+        assert measured.sent == 1000
+        assert measured.lost == 47
+        assert measured.outage_ms == pytest.approx(420)
+        assert measured.reroute_ms == pytest.approx(420)
+        assert measured.failback_outage_ms == pytest.approx(50)
+        assert measured.failback_ms == pytest.approx(1250)
+
+    def test_no_loss(self) -> None:
+        measured = analyze(_output([]), PLAN)
+        assert measured.reroute_ms == 0
+        assert measured.gaps == []
+
+    def test_never_rerouted(self) -> None:
+        measured = analyze(_output(range(100, 600), rejoined=False), PLAN)
+        assert measured.reroute_ms is None
+        assert measured.outage_ms == pytest.approx(5000)
+        assert measured.failback_ms is None
+
+    def test_iputils_sequence_numbers(self) -> None:
+        measured = analyze(_output(range(100, 120), iputils=True), PLAN)
+        assert measured.reroute_ms == pytest.approx(200)
+
+    def test_unrelated_loss_ignored(self) -> None:
+        measured = analyze(_output([20, 21, 150, 900]), PLAN)
+        assert measured.outage_ms == 0
+        assert measured.reroute_ms == 0
+        assert measured.failback_outage_ms == 0
+        assert measured.lost == 4
+
+    def test_missing_events(self) -> None:
+        with pytest.raises(ValueError, match="down, up"):
+            analyze("EVENT start 1.00\n", PLAN)
+
+    def test_parse(self) -> None:
+        events, seqs = parse_probe_output(_output(range(2, 1000)))
+        assert events["down"] == 501.0
+        assert seqs == [0, 1]
+
+
+class TestProbeScript:
+    """Tests for the remote measurement script."""
+
+    def test_restores_link_on_exit(self) -> None:
+        script = build_probe_script(PLAN)
+        assert "trap 'ip link set $IF up; rm -f $OUT' EXIT" in script
+        assert "ping -i 0.01 -c 1000 -W 1 10.11.12.2" in script
+        assert PLAN.timeout_s > 40
+
+    def test_restores_link_on_hangup(self) -> None:
+        # A dropped SSH session sends SIGHUP; the signal trap must exit so
+        # that the EXIT trap brings the link back up
+        signals = [line for line in build_probe_script(PLAN).splitlines() if "'exit 1'" in line]
+        assert len(signals) == 1
+        assert {"HUP", "PIPE", "INT", "TERM"} <= set(signals[0].split()[3:])
+
+
+class TestCheckLinkConvergence:
+    """Tests for the failover.convergence check on a simulated mesh."""
+
+    def test_ring_converges(self) -> None:
+        with simulate(SimulatedMesh(size=5, wireless_hops=0, reroute_ms=400)):
+            result = failover.check_link_convergence()
+        assert result.status == CheckStatus.PASS
+        assert result.data["reroute_ms"] == pytest.approx(400)
+        assert result.data["packets_lost"] == 40
+        assert result.data["failback_ms"] == pytest.approx(1500)
+
+    def test_slow_reroute_fails(self) -> None:
+        with simulate(SimulatedMesh(size=5, wireless_hops=0, reroute_ms=2500)):
+            result = failover.check_link_convergence()
+        assert result.status == CheckStatus.FAIL
+        assert "exceeds" in next(iter(result.nodes.values())).message
+
+    def test_line_has_no_redundant_link(self) -> None:
+        with simulate(SimulatedMesh(size=4, topology="line", wireless_hops=0)):
+            result = failover.check_link_convergence()
+        assert result.status == CheckStatus.SKIP
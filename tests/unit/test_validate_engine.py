@@ -0,0 +1,95 @@
+"""
+Unit tests for the asyncio command engine.
+
+Processes are real local commands; no network access is required.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from validate.core import engine, executor
+
+
+class TestRunProcess:
+    """Tests for the bounded asyncio subprocess runner."""
+
+    def test_collects_output(self) -> None:
+        """Return code, stdout and stderr are all returned."""
+        rc, stdout, stderr = engine.run_sync(
+            engine.run_process("sh", "-c", "echo out; echo err >&2; exit 4", timeout=5)
+        )
+
+        assert (rc, stdout, stderr) == (4, "out\n", "err\n")
+
+    def test_shell(self) -> None:
+        """Shell strings are run through the shell."""
+        assert executor.run_local("echo a | tr a b") == (0, "b\n", "")
+
+    def test_timeout_kills_process(self) -> None:
+        """A command that outlives its timeout is killed and reported."""
+        start = time.time()
+        rc, _, stderr = executor.run_local("sleep 5", timeout=1)
+
+        assert rc == -1
+        assert "timed out" in stderr
+        assert time.time() - start < 3
+
+    def test_spawn_failure(self) -> None:
+        """A missing program is reported, not raised."""
+        rc, _, stderr = engine.run_sync(engine.run_process("/nonexistent/prog", timeout=5))
+
+        assert rc == -1
+        assert stderr
+
+    def test_inflight_bound(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No more than MAX_INFLIGHT_COMMANDS processes run at once."""
+        monkeypatch.setattr(engine, "MAX_INFLIGHT_COMMANDS", 2)
+
+        async def main() -> float:
+            start = time.time()
+            await asyncio.gather(*(engine.run_process("sleep", "0.2", timeout=5) for _ in range(4)))
+            return time.time() - start
+
+        # A fresh loop gets a fresh semaphore with the patched size
+        elapsed = asyncio.run(main())
+
+        assert elapsed >= 0.4
+
+    def test_many_concurrent_commands(self) -> None:
+        """Hundreds of commands can be in flight from one loop."""
+
+        async def main() -> list:
+            return await asyncio.gather(
+                *(executor.run_local_async(f"echo {i}", timeout=10) for i in range(200))
+            )
+
+        results = engine.run_sync(main())
+
+        assert [r[1] for r in results] == [f"{i}\n" for i in range(200)]
+
+
+class TestRunSync:
+    """Tests for the sync-to-async bridge."""
+
+    def test_reraises(self) -> None:
+        """Exceptions inside the coroutine propagate to the caller."""
+
+        async def boom() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            engine.run_sync(boom())
+
+    def test_refuses_engine_thread(self) -> None:
+        """Blocking on the engine loop from its own thread is an error."""
+
+        async def nested() -> str:
+            try:
+                executor.run_local("true")
+            except RuntimeError as e:
+                return str(e)
+            return "no error"
+
+        assert "engine loop" in engine.run_sync(nested())
@@ -0,0 +1,180 @@
+"""
+Unit tests for the validation framework executor.
+
+Subprocess calls are replaced with fakes so no network access is required.
+"""
+
+import asyncio
+import os
+import subprocess
+from pathlib import Path
+from typing import Any, Generator, List, Tuple
+
+import pytest
+
+from validate.core import executor
+
+
+class FakeProcess:
+    """Minimal asyncio.subprocess.Process stand-in."""
+
+    def __init__(self, completed: subprocess.CompletedProcess) -> None:
+        self.returncode = completed.returncode
+        self._stdout = completed.stdout or ""
+        self._stderr = completed.stderr or ""
+
+    async def communicate(self) -> Tuple[bytes, bytes]:
+        out, err = self._stdout, self._stderr
+        return (
+            out.encode() if isinstance(out, str) else out,
+            err.encode() if isinstance(err, str) else err,
+        )
+
+
+class FakeRun:
+    """Records subprocess calls (sync and asyncio) and fakes ssh behaviour."""
+
+    def __init__(self, master_rc: int = 0, stdout: str = "ok\n") -> None:
+        self.calls: List[List[str]] = []
+        self.master_rc = master_rc
+        self.stdout = stdout
+
+    def __call__(self, cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        self.calls.append(cmd)
+        if "-M" in cmd and self.master_rc == 0:
+            # Simulate the master creating its control socket
+            control_path = next(a.split("=", 1)[1] for a in cmd if a.startswith("ControlPath="))
+            Path(control_path).touch()
+        if "-M" in cmd:
+            return subprocess.CompletedProcess(cmd, self.master_rc, None, "connect failed")
+        if "-O" in cmd:
+            return subprocess.CompletedProcess(cmd, 0, b"", b"")
+        return subprocess.CompletedProcess(cmd, 0, self.stdout, "")
+
+    async def create_subprocess_exec(self, *cmd: str, **kwargs: Any) -> FakeProcess:
+        return FakeProcess(self(list(cmd)))
+
+    @property
+    def master_calls(self) -> List[List[str]]:
+        return [c for c in self.calls if "-M" in c]
+
+
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch) -> Generator[FakeRun, None, None]:
+    """Replace process spawning in the executor and reset session state."""
+    fake = FakeRun()
+    monkeypatch.setattr(executor.subprocess, "run", fake)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake.create_subprocess_exec)
+    monkeypatch.setattr(executor, "SSH_MULTIPLEX", True)
+    yield fake
+    executor.close_sessions()
+
+
+class TestMultiplexing:
+    """Tests for persistent multiplexed SSH sessions."""
+
+    def test_ssh_args_use_control_path(self, fake_run: FakeRun) -> None:
+        """Command connections point at the node's control socket."""
+        args = executor.ssh_args("10.11.12.1")
+        assert "ControlMaster=no" in args
+        control = [a for a in args if a.startswith("ControlPath=")]
+        assert control and control[0].endswith("10.11.12.1")
+        assert args[-1] == "root@10.11.12.1"
+
+    def test_master_opened_once(self, fake_run: FakeRun) -> None:
+        """Repeated commands reuse a single master connection."""
+        for _ in range(3):
+            rc, stdout, _ = executor.ssh_command("10.11.12.1", "echo ok")
+            assert rc == 0
+            assert stdout == "ok\n"
+
+        assert len(fake_run.master_calls) == 1
+        assert len(fake_run.calls) == 4
+
+    def test_master_failure_returns_error(self, fake_run: FakeRun) -> None:
+        """A node that refuses the master connection is not retried per command."""
+        fake_run.master_rc = 255
+        rc, stdout, stderr = executor.ssh_command("10.11.12.2", "echo ok")
+
+        assert rc == 255
+        assert stdout == ""
+        assert "connect failed" in stderr
+        assert len(fake_run.calls) == 1
+
+    def test_close_sessions(self, fake_run: FakeRun) -> None:
+        """Closing sessions stops masters and removes the socket directory."""
+        executor.ssh_command("10.11.12.1", "echo ok")
+        control_dir = executor._control_dir
+        assert control_dir is not None and os.path.isdir(control_dir)
+
+        executor.close_sessions()
+
+        assert any("-O" in c and "exit" in c for c in fake_run.calls)
+        assert not os.path.exists(control_dir)
+        assert executor._control_dir is None
+
+    def test_multiplex_disabled(self, fake_run: FakeRun, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With multiplexing off every command is a plain ssh call."""
+        monkeypatch.setattr(executor, "SSH_MULTIPLEX", False)
+        executor.ssh_command("10.11.12.3", "echo ok")
+
+        assert fake_run.master_calls == []
+        assert not any(a.startswith("ControlPath=") for a in fake_run.calls[0])
+
+
+def _run_locally(node: str, command: str, timeout: int = 30) -> Tuple[int, str, str]:
+    """Run a batch script with the local shell instead of over SSH."""
+    result = subprocess.run(["sh", "-c", command], capture_output=True, text=True)
+    return result.returncode, result.stdout, result.stderr
+
+
+class TestRunBatch:
+    """Tests for batched multi-command execution."""
+
+    def test_per_command_results(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each command gets its own return code, stdout and stderr."""
+        monkeypatch.setattr(executor, "run_on_node", _run_locally)
+        results = executor.NodeExecutor("node1").run_batch(
+            [
+                "echo one",
+                "printf 'no-newline'",
+                "echo oops >&2; exit 3",
+                "exit 0 # trailing comment",
+            ]
+        )
+
+        assert results == [
+            (0, "one\n", ""),
+            (0, "no-newline", ""),
+            (3, "", "oops\n"),
+            (0, "", ""),
+        ]
+
+    def test_single_round_trip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A batch is sent as one remote invocation."""
+        calls: List[str] = []
+
+        def fake(node: str, command: str, timeout: int = 30) -> Tuple[int, str, str]:
+            calls.append(command)
+            return _run_locally(node, command, timeout)
+
+        monkeypatch.setattr(executor, "run_on_node", fake)
+        executor.run_batch_on_node("node1", ["true", "false", "echo x"])
+
+        assert len(calls) == 1
+
+    def test_truncated_output(self) -> None:
+        """Commands without a complete frame are reported as errors."""
+        token = "__VALIDATE_test"
+        script = executor._batch_script(["echo a", "echo b"], token)
+        _, stdout, _ = _run_locally("node1", script)
+        truncated = stdout[: stdout.index(f"{token}:1:ERR")]
+
+        results = executor._parse_batch_output(truncated, "Connection closed", token, 2)
+
+        assert results[0] == (0, "a\n", "")
+        assert results[1] == (-1, "", "Connection closed")
+
+    def test_empty_batch(self) -> None:
+        """An empty batch makes no remote call."""
+        assert executor.run_batch_on_node("node1", []) == []
@@ -0,0 +1,130 @@
+"""
+Unit tests for fleet mode (many sites validated concurrently).
+"""
+
+import asyncio
+import io
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from validate.__main__ import main, read_sites
+from validate.core import engine
+from validate.core.fleet import (
+    FleetResult,
+    FleetRunner,
+    SiteOptions,
+    SiteResult,
+    parse_site,
+)
+from validate.core.results import CheckResult, CheckStatus, PhaseResult, Tier, ValidationResult
+from validate.reporters.console import ConsoleReporter
+
+
+def _failed_site(site: str, *categories: str) -> SiteResult:
+    """Roll up a run of a site where the given checks failed."""
+    phase = PhaseResult(phase=1, name="Prerequisites")
+    phase.checks.append(CheckResult("connectivity.ssh", CheckStatus.PASS))
+    phase.checks.extend(CheckResult(c, CheckStatus.FAIL, "down") for c in categories)
+    return SiteResult.from_validation(site, ValidationResult(Tier.SMOKE, [phase]), details=False)
+
+
+class TestFleetRunner:
+    """Tests for running sites in worker processes."""
+
+    def test_simulated_sites(self) -> None:
+        finished: List[str] = []
+        sites = [parse_site(name, simulated=True) for name in ("alpha", "beta", "gamma")]
+        options = SiteOptions(simulate=3, details=True)
+        runner = FleetRunner(sites, Tier.SMOKE, workers=2, options=options)
+        result = runner.run(on_site_complete=lambda site: finished.append(site.site))
+        assert result.passed and result.workers == 2
+        assert [site.site for site in result.sites] == ["alpha", "beta", "gamma"]
+        assert sorted(finished) == ["alpha", "beta", "gamma"]
+        alpha = result.sites[0]
+        assert alpha.total_checks == alpha.passed_checks == 3
+        assert alpha.peak_rss_kb > 0 and alpha.result is not None
+        assert alpha.to_dict()["result"]["result"] == "PASS"
+
+    def test_unloadable_inventory_is_site_error(self, tmp_path: Path) -> None:
+        missing = parse_site(str(tmp_path / "delta" / "inventory" / "hosts.yml"))
+        result = FleetRunner([missing], Tier.SMOKE).run()
+        site = result.sites[0]
+        assert site.site == "delta" and site.status == CheckStatus.ERROR
+        assert "Inventory not found" in site.message
+        assert not result.passed and result.to_dict()["summary"]["error"] == 1
+
+    def test_rejects_duplicate_and_empty_fleets(self) -> None:
+        with pytest.raises(ValueError, match="Duplicate"):
+            FleetRunner([parse_site("a=x.yml"), parse_site("a=y.yml")])
+        with pytest.raises(ValueError):
+            FleetRunner([])
+
+
+class TestRollup:
+    """Tests for site and fleet rollups."""
+
+    def test_failing_checks_across_sites(self) -> None:
+        fleet = FleetResult(
+            Tier.SMOKE,
+            [
+                _failed_site("a", "batman.module"),
+                _failed_site("b", "batman.module", "connectivity.ping"),
+                _failed_site("c"),
+            ],
+        )
+        assert fleet.failing_checks() == {
+            "batman.module": ["a", "b"],
+            "connectivity.ping": ["b"],
+        }
+        assert fleet.count(CheckStatus.FAIL) == 2 and not fleet.passed
+        b = fleet.sites[1]
+        assert (b.message, b.total_checks, b.passed_checks) == ("2 check(s) failed", 3, 1)
+
+    def test_console_footer(self) -> None:
+        fleet = FleetResult(Tier.SMOKE, [_failed_site(f"s{n}", "batman.module") for n in range(7)])
+        fleet.sites.append(SiteResult("broken", CheckStatus.ERROR, "Worker failed: killed"))
+        output = io.StringIO()
+        ConsoleReporter(output=output, color=False).fleet_footer(fleet)
+        text = output.getvalue()
+        assert " RESULT: FAIL (0/8 sites passed)" in text
+        assert "batman.module: 7 site(s) (s0, s1, s2, s3, s4 and 2 more)" in text
+        assert "broken: Worker failed: killed" in text
+
+
+class TestSites:
+    """Tests for naming and listing sites."""
+
+    def test_parse_site(self) -> None:
+        assert parse_site("lab=/etc/mesh/hosts.yml").name == "lab"
+        assert parse_site("sites/alpha/inventory/hosts.yml").name == "alpha"
+        assert parse_site("beta/openwrt-mesh-ansible/inventory/hosts.yml").name == "beta"
+        assert parse_site("gamma.yml").name == "gamma"
+        assert parse_site("delta", simulated=True).inventory is None
+        for bad in ("", "name=", "=hosts.yml"):
+            with pytest.raises(ValueError):
+                parse_site(bad)
+
+    def test_sites_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "sites.txt"
+        path.write_text("# all sites\nalpha=a.yml\n\nbeta=b.yml  # new\n")
+        assert read_sites(["gamma=c.yml"], str(path)) == [
+            "gamma=c.yml",
+            "alpha=a.yml",
+            "beta=b.yml",
+        ]
+        assert main(["fleet", "--sites-file", str(tmp_path / "missing.txt")]) == 2
+
+    def test_limit_commands(self) -> None:
+        async def slots_left() -> bool:
+            slots = engine.command_slots()
+            for _ in range(3):
+                await slots.acquire()
+            return slots.locked()
+
+        engine.limit_commands(3)
+        try:
+            assert asyncio.run(slots_left())
+        finally:
+            engine.limit_commands(None)
@@ -4,6 +4,12 @@ Unit tests for the validation framework.
 Tests the core framework components without requiring network access.
 """
 
+import asyncio
+import threading
+import time
+from typing import Callable
+
+from validate.core.fanout import fan_out, fan_out_async
 from validate.core.results import (
     CheckResult,
     CheckStatus,
@@ -413,3 +419,245 @@ class TestCreateRunner:
         assert 4 in runner._phases
         # Comprehensive has most checks
         assert runner.get_check_count() > 10
+
+
+class TestFanOut:
+    """Tests for concurrent per-node fan-out."""
+
+    def test_results_in_node_order(self) -> None:
+        """Node results are merged in node order, not completion order."""
+        delays = {"node1": 0.05, "node2": 0.0, "node3": 0.02}
+
+        def check_node(node: str) -> NodeResult:
+            time.sleep(delays[node])
+            return NodeResult(node=node, status=CheckStatus.PASS)
+
+        result = CheckResult(category="test", status=CheckStatus.PASS)
+        fan_out(result, check_node, nodes=["node1", "node2", "node3"])
+
+        assert list(result.nodes) == ["node1", "node2", "node3"]
+
+    def test_runs_concurrently_with_bound(self) -> None:
+        """Node bodies overlap, but never more than max_workers at once."""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def check_node(node: str) -> NodeResult:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return NodeResult(node=node, status=CheckStatus.PASS)
+
+        result = CheckResult(category="test", status=CheckStatus.PASS)
+        fan_out(result, check_node, nodes=[f"node{i}" for i in range(8)], max_workers=3)
+
+        assert len(result.nodes) == 8
+        assert 1 < peak[0] <= 3
+
+    def test_exception_becomes_node_error(self) -> None:
+        """An exception for one node only affects that node."""
+
+        def check_node(node: str) -> NodeResult:
+            if node == "node2":
+                raise RuntimeError("boom")
+            return NodeResult(node=node, status=CheckStatus.PASS)
+
+        result = CheckResult(category="test", status=CheckStatus.PASS)
+        fan_out(result, check_node, nodes=["node1", "node2", "node3"])
+        result.aggregate_status()
+
+        assert result.nodes["node1"].status == CheckStatus.PASS
+        assert result.nodes["node2"].status == CheckStatus.ERROR
+        assert "boom" in result.nodes["node2"].message
+        assert result.status == CheckStatus.ERROR
+
+
+def _timed_check(
+    category: str,
+    log: list,
+    status: CheckStatus = CheckStatus.PASS,
+    delay: float = 0.05,
+) -> Callable[[], CheckResult]:
+    """Build a check that records its start/end times in log."""
+
+    def check() -> CheckResult:
+        start = time.time()
+        time.sleep(delay)
+        log.append((category, start, time.time()))
+        return CheckResult(category=category, status=status)
+
+    return check
+
+
+def _overlaps(log: list, a: str, b: str) -> bool:
+    """Return True if checks a and b ran at the same time."""
+    spans = {category: (start, end) for category, start, end in log}
+    return spans[a][0] < spans[b][1] and spans[b][0] < spans[a][1]
+
+
+class TestPhaseScheduling:
+    """Tests for parallel check execution within a phase."""
+
+    def test_independent_checks_overlap(self) -> None:
+        """Checks without constraints run concurrently."""
+        log: list = []
+        runner = ValidationRunner(tier=Tier.SMOKE, max_parallel=4)
+        runner.register_check(1, "a", _timed_check("a", log))
+        runner.register_check(1, "b", _timed_check("b", log))
+
+        result = runner.run()
+
+        assert result.passed is True
+        assert _overlaps(log, "a", "b")
+
+    def test_max_parallel_one_is_sequential(self) -> None:
+        """With one worker checks run in registration order."""
+        log: list = []
+        runner = ValidationRunner(tier=Tier.SMOKE, max_parallel=1)
+        for name in ("a", "b", "c"):
+            runner.register_check(1, name, _timed_check(name, log, delay=0.01))
+
+        result = runner.run()
+
+        assert [c.category for c in result.phases[0].checks] == ["a", "b", "c"]
+        assert not _overlaps(log, "a", "b")
+
+    def test_dependency_runs_after(self) -> None:
+        """A dependent check starts only after its dependency finished."""
+        log: list = []
+        runner = ValidationRunner(tier=Tier.SMOKE)
+        runner.register_check(1, "base", _timed_check("base", log))
+        runner.register_check(1, "child", _timed_check("child", log), depends_on=["base"])
+
+        runner.run()
+
+        spans = {category: (start, end) for category, start, end in log}
+        assert spans["child"][0] >= spans["base"][1]
+
+    def test_failed_dependency_skips_transitively(self) -> None:
+        """Dependents of a failed check, and their dependents, are skipped."""
+        log: list = []
+        runner = ValidationRunner(tier=Tier.SMOKE)
+        runner.register_phase(1, "Prerequisites")
+        runner.register_check(1, "pre", _timed_check("pre", log, delay=0))
+        runner.register_check(2, "base", _timed_check("base", log, CheckStatus.FAIL, 0))
+        runner.register_check(2, "child", _timed_check("child", log), depends_on=["base"])
+        runner.register_check(2, "grandchild", _timed_check("gc", log), depends_on=["child"])
+        runner.register_check(3, "later", _timed_check("later", log), depends_on=["child"])
+
+        result = runner.run()
+        checks = {c.category: c for c in result.all_checks}
+
+        assert checks["child"].status == CheckStatus.SKIP
+        assert "base" in checks["child"].message
+        assert checks["grandchild"].status == CheckStatus.SKIP
+        assert "child" in checks["grandchild"].message
+        assert checks["later"].status == CheckStatus.SKIP
+        assert [entry[0] for entry in log] == ["pre", "base"]
+
+    def test_unregistered_dependency_ignored(self) -> None:
+        """Dependencies filtered out by tier do not block a check."""
+        runner = ValidationRunner(tier=Tier.SMOKE)
+        runner.register_check(1, "above", _timed_check("above", []), Tier.COMPREHENSIVE)
+        runner.register_check(1, "child", _timed_check("child", []), depends_on=["above"])
+
+        result = runner.run()
+
+        assert result.all_checks[0].status == CheckStatus.PASS
+
+    def test_shared_resource_serializes(self) -> None:
+        """Checks sharing a resource never overlap."""
+        log: list = []
+        runner = ValidationRunner(tier=Tier.SMOKE, max_parallel=4)
+        runner.register_check(1, "a", _timed_check("a", log), resources=["probe"])
+        runner.register_check(1, "b", _timed_check("b", log), resources=["probe"])
+        runner.register_check(1, "c", _timed_check("c", log))
+
+        runner.run()
+
+        assert not _overlaps(log, "a", "b")
+        assert _overlaps(log, "a", "c")
+
+    def test_disruptive_runs_alone(self) -> None:
+        """A disruptive check waits for, and blocks, every other check."""
+        log: list = []
+        runner = ValidationRunner(tier=Tier.SMOKE, max_parallel=4)
+        runner.register_check(1, "a", _timed_check("a", log))
+        runner.register_check(1, "d", _timed_check("d", log), resources=["disruptive"])
+        runner.register_check(1, "b", _timed_check("b", log))
+
+        runner.run()
+
+        assert not _overlaps(log, "d", "a")
+        assert not _overlaps(log, "d", "b")
+
+    def test_results_in_completion_order(self) -> None:
+        """Results are reported as checks finish, not in registration order."""
+        reported: list = []
+        runner = ValidationRunner(tier=Tier.SMOKE, max_parallel=2)
+        runner.register_check(1, "slow", _timed_check("slow", [], delay=0.1))
+        runner.register_check(1, "fast", _timed_check("fast", [], delay=0))
+
+        result = runner.run(on_check_complete=lambda c: reported.append(c.category))
+
+        assert reported == ["fast", "slow"]
+        assert [c.category for c in result.phases[0].checks] == ["fast", "slow"]
+
+
+class TestAsyncChecks:
+    """Tests for async check functions and per-node fan-out."""
+
+    def test_mixed_sync_and_async_checks(self) -> None:
+        """Sync and async checks run together and can overlap."""
+        log: list = []
+
+        async def async_check() -> CheckResult:
+            start = time.time()
+            await asyncio.sleep(0.05)
+            log.append(("async", start, time.time()))
+            return CheckResult(category="async", status=CheckStatus.PASS)
+
+        runner = ValidationRunner(tier=Tier.SMOKE, max_parallel=4)
+        runner.register_check(1, "sync", _timed_check("sync", log))
+        runner.register_check(1, "async", async_check)
+
+        result = runner.run()
+
+        assert result.passed is True
+        assert {c.category for c in result.all_checks} == {"sync", "async"}
+        assert _overlaps(log, "sync", "async")
+
+    def test_async_check_exception(self) -> None:
+        """An exception in an async check becomes an ERROR result."""
+
+        async def broken() -> CheckResult:
+            raise RuntimeError("boom")
+
+        runner = ValidationRunner(tier=Tier.SMOKE)
+        runner.register_check(1, "broken", broken)
+
+        check = runner.run().all_checks[0]
+
+        assert check.status == CheckStatus.ERROR
+        assert "boom" in check.message
+
+    def test_fan_out_async(self) -> None:
+        """Async node bodies run concurrently and merge in node order."""
+
+        async def check_node(node: str) -> NodeResult:
+            await asyncio.sleep(0.05 if node == "node1" else 0)
+            if node == "node3":
+                raise RuntimeError("boom")
+            return NodeResult(node=node, status=CheckStatus.PASS)
+
+        result = CheckResult(category="test", status=CheckStatus.PASS)
+        start = time.time()
+        asyncio.run(fan_out_async(result, check_node, nodes=["node1", "node2", "node3"]))
+
+        assert list(result.nodes) == ["node1", "node2", "node3"]
+        assert result.nodes["node3"].status == CheckStatus.ERROR
+        assert time.time() - start < 0.1
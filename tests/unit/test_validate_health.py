@@ -0,0 +1,192 @@
+"""
+Unit tests for per-node circuit breakers.
+
+No network access is required; ssh results are faked.
+"""
+
+import time
+from typing import Generator, List, Tuple
+
+import pytest
+
+from validate.core import executor, health
+from validate.core.fanout import fan_out
+from validate.core.health import CircuitBreaker, CircuitState
+from validate.core.results import CheckResult, CheckStatus, NodeResult, Tier
+from validate.core.runner import ValidationRunner
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+class TestCircuitBreaker:
+    """Tests for the breaker state machine."""
+
+    def test_opens_after_threshold(self) -> None:
+        """Consecutive failures open the circuit."""
+        breaker = CircuitBreaker(threshold=2, reset_s=60)
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.is_open()
+        assert not breaker.allow()
+
+    def test_success_resets_count(self) -> None:
+        """A success in between clears the failure count."""
+        breaker = CircuitBreaker(threshold=2, reset_s=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_trial_success_closes(self) -> None:
+        """After the reset time one trial call is allowed; success closes."""
+        breaker = CircuitBreaker(threshold=1, reset_s=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert not breaker.is_open()
+        assert breaker.allow()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow()  # Only one trial at a time
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.open_s > 0
+
+    def test_half_open_trial_failure_reopens(self) -> None:
+        """A failed trial re-opens the circuit for another reset period."""
+        breaker = CircuitBreaker(threshold=1, reset_s=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.is_open()
+
+    def test_trip(self) -> None:
+        """Tripping opens a closed circuit without waiting for failures."""
+        breaker = CircuitBreaker(threshold=5, reset_s=60)
+        breaker.trip()
+
+        assert breaker.is_open()
+
+
+class TestExecutorCircuit:
+    """Tests for circuit handling in ssh_command."""
+
+    def test_fast_fail_when_open(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Once the circuit opens, commands fail without running ssh."""
+        calls: List[str] = []
+
+        async def unreachable(*args: str, **kwargs: object) -> Tuple[int, str, str]:
+            calls.append(args[-1])
+            return 255, "", "No route to host"
+
+        monkeypatch.setattr(executor, "SSH_MULTIPLEX", False)
+        monkeypatch.setattr(executor, "run_process", unreachable)
+        monkeypatch.setattr(health, "CIRCUIT_FAILURE_THRESHOLD", 2)
+        monkeypatch.setattr(health, "CIRCUIT_RESET_S", 60.0)
+
+        for _ in range(4):
+            rc, _, stderr = executor.ssh_command("10.11.12.2", "echo ok")
+            assert rc == 255
+
+        assert len(calls) == 2
+        assert "circuit open" in stderr
+
+    def test_command_errors_do_not_count(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A command that runs but fails says nothing about reachability."""
+
+        async def failing(*args: str, **kwargs: object) -> Tuple[int, str, str]:
+            return 1, "", "not found"
+
+        monkeypatch.setattr(executor, "SSH_MULTIPLEX", False)
+        monkeypatch.setattr(executor, "run_process", failing)
+
+        for _ in range(5):
+            executor.ssh_command("10.11.12.3", "false")
+
+        assert health.circuit("10.11.12.3").state == CircuitState.CLOSED
+
+    def test_command_timeouts_do_not_count(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A long command overrunning its timeout leaves a reachable node's circuit closed."""
+
+        async def overrun(*args: str, **kwargs: object) -> Tuple[int, str, str]:
+            return -1, "", "Command timed out after 5s"
+
+        monkeypatch.setattr(executor, "SSH_MULTIPLEX", False)
+        monkeypatch.setattr(executor, "run_process", overrun)
+        monkeypatch.setattr(health, "CIRCUIT_FAILURE_THRESHOLD", 2)
+
+        for _ in range(4):
+            rc, _, _ = executor.ssh_command("10.11.12.3", "iperf3 -c 10.11.12.1", timeout=5)
+            assert rc == -1
+
+        assert health.circuit("10.11.12.3").state == CircuitState.CLOSED
+        assert not health.is_connection_failure(-1, "Command timed out after 5s")
+        assert health.is_connection_failure(255, "ssh: connect to host: Connection timed out")
+
+
+class TestFanOutCircuit:
+    """Tests for unreachable nodes in fan_out."""
+
+    def test_open_node_is_error(self) -> None:
+        """Nodes with an open circuit get ERROR with the open time recorded."""
+        health.node_circuit("node2").trip()  # type: ignore[union-attr]
+        checked: List[str] = []
+
+        def check_node(node: str) -> NodeResult:
+            checked.append(node)
+            return NodeResult(node=node, status=CheckStatus.PASS)
+
+        result = CheckResult(category="test", status=CheckStatus.PASS)
+        fan_out(result, check_node, nodes=["node1", "node2", "node3"])
+
+        assert sorted(checked) == ["node1", "node3"]
+        assert list(result.nodes) == ["node1", "node2", "node3"]
+        assert result.nodes["node2"].status == CheckStatus.ERROR
+        assert "circuit_open_s" in result.nodes["node2"].data
+        result.aggregate_status()
+        assert result.status == CheckStatus.ERROR  # Not PASS with node2 down
+        assert health.circuit_summary().keys() == {"node2"}
+
+
+class TestRunnerCircuit:
+    """Tests for feeding check verdicts into circuits."""
+
+    def test_unreachable_verdict_trips_circuit(self) -> None:
+        """Nodes a check flags unreachable fail later checks without being run."""
+
+        def prerequisite() -> CheckResult:
+            result = CheckResult(category="pre", status=CheckStatus.FAIL)
+            result.add_node_result("node3", CheckStatus.FAIL, data={"unreachable": True})
+            return result
+
+        def later() -> CheckResult:
+            result = CheckResult(category="later", status=CheckStatus.PASS)
+            fan_out(result, lambda n: NodeResult(node=n, status=CheckStatus.PASS))
+            result.aggregate_status()
+            return result
+
+        runner = ValidationRunner(tier=Tier.SMOKE)
+        runner.register_check(1, "pre", prerequisite)
+        runner.register_check(2, "later", later)
+
+        result = runner.run(abort_on_phase1_fail=False)
+        later_result = result.phases[1].checks[0]
+
+        assert later_result.nodes["node3"].status == CheckStatus.ERROR
+        assert later_result.status == CheckStatus.ERROR
+        assert later_result.nodes["node1"].status == CheckStatus.PASS
+        assert "node3" in result.circuit_open_s
+        assert "circuit_open_s" in result.to_dict()
@@ -0,0 +1,194 @@
+"""
+Unit tests for the validation history store and regression detection.
+"""
+
+import io
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from validate.__main__ import main
+from validate.core import health
+from validate.core.history import METRIC_BY_NAME, HistoryStore, find_regressions, judge
+from validate.core.results import (
+    CheckResult,
+    CheckStatus,
+    NodeResult,
+    PhaseResult,
+    Tier,
+    ValidationResult,
+)
+from validate.core.runner import create_runner
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.reporters.history import HistoryReporter, sparkline
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+@pytest.fixture
+def store() -> Generator[HistoryStore, None, None]:
+    """An in-memory history store."""
+    history = HistoryStore(":memory:")
+    yield history
+    history.close()
+
+
+def _run(hour: int, latency_ms: float, neighbors: int = 3) -> ValidationResult:
+    """A one-check run with the given node metrics."""
+    nodes = {
+        "node1": NodeResult(
+            "node1",
+            CheckStatus.PASS,
+            data={"latency_ms": latency_ms, "neighbor_count": neighbors, "reachable": True},
+        ),
+        "node2": NodeResult("node2", CheckStatus.PASS, data={"latency_ms": 2.0}),
+    }
+    check = CheckResult("connectivity.ping", CheckStatus.PASS, duration_ms=500, nodes=nodes)
+    phase = PhaseResult(1, "Connectivity", checks=[check])
+    return ValidationResult(
+        Tier.SMOKE, phases=[phase], timestamp=START + timedelta(hours=hour), duration_ms=600
+    )
+
+
+def _fill(store: HistoryStore, runs: int) -> None:
+    """Record stable runs with a little latency noise."""
+    for hour in range(runs):
+        store.record(_run(hour, 5.0 + (hour % 3) * 0.2))
+
+
+class TestStore:
+    """Tests for recording and querying runs."""
+
+    def test_record_and_series(self, store: HistoryStore) -> None:
+        _fill(store, 5)
+        runs = store.runs()
+        assert [r["result"] for r in runs] == ["PASS"] * 5
+        assert runs[0]["ts"] > runs[-1]["ts"]
+        series = store.series("latency_ms", "connectivity.ping", "node1")
+        assert [v for _, v in series] == [5.0, 5.2, 5.4, 5.0, 5.2]
+        assert [v for _, v in store.series("duration_ms", "connectivity.ping")] == [500.0] * 5
+        # Non-numeric data (reachable) is not a metric; node2 has no neighbor_count
+        assert store.series("neighbor_count", "connectivity.ping", "node2") == []
+
+    def test_series_window_and_limit(self, store: HistoryStore) -> None:
+        _fill(store, 10)
+        since = (START + timedelta(hours=4)).timestamp()
+        until = (START + timedelta(hours=8)).timestamp()
+        values = store.series("latency_ms", "connectivity.ping", "node1", since=since, until=until)
+        assert len(values) == 4
+        assert len(store.series("latency_ms", "connectivity.ping", "node1", limit=3)) == 3
+        with pytest.raises(ValueError):
+            store.series("bogus", "connectivity.ping", "node1")
+
+    def test_trend_buckets(self, store: HistoryStore) -> None:
+        _fill(store, 48)
+        buckets = store.trend("latency_ms", "connectivity.ping", "node1", bucket_s=86400)
+        assert [b["count"] for b in buckets] == [24, 24]
+        assert buckets[0]["min"] == 5.0 and buckets[0]["max"] == 5.4
+
+    def test_persists_to_file(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "sub" / "history.db")
+        history = HistoryStore(path)
+        history.record(_run(0, 5.0))
+        history.close()
+        history = HistoryStore(path)
+        assert len(history.runs()) == 1
+        history.close()
+
+
+class TestRegressions:
+    """Tests for comparing the latest run with its baseline."""
+
+    def test_stable_runs_have_no_regressions(self, store: HistoryStore) -> None:
+        _fill(store, 30)
+        assert find_regressions(store) == []
+
+    def test_latency_regression(self, store: HistoryStore) -> None:
+        _fill(store, 30)
+        store.record(_run(30, 25.0))
+        regressions = find_regressions(store)
+        assert len(regressions) == 1
+        r = regressions[0]
+        assert (r.category, r.node, r.metric) == ("connectivity.ping", "node1", "latency_ms")
+        assert r.baseline == 5.2 and r.samples == 30
+        assert r.change_pct is not None and r.change_pct > 300
+
+    def test_lower_is_worse(self, store: HistoryStore) -> None:
+        _fill(store, 30)
+        store.record(_run(30, 5.0, neighbors=1))
+        assert [r.metric for r in find_regressions(store)] == ["neighbor_count"]
+
+    def test_needs_enough_samples(self, store: HistoryStore) -> None:
+        _fill(store, 5)
+        store.record(_run(5, 25.0))
+        assert find_regressions(store) == []
+        assert len(find_regressions(store, min_samples=5)) == 1
+
+    def test_min_change_floor(self) -> None:
+        metric = METRIC_BY_NAME["latency_ms"]
+        # A perfectly flat baseline makes any change infinitely significant
+        assert judge(metric, 5.5, [5.0] * 20, z=3) is None
+        regression = judge(metric, 6.5, [5.0] * 20, z=3)
+        assert regression is not None and regression.z == float("inf")
+
+    def test_simulated_runs(self, store: HistoryStore) -> None:
+        mesh = SimulatedMesh(size=3)
+        with simulate(mesh):
+            for _ in range(12):
+                store.record(create_runner(Tier.SMOKE).run())
+                health.reset_circuits()
+            mesh.set_latency("node2", 80.0)
+            store.record(create_runner(Tier.SMOKE).run())
+        found = {(r.category, r.node, r.metric) for r in find_regressions(store)}
+        assert ("connectivity.ping", "node2", "latency_ms") in found
+        assert all(node != "node1" for _, node, _ in found)
+
+
+class TestReport:
+    """Tests for the history console output and command."""
+
+    def test_sparkline(self) -> None:
+        assert sparkline([]) == ""
+        assert sparkline([1, 1]) == "▁▁"
+        assert sparkline([0, 7, 3.5]) == "▁█▅"
+
+    def test_reporter(self, store: HistoryStore) -> None:
+        _fill(store, 30)
+        store.record(_run(30, 25.0))
+        output = io.StringIO()
+        reporter = HistoryReporter(output=output)
+        reporter.runs(store.runs(limit=2))
+        reporter.regressions(find_regressions(store), 50)
+        text = output.getvalue()
+        assert "smoke" in text and "1/1 passed" in text
+        assert "connectivity.ping node1 latency_ms: 25" in text
+
+    def test_history_command(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = str(tmp_path / "history.db")
+        history = HistoryStore(path)
+        _fill(history, 30)
+        history.close()
+        assert (
+            main(["history", "--db", path, "--check", "connectivity.ping", "--days", "10000"]) == 0
+        )
+        text = capsys.readouterr().out
+        assert "Trends (daily averages)" in text
+        assert "connectivity.ping node1 latency_ms" in text
+
+        history = HistoryStore(path)
+        history.record(_run(30, 25.0))
+        history.close()
+        assert main(["history", "--db", path, "--json"]) == 1
+        data = json.loads(capsys.readouterr().out)
+        assert len(data["runs"]) == 10 and data["regressions"][0]["node"] == "node1"
@@ -0,0 +1,122 @@
+"""
+Unit tests for the in-process ICMP probe engine.
+
+Loopback probes run only where the kernel permits unprivileged ICMP
+datagram sockets (net.ipv4.ping_group_range); the fallback is exercised
+through the simulated mesh.
+"""
+
+import asyncio
+import socket
+import struct
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytest
+
+from validate.checks import connectivity, performance
+from validate.core import executor, icmp
+from validate.core.results import CheckStatus
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.parsers.ping import PingStats
+
+
+def _ping_sockets_allowed() -> bool:
+    """Check whether this process may open an ICMP datagram socket."""
+    try:
+        socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP).close()
+    except OSError:
+        return False
+    return True
+
+
+class TestPackets:
+    """Tests for echo packet building and parsing."""
+
+    def test_echo_request(self) -> None:
+        packet = icmp.echo_request(0x10005)
+        assert len(packet) == 8 + icmp.PAYLOAD_SIZE
+        assert packet[0] == icmp.ICMP_ECHO_REQUEST
+        assert struct.unpack("!H", packet[6:8])[0] == 5
+
+    def test_parse_echo_reply(self) -> None:
+        reply = struct.pack("!BBHHH", icmp.ICMP_ECHO_REPLY, 0, 0, 77, 42) + b"x" * 56
+        assert icmp.parse_echo_reply(reply) == 42
+        assert icmp.parse_echo_reply(b"\x03\x01" + reply[2:]) is None
+        assert icmp.parse_echo_reply(b"\x00") is None
+
+    def test_ping_command(self) -> None:
+        assert icmp.ping_command("10.0.0.1", 3, 1.0, 2, "") == "ping -c 3 -W 2 10.0.0.1"
+        assert (
+            icmp.ping_command("10.0.0.1", 100, 0.1, 2, "eth0")
+            == "ping -c 100 -i 0.1 -W 2 -I eth0 10.0.0.1"
+        )
+
+
+@pytest.mark.skipif(not _ping_sockets_allowed(), reason="ICMP datagram sockets not permitted")
+class TestNative:
+    """Tests for native probing over loopback."""
+
+    def test_loopback_targets_concurrently(self) -> None:
+        stats = asyncio.run(
+            icmp.ping_native(["127.0.0.1", "127.0.0.2"], count=5, interval_s=0.01, timeout_s=1)
+        )
+        assert set(stats) == {"127.0.0.1", "127.0.0.2"}
+        for result in stats.values():
+            assert (result.sent, result.received) == (5, 5)
+            assert result.p99 is not None and result.p99 < 100
+
+    def test_rejects_non_ipv4(self) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(icmp.ping_native(["::1"], count=1))
+
+
+class TestFallback:
+    """Tests for the transport-level ping and its subprocess fallback."""
+
+    def test_ssh_transport_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        commands: List[str] = []
+
+        async def refuse(*args: object, **kwargs: object) -> Dict[str, PingStats]:
+            raise PermissionError(13, "Permission denied")
+
+        async def local(self: object, command: str, timeout: int) -> Tuple[int, str, str]:
+            commands.append(command)
+            return 1, "1 packets transmitted, 0 received, 100% packet loss\n", ""
+
+        monkeypatch.setattr(icmp, "_native_error", None)
+        monkeypatch.setattr(icmp, "ping_native", refuse)
+        monkeypatch.setattr(executor.SSHTransport, "local", local)
+        transport = executor.SSHTransport()
+        stats = asyncio.run(transport.ping(["10.0.0.1", "10.0.0.2"], 1, 1.0, 1, "eth0"))
+        assert sorted(commands) == [
+            "ping -c 1 -W 1 -I eth0 10.0.0.1",
+            "ping -c 1 -W 1 -I eth0 10.0.0.2",
+        ]
+        assert stats["10.0.0.2"].loss_pct == 100.0
+
+    def test_checks_ping_all_nodes_at_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        mesh = SimulatedMesh(size=4)
+        pinged: List[List[str]] = []
+        with simulate(mesh) as transport:
+            original = transport.ping
+
+            async def record(
+                addresses: Sequence[str],
+                count: int,
+                interval_s: float,
+                timeout_s: float,
+                iface: str,
+                on_outcome: Optional[icmp.Outcome] = None,
+            ) -> Dict[str, PingStats]:
+                pinged.append(list(addresses))
+                return await original(addresses, count, interval_s, timeout_s, iface, on_outcome)
+
+            monkeypatch.setattr(transport, "ping", record)
+            mesh.fail_node("node2")
+            result = connectivity.check_ping()
+            stress = performance.check_stress_ping()
+        assert len(pinged) == 2 and len(pinged[0]) == 4
+        assert result.nodes["node2"].status == CheckStatus.FAIL
+        assert result.nodes["node1"].data["latency_ms"] > 0
+        assert stress.nodes["node1"].data["packets_received"] == 100
+        assert stress.nodes["node2"].status == CheckStatus.FAIL
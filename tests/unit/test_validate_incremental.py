@@ -0,0 +1,131 @@
+"""
+Unit tests for incremental validation (input fingerprints and the result cache).
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, Generator
+
+import pytest
+
+from validate.__main__ import main
+from validate.core import health
+from validate.core.incremental import ResultCache, collect_fingerprints, fingerprint
+from validate.core.results import CheckResult, CheckStatus, NodeResult, Tier, ValidationResult
+from validate.core.runner import create_runner
+from validate.core.simulator import SimulatedMesh, simulate
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test closed circuits."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+def _run(cache: ResultCache, tier: Tier = Tier.STANDARD) -> Dict[str, CheckResult]:
+    """Run a tier with a cache and index the results by check."""
+    result: ValidationResult = create_runner(tier, cache=cache).run()
+    return {check.category: check for check in result.all_checks}
+
+
+class TestIncrementalRun:
+    """Tests for reusing results across runs of the simulated mesh."""
+
+    def test_reuses_unchanged_checks(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "results.json")
+        mesh = SimulatedMesh(size=4)
+        with simulate(mesh):
+            first = ResultCache(path)
+            assert all(c.cached_s is None for c in _run(first).values())
+            first.save()
+            health.reset_circuits()
+            second = ResultCache(path)
+            checks = _run(second)
+        # batctl last-seen times differ between runs, yet batman checks are reused
+        assert checks["batman.neighbors"].cached_s is not None
+        assert checks["vlans.client"].cached_s is not None
+        assert checks["connectivity.ssh"].cached_s is None  # No inputs: always runs
+        assert second.hits == sum(1 for c in checks.values() if c.cached_s is not None)
+        assert all(c.status == CheckStatus.PASS for c in checks.values())
+
+    def test_changed_input_reruns_check(self, tmp_path: Path) -> None:
+        mesh = SimulatedMesh(size=4)
+        with simulate(mesh):
+            cache = ResultCache(str(tmp_path / "results.json"))
+            _run(cache, Tier.COMPREHENSIVE)
+            mesh.set_uci("node1", "network.lan.proto", "dhcp")
+            mesh.fail_link("node1", "node2")
+            health.reset_circuits()
+            checks = _run(cache, Tier.COMPREHENSIVE)
+        assert checks["vlans.client"].cached_s is None
+        assert checks["batman.neighbors"].cached_s is None
+        assert checks["security.https"].cached_s is not None
+
+    def test_stale_and_failed_results_are_not_reused(self, tmp_path: Path) -> None:
+        mesh = SimulatedMesh(size=4)
+        with simulate(mesh):
+            cache = ResultCache(str(tmp_path / "results.json"), max_age_s=0)
+            _run(cache)
+            assert all(c.cached_s is None for c in _run(cache).values())
+            cache.max_age_s = 3600
+            mesh.fail_command("node2", "dropbear", rc=1)
+            health.reset_circuits()
+            failed = _run(cache, Tier.COMPREHENSIVE)["security.ssh"]
+            health.reset_circuits()
+            again = _run(cache, Tier.COMPREHENSIVE)["security.ssh"]
+        assert failed.status != CheckStatus.PASS
+        assert again.cached_s is None
+
+    def test_simulated_run_needs_cache_path(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["smoke", "--simulate", "3", "--incremental"]) == 2
+        assert "--result-cache" in capsys.readouterr().err
+
+
+class TestResultCache:
+    """Tests for the cache file and fingerprints."""
+
+    def test_tolerates_corrupt_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "results.json"
+        path.write_text("{not json")
+        cache = ResultCache(str(path))
+        assert cache.lookup("batman.neighbors", "abc") is None
+        cache.store("batman.neighbors", "abc", CheckResult("batman.neighbors", CheckStatus.PASS))
+        cache.save()
+        assert json.loads(path.read_text())["checks"]["batman.neighbors"]["fingerprint"] == "abc"
+
+    def test_lookup_checks_fingerprint_and_age(self, tmp_path: Path) -> None:
+        cache = ResultCache(str(tmp_path / "results.json"), max_age_s=60)
+        cache.store("a", "fp", CheckResult("a", CheckStatus.PASS, "ok"))
+        assert cache.lookup("a", "other") is None
+        hit = cache.lookup("a", "fp")
+        assert hit is not None and hit.message == "ok" and hit.cached_s is not None
+        cache._entries["a"]["time"] = time.time() - 120
+        assert cache.lookup("a", "fp") is None
+        assert cache.hits == 1
+
+    def test_result_round_trip(self) -> None:
+        result = CheckResult(
+            "batman.gateways",
+            CheckStatus.WARN,
+            "1 gateway",
+            duration_ms=12.5,
+            nodes={"node1": NodeResult("node1", CheckStatus.WARN, "few", {"gateways": 1})},
+            data={"count": 1},
+            cached_s=30.0,
+        )
+        restored = CheckResult.from_dict(result.to_dict())
+        assert restored.to_dict() == result.to_dict()
+        assert CheckResult.from_dict(CheckResult("x", CheckStatus.PASS).to_dict()).cached_s is None
+
+    def test_fingerprint_needs_every_node(self) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            digests = asyncio.run(collect_fingerprints(["links", "uci:network"]))
+            assert fingerprint(["links"], digests) is not None
+            del digests["node2"]["links"]
+            assert fingerprint(["links"], digests) is None
+            with pytest.raises(ValueError):
+                asyncio.run(collect_fingerprints(["nonsense"]))
@@ -0,0 +1,166 @@
+"""
+Unit tests for the inventory-driven node registry.
+
+Inventories are written to a temporary directory; no network access is
+required.
+"""
+
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from validate import inventory
+from validate.inventory import NodeRegistry, load_inventory, resolve_var
+
+GROUP_VARS = """\
+hostname_prefix: "{{ lookup('env', 'TEST_HOSTNAME_PREFIX') | default('mesh-node', true) }}"
+vlans:
+  management:
+    network: "{{ lookup('env', 'TEST_MGMT_NETWORK') | default('10.11.10.0/24', true) }}"
+dhcp_pools:
+  node1:
+    start: "{{ lookup('env', 'TEST_DHCP_START') | default('100', true) | int }}"
+"""
+
+HOSTS = """\
+all:
+  children:
+    mesh_nodes:
+      children:
+        gateways:
+          vars:
+            has_wan: true
+          hosts:
+            node1: {node_ip: 10.11.12.1, node_id: 1}
+            node2: {node_ip: 10.11.12.2, node_id: 2}
+        clients:
+          vars:
+            has_wan: false
+          hosts:
+            node4: {node_ip: 10.11.12.4, node_id: 4}
+            node3: {node_ip: 10.11.12.3, node_id: 3}
+    switches:
+      hosts:
+        switch_a: {ansible_host: 10.11.10.11}
+"""
+
+
+@pytest.fixture
+def inventory_file(tmp_path: Path) -> Generator[Path, None, None]:
+    """Write a four-node inventory with group_vars beside it."""
+    (tmp_path / "inventory").mkdir()
+    (tmp_path / "group_vars").mkdir()
+    (tmp_path / "group_vars" / "all.yml").write_text(GROUP_VARS)
+    path = tmp_path / "inventory" / "hosts.yml"
+    path.write_text(HOSTS)
+    yield path
+    inventory._load_inventory_cached.cache_clear()
+
+
+class TestLoadInventory:
+    """Tests for building NodeInfo from an inventory."""
+
+    def test_mesh_nodes_only_sorted_by_id(self, inventory_file: Path) -> None:
+        nodes = load_inventory(inventory_file)
+        assert list(nodes) == ["node1", "node2", "node3", "node4"]
+
+    def test_roles_and_gateway_mode(self, inventory_file: Path) -> None:
+        nodes = load_inventory(inventory_file)
+        assert nodes["node1"].roles == ("gateways",)
+        assert nodes["node1"].gw_mode == "server"
+        assert nodes["node4"].roles == ("clients",)
+        assert nodes["node4"].gw_mode == "client"
+
+    def test_default_ring_cabling(self, inventory_file: Path) -> None:
+        nodes = load_inventory(inventory_file)
+        # lan3 goes to the previous node and lan4 to the next, as deployed
+        assert nodes["node2"].lan3_peer == "node1"
+        assert nodes["node3"].lan3_peer == "node2"
+        assert nodes["node2"].lan4_peer == "node3"
+        assert nodes["node1"].lan3_peer == "node4"
+        assert nodes["node4"].lan4_peer == "node1"
+        assert sorted(nodes["node2"].peers) == ["node1", "node3"]
+
+    def test_explicit_mesh_ports(self, tmp_path: Path) -> None:
+        path = tmp_path / "hosts.yml"
+        path.write_text(
+            "all:\n  children:\n    mesh_nodes:\n      hosts:\n"
+            "        a: {node_ip: 10.0.0.1, node_id: 1, mesh_ports: {lan3: b}}\n"
+            "        b: {node_ip: 10.0.0.2, node_id: 2, mesh_ports: {lan4: a}}\n"
+        )
+        nodes = load_inventory(path)
+        assert nodes["a"].mesh_ports == {"lan3": "b"}
+        assert nodes["b"].lan4_peer == "a"
+        assert nodes["b"].lan3_peer == ""
+
+    def test_group_vars_resolved(
+        self, inventory_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TEST_HOSTNAME_PREFIX", "lab-")
+        monkeypatch.setenv("TEST_MGMT_NETWORK", "192.168.10.0/24")
+        nodes = load_inventory(inventory_file)
+        assert nodes["node3"].name == "lab-3"
+        assert nodes["node3"].mgmt_ip == "192.168.10.3"
+        assert nodes["node1"].hostvars["dhcp_pools"]["node1"]["start"] == 100
+
+    def test_parsed_once(self, inventory_file: Path) -> None:
+        load_inventory(inventory_file)
+        inventory_file.write_text("not: an inventory\n")
+        assert len(load_inventory(inventory_file)) == 4
+
+    def test_missing_inventory(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load_inventory(tmp_path / "missing.yml")
+
+    def test_repo_inventory(self) -> None:
+        nodes = load_inventory()
+        assert {"node1", "node2", "node3"} <= set(nodes)
+        assert nodes["node1"].ip == "10.11.12.1"
+        assert nodes["node1"].lan3_peer == "node2"
+
+
+class TestNodeRegistry:
+    """Tests for the lazily loaded registry."""
+
+    def test_lazy(self, tmp_path: Path) -> None:
+        registry = NodeRegistry(tmp_path / "missing.yml")
+        with pytest.raises(FileNotFoundError):
+            len(registry)
+
+    def test_mapping(self, inventory_file: Path) -> None:
+        registry = NodeRegistry(inventory_file)
+        assert len(registry) == 4
+        assert registry["node2"].ip == "10.11.12.2"
+        assert dict(registry) == load_inventory(inventory_file)
+
+    def test_env_override(self, inventory_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MESH_INVENTORY", str(inventory_file))
+        assert "node4" in NodeRegistry()
+
+    def test_replace_and_reload(self, inventory_file: Path) -> None:
+        registry = NodeRegistry(inventory_file)
+        saved = dict(registry)
+        registry.clear()
+        assert len(registry) == 0
+        registry.update(saved)
+        assert registry == saved
+
+        registry.clear()
+        registry.reload()
+        assert len(registry) == 4
+
+
+class TestResolveVar:
+    """Tests for env-lookup template resolution."""
+
+    def test_nested(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TEST_FLAG", "false")
+        value = {
+            "flag": "{{ lookup('env', 'TEST_FLAG') | default('true', true) | bool }}",
+            "list": ["{{ lookup('env', 'TEST_UNSET') | default('x', true) }}"],
+        }
+        assert resolve_var(value) == {"flag": False, "list": ["x"]}
+
+    def test_other_templates_untouched(self) -> None:
+        assert resolve_var("{{ node_ip }}") == "{{ node_ip }}"
@@ -0,0 +1,94 @@
+"""
+Unit tests for the node-to-node latency matrix.
+
+Probes run against the simulated mesh; no network access is required.
+"""
+
+from typing import Generator
+
+import pytest
+
+from validate.checks import performance
+from validate.core import health
+from validate.core.latency import (
+    ROUTED,
+    LatencyTarget,
+    build_probe_script,
+    link_local,
+    parse_probe_output,
+)
+from validate.core.results import CheckStatus
+from validate.core.simulator import SimulatedMesh, simulate
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+class TestProbe:
+    """Tests for the per-node probe script."""
+
+    def test_link_local(self) -> None:
+        assert link_local("02:ba:00:01:00:03") == "fe80::ba:ff:fe01:3"
+        assert link_local("aa:bb:cc:dd:ee:ff") == "fe80::a8bb:ccff:fedd:eeff"
+
+    def test_script_runs_targets_concurrently(self) -> None:
+        targets = [
+            LatencyTarget(peer="node2", address="10.11.12.2"),
+            LatencyTarget(peer="node2", address="fe80::1", kind="wired", iface="lan3.100"),
+        ]
+        script = build_probe_script(targets, count=20, interval_s=0.05)
+        assert 'ping -c 20 -i 0.05 -W 1 10.11.12.2 >"$D/node2" 2>&1 &' in script
+        assert "ping -6 -c 20 -i 0.05 -W 1 -I lan3.100 fe80::1" in script
+        assert script.index("&\nwait") > 0
+
+    def test_parse_sections(self) -> None:
+        output = (
+            "@@@ node2\n64 bytes from x: seq=0 ttl=64 time=0.5 ms\n"
+            "1 packets transmitted, 1 packets received, 0% packet loss\n"
+            "@@@ node3@mesh0\n1 packets transmitted, 0 packets received, 100% packet loss\n"
+        )
+        results = parse_probe_output(output)
+        assert results["node2"].rtts == [0.5]
+        assert results["node3@mesh0"].received == 0
+
+
+class TestCheckLatencyMatrix:
+    """Tests for the performance.latency_matrix check on a simulated mesh."""
+
+    def test_all_pairs_and_paths(self) -> None:
+        with simulate(SimulatedMesh(size=5, jitter_ms=0.05)):
+            result = performance.check_latency_matrix()
+        assert result.status == CheckStatus.PASS
+        matrix = result.data["matrix"]
+        assert set(matrix["node1"]) == {"node2", "node3", "node4", "node5"}
+        assert matrix["node1"]["node3"]["p50_ms"] > matrix["node1"]["node2"]["p50_ms"]
+        by_kind = result.data["by_kind"]
+        assert by_kind["wired"]["p50_ms"] < by_kind["wireless"]["p50_ms"]
+        assert result.data["links"]["node1"]["node2@lan4.100"]["kind"] == "wired"
+
+    def test_unreachable_peer_fails(self) -> None:
+        mesh = SimulatedMesh(size=4)
+        with simulate(mesh):
+            mesh.fail_node("node3")
+            result = performance.check_latency_matrix()
+        assert result.nodes["node1"].status == CheckStatus.FAIL
+        assert "node3 unreachable" in result.nodes["node1"].message
+
+    def test_jittery_wired_link_warns(self) -> None:
+        with simulate(SimulatedMesh(size=3, jitter_ms=3.5)):
+            result = performance.check_latency_matrix()
+        assert result.status == CheckStatus.WARN
+        assert "jitter" in result.nodes["node1"].message
+
+    def test_routed_targets_only_without_graph(self) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            from validate.core.latency import plan_targets
+
+            targets = plan_targets("node1")
+        assert [t.peer for t in targets] == ["node2", "node3"]
+        assert all(t.kind == ROUTED for t in targets)
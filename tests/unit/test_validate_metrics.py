@@ -0,0 +1,194 @@
+"""
+Unit tests for the metrics exporter and its exposition formats.
+"""
+
+import os
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Generator, List
+
+import pytest
+
+from validate.__main__ import main, parse_schedule
+from validate.core import exporter as exporter_module
+from validate.core import health
+from validate.core.executor import run_on_node
+from validate.core.exporter import Exporter
+from validate.core.results import Tier
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.core.timing import CommandTiming, command_timings, reset_command_timings
+from validate.reporters.metrics import (
+    MetricFamily,
+    MetricsServer,
+    render,
+    tier_families,
+    timing_families,
+    write_textfile,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state() -> Generator[None, None, None]:
+    """Give every test clean circuits and timings."""
+    health.reset_circuits()
+    reset_command_timings()
+    yield
+    health.reset_circuits()
+    reset_command_timings()
+
+
+def _families() -> List[MetricFamily]:
+    """Families covering each type and an empty one."""
+    counter = MetricFamily("runs", "counter", "Runs")
+    counter.add({"tier": "smoke"}, 3)
+    state = MetricFamily("check_status", "stateset", "Status")
+    state.add({"check": 'a"b\\c', "mesh_validate_check_status": "pass"}, 1)
+    gauge = MetricFamily("run_duration_seconds", "gauge", "Duration", "seconds")
+    gauge.add({}, 1.5)
+    gauge.add({"tier": "x"}, float("inf"))
+    return [counter, state, gauge, MetricFamily("empty", "gauge", "Unused")]
+
+
+class TestRender:
+    """Tests for the OpenMetrics and Prometheus text formats."""
+
+    def test_openmetrics(self) -> None:
+        lines = render(_families(), openmetrics=True).splitlines()
+        assert lines[:3] == [
+            "# TYPE mesh_validate_runs counter",
+            "# HELP mesh_validate_runs Runs",
+            'mesh_validate_runs_total{tier="smoke"} 3',
+        ]
+        assert "# TYPE mesh_validate_check_status stateset" in lines
+        assert 'mesh_validate_check_status{check="a\\"b\\\\c",' in lines[5]
+        assert "# UNIT mesh_validate_run_duration_seconds seconds" in lines
+        assert "mesh_validate_run_duration_seconds 1.5" in lines
+        assert 'mesh_validate_run_duration_seconds{tier="x"} +Inf' in lines
+        assert not any("empty" in line for line in lines)
+        assert lines[-1] == "# EOF"
+
+    def test_prometheus_text(self) -> None:
+        text = render(_families(), openmetrics=False)
+        assert "# TYPE mesh_validate_runs_total counter\n" in text
+        assert "# TYPE mesh_validate_check_status gauge\n" in text
+        assert "# UNIT" not in text and "# EOF" not in text
+
+    def test_timing_histogram(self) -> None:
+        timing = CommandTiming()
+        for duration in (0.005, 0.2, 0.2, 40):
+            timing.observe(duration)
+        timing.observe(10, failed=True)
+        assert timing.cumulative()[-1] == timing.count == 5
+        text = render(timing_families({"node1": timing}))
+        assert 'mesh_validate_command_duration_seconds_bucket{node="node1",le="0.01"} 1' in text
+        assert 'mesh_validate_command_duration_seconds_bucket{node="node1",le="0.25"} 3' in text
+        assert 'mesh_validate_command_duration_seconds_bucket{node="node1",le="+Inf"} 5' in text
+        assert 'mesh_validate_command_duration_seconds_count{node="node1"} 5' in text
+        assert 'mesh_validate_command_connection_failures_total{node="node1"} 1' in text
+
+
+class TestExporter:
+    """Tests for scheduled runs and the metrics built from them."""
+
+    def test_runs_due_tiers(self) -> None:
+        mesh = SimulatedMesh(size=3)
+        updates: List[Exporter] = []
+        with simulate(mesh):
+            exporter = Exporter([(Tier.SMOKE, 60), (Tier.STANDARD, 600)], on_update=updates.append)
+            wait = exporter.run_due()
+            assert 0 < wait <= 60 and len(updates) == 2
+            assert exporter.run_due() > 0 and len(updates) == 2  # Nothing due yet
+            mesh.fail_node("node2")
+            exporter.run_tier(exporter.tiers[0])
+        text = render(tier_families(exporter.states()))
+        assert 'mesh_validate_runs_total{tier="smoke"} 2' in text
+        assert 'mesh_validate_run_passed{tier="smoke"} 0' in text
+        assert 'mesh_validate_run_passed{tier="standard"} 1' in text
+        assert (
+            'mesh_validate_check_status{tier="smoke",check="connectivity.ssh",'
+            'mesh_validate_check_status="fail"} 1'
+        ) in text
+        assert (
+            'mesh_validate_node_passed{tier="smoke",check="connectivity.ssh",node="node2"} 0'
+        ) in text
+        assert 'mesh_validate_node_latency_seconds{tier="smoke",check="connectivity.ping",' in text
+
+    def test_failed_run_keeps_last_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            exporter = Exporter([(Tier.SMOKE, 60)])
+            exporter.run_once()
+            first = exporter.states()[0].result
+
+            def broken(tier: Tier) -> None:
+                raise RuntimeError("boom")
+
+            monkeypatch.setattr(exporter_module, "create_runner", broken)
+            exporter.run_once()
+        state = exporter.states()[0]
+        assert (state.runs, state.errors) == (2, 1)
+        assert state.result is first
+
+    def test_serve_stops(self) -> None:
+        stop = threading.Event()
+        with simulate(SimulatedMesh(size=3)):
+            exporter = Exporter([(Tier.SMOKE, 60)], on_update=lambda _: stop.set())
+            exporter.serve(stop)
+        assert exporter.states()[0].runs == 1
+
+    def test_rejects_bad_schedule(self) -> None:
+        with pytest.raises(ValueError):
+            Exporter([])
+        with pytest.raises(ValueError):
+            Exporter([(Tier.SMOKE, 0)])
+
+    def test_commands_are_timed(self) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            run_on_node("node1", "true")
+            run_on_node("node1", "true")
+        timings = command_timings()
+        assert timings["node1"].count == 2 and timings["node1"].failures == 0
+
+
+class TestOutput:
+    """Tests for the HTTP endpoint, textfile output and command line."""
+
+    def test_server_negotiates_format(self) -> None:
+        family = MetricFamily("runs", "counter", "Runs")
+        family.add({}, 1)
+        server = MetricsServer()
+        try:
+            server.update([family])
+            with urllib.request.urlopen(server.url) as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert b"mesh_validate_runs_total 1" in response.read()
+            request = urllib.request.Request(
+                server.url, headers={"Accept": "application/openmetrics-text; version=1.0.0"}
+            )
+            with urllib.request.urlopen(request) as response:
+                assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+                assert response.read().endswith(b"# EOF\n")
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"))
+        finally:
+            server.close()
+
+    def test_write_textfile(self, tmp_path: Path) -> None:
+        family = MetricFamily("runs", "counter", "Runs")
+        family.add({}, 1)
+        path = tmp_path / "mesh.prom"
+        write_textfile(str(path), [family])
+        write_textfile(str(path), [family])
+        assert path.read_text().startswith("# TYPE mesh_validate_runs_total counter")
+        assert os.listdir(tmp_path) == ["mesh.prom"]
+
+    def test_parse_schedule(self) -> None:
+        assert parse_schedule(["smoke:60", "standard"], 300) == [
+            (Tier.SMOKE, 60.0),
+            (Tier.STANDARD, 300.0),
+        ]
+
+    def test_needs_an_output(self) -> None:
+        with pytest.raises(SystemExit):
+            main(["export", "smoke"])
@@ -0,0 +1,237 @@
+"""
+Unit tests for the batctl table parsers.
+
+Sample output follows batctl 2023.x (text and JSON) for both routing
+algorithms.
+"""
+
+import pytest
+
+from validate.parsers.batctl import (
+    parse_gateways,
+    parse_hardifs,
+    parse_header,
+    parse_neighbors,
+    parse_originators,
+)
+from validate.parsers.ping import parse_ping, percentile, ping_outcomes
+
+HEADER_IV = (
+    "[B.A.T.M.A.N. adv 2023.1, MainIF/MAC: phy0-mesh0/66:63:4c:66:e1:a4 "
+    "(bat0/aa:bb:cc:dd:ee:00 BATMAN_IV)]"
+)
+HEADER_V = HEADER_IV.replace("BATMAN_IV", "BATMAN_V")
+
+ORIGINATORS_IV = f"""{HEADER_IV}
+   Originator        last-seen (#/255) Nexthop           [outgoingIF]
+ * ba:0f:9a:77:f2:47    0.320s   (255) ba:0f:9a:77:f2:47 [  lan3.100]
+   ba:0f:9a:77:f2:47    0.320s   (230) ea:ad:e0:3a:08:29 [  lan4.100]
+ * ea:ad:e0:3a:08:29    1.020s   (251) ea:ad:e0:3a:08:29 [  lan4.100]
+"""
+
+ORIGINATORS_V = f"""{HEADER_V}
+   Originator        last-seen ( throughput)  Nexthop           [outgoingIF]
+ * ba:0f:9a:77:f2:47    0.120s (      866.6)  ba:0f:9a:77:f2:47 [phy0-mesh0]
+"""
+
+ORIGINATORS_JSON = (
+    '[{"hard_ifindex":9,"hard_ifname":"lan3.100","orig_address":"ba:0f:9a:77:f2:47",'
+    '"neigh_address":"ba:0f:9a:77:f2:47","last_seen_msecs":320,"tq":255,"best":true},'
+    '{"hard_ifindex":10,"hard_ifname":"lan4.100","orig_address":"ba:0f:9a:77:f2:47",'
+    '"neigh_address":"ea:ad:e0:3a:08:29","last_seen_msecs":320,"tq":230}]'
+)
+
+NEIGHBORS_IV = f"""{HEADER_IV}
+IF             Neighbor              last-seen
+      lan3.100	  ba:0f:9a:77:f2:47    0.210s
+    phy0-mesh0	  ea:ad:e0:3a:08:29    1.700s
+"""
+
+NEIGHBORS_V = f"""{HEADER_V}
+         Neighbor   last-seen (  throughput) [        IF]
+ba:0f:9a:77:f2:47    0.210s (     1000.0) [  lan3.100]
+"""
+
+GATEWAYS_IV = f"""{HEADER_IV}
+  Router            ( TQ) Next Hop          [outgoingIf]  Bandwidth
+* ba:0f:9a:77:f2:47 (255) ba:0f:9a:77:f2:47 [  lan3.100]: 100.0/20.0 MBit
+  ea:ad:e0:3a:08:29 (230) ea:ad:e0:3a:08:29 [  lan4.100]: 50.0/10.0 MBit
+"""
+
+GATEWAYS_JSON = (
+    '[{"orig_address":"ba:0f:9a:77:f2:47","router":"ea:ad:e0:3a:08:29",'
+    '"hard_ifname":"lan4.100","bandwidth_down":1000,"bandwidth_up":200,'
+    '"throughput":8666,"best":true}]'
+)
+
+
+class TestHeader:
+    """Tests for the table header line."""
+
+    def test_parse(self) -> None:
+        header = parse_header(ORIGINATORS_IV)
+        assert header is not None
+        assert header.version == "2023.1"
+        assert header.main_if == "phy0-mesh0"
+        assert header.mesh_mac == "aa:bb:cc:dd:ee:00"
+        assert header.algorithm == "BATMAN_IV"
+
+    def test_missing(self) -> None:
+        assert parse_header("lan3.100: active\n") is None
+
+
+class TestOriginators:
+    """Tests for originator tables."""
+
+    def test_text_batman_iv(self) -> None:
+        table = parse_originators(ORIGINATORS_IV)
+        assert table.source == "text"
+        assert len(table.entries) == 3
+        assert table.originators == {"ba:0f:9a:77:f2:47", "ea:ad:e0:3a:08:29"}
+
+        first = table.entries[0]
+        assert first.best
+        assert first.tq == 255
+        assert first.throughput_mbit is None
+        assert first.outgoing_if == "lan3.100"
+        assert first.last_seen_s == pytest.approx(0.32)
+
+    def test_best_routes(self) -> None:
+        routes = parse_originators(ORIGINATORS_IV).best_routes()
+        assert routes["ba:0f:9a:77:f2:47"].next_hop == "ba:0f:9a:77:f2:47"
+        assert routes["ea:ad:e0:3a:08:29"].tq == 251
+
+    def test_text_batman_v(self) -> None:
+        entry = parse_originators(ORIGINATORS_V).entries[0]
+        assert entry.throughput_mbit == pytest.approx(866.6)
+        assert entry.tq is None
+        assert entry.outgoing_if == "phy0-mesh0"
+
+    def test_json(self) -> None:
+        table = parse_originators(ORIGINATORS_JSON)
+        assert table.source == "json"
+        assert [e.best for e in table.entries] == [True, False]
+        assert table.entries[1].next_hop == "ea:ad:e0:3a:08:29"
+        assert table.entries[1].last_seen_s == pytest.approx(0.32)
+
+    def test_json_per_line(self) -> None:
+        lines = ORIGINATORS_JSON[1:-1].replace("},{", "}\n{")
+        assert len(parse_originators(lines).entries) == 2
+
+    def test_empty(self) -> None:
+        assert parse_originators("").entries == []
+        assert parse_originators("[]").source == "json"
+
+    def test_malformed_json(self) -> None:
+        with pytest.raises(ValueError):
+            parse_originators('[{"orig_address": ')
+
+
+class TestNeighbors:
+    """Tests for neighbor tables."""
+
+    def test_text_batman_iv(self) -> None:
+        table = parse_neighbors(NEIGHBORS_IV)
+        assert [(n.hardif, n.neighbor) for n in table.entries] == [
+            ("lan3.100", "ba:0f:9a:77:f2:47"),
+            ("phy0-mesh0", "ea:ad:e0:3a:08:29"),
+        ]
+        assert table.entries[1].last_seen_s == pytest.approx(1.7)
+
+    def test_text_batman_v(self) -> None:
+        entry = parse_neighbors(NEIGHBORS_V).entries[0]
+        assert entry.hardif == "lan3.100"
+        assert entry.throughput_mbit == pytest.approx(1000.0)
+
+    def test_json(self) -> None:
+        table = parse_neighbors(
+            '[{"hard_ifname":"lan3.100","neigh_address":"ba:0f:9a:77:f2:47",'
+            '"last_seen_msecs":210,"throughput":10000}]'
+        )
+        assert table.neighbors == {"ba:0f:9a:77:f2:47"}
+        assert table.entries[0].throughput_mbit == pytest.approx(1000.0)
+
+
+class TestGateways:
+    """Tests for gateway lists."""
+
+    def test_text(self) -> None:
+        table = parse_gateways(GATEWAYS_IV)
+        assert len(table.entries) == 2
+        selected = table.selected
+        assert selected is not None
+        assert selected.router == "ba:0f:9a:77:f2:47"
+        assert selected.bandwidth_down_mbit == 100.0
+        assert selected.bandwidth_up_mbit == 20.0
+        assert table.entries[1].tq == 230
+
+    def test_legacy_selection_marker(self) -> None:
+        table = parse_gateways(GATEWAYS_IV.replace("* ba:", "=> ba:"))
+        assert table.selected is not None
+
+    def test_json(self) -> None:
+        entry = parse_gateways(GATEWAYS_JSON).entries[0]
+        assert entry.next_hop == "ea:ad:e0:3a:08:29"
+        assert entry.bandwidth_down_mbit == 100.0
+        assert entry.throughput_mbit == pytest.approx(866.6)
+        assert entry.best
+
+
+class TestHardIfs:
+    """Tests for hard interface lists."""
+
+    def test_parse(self) -> None:
+        table = parse_hardifs("lan3.100: active\nlan4.100: active\nphy1-mesh0: inactive\n")
+        assert [h.name for h in table.entries] == ["lan3.100", "lan4.100", "phy1-mesh0"]
+        assert table.active == ["lan3.100", "lan4.100"]
+
+
+BUSYBOX_PING = """PING 10.11.12.2 (10.11.12.2): 56 data bytes
+64 bytes from 10.11.12.2: seq=0 ttl=64 time=0.512 ms
+64 bytes from 10.11.12.2: seq=1 ttl=64 time=0.900 ms
+64 bytes from 10.11.12.2: seq=1 ttl=64 time=0.950 ms (DUP!)
+64 bytes from 10.11.12.2: seq=3 ttl=64 time=0.400 ms
+
+--- 10.11.12.2 ping statistics ---
+4 packets transmitted, 3 packets received, 1 duplicates, 25% packet loss
+"""
+
+IPUTILS_PING = """PING 10.11.12.2 (10.11.12.2) 56(84) bytes of data.
+64 bytes from 10.11.12.2: icmp_seq=1 ttl=64 time=1.10 ms
+64 bytes from 10.11.12.2: icmp_seq=2 ttl=64 time=1.30 ms
+"""
+
+
+class TestPing:
+    """Tests for per-packet ping parsing."""
+
+    def test_busybox(self) -> None:
+        stats = parse_ping(BUSYBOX_PING)
+        assert (stats.sent, stats.received) == (4, 3)
+        assert stats.rtts == [0.512, 0.9, 0.4]
+        assert stats.loss_pct == 25.0
+        assert stats.p50 == 0.512
+        assert stats.max == 0.9
+        assert stats.jitter == pytest.approx((0.388 + 0.5) / 2)
+
+    def test_iputils_without_summary(self) -> None:
+        stats = parse_ping(IPUTILS_PING)
+        assert (stats.sent, stats.received) == (2, 2)
+        assert stats.summary()["p99_ms"] == 1.3
+
+    def test_unreachable(self) -> None:
+        stats = parse_ping("2 packets transmitted, 0 received, 100% packet loss\n")
+        assert stats.loss_pct == 100.0
+        assert stats.p50 is None
+        assert stats.summary()["jitter_ms"] is None
+
+    def test_outcomes_in_sequence(self) -> None:
+        assert list(ping_outcomes(BUSYBOX_PING)) == [(0, 0.512), (1, 0.9), (2, None), (3, 0.4)]
+        assert list(ping_outcomes(IPUTILS_PING)) == [(0, 1.1), (1, 1.3)]
+
+    def test_percentile_nearest_rank(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) is None
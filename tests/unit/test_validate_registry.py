@@ -0,0 +1,142 @@
+"""
+Unit tests for the check registry (lazy loading, plugins, --list).
+"""
+
+import json
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from typing import Generator, List
+
+import pytest
+
+from validate.__main__ import TOPOLOGIES, main
+from validate.checks import CHECKS
+from validate.core import health, registry, simulator
+from validate.core.registry import CheckSpec, check_specs
+from validate.core.results import CheckResult, CheckStatus, Tier
+from validate.core.runner import create_runner
+from validate.core.simulator import SimulatedMesh, simulate
+
+
+def plugin_check() -> CheckResult:
+    """A check shipped by a plugin."""
+    return CheckResult("ups.battery", CheckStatus.PASS, "on mains")
+
+
+PLUGIN_CHECKS = [CheckSpec("ups.battery", f"{__name__}:plugin_check", 3, cost_s=4)]
+
+
+@pytest.fixture(autouse=True)
+def clean_registry() -> Generator[None, None, None]:
+    """Give every test the built-in checks only, and closed circuits."""
+    registry.plugin_specs.cache_clear()
+    health.reset_circuits()
+    yield
+    registry._runtime.clear()
+    registry.plugin_specs.cache_clear()
+    health.reset_circuits()
+
+
+def _imported(code: str) -> List[str]:
+    """Modules of interest imported by a fresh interpreter running code."""
+    probe = (
+        f"{code}\nimport sys\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith('validate.checks.') "
+        "or m in ('asyncio', 'yaml', 'sqlite3', 'http.server')), file=sys.stderr)"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return out.stderr.split()
+
+
+class TestBuiltinChecks:
+    """Tests for the declared built-in checks."""
+
+    def test_targets_resolve(self) -> None:
+        assert len({spec.category for spec in CHECKS}) == len(CHECKS)
+        for spec in CHECKS:
+            assert callable(spec.load()), spec.category
+
+    def test_runner_keeps_phases(self) -> None:
+        names = create_runner(Tier.SMOKE).get_phase_names()
+        assert names == [(1, "Prerequisites"), (2, "Foundation"), (3, "Network")]
+        assert create_runner(Tier.CERTIFICATION).get_check_count() == len(CHECKS)
+
+    def test_listing_imports_nothing_heavy(self) -> None:
+        assert _imported("from validate.__main__ import main; main(['--list'])") == []
+
+    def test_runner_imports_no_checks(self) -> None:
+        code = (
+            "from validate.core.runner import create_runner\n"
+            "from validate.core.results import Tier\n"
+            "create_runner(Tier.CERTIFICATION)"
+        )
+        assert [m for m in _imported(code) if m.startswith("validate.checks.")] == []
+
+
+class TestPlugins:
+    """Tests for checks added by other packages."""
+
+    def test_entry_point_checks_run(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        points = [
+            EntryPoint("ups", f"{__name__}:PLUGIN_CHECKS", registry.ENTRY_POINT_GROUP),
+            EntryPoint("broken", "no_such_module:CHECKS", registry.ENTRY_POINT_GROUP),
+        ]
+        monkeypatch.setattr(registry, "entry_points", lambda group: points)
+        with pytest.warns(RuntimeWarning, match="'broken' not loaded"):
+            specs = {spec.category: spec for spec in check_specs(Tier.SMOKE)}
+        assert specs["ups.battery"].source == "ups"
+        with simulate(SimulatedMesh(size=3)):
+            result = create_runner(Tier.SMOKE).run()
+        checks = {check.category: check for check in result.all_checks}
+        assert checks["ups.battery"].message == "on mains"
+
+    def test_register_and_broken_target(self) -> None:
+        registry.register(CheckSpec("lab.missing", "no_such_module:check", 1))
+        with pytest.raises(ValueError):
+            registry.register(CheckSpec("connectivity.ping", "x:y", 1))
+        with simulate(SimulatedMesh(size=3)):
+            result = create_runner(Tier.SMOKE).run()
+        missing = next(c for c in result.all_checks if c.category == "lab.missing")
+        assert missing.status == CheckStatus.ERROR and "no_such_module" in missing.message
+        registry.unregister("lab.missing")
+        assert "lab.missing" not in {spec.category for spec in check_specs()}
+
+    def test_duplicate_plugin_check_is_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        dup = [CheckSpec("batman.module", f"{__name__}:plugin_check", 1)]
+        monkeypatch.setattr(registry, "plugin_specs", lambda: tuple(dup))
+        with pytest.warns(RuntimeWarning, match="batman.module"):
+            specs = check_specs()
+        module = next(spec for spec in specs if spec.category == "batman.module")
+        assert module.source == "builtin"
+
+    def test_resolve_rejects_bad_targets(self) -> None:
+        with pytest.raises(ValueError):
+            registry.resolve("validate.checks.batman")
+        with pytest.raises(ValueError):
+            registry.resolve(f"{__name__}:PLUGIN_CHECKS")
+
+
+class TestListCommand:
+    """Tests for python -m validate --list."""
+
+    def test_list_tier_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["smoke", "--list", "--json"]) == 0
+        checks = json.loads(capsys.readouterr().out)["checks"]
+        assert [c["category"] for c in checks] == [
+            "connectivity.ping",
+            "connectivity.ssh",
+            "batman.module",
+        ]
+        assert checks[0]["target"] == "validate.checks.connectivity:check_ping"
+
+    def test_list_table(self, capsys: pytest.CaptureFixture[str]) -> None:
+        registry.register(*PLUGIN_CHECKS)
+        assert main(["--list"]) == 0
+        out = capsys.readouterr().out
+        assert "Phase 5: Certification" in out and "from runtime" in out
+        assert out.rstrip().endswith("if run one at a time")
+        assert f"{len(CHECKS) + 1} checks" in out
+
+    def test_topologies_match_simulator(self) -> None:
+        assert TOPOLOGIES == simulator.TOPOLOGIES
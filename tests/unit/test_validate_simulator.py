@@ -0,0 +1,131 @@
+"""
+Unit tests for the simulated mesh backend.
+
+The whole framework runs against SimulatedTransport; no network access is
+required.
+"""
+
+from typing import Generator
+
+import pytest
+
+from validate.checks import batman, performance
+from validate.config import NODES
+from validate.core import executor, health
+from validate.core.results import CheckStatus, Tier
+from validate.core.runner import create_runner
+from validate.core.simulator import SimulatedMesh, SimulatedTransport, simulate
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+class TestSimulatedMesh:
+    """Tests for topology construction and fault injection."""
+
+    def test_ring_neighbors(self) -> None:
+        mesh = SimulatedMesh(size=10)
+        peers = {peer for _, peer, _ in mesh.neighbors("node1")}
+        assert peers == {"node2", "node10"}
+
+    def test_full_topology_reaches_everyone(self) -> None:
+        mesh = SimulatedMesh(size=6, topology="full")
+        peers = {peer for _, peer, _ in mesh.neighbors("node1")}
+        assert peers == {f"node{n}" for n in range(2, 7)}
+
+    def test_unknown_topology(self) -> None:
+        with pytest.raises(ValueError):
+            SimulatedMesh(topology="star")
+
+    def test_node_ips_unique(self) -> None:
+        mesh = SimulatedMesh(size=600)
+        assert len({info.ip for info in mesh.node_infos().values()}) == 600
+
+    def test_routes_follow_failures(self) -> None:
+        mesh = SimulatedMesh(size=6, topology="line")
+        assert mesh.routes("node1")["node6"][2] == 5
+
+        mesh.fail_link("node3", "node4")
+        assert "node6" not in mesh.routes("node1")
+
+    def test_simulate_restores_nodes(self) -> None:
+        saved = dict(NODES)
+        previous = executor.get_transport()
+        with simulate(SimulatedMesh(size=20)) as transport:
+            assert len(NODES) == 20
+            assert executor.get_transport() is transport
+        assert NODES == saved
+        assert executor.get_transport() is previous
+
+
+class TestSimulatedTransport:
+    """Tests for synthesized command output."""
+
+    def test_batch_round_trip(self) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            results = executor.run_batch_on_node("node2", ["echo one", "false_cmd", "echo two"])
+        assert [(rc, out.strip()) for rc, out, _ in results] == [(0, "one"), (127, ""), (0, "two")]
+
+    def test_down_node_is_unreachable(self) -> None:
+        mesh = SimulatedMesh(size=3)
+        mesh.fail_node("node3")
+        with simulate(mesh):
+            rc, _, _ = executor.ssh_command(NODES["node3"].ip, "echo hi")
+        assert rc == 255
+
+    def test_fail_command(self) -> None:
+        mesh = SimulatedMesh(size=3)
+        mesh.fail_command("node1", "batctl n", rc=1, stderr="batctl: not found")
+        with simulate(mesh):
+            result = batman.check_neighbors()
+        assert result.nodes["node1"].status == CheckStatus.FAIL
+        assert result.nodes["node2"].status == CheckStatus.PASS
+
+    def test_failed_link_reduces_neighbors(self) -> None:
+        mesh = SimulatedMesh(size=5)
+        mesh.fail_link("node1", "node2")
+        with simulate(mesh):
+            result = batman.check_neighbors()
+        # One wired and one wireless neighbor per remaining peer
+        assert result.nodes["node1"].data["neighbor_count"] == 2
+        assert result.nodes["node3"].data["neighbor_count"] == 4
+
+    def test_loss_reported_by_stress_ping(self) -> None:
+        mesh = SimulatedMesh(size=3)
+        mesh.set_loss("node2", 20.0)
+        with simulate(mesh):
+            result = performance.check_stress_ping()
+        assert result.nodes["node2"].status == CheckStatus.FAIL
+        assert result.nodes["node2"].data["packet_loss_pct"] == 20.0
+        assert result.nodes["node1"].status == CheckStatus.PASS
+
+    def test_not_live(self) -> None:
+        assert not SimulatedTransport(SimulatedMesh()).live
+
+
+class TestSimulatedRuns:
+    """End-to-end runs of the framework against simulated meshes."""
+
+    def test_three_node_certification(self) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            result = create_runner(Tier.CERTIFICATION).run()
+        assert result.passed, [c.category for c in result.failed_check_list]
+
+    def test_fifty_node_standard(self) -> None:
+        with simulate(SimulatedMesh(size=50)):
+            result = create_runner(Tier.STANDARD).run()
+        assert result.passed, [c.category for c in result.failed_check_list]
+        assert len(result.phases[0].checks[0].nodes) == 50
+
+    def test_down_node_opens_circuit(self) -> None:
+        mesh = SimulatedMesh(size=10)
+        mesh.fail_node("node7")
+        with simulate(mesh):
+            result = create_runner(Tier.SMOKE).run(abort_on_phase1_fail=False)
+        assert not result.passed
+        assert "node7" in result.circuit_open_s
@@ -0,0 +1,143 @@
+"""
+Unit tests for per-node state snapshots.
+
+Snapshot collection is faked so no network access is required.
+"""
+
+from typing import Generator, List, Sequence, Tuple
+
+import pytest
+
+from validate.core import snapshot
+from validate.core.snapshot import NodeSnapshot
+
+IP_LINK = """\
+1: lo: <LOOPBACK,UP,LOWER_UP> mtu 65536 qdisc noqueue state UNKNOWN qlen 1000
+    link/loopback 00:00:00:00:00:00 brd 00:00:00:00:00:00
+7: lan3.100@lan3: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1536 qdisc noqueue
+    link/ether 02:11:22:33:44:03 brd ff:ff:ff:ff:ff:ff
+12: bat0: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc noqueue state UNKNOWN
+    link/ether 66:63:4c:66:e1:a4 brd ff:ff:ff:ff:ff:ff
+"""
+
+PS = """\
+  PID USER       VSZ STAT COMMAND
+    1 root      1660 S    /sbin/procd
+    3 root         0 IW   [kworker/0:0-eve]
+ 1234 root      1232 S    /usr/sbin/dnsmasq -C /var/etc/dnsmasq.conf.cfg01411c
+ 1300 root      3010 S    sshd: /usr/sbin/sshd -D [listener]
+12345 network   1024.5m SW< ubusd
+"""
+
+UCI = """\
+uhttpd.main=uhttpd
+uhttpd.main.listen_https='0.0.0.0:443' '[::]:443'
+dhcp.lan=dhcp
+dhcp.lan.interface='lan'
+"""
+
+LSMOD = """\
+batman_adv            167936  0
+cfg80211              245760  4 mt7915e,mt76_connac_lib,mt76,mac80211
+"""
+
+
+def make_snapshot() -> NodeSnapshot:
+    """Build a snapshot from canned command output."""
+    return NodeSnapshot(
+        node="node1",
+        outputs={
+            "links": (0, IP_LINK, ""),
+            "processes": (0, PS, ""),
+            "uci": (0, UCI, ""),
+            "modules": (0, LSMOD, ""),
+        },
+    )
+
+
+class TestNodeSnapshot:
+    """Tests for snapshot accessors."""
+
+    def test_link_block(self) -> None:
+        """Look up a single interface's ip link block."""
+        snap = make_snapshot()
+        bat0 = snap.link("bat0")
+        assert bat0 is not None
+        assert "link/ether 66:63:4c:66:e1:a4" in bat0
+        assert snap.link("lan3.100") is not None
+        assert snap.link("mesh0") is None
+
+    def test_process_running(self) -> None:
+        """Match processes like pgrep and pgrep -x."""
+        snap = make_snapshot()
+        assert snap.process_running("dnsmasq")
+        assert snap.process_running("sshd", exact=False)
+        assert not snap.process_running("dropbear", exact=False)
+        assert not snap.process_running("dnsm")
+        # A wide VSZ pushes STAT under the COMMAND header
+        assert snap.process_running("ubusd")
+
+    def test_uci(self) -> None:
+        """Read UCI packages and values."""
+        snap = make_snapshot()
+        assert len(snap.uci_lines("dhcp")) == 2
+        assert snap.uci_get("uhttpd.main.listen_https") is not None
+        assert snap.uci_get("uhttpd.main.missing") is None
+
+    def test_module_loaded(self) -> None:
+        """Detect loaded kernel modules."""
+        snap = make_snapshot()
+        assert snap.module_loaded("batman_adv")
+        assert not snap.module_loaded("batman")
+
+    def test_missing_key(self) -> None:
+        """Unknown keys return an error tuple."""
+        rc, _, stderr = make_snapshot().get("nope")
+        assert rc == -1
+        assert "nope" in stderr
+
+
+@pytest.fixture
+def batch_calls(monkeypatch: pytest.MonkeyPatch) -> Generator[List[str], None, None]:
+    """Fake run_batch_on_node and record which nodes were queried."""
+    calls: List[str] = []
+
+    def fake(node: str, commands: Sequence[str], timeout: int = 30) -> List[Tuple[int, str, str]]:
+        calls.append(node)
+        return [(0, "", "") for _ in commands]
+
+    monkeypatch.setattr("validate.core.executor.run_batch_on_node", fake)
+    snapshot.clear_snapshots()
+    yield calls
+    snapshot.clear_snapshots()
+
+
+class TestSnapshotCache:
+    """Tests for the shared snapshot cache."""
+
+    def test_collected_once(self, batch_calls: List[str]) -> None:
+        """Repeated reads share one remote call per node."""
+        first = snapshot.get_snapshot("node1")
+        second = snapshot.get_snapshot("node1")
+        snapshot.get_snapshot("node2")
+
+        assert first is second
+        assert batch_calls == ["node1", "node2"]
+        assert set(first.outputs) == set(snapshot.SNAPSHOT_COMMANDS)
+
+    def test_refresh(self, batch_calls: List[str]) -> None:
+        """Refresh replaces the cached snapshot."""
+        old = snapshot.get_snapshot("node1")
+        new = snapshot.refresh_snapshot("node1")
+
+        assert new is not old
+        assert snapshot.get_snapshot("node1") is new
+        assert batch_calls == ["node1", "node1"]
+
+    def test_clear(self, batch_calls: List[str]) -> None:
+        """Clearing forces a new collection."""
+        snapshot.get_snapshot("node1")
+        snapshot.clear_snapshots()
+        snapshot.get_snapshot("node1")
+
+        assert batch_calls == ["node1", "node1"]
@@ -0,0 +1,108 @@
+"""
+Unit tests for the JSON Lines reporter and live event streams.
+"""
+
+import io
+import json
+import socket
+import urllib.request
+from pathlib import Path
+from typing import Generator, List
+
+import pytest
+
+from validate.__main__ import run_live
+from validate.core import health
+from validate.core.results import Tier
+from validate.core.runner import create_runner
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.reporters.jsonl import JSONLReporter
+from validate.reporters.stream import SSEStream, UnixSocketStream
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+class TestJSONLReporter:
+    """Tests for live JSON Lines output."""
+
+    def test_events_in_run_order(self) -> None:
+        output = io.StringIO()
+        lines: List[str] = []
+        reporter = JSONLReporter(output=output, sinks=[lines.append])
+        with simulate(SimulatedMesh(size=3)):
+            result = run_live(create_runner(Tier.SMOKE), [reporter], abort_on_phase1_fail=True)
+
+        events = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [e["seq"] for e in events] == list(range(1, len(events) + 1))
+        assert lines == output.getvalue().splitlines()
+        kinds = [e["event"] for e in events]
+        assert kinds[:2] == ["run_start", "phase_start"]
+        assert kinds[-1] == "summary"
+        assert kinds.count("check") == result.total_checks
+        assert kinds.count("phase_start") == kinds.count("phase_end") == len(result.phases)
+        # Each phase's checks sit between its start and end
+        assert kinds.index("phase_end") > kinds.index("check")
+        assert events[-1]["result"] == "PASS" and "phases" not in events[-1]
+        phase_end = events[kinds.index("phase_end")]
+        assert phase_end["summary"]["total"] == len(result.phases[0].checks)
+
+    def test_flushes_each_event(self) -> None:
+        class Counting(io.StringIO):
+            flushes = 0
+
+            def flush(self) -> None:
+                self.flushes += 1
+
+        output = Counting()
+        reporter = JSONLReporter(output=output)
+        reporter.header(Tier.SMOKE)
+        reporter.phase_start(1, "Prerequisites")
+        assert output.flushes == 2
+
+
+class TestStreams:
+    """Tests for the Unix socket and server-sent-events streams."""
+
+    def test_unix_socket_replays_then_streams(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "events.sock")
+        stream = UnixSocketStream(path)
+        stream.publish('{"seq":1}')
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(path)
+        client.settimeout(5)
+        received = client.recv(4096)  # History arrives on connect
+        stream.publish('{"seq":2}')
+        stream.close()
+
+        while True:
+            chunk = client.recv(4096)
+            if not chunk:
+                break
+            received += chunk
+        client.close()
+        assert received.decode().splitlines() == ['{"seq":1}', '{"seq":2}']
+        assert not Path(path).exists()
+
+    def test_sse(self) -> None:
+        stream = SSEStream(port=0)
+        stream.publish('{"event":"check","seq":7}')
+        response = urllib.request.urlopen(stream.url, timeout=5)
+        assert response.headers["Content-Type"] == "text/event-stream"
+        stream.close()
+        body = response.read().decode()
+        assert 'id: 7\ndata: {"event":"check","seq":7}\n\n' in body
+        assert body.endswith("event: end\ndata: {}\n\n")
+
+    def test_sse_unknown_path(self) -> None:
+        stream = SSEStream(port=0)
+        try:
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(stream.url.replace("/events", "/"), timeout=5)
+        finally:
+            stream.close()
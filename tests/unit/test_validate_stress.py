@@ -0,0 +1,120 @@
+"""
+Unit tests for streaming ping-soak analysis and the stress check.
+"""
+
+from typing import Generator, List, Optional, Tuple
+
+import pytest
+
+from validate.checks import performance
+from validate.core import health
+from validate.core.results import CheckStatus
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.core.stress import MAX_WINDOWS, StressAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+def _analyze(pattern: str, interval_s: float = 0.1, rtt: float = 1.0) -> StressAnalyzer:
+    """Feed a pattern of outcomes ("." reply, "x" lost) in order."""
+    analysis = StressAnalyzer(interval_s)
+    for seq, outcome in enumerate(pattern):
+        analysis.add(seq, rtt if outcome == "." else None)
+    analysis.finish(len(pattern))
+    return analysis
+
+
+class TestStressAnalyzer:
+    """Tests for StressAnalyzer."""
+
+    def test_spread_vs_burst(self) -> None:
+        spread = _analyze(("." * 19 + "x") * 5)
+        burst = _analyze("." * 50 + "x" * 5 + "." * 45)
+        assert spread.loss_pct == burst.loss_pct == 5.0
+        assert spread.bursts == {1: 5}
+        assert spread.longest_outage_ms == pytest.approx(100)
+        assert burst.bursts == {5: 1}
+        assert burst.longest_outage_ms == pytest.approx(500)
+
+    def test_trailing_burst_closed_by_finish(self) -> None:
+        analysis = _analyze("...xxx")
+        assert analysis.longest_burst == 3
+        assert analysis.summary()["loss_bursts"] == 1
+
+    def test_reorders_outcomes(self) -> None:
+        analysis = StressAnalyzer(0.1)
+        outcomes: List[Tuple[int, Optional[float]]] = [
+            (1, 1.0),
+            (2, 1.0),
+            (0, None),
+            (4, 1.0),
+            (3, None),
+        ]
+        for seq, rtt in outcomes:
+            analysis.add(seq, rtt)
+        analysis.finish(5)
+        assert (analysis.sent, analysis.received) == (5, 3)
+        assert analysis.bursts == {1: 2}
+
+    def test_unreported_packets_are_lost(self) -> None:
+        analysis = StressAnalyzer(0.1)
+        analysis.add(0, 1.0)
+        analysis.add(2, 1.0)
+        analysis.finish(5)
+        assert (analysis.sent, analysis.received) == (5, 2)
+        assert analysis.bursts == {1: 1, 2: 1}
+
+    def test_histogram_percentiles(self) -> None:
+        analysis = StressAnalyzer(0.1)
+        for seq in range(100):
+            analysis.add(seq, 0.3 if seq < 90 else 40.0)
+        analysis.finish()
+        assert analysis.percentile(50) == 0.5
+        assert analysis.percentile(99) == 40.0
+        assert analysis.summary()["rtt_histogram"] == {"<=0.5ms": 90, "<=50ms": 10}
+
+    def test_windows_stay_bounded(self) -> None:
+        analysis = StressAnalyzer(0.01, window_packets=10)
+        for seq in range(10000):
+            analysis.add(seq, 1.0 + seq / 1000)
+        analysis.finish()
+        trend = analysis.trend()
+        assert len(trend) <= MAX_WINDOWS
+        assert sum(w.sent for w in analysis.windows) == 10000
+        assert trend[-1]["avg_ms"] > trend[0]["avg_ms"]
+        # 1 ms per 1000 packets at 100 pps: 6 ms per minute
+        assert analysis.rtt_slope_ms_per_min == pytest.approx(6.0)
+
+
+class TestCheckStressPing:
+    """Tests for performance.stress on a simulated mesh."""
+
+    def test_outage_fails_despite_low_loss(self) -> None:
+        mesh = SimulatedMesh(size=3)
+        mesh.set_loss("node2", 5.0, burst=True)
+        mesh.set_loss("node3", 5.0)
+        with simulate(mesh):
+            result = performance.check_stress_ping()
+        node2, node3 = result.nodes["node2"], result.nodes["node3"]
+        assert node2.status == CheckStatus.FAIL
+        assert "500ms outage" in node2.message
+        assert node2.data["burst_lengths"] == {"5": 1}
+        assert node3.status == CheckStatus.PASS
+        assert node3.data["packet_loss_pct"] == 5.0
+        assert node3.data["loss_bursts"] > 1
+
+    def test_configurable_duration_and_rate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(performance, "STRESS_DURATION_S", 30)
+        monkeypatch.setattr(performance, "STRESS_RATE_PPS", 20)
+        with simulate(SimulatedMesh(size=2)):
+            result = performance.check_stress_ping()
+        assert result.status == CheckStatus.PASS
+        data = result.nodes["node1"].data
+        assert data["packets_sent"] == data["ping_count"] == 600
+        assert data["trend"][0]["start_s"] == 0.0
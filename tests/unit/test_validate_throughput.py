@@ -0,0 +1,234 @@
+"""
+Unit tests for the iperf3 throughput matrix engine.
+
+Measurements run against the simulated mesh or a stub; no network access
+is required.
+"""
+
+import asyncio
+import json
+from typing import Generator, List, Set, Tuple
+
+import pytest
+
+from validate.checks import performance
+from validate.core import health, throughput
+from validate.core.engine import run_sync
+from validate.core.results import CheckStatus
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.core.throughput import (
+    HOST,
+    JobQueue,
+    Measurement,
+    ThroughputJob,
+    parse_iperf_json,
+    plan_jobs,
+    run_matrix,
+)
+from validate.core.topology import MeshGraph
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+def _ring(size: int) -> MeshGraph:
+    """Wired ring node1..nodeN."""
+    graph = MeshGraph()
+    for i in range(1, size + 1):
+        graph.add_link(f"node{i}", f"node{i % size + 1}", "lan3.100")
+    return graph
+
+
+def _iperf(mbps: float, **end: object) -> str:
+    """Minimal iperf3 -J output."""
+    return json.dumps(
+        {
+            "intervals": [{"sum": {"bits_per_second": mbps * 1e6}}] * 3,
+            "end": end
+            or {
+                "sum_sent": {"bits_per_second": mbps * 1e6, "retransmits": 2},
+                "sum_received": {"bits_per_second": mbps * 1e6},
+            },
+        }
+    )
+
+
+class TestPlan:
+    """Tests for job planning and scheduling."""
+
+    def test_pairs_and_host(self) -> None:
+        nodes = ["node1", "node2", "node3", "node4"]
+        jobs = plan_jobs(_ring(4), nodes, modes=["tcp", "udp"])
+        # 6 unordered pairs plus 4 host runs, per mode
+        assert len(jobs) == 20
+        assert sum(1 for job in jobs if job.client == HOST) == 8
+
+    def test_resources_cover_path(self) -> None:
+        jobs = plan_jobs(_ring(6), [f"node{i}" for i in range(1, 7)], modes=["tcp"])
+        across = next(job for job in jobs if job.key == "node1->node4/tcp")
+        links = {r for r in across.resources if r.startswith("link:")}
+        assert len(links) == 3
+        assert {"node1", "node4"} <= across.resources
+
+    def test_unknown_mode(self) -> None:
+        with pytest.raises(ValueError, match="warp"):
+            plan_jobs(_ring(3), ["node1"], modes=["warp"])
+
+    def test_disjoint_pairs_start_together(self) -> None:
+        jobs = plan_jobs(_ring(6), [f"node{i}" for i in range(1, 7)], ["tcp"], include_host=False)
+        ready = JobQueue(jobs).start()
+        assert len(ready) >= 2
+        for i, a in enumerate(ready):
+            for b in ready[i + 1 :]:
+                assert not a.resources & b.resources
+
+    def test_path_found_once_per_pair(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        graph = _ring(5)
+        calls: List[str] = []
+        path = graph.path
+        monkeypatch.setattr(graph, "path", lambda a, b: calls.append(a + b) or path(a, b))
+        jobs = plan_jobs(graph, [f"node{i}" for i in range(1, 6)], include_host=False)
+        assert len(calls) == 10 and len(jobs) == 10 * len(throughput.MODES)
+
+    def test_queue_wakes_waiting_jobs_in_order(self) -> None:
+        def job(client: str, server: str, *links: str) -> ThroughputJob:
+            resources = frozenset({client, server, *links})
+            return ThroughputJob(client=client, server=server, mode="tcp", resources=resources)
+
+        first, blocked, disjoint = job("a", "b", "ab"), job("a", "c", "ab"), job("d", "e")
+        again = ThroughputJob("a", "b", "udp", resources=first.resources)
+        queue = JobQueue([first, blocked, disjoint, again])
+        # A blocked job doesn't hold up later jobs that need none of its resources
+        assert queue.start() == [first, disjoint]
+        assert queue.release(disjoint) == []
+        # The earlier job wins what was freed; the same pair's next mode waits
+        assert queue.release(first) == [blocked]
+        assert queue.release(blocked) == [again]
+        assert queue.release(again) == [] and len(queue) == 0
+
+    def test_no_shared_link_at_runtime(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        active: List[Set[str]] = []
+        clashes: List[str] = []
+        peak = [0]
+
+        async def fake_measure(job: ThroughputJob, *args: int) -> Measurement:
+            for other in active:
+                if other & job.resources:
+                    clashes.append(job.key)
+            active.append(set(job.resources))
+            peak[0] = max(peak[0], len(active))
+            await asyncio.sleep(0.01)
+            active.remove(set(job.resources))
+            return Measurement(client=job.client, server=job.server, mode=job.mode, mbps=1.0)
+
+        monkeypatch.setattr(throughput, "_measure", fake_measure)
+        jobs = plan_jobs(_ring(8), [f"node{i}" for i in range(1, 9)], ["tcp", "bidir"])
+        matrix = run_sync(run_matrix(jobs))
+        assert clashes == []
+        assert peak[0] > 1
+        assert [m.client for m in matrix.measurements] == [job.client for job in jobs]
+
+
+class TestMeasure:
+    """Tests for running one measurement."""
+
+    def _script(self, monkeypatch: pytest.MonkeyPatch, refusals: int) -> List[str]:
+        """Stub commands: the client is refused the first times, then gets through."""
+        commands: List[str] = []
+
+        async def on_node(node: str, command: str, timeout: int = 30) -> Tuple[int, str, str]:
+            commands.append(command)
+            if not command.startswith("iperf3 -c"):
+                return 0, "", ""
+            if commands.count(command) <= refusals:
+                return 1, json.dumps({"error": "unable to connect: Connection refused"}), ""
+            return 0, _iperf(500), ""
+
+        monkeypatch.setattr(throughput, "run_on_node_async", on_node)
+        monkeypatch.setattr(throughput, "CONNECT_RETRY_S", 0)
+        return commands
+
+    def _measure(self) -> Measurement:
+        job = ThroughputJob(client="node1", server="node2", mode="tcp")
+        with simulate(SimulatedMesh(size=3)):
+            return run_sync(throughput._measure(job, 1, 1, 1))
+
+    def test_client_retried_until_server_listens(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        commands = self._script(monkeypatch, refusals=2)
+        measurement = self._measure()
+        assert measurement.ok and measurement.mbps == 500
+        assert sum(c.startswith("iperf3 -c") for c in commands) == 3
+        assert not any(c.startswith("kill") for c in commands)
+
+    def test_server_stopped_when_client_never_connects(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        commands = self._script(monkeypatch, refusals=99)
+        measurement = self._measure()
+        assert not measurement.ok and "Connection refused" in measurement.error
+        assert sum(c.startswith("iperf3 -c") for c in commands) == throughput.CONNECT_ATTEMPTS
+        assert commands[-1].startswith(f"kill $(cat {throughput.IPERF_PIDFILE})")
+
+
+class TestParse:
+    """Tests for iperf3 JSON parsing."""
+
+    def test_tcp(self) -> None:
+        m = parse_iperf_json(_iperf(912.5), Measurement("node1", "node2", "tcp"))
+        assert m.mbps == 912.5
+        assert m.samples == [912.5] * 3
+        assert m.retransmits == 2
+
+    def test_bidir(self) -> None:
+        output = _iperf(
+            900,
+            sum_received={"bits_per_second": 9e8},
+            sum_received_bidir_reverse={"bits_per_second": 8e8},
+        )
+        m = parse_iperf_json(output, Measurement("node1", "node2", "bidir"))
+        assert (m.mbps, m.reverse_mbps) == (900.0, 800.0)
+
+    def test_udp(self) -> None:
+        output = _iperf(100, sum={"bits_per_second": 1e8, "jitter_ms": 0.2, "lost_percent": 1.5})
+        m = parse_iperf_json(output, Measurement("node1", "node2", "udp"))
+        assert (m.mbps, m.jitter_ms, m.lost_pct) == (100.0, 0.2, 1.5)
+
+    def test_error(self) -> None:
+        m = parse_iperf_json('{"error": "unable to connect"}', Measurement("a", "b", "tcp"))
+        assert not m.ok
+        assert m.error == "unable to connect"
+        assert not parse_iperf_json("", Measurement("a", "b", "tcp")).ok
+
+
+class TestCheckThroughput:
+    """Tests for the performance.throughput check on a simulated mesh."""
+
+    def test_ring_passes(self) -> None:
+        with simulate(SimulatedMesh(size=4)):
+            result = performance.check_throughput()
+        assert result.status == CheckStatus.PASS
+        matrix = result.data["matrix"]
+        assert matrix["tcp"]["node1"]["node3"] > 400
+        assert matrix["bidir"]["node3"]["node1"] > 400  # Reverse direction
+        assert result.data["measurements"][0]["samples"]
+
+    def test_below_threshold_fails(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(performance.THRESHOLDS, "min_wired_mbps", 2000)
+        with simulate(SimulatedMesh(size=3)):
+            result = performance.check_throughput()
+        assert result.status == CheckStatus.FAIL
+        assert "below 2000" in result.nodes["node1"].message
+
+    def test_unreachable_node_fails(self) -> None:
+        mesh = SimulatedMesh(size=4, wireless_hops=0)
+        mesh.fail_link("node1", "node2")
+        mesh.fail_link("node1", "node4")
+        with simulate(mesh):
+            result = performance.check_throughput()
+        assert result.nodes["node1"].status == CheckStatus.FAIL
+        assert result.nodes["node3"].status == CheckStatus.FAIL
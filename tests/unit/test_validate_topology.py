@@ -0,0 +1,208 @@
+"""
+Unit tests for the mesh topology graph and redundancy analysis.
+
+Graphs are built by hand or from a simulated mesh; no network access is
+required.
+"""
+
+import random
+from typing import Generator, List, Set, Tuple
+
+import pytest
+
+from validate.checks import failover
+from validate.core import health
+from validate.core.results import CheckStatus
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.core.topology import (
+    MAX_EDGE_CONNECTIVITY,
+    WIRED,
+    WIRELESS,
+    MeshGraph,
+    build_topology,
+    link_kind,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test clean circuit state."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+def _graph(edges: List[Tuple[str, str]]) -> MeshGraph:
+    """Build a graph with one wired link per edge."""
+    graph = MeshGraph()
+    for a, b in edges:
+        graph.add_link(a, b, "lan3.100")
+    return graph
+
+
+def _ring(size: int) -> List[Tuple[str, str]]:
+    """Edges of a ring of size nodes."""
+    return [(f"n{i}", f"n{(i + 1) % size}") for i in range(size)]
+
+
+class TestRedundancy:
+    """Tests for bridges, articulation points and edge connectivity."""
+
+    def test_ring(self) -> None:
+        graph = _graph(_ring(6))
+        assert graph.bridges() == []
+        assert graph.articulation_points() == set()
+        assert graph.edge_connectivity() == 2
+        # Any two ring links form a cut: one group holding all six
+        assert [len(group) for group in graph.analyze().cut_groups] == [6]
+
+    def test_line(self) -> None:
+        graph = _graph([("a", "b"), ("b", "c"), ("c", "d")])
+        assert len(graph.bridges()) == 3
+        assert graph.articulation_points() == {"b", "c"}
+        assert graph.edge_connectivity() == 1
+
+    def test_bowtie(self) -> None:
+        # Two triangles sharing node c: no bridges, one cut vertex
+        graph = _graph([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "e"), ("e", "c")])
+        assert graph.bridges() == []
+        assert graph.articulation_points() == {"c"}
+        assert graph.edge_connectivity() == 2
+        # Each triangle is its own cut group
+        groups = graph.analyze().cut_groups
+        assert sorted(sorted(link.label for link in group) for group in groups) == [
+            sorted(link.label for link in graph.links[:3]),
+            sorted(link.label for link in graph.links[3:]),
+        ]
+
+    def test_parallel_links_are_not_bridges(self) -> None:
+        graph = _graph([("a", "b")])
+        graph.add_link("a", "b", "mesh0")
+        assert graph.bridges() == []
+        assert graph.edge_connectivity() == 2
+
+    def test_complete_graph(self) -> None:
+        nodes = [f"n{i}" for i in range(5)]
+        graph = _graph([(a, b) for i, a in enumerate(nodes) for b in nodes[i + 1 :]])
+        assert graph.edge_connectivity() == MAX_EDGE_CONNECTIVITY
+        assert graph.analyze().cut_groups == []
+
+    def test_disconnected(self) -> None:
+        graph = _graph([("a", "b"), ("b", "c"), ("c", "a")])
+        graph.add_node("lonely")
+        assert not graph.is_connected()
+        assert graph.edge_connectivity() == 0
+        assert len(graph.analyze().components) == 2
+
+    def test_self_loop_ignored(self) -> None:
+        graph = MeshGraph(["a"])
+        assert graph.add_link("a", "a", "mesh0") is None
+        assert graph.edge_connectivity() == 0
+
+    def test_deep_line_no_recursion_limit(self) -> None:
+        graph = _graph([(f"n{i}", f"n{i + 1}") for i in range(5000)])
+        assert len(graph.bridges()) == 5000
+
+    def test_matches_brute_force(self) -> None:
+        rng = random.Random(7)
+        for _ in range(30):
+            nodes = [f"n{i}" for i in range(8)]
+            edges = [(a, b) for a in nodes for b in nodes if a < b and rng.random() < 0.35]
+            graph = _graph(edges)
+            expected = {link.id for link in graph.links if not _connected_without(graph, {link.id})}
+            assert {link.id for link in graph.bridges()} == expected
+
+
+def _connected_without(graph: MeshGraph, failed: Set[int]) -> bool:
+    """Brute-force connectivity check with some links removed."""
+    nodes = graph.nodes
+    seen = {nodes[0]}
+    stack = [nodes[0]]
+    while stack:
+        for peer, link in graph.neighbors(stack.pop()):
+            if link.id not in failed and peer not in seen:
+                seen.add(peer)
+                stack.append(peer)
+    return len(seen) == len(nodes)
+
+
+class TestPaths:
+    """Tests for best and alternate path costs."""
+
+    def test_costs_from_metrics(self) -> None:
+        graph = MeshGraph()
+        iv = graph.add_link("a", "b", "lan3.100", tq=255)
+        v = graph.add_link("a", "c", "mesh0", throughput_mbit=500.0)
+        assert iv is not None and v is not None
+        assert iv.cost == pytest.approx(1.0)
+        assert v.cost == pytest.approx(2.0)
+        assert (iv.kind, v.kind) == (WIRED, WIRELESS)
+
+    def test_alternate_path(self) -> None:
+        graph = _graph(_ring(4))
+        costs = graph.path_costs("n0")
+        assert costs["n1"].cost == 1.0
+        assert costs["n1"].first_hop == "n1"
+        assert costs["n1"].alternate_cost == 3.0
+        assert costs["n2"].hops == 2
+
+    def test_no_alternate_over_bridge(self) -> None:
+        costs = _graph([("a", "b"), ("b", "c")]).path_costs("a")
+        assert costs["c"].alternate_cost is None
+
+    def test_link_kind(self) -> None:
+        assert link_kind("lan4.100") == WIRED
+        assert link_kind("phy0-mesh0") == WIRELESS
+        assert link_kind("bat0") == "other"
+
+
+class TestBuildTopology:
+    """Tests for building the graph from simulated snapshots."""
+
+    def test_ring_with_wireless(self) -> None:
+        with simulate(SimulatedMesh(size=6)):
+            graph = build_topology()
+        # Six wired plus six wireless ring links, each seen from both ends once
+        assert len(graph.links) == 12
+        assert {link.kind for link in graph.links} == {WIRED, WIRELESS}
+        assert all(link.tq for link in graph.links)
+        assert graph.edge_connectivity() == MAX_EDGE_CONNECTIVITY
+
+    def test_cached_per_snapshot(self) -> None:
+        with simulate(SimulatedMesh(size=4)):
+            assert build_topology() is build_topology()
+
+    def test_failed_link_becomes_bridge(self) -> None:
+        mesh = SimulatedMesh(size=5, wireless_hops=0)
+        mesh.fail_link("node1", "node2")
+        with simulate(mesh):
+            graph = build_topology()
+        assert len(graph.bridges()) == 4
+        assert graph.articulation_points() == {"node3", "node4", "node5"}
+
+
+class TestFailoverChecks:
+    """Tests for the topology-aware failover checks."""
+
+    def test_ring_passes(self) -> None:
+        with simulate(SimulatedMesh(size=8, wireless_hops=0)):
+            link = failover.check_link_failover()
+            node = failover.check_node_failover()
+        assert link.status == CheckStatus.PASS
+        assert link.data["edge_connectivity"] == 2
+        assert "2-edge-connected" in link.message
+        # Losing the link to a neighbor sends traffic the long way round the ring
+        assert all(n.data["alternate_cost_delta"] > 0 for n in link.nodes.values())
+        assert node.status == CheckStatus.PASS
+
+    def test_line_fails_on_bridges(self) -> None:
+        with simulate(SimulatedMesh(size=4, topology="line", wireless_hops=0)):
+            link = failover.check_link_failover()
+            node = failover.check_node_failover()
+        # Interior nodes have two neighbors yet every link is critical
+        assert link.status == CheckStatus.FAIL
+        assert len(link.data["bridges"]) == 3
+        assert link.nodes["node2"].status == CheckStatus.FAIL
+        assert "alternate_cost_delta" not in link.nodes["node2"].data
+        assert node.status == CheckStatus.FAIL
+        assert node.data["articulation_points"] == ["node2", "node3"]
@@ -0,0 +1,144 @@
+"""
+Unit tests for record/replay transports.
+
+A scripted transport stands in for SSH so no network access is required.
+"""
+
+import time
+from pathlib import Path
+from typing import Generator, List, Tuple
+
+import pytest
+
+from validate.core import executor, health
+from validate.core.transport import (
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+    load_recording,
+)
+
+
+class ScriptedTransport(Transport):
+    """Answers with the local shell, counting calls."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str]] = []
+
+    async def ssh(self, node_ip: str, command: str, timeout: int) -> Tuple[int, str, str]:
+        self.calls.append((node_ip, command))
+        return await self.local(command, timeout)
+
+    async def local(self, command: str, timeout: int) -> Tuple[int, str, str]:
+        from validate.core.engine import run_process
+
+        return await run_process(command, timeout=timeout, shell=True)
+
+
+@pytest.fixture
+def restore_transport() -> Generator[None, None, None]:
+    """Put the live transport back after the test."""
+    previous = executor.get_transport()
+    health.reset_circuits()
+    yield
+    executor.set_transport(previous)
+
+
+def _record(path: Path) -> List[object]:
+    """Run a fixed set of commands under a RecordingTransport."""
+    recorder = RecordingTransport(ScriptedTransport(), str(path))
+    executor.set_transport(recorder)
+    results: List[object] = [
+        executor.run_on_node("node1", "echo one"),
+        executor.run_batch_on_node("node2", ["echo a", "echo b >&2; exit 2"]),
+        executor.run_local("echo local"),
+    ]
+    recorder.close()
+    return results
+
+
+class TestRecordReplay:
+    """Round trips through a recording."""
+
+    @pytest.mark.parametrize("name", ["run.jsonl", "run.jsonl.gz"])
+    def test_round_trip(self, tmp_path: Path, restore_transport: None, name: str) -> None:
+        """Replay returns exactly what was recorded, including batches."""
+        path = tmp_path / name
+        recorded = _record(path)
+
+        executor.set_transport(ReplayTransport(str(path)))
+        replayed = [
+            executor.run_on_node("node1", "echo one"),
+            executor.run_batch_on_node("node2", ["echo a", "echo b >&2; exit 2"]),
+            executor.run_local("echo local"),
+        ]
+
+        assert replayed == recorded
+        assert recorded[1] == [(0, "a\n", ""), (2, "", "b\n")]
+
+    def test_batch_token_normalized(self, tmp_path: Path, restore_transport: None) -> None:
+        """The random batch framing token is not stored in the recording."""
+        path = tmp_path / "run.jsonl"
+        _record(path)
+
+        assert "__VALIDATE_TOKEN" in path.read_text()
+        assert len(load_recording(str(path))) == 3
+
+    def test_repeated_commands_in_order(self, tmp_path: Path, restore_transport: None) -> None:
+        """Repeats get their results in recorded order, then the last one."""
+        path = tmp_path / "run.jsonl"
+        counter = tmp_path / "n"
+        recorder = RecordingTransport(ScriptedTransport(), str(path))
+        executor.set_transport(recorder)
+        for i in range(2):
+            counter.write_text(f"{i}\n")
+            executor.run_local(f"cat {counter}")
+        recorder.close()
+
+        executor.set_transport(ReplayTransport(str(path)))
+        outputs = [executor.run_local(f"cat {counter}")[1] for _ in range(3)]
+
+        assert outputs == ["0\n", "1\n", "1\n"]
+
+    def test_unknown_command(self, tmp_path: Path, restore_transport: None) -> None:
+        """Commands missing from the recording fail without running."""
+        path = tmp_path / "run.jsonl"
+        _record(path)
+        executor.set_transport(ReplayTransport(str(path)))
+
+        rc, _, stderr = executor.run_local("echo never-recorded")
+
+        assert rc == -1
+        assert "No recording" in stderr
+
+    def test_paced_replay(self, tmp_path: Path, restore_transport: None) -> None:
+        """With a speed set, replay waits for the scaled recorded duration."""
+        path = tmp_path / "run.jsonl"
+        recorder = RecordingTransport(ScriptedTransport(), str(path))
+        executor.set_transport(recorder)
+        executor.run_local("sleep 0.2")
+        recorder.close()
+
+        executor.set_transport(ReplayTransport(str(path), speed=2.0))
+        start = time.time()
+        executor.run_local("sleep 0.2")
+
+        assert 0.08 <= time.time() - start < 0.2
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        """A file without the recording header is refused."""
+        path = tmp_path / "other.jsonl"
+        path.write_text('{"hello": 1}\n')
+
+        with pytest.raises(ValueError, match="Not a validation recording"):
+            ReplayTransport(str(path))
+
+    def test_incomplete_transport_rejected(self) -> None:
+        """A transport missing local() fails when constructed, not mid-run."""
+
+        class SshOnly(Transport):
+            async def ssh(self, node_ip: str, command: str, timeout: int) -> Tuple[int, str, str]:
+                return 0, "", ""
+
+        with pytest.raises(TypeError, match="local"):
+            SshOnly()  # type: ignore[abstract]
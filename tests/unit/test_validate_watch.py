@@ -0,0 +1,145 @@
+"""
+Unit tests for watch mode (routing-state polls and change events).
+"""
+
+import json
+import threading
+from typing import Generator, List, Set, Tuple
+
+import pytest
+
+from validate.__main__ import main, parse_duration
+from validate.core import health
+from validate.core.results import Tier
+from validate.core.simulator import SimulatedMesh, simulate
+from validate.core.watch import CRITICAL, NodeState, Watcher, WatchEvent, diff_states
+from validate.reporters.jsonl import JSONLReporter
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuits() -> Generator[None, None, None]:
+    """Give every test closed circuits."""
+    health.reset_circuits()
+    yield
+    health.reset_circuits()
+
+
+def _kinds(events: List[WatchEvent]) -> Set[Tuple[str, str]]:
+    """(node, kind) of each event."""
+    return {(event.node, event.kind) for event in events}
+
+
+class TestWatcher:
+    """Tests for polling the simulated mesh."""
+
+    def test_steady_mesh_is_quiet(self) -> None:
+        events: List[WatchEvent] = []
+        with simulate(SimulatedMesh(size=4)):
+            watcher = Watcher(10, events.append, full_tier=None)
+            for _ in range(3):
+                watcher.poll()
+        assert events == [] and watcher.polls == 3
+
+    def test_node_failure_and_recovery(self) -> None:
+        mesh = SimulatedMesh(size=5)
+        with simulate(mesh):
+            watcher = Watcher(10, lambda _: None, full_tier=None)
+            watcher.poll()
+            mesh.fail_node("node1")
+            down = watcher.poll()
+            mesh.restore_node("node1")
+            health.reset_circuits()
+            up = watcher.poll()
+        assert [e.severity for e in down if e.node == "node1"] == [CRITICAL]
+        kinds = _kinds(down)
+        assert {
+            ("node1", "node_down"),
+            ("node5", "neighbor_lost"),
+            ("node5", "gateway_switch"),
+        } <= kinds
+        switch = next(e for e in down if (e.node, e.kind) == ("node5", "gateway_switch"))
+        assert switch.message == "gateway switched from node1 to node3"
+        assert {("node1", "node_up"), ("node5", "neighbor_found")} <= _kinds(up)
+
+    def test_link_and_bat0_changes(self) -> None:
+        mesh = SimulatedMesh(size=5)
+        with simulate(mesh):
+            watcher = Watcher(10, lambda _: None, full_tier=None, tq_drop=50)
+            watcher.poll()
+            mesh.fail_link("node2", "node3")
+            mesh.fail_command("node4", "ip link show bat0", rc=1)
+            events = watcher.poll()
+        kinds = _kinds(events)
+        assert {("node2", "neighbor_lost"), ("node2", "tq_drop"), ("node4", "bat0_down")} <= kinds
+        lost = [e.message for e in events if (e.node, e.kind) == ("node2", "neighbor_lost")]
+        assert lost == ["lost neighbor node3 on lan4.100", "lost neighbor node3 on mesh0"]
+
+    def test_full_runs_report_check_changes(self) -> None:
+        mesh = SimulatedMesh(size=3)
+        events: List[WatchEvent] = []
+        with simulate(mesh):
+            watcher = Watcher(10, events.append, full_tier=Tier.SMOKE, full_interval_s=600)
+            assert watcher.exporter is not None
+            watcher.exporter.run_once()
+            assert events == []
+            mesh.fail_node("node2")
+            watcher.exporter.run_once()
+            failed = [e for e in events if e.kind == "check_failed"]
+            mesh.restore_node("node2")
+            health.reset_circuits()
+            watcher.exporter.run_once()
+        assert failed and all(e.node == "mesh" for e in failed)
+        assert {e.data["check"] for e in events if e.kind == "check_recovered"} == {
+            e.data["check"] for e in failed
+        }
+
+    def test_serve_stops_after_polls(self) -> None:
+        with simulate(SimulatedMesh(size=3)):
+            watcher = Watcher(0.01, lambda _: None, full_tier=Tier.SMOKE)
+            watcher.serve(threading.Event(), polls=3)
+            assert watcher.exporter is not None
+            assert watcher.polls == 3 and watcher.exporter.states()[0].runs == 1
+
+
+class TestDiff:
+    """Tests for comparing two polls."""
+
+    def test_tq_drop_threshold(self) -> None:
+        prev = NodeState(reachable=True, originators={"aa": (255, "bb"), "cc": (200, "bb")})
+        cur = NodeState(reachable=True, originators={"aa": (230, "bb"), "cc": (100, "bb")})
+        events = diff_states("node1", prev, cur, names={"cc": "node3"}, tq_drop=50)
+        assert [(e.kind, e.message) for e in events] == [
+            ("tq_drop", "TQ to node3 fell from 200 to 100")
+        ]
+
+    def test_unreadable_state_is_not_compared(self) -> None:
+        prev = NodeState(reachable=True, neighbors={("mesh0", "aa")}, gateway="gw", gateways={"gw"})
+        cur = NodeState(reachable=True)
+        assert diff_states("node1", prev, cur) == []
+        lost = NodeState(reachable=True, gateway=None, gateways=set())
+        assert [e.kind for e in diff_states("node1", prev, lost)] == ["gateway_lost"]
+
+
+class TestCommand:
+    """Tests for python -m validate watch."""
+
+    def test_parse_duration(self) -> None:
+        assert parse_duration("10s") == 10
+        assert parse_duration("15m") == 900
+        assert parse_duration("2h") == 7200
+        assert parse_duration("2.5") == 2.5
+        with pytest.raises(ValueError):
+            parse_duration("soon")
+
+    def test_watch_jsonl(self, capsys: pytest.CaptureFixture[str]) -> None:
+        argv = ["watch", "--simulate", "3", "--polls", "2", "--interval", "0.01s"]
+        assert main(argv + ["--full-interval", "0", "--jsonl"]) == 0
+        assert capsys.readouterr().out == ""  # Nothing changed
+
+    def test_change_event_line(self) -> None:
+        lines: List[str] = []
+        JSONLReporter(output=None, sinks=[lines.append]).watch_event(
+            WatchEvent("node2", "bat0_down", CRITICAL, "bat0 down")
+        )
+        event = json.loads(lines[0])
+        assert (event["event"], event["node"], event["kind"]) == ("change", "node2", "bat0_down")
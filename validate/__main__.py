@@ -6,16 +6,55 @@ Usage:
     python -m validate smoke
     python -m validate standard --json
     python -m validate comprehensive --verbose
+    python -m validate standard --record run.jsonl.gz
+    python -m validate standard --replay run.jsonl.gz
+    python -m validate certification --simulate 100
+    python -m validate certification --jsonl
+    python -m validate certification --stream-sse 8765
+    python -m validate history --check connectivity.ping --days 7
+    python -m validate export smoke standard:900 --listen 0.0.0.0:9812
+    python -m validate standard --incremental
+    python -m validate watch --interval 10s --full-interval 15m
+    python -m validate --list
+    python -m validate fleet alpha=sites/alpha/hosts.yml beta=sites/beta/hosts.yml
 """
 
 import argparse
+import json
 import sys
-from typing import List, Optional, Union
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from validate.core.results import CheckResult, PhaseResult, Tier
-from validate.core.runner import create_runner
-from validate.reporters.console import ConsoleReporter
-from validate.reporters.json import JSONReporter
+from validate.config import (
+    CHECK_BUDGET_S,
+    EXPORT_INTERVAL_S,
+    FLEET_SITE_INFLIGHT,
+    FLEET_WORKERS,
+    HISTORY_DB,
+    INCREMENTAL_MAX_AGE_S,
+    RESULT_CACHE,
+    WATCH_FULL_INTERVAL_S,
+    WATCH_INTERVAL_S,
+    WATCH_TQ_DROP,
+)
+from validate.core.results import CheckResult, PhaseResult, Tier, ValidationResult
+
+# Modules a command needs are imported where it runs, so that --list, --help
+# and a smoke run don't pay for the simulator, the history database or the
+# metrics server.
+if TYPE_CHECKING:
+    from validate.core.exporter import Exporter
+    from validate.core.history import HistoryStore
+    from validate.core.incremental import ResultCache
+    from validate.core.runner import ValidationRunner
+    from validate.core.transport import Transport
+    from validate.reporters.console import ConsoleReporter
+    from validate.reporters.jsonl import JSONLReporter
+    from validate.reporters.metrics import MetricsServer
+    from validate.reporters.stream import EventBroadcaster
+
+# Topologies of the simulated mesh (simulator.TOPOLOGIES, without importing it)
+TOPOLOGIES = ("ring", "line", "full")
 
 
 def parse_tier(tier_str: str) -> Tier:
@@ -35,6 +74,762 @@ def parse_tier(tier_str: str) -> Tier:
     return tier_map.get(tier_str.lower(), Tier.STANDARD)
 
 
+def configure_transport(args: argparse.Namespace) -> Optional["Transport"]:
+    """
+    Install a simulated, recording or replay transport if requested.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        The installed transport, or None to use live SSH.
+    """
+    import atexit
+    import contextlib
+
+    from validate.core.executor import get_transport, set_transport
+    from validate.core.simulator import SimulatedMesh, simulate
+    from validate.core.transport import RecordingTransport, ReplayTransport
+
+    transport: Optional[Transport] = None
+    if args.simulate:
+        # Kept active until exit; NODES is restored by the context manager
+        stack = contextlib.ExitStack()
+        mesh = SimulatedMesh(size=args.simulate, topology=args.sim_topology)
+        transport = stack.enter_context(simulate(mesh))
+        atexit.register(stack.close)
+
+    if args.replay:
+        transport = ReplayTransport(args.replay, speed=args.replay_speed)
+    elif args.record:
+        transport = RecordingTransport(get_transport(), args.record)
+
+    if transport is not None:
+        set_transport(transport)
+        atexit.register(transport.close)
+    return transport
+
+
+def open_streams(args: argparse.Namespace) -> List["EventBroadcaster"]:
+    """
+    Start the live event streams requested on the command line.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Started streams (closed at exit).
+
+    Raises:
+        OSError: If a socket or port cannot be bound.
+        ValueError: If --stream-sse is not [HOST:]PORT.
+    """
+    import atexit
+
+    from validate.reporters.stream import SSEStream, UnixSocketStream
+
+    streams: List[EventBroadcaster] = []
+    if args.stream_socket:
+        streams.append(UnixSocketStream(args.stream_socket))
+    if args.stream_sse:
+        host, _, port = args.stream_sse.rpartition(":")
+        sse = SSEStream(host or "127.0.0.1", int(port))
+        print(f"Streaming events at {sse.url}", file=sys.stderr)
+        streams.append(sse)
+    for stream in streams:
+        atexit.register(stream.close)
+    return streams
+
+
+LiveReporter = Union["ConsoleReporter", "JSONLReporter"]
+
+
+def run_live(
+    runner: "ValidationRunner", reporters: Sequence[LiveReporter], abort_on_phase1_fail: bool
+) -> ValidationResult:
+    """
+    Run validation, passing every event to each reporter as it happens.
+
+    Args:
+        runner: Configured runner.
+        reporters: Reporters to feed.
+        abort_on_phase1_fail: If True, abort if any Phase 1 check fails.
+
+    Returns:
+        The validation result.
+    """
+    for reporter in reporters:
+        reporter.header(runner.tier)
+
+    def on_phase_start(phase_num: int, name: str) -> None:
+        for reporter in reporters:
+            reporter.phase_start(phase_num, name)
+
+    def on_check_complete(check: CheckResult) -> None:
+        for reporter in reporters:
+            reporter.check_result(check)
+
+    def on_phase_complete(phase: PhaseResult) -> None:
+        for reporter in reporters:
+            reporter.phase_end(phase)
+
+    result = runner.run(
+        abort_on_phase1_fail=abort_on_phase1_fail,
+        on_check_complete=on_check_complete,
+        on_phase_complete=on_phase_complete,
+        on_phase_start=on_phase_start,
+    )
+
+    for reporter in reporters:
+        reporter.footer(result)
+    return result
+
+
+def open_cache(args: argparse.Namespace) -> Optional["ResultCache"]:
+    """
+    Open the result cache for an incremental run.
+
+    Live runs default to RESULT_CACHE; simulated and replayed runs need an
+    explicit --result-cache so their results never stand in for the real
+    mesh's.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        The cache, or None for a full run.
+
+    Raises:
+        ValueError: If --incremental is given for a non-live run without
+            --result-cache.
+    """
+    if not args.incremental:
+        return None
+    from validate.core.executor import get_transport
+    from validate.core.incremental import ResultCache
+
+    if not args.result_cache and not get_transport().live:
+        raise ValueError("--incremental on a simulated or replayed mesh needs --result-cache")
+    return ResultCache(args.result_cache or RESULT_CACHE, max_age_s=args.max_staleness)
+
+
+def save_cache(cache: Optional["ResultCache"]) -> None:
+    """
+    Write the result cache after an incremental run.
+
+    A cache that cannot be written only costs the next run its reuse, so
+    this warns instead of failing the run.
+
+    Args:
+        cache: The run's cache, or None for a full run.
+    """
+    if cache is None:
+        return
+    try:
+        cache.save()
+    except OSError as e:
+        print(f"Warning: result cache not saved: {e}", file=sys.stderr)
+
+
+def save_history(args: argparse.Namespace, result: ValidationResult) -> None:
+    """
+    Record a finished run in the history database.
+
+    Live runs are recorded unless --no-history is given; simulated and
+    replayed runs only with an explicit --history-db.
+
+    Args:
+        args: Parsed command line arguments.
+        result: The validation result.
+    """
+    import sqlite3
+
+    from validate.core.executor import get_transport
+    from validate.core.history import HistoryStore
+
+    if args.no_history or not (args.history_db or get_transport().live):
+        return
+    try:
+        store = HistoryStore(args.history_db or HISTORY_DB)
+        try:
+            store.record(result)
+        finally:
+            store.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: run not saved to history: {e}", file=sys.stderr)
+
+
+def history_trends(store: "HistoryStore", args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Trend series for the latest run's metrics matching the filters.
+
+    Args:
+        store: History to read.
+        args: Parsed history arguments (check, node, metric, days, tier).
+
+    Returns:
+        Dicts with category, node, metric and buckets.
+    """
+    latest = store.latest_run(args.tier)
+    if latest is None:
+        return []
+    since = time.time() - args.days * 86400
+    bucket_s = 3600 if args.days <= 2 else 86400
+    trends = []
+    for category, node, metric, _ in store.run_values(latest["id"]):
+        if (args.check and category != args.check) or (args.node and node != args.node):
+            continue
+        if args.metric and metric != args.metric:
+            continue
+        buckets = store.trend(metric, category, node, bucket_s, since, latest["tier"])
+        trends.append({"category": category, "node": node, "metric": metric, "buckets": buckets})
+    return trends
+
+
+def history_main(argv: List[str]) -> int:
+    """
+    Show recorded runs, trends and regressions (python -m validate history).
+
+    Args:
+        argv: Arguments after "history".
+
+    Returns:
+        Exit code (0, or 1 if the latest run regressed).
+    """
+    import sqlite3
+    from dataclasses import asdict
+
+    from validate.core.history import METRIC_BY_NAME, HistoryStore, find_regressions
+    from validate.reporters.history import HistoryReporter
+
+    parser = argparse.ArgumentParser(
+        prog="python -m validate history",
+        description="Show validation history, trends and regressions",
+    )
+    parser.add_argument(
+        "--db", default=HISTORY_DB, help=f"History database (default: {HISTORY_DB})"
+    )
+    parser.add_argument("--tier", help="Only runs of this tier (default: the latest run's)")
+    parser.add_argument("--check", metavar="CATEGORY", help="Trends for this check")
+    parser.add_argument("--node", help="Trends for this node")
+    parser.add_argument("--metric", choices=sorted(METRIC_BY_NAME), help="Trends for this metric")
+    parser.add_argument("--days", type=float, default=30, help="Trend window (default: 30)")
+    parser.add_argument("--runs", type=int, default=10, help="Recent runs to list (default: 10)")
+    parser.add_argument(
+        "--baseline", type=int, default=50, help="Runs in the rolling baseline (default: 50)"
+    )
+    parser.add_argument(
+        "--z", type=float, default=3.0, help="Robust z-score of a regression (default: 3)"
+    )
+    parser.add_argument(
+        "--min-samples",
+        type=int,
+        default=10,
+        help="Fewest baseline runs needed to judge a metric (default: 10)",
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    parser.add_argument("--no-color", action="store_true", help="Disable colored output")
+    args = parser.parse_args(argv)
+    if args.tier:
+        args.tier = parse_tier(args.tier).name.lower()
+
+    try:
+        store = HistoryStore(args.db)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    runs = store.runs(args.tier, args.runs)
+    regressions = find_regressions(
+        store, args.tier, baseline_runs=args.baseline, min_samples=args.min_samples, z=args.z
+    )
+    filtered = args.check or args.node or args.metric
+    trends = history_trends(store, args) if filtered else []
+    store.close()
+
+    if args.json:
+        data = {"runs": runs, "regressions": [asdict(r) for r in regressions], "trends": trends}
+        print(json.dumps(data, indent=2, default=str))
+    else:
+        reporter = HistoryReporter(output=sys.stdout, color=not args.no_color)
+        reporter.runs(runs)
+        if filtered:
+            reporter.trends(trends, "hourly" if args.days <= 2 else "daily")
+        reporter.regressions(regressions, args.baseline)
+    return 1 if regressions else 0
+
+
+def parse_schedule(specs: Sequence[str], interval_s: float) -> List[Tuple[Tier, float]]:
+    """
+    Parse exporter tiers of the form TIER[:SECONDS].
+
+    Args:
+        specs: Tier specifications (e.g. ["smoke:60", "standard"]).
+        interval_s: Interval for tiers without their own.
+
+    Returns:
+        (tier, interval) pairs.
+
+    Raises:
+        ValueError: If an interval is not a number.
+    """
+    schedule = []
+    for spec in specs:
+        name, _, seconds = spec.partition(":")
+        schedule.append((parse_tier(name), float(seconds) if seconds else interval_s))
+    return schedule
+
+
+def export_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the export command."""
+    parser = argparse.ArgumentParser(
+        prog="python -m validate export",
+        description="Export scheduled validation results as Prometheus/OpenMetrics metrics",
+    )
+    parser.add_argument(
+        "tiers",
+        nargs="*",
+        default=["smoke"],
+        metavar="TIER[:SECONDS]",
+        help=f"Tiers to run, each with its own interval (default: smoke every "
+        f"{EXPORT_INTERVAL_S:g}s)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=EXPORT_INTERVAL_S,
+        help=f"Seconds between runs of tiers without their own (default: {EXPORT_INTERVAL_S:g})",
+    )
+    parser.add_argument(
+        "--listen",
+        metavar="[HOST:]PORT",
+        help="Serve metrics at http://HOST:PORT/metrics (default host: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--textfile",
+        metavar="FILE",
+        help="Write metrics to FILE after every run (node_exporter textfile collector)",
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Run every tier once, write --textfile and exit"
+    )
+    parser.add_argument(
+        "--simulate", type=int, metavar="N", help="Export from a simulated mesh of N nodes"
+    )
+    parser.add_argument(
+        "--sim-topology",
+        choices=TOPOLOGIES,
+        default="ring",
+        help="Topology of the simulated mesh (default: ring)",
+    )
+    parser.set_defaults(record=None, replay=None)
+    return parser
+
+
+def metrics_publisher(
+    server: Optional["MetricsServer"], textfile: Optional[str]
+) -> Callable[["Exporter"], None]:
+    """
+    Build the exporter's update callback.
+
+    Args:
+        server: Server to refresh, if any.
+        textfile: File to rewrite, if any.
+
+    Returns:
+        Callback rendering the exporter state and command timings.
+    """
+    from validate.core.timing import command_timings
+    from validate.reporters.metrics import tier_families, timing_families, write_textfile
+
+    def publish(exporter: "Exporter") -> None:
+        families = tier_families(exporter.states()) + timing_families(command_timings())
+        if server is not None:
+            server.update(families)
+        if textfile:
+            try:
+                write_textfile(textfile, families)
+            except OSError as e:
+                print(f"Warning: metrics not written: {e}", file=sys.stderr)
+
+    return publish
+
+
+def export_main(argv: List[str]) -> int:
+    """
+    Run tiers on a schedule and export their results as metrics
+    (python -m validate export).
+
+    Args:
+        argv: Arguments after "export".
+
+    Returns:
+        Exit code (with --once: 0 if every tier passed, else 1).
+    """
+    import signal
+    import threading
+
+    from validate.core.exporter import Exporter
+    from validate.reporters.metrics import MetricsServer
+
+    parser = export_parser()
+    args = parser.parse_args(argv)
+    if not args.listen and not args.textfile:
+        parser.error("nothing to export to: give --listen and/or --textfile")
+
+    server: Optional[MetricsServer] = None
+    try:
+        schedule = parse_schedule(args.tiers, args.interval)
+        configure_transport(args)
+        if args.listen and not args.once:
+            host, _, port = args.listen.rpartition(":")
+            server = MetricsServer(host or "127.0.0.1", int(port))
+            print(f"Serving metrics at {server.url}", file=sys.stderr)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    exporter = Exporter(schedule, on_update=metrics_publisher(server, args.textfile))
+    if args.once:
+        exporter.run_once()
+        return 0 if all(s.result and s.result.passed for s in exporter.states()) else 1
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        exporter.serve(stop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.close()
+    return 0
+
+
+def parse_duration(text: str) -> float:
+    """
+    Parse a duration such as "10s", "15m", "2h" or "30" (seconds).
+
+    Args:
+        text: Duration.
+
+    Returns:
+        Seconds.
+
+    Raises:
+        ValueError: If text is not a number with an optional s, m or h suffix.
+    """
+    units = {"s": 1, "m": 60, "h": 3600}
+    text = text.strip().lower()
+    scale = units.get(text[-1:], 0)
+    return float(text[:-1]) * scale if scale else float(text)
+
+
+def watch_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the watch command."""
+    parser = argparse.ArgumentParser(
+        prog="python -m validate watch",
+        description="Watch the mesh continuously and report routing changes as they happen",
+    )
+    parser.add_argument(
+        "--interval",
+        type=parse_duration,
+        default=WATCH_INTERVAL_S,
+        metavar="DURATION",
+        help=f"Time between polls, e.g. 10s (default: {WATCH_INTERVAL_S:g}s)",
+    )
+    parser.add_argument(
+        "--tier",
+        default="standard",
+        help="Tier run at the slower cadence (default: standard)",
+    )
+    parser.add_argument(
+        "--full-interval",
+        type=parse_duration,
+        default=WATCH_FULL_INTERVAL_S,
+        metavar="DURATION",
+        help=f"Time between full runs, 0 for none (default: {WATCH_FULL_INTERVAL_S:g}s)",
+    )
+    parser.add_argument(
+        "--tq-drop",
+        type=int,
+        default=WATCH_TQ_DROP,
+        help=f"Smallest TQ decrease reported (default: {WATCH_TQ_DROP})",
+    )
+    parser.add_argument(
+        "--polls", type=int, metavar="N", help="Stop after N polls (default: run until stopped)"
+    )
+    parser.add_argument(
+        "--jsonl", action="store_true", help="Write changes as JSON Lines instead of text"
+    )
+    parser.add_argument("--no-color", action="store_true", help="Disable colored output")
+    parser.add_argument(
+        "--stream-socket", metavar="PATH", help="Serve the changes live on a Unix socket"
+    )
+    parser.add_argument(
+        "--stream-sse",
+        metavar="[HOST:]PORT",
+        help="Serve the changes as server-sent events at http://HOST:PORT/events",
+    )
+    parser.add_argument(
+        "--simulate", type=int, metavar="N", help="Watch a simulated mesh of N nodes"
+    )
+    parser.add_argument(
+        "--sim-topology",
+        choices=TOPOLOGIES,
+        default="ring",
+        help="Topology of the simulated mesh (default: ring)",
+    )
+    parser.set_defaults(record=None, replay=None)
+    return parser
+
+
+def watch_main(argv: List[str]) -> int:
+    """
+    Poll the mesh and report changes until stopped (python -m validate watch).
+
+    Args:
+        argv: Arguments after "watch".
+
+    Returns:
+        Exit code (0 when stopped, 2 on a setup error).
+    """
+    import signal
+    import threading
+
+    from validate.core.watch import Watcher, WatchEvent
+    from validate.reporters.console import ConsoleReporter
+    from validate.reporters.jsonl import JSONLReporter
+
+    args = watch_parser().parse_args(argv)
+    full_tier = parse_tier(args.tier) if args.full_interval > 0 else None
+    try:
+        configure_transport(args)
+        streams = open_streams(args)
+        reporters: List[LiveReporter] = []
+        if args.jsonl or streams:
+            reporters.append(
+                JSONLReporter(output=sys.stdout if args.jsonl else None, sinks=streams)
+            )
+        if not args.jsonl:
+            reporters.append(ConsoleReporter(color=not args.no_color))
+
+        def on_event(event: WatchEvent) -> None:
+            for reporter in reporters:
+                reporter.watch_event(event)
+
+        watcher = Watcher(
+            args.interval,
+            on_event,
+            full_tier=full_tier,
+            full_interval_s=args.full_interval or WATCH_FULL_INTERVAL_S,
+            tq_drop=args.tq_drop,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    full = f", {full_tier.name.lower()} every {args.full_interval:g}s" if full_tier else ""
+    print(f"Watching the mesh every {args.interval:g}s{full}", file=sys.stderr)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        watcher.serve(stop, polls=args.polls)
+    except KeyboardInterrupt:
+        stop.set()
+    return 0
+
+
+def fleet_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the fleet command."""
+    parser = argparse.ArgumentParser(
+        prog="python -m validate fleet",
+        description="Validate many mesh sites concurrently and report per-site rollups",
+    )
+    parser.add_argument(
+        "sites",
+        nargs="*",
+        metavar="[NAME=]INVENTORY",
+        help="Sites to validate, each an Ansible inventory (named after its path by default)",
+    )
+    parser.add_argument(
+        "--sites-file",
+        metavar="FILE",
+        help="Read more sites from FILE, one per line (# starts a comment)",
+    )
+    parser.add_argument(
+        "--tier", default="standard", help="Tier run at every site (default: standard)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=FLEET_WORKERS,
+        help=f"Sites validated at once, one process each (default: {FLEET_WORKERS})",
+    )
+    parser.add_argument(
+        "--site-inflight",
+        type=int,
+        default=FLEET_SITE_INFLIGHT,
+        metavar="N",
+        help=f"Commands in flight per site (default: {FLEET_SITE_INFLIGHT})",
+    )
+    parser.add_argument(
+        "--slo",
+        type=float,
+        metavar="SECONDS",
+        help="Time each site's run may take, 0 for unlimited (default: the tier's)",
+    )
+    parser.add_argument(
+        "--check-budget",
+        type=float,
+        metavar="SECONDS",
+        help=f"Time a check may take, 0 for unlimited (default: {CHECK_BUDGET_S:g})",
+    )
+    parser.add_argument(
+        "--continue-on-fail",
+        action="store_true",
+        help="Continue a site's validation even if its Phase 1 fails",
+    )
+    parser.add_argument(
+        "--details",
+        action="store_true",
+        help="Include every site's full result in the JSON output",
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of text")
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="List each site's failed checks"
+    )
+    parser.add_argument("--no-color", action="store_true", help="Disable colored output")
+    parser.add_argument(
+        "--simulate",
+        type=int,
+        metavar="N",
+        help="Validate simulated meshes of N nodes (sites may then be bare names)",
+    )
+    parser.add_argument(
+        "--sim-topology",
+        choices=TOPOLOGIES,
+        default="ring",
+        help="Topology of the simulated meshes (default: ring)",
+    )
+    return parser
+
+
+def read_sites(specs: Sequence[str], sites_file: Optional[str]) -> List[str]:
+    """
+    Collect site specifications from the command line and a sites file.
+
+    Args:
+        specs: Sites given as arguments.
+        sites_file: File listing more sites, if any.
+
+    Returns:
+        Site specifications, in order.
+
+    Raises:
+        OSError: If the sites file cannot be read.
+    """
+    sites = list(specs)
+    if sites_file:
+        with open(sites_file, encoding="utf-8") as f:
+            for line in f:
+                spec = line.split("#", 1)[0].strip()
+                if spec:
+                    sites.append(spec)
+    return sites
+
+
+def fleet_main(argv: List[str]) -> int:
+    """
+    Validate many sites concurrently (python -m validate fleet).
+
+    Args:
+        argv: Arguments after "fleet".
+
+    Returns:
+        Exit code (0 if every site passed, 1 if any did not, 2 on a setup
+        error).
+    """
+    from validate.core.fleet import FleetRunner, SiteOptions, parse_site
+    from validate.reporters.console import ConsoleReporter
+    from validate.reporters.json import JSONReporter
+
+    parser = fleet_parser()
+    args = parser.parse_args(argv)
+    options = SiteOptions(
+        slo_s=args.slo,
+        check_budget_s=args.check_budget,
+        abort_on_phase1_fail=not args.continue_on_fail,
+        inflight=args.site_inflight,
+        details=args.details,
+        simulate=args.simulate,
+        sim_topology=args.sim_topology,
+    )
+    try:
+        specs = read_sites(args.sites, args.sites_file)
+        sites = [parse_site(spec, simulated=bool(args.simulate)) for spec in specs]
+        runner = FleetRunner(sites, parse_tier(args.tier), workers=args.workers, options=options)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        result = runner.run()
+        JSONReporter().report(result)
+    else:
+        reporter = ConsoleReporter(color=not args.no_color, verbose=args.verbose)
+        reporter.fleet_header(runner.tier, len(sites), runner.workers)
+        result = runner.run(on_site_complete=reporter.fleet_site)
+        reporter.fleet_footer(result)
+    return 0 if result.passed else 1
+
+
+def list_checks(tier: Optional[Tier], as_json: bool) -> int:
+    """
+    Print the registered checks without importing any of them (--list).
+
+    Args:
+        tier: Only checks that run at this tier (default: all).
+        as_json: Output JSON instead of a table.
+
+    Returns:
+        Exit code (always 0).
+    """
+    from validate.core.registry import check_specs, phase_name
+
+    specs = sorted(check_specs(tier), key=lambda spec: spec.phase)
+    if as_json:
+        checks = [
+            {
+                "category": spec.category,
+                "phase": spec.phase,
+                "tier": spec.min_tier.name.lower(),
+                "depends_on": spec.depends_on,
+                "resources": spec.resources,
+                "inputs": spec.inputs,
+                "budget_s": spec.budget_s,
+                "cost_s": spec.cost_s,
+                "target": spec.target,
+                "source": spec.source,
+            }
+            for spec in specs
+        ]
+        print(json.dumps({"checks": checks}, indent=2))
+        return 0
+
+    phase = None
+    for spec in specs:
+        if spec.phase != phase:
+            phase = spec.phase
+            print(f"Phase {phase}: {phase_name(phase)}")
+        notes = [f"after {', '.join(spec.depends_on)}"] if spec.depends_on else []
+        notes += [f"from {spec.source}"] if spec.source != "builtin" else []
+        line = f"  {spec.category:<28} {spec.min_tier.name.lower():<14} ~{spec.cost_s:g}s"
+        print(f"{line:<56}{'  '.join(notes)}".rstrip())
+    total = sum(spec.cost_s for spec in specs)
+    print(f"{len(specs)} checks, ~{total:g}s if run one at a time")
+    return 0
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Run the validation framework.
@@ -45,34 +840,66 @@ def main(argv: Optional[List[str]] = None) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    argv = sys.argv[1:] if argv is None else argv
+    subcommands = {
+        "history": history_main,
+        "export": export_main,
+        "watch": watch_main,
+        "fleet": fleet_main,
+    }
+    if argv and argv[0] in subcommands:
+        return subcommands[argv[0]](argv[1:])
+
     parser = argparse.ArgumentParser(
         description="Mesh Network Validation Framework",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
-Tiers:
-  smoke (1)         Quick health check (~30s)
-  standard (2)      Post-deployment verification (~3min)
-  comprehensive (3) Full functional validation (~10min)
-  certification (4) Production readiness (~30min)
+Tiers (and their default SLO; a run that takes longer fails):
+  smoke (1)         Quick health check (30s)
+  standard (2)      Post-deployment verification (3min)
+  comprehensive (3) Full functional validation (10min)
+  certification (4) Production readiness (30min)
 
 Examples:
   python -m validate smoke
   python -m validate standard --verbose
   python -m validate comprehensive --json
+  python -m validate standard --record run.jsonl.gz
+  python -m validate standard --replay run.jsonl.gz --replay-speed 10
+  python -m validate certification --simulate 100 --sim-topology line
+  python -m validate certification --jsonl | jq -c 'select(.event == "check")'
+  python -m validate certification --stream-socket /tmp/mesh.sock
+  python -m validate history --check batman.neighbors --node node2
+  python -m validate export smoke:60 standard:900 --listen 9812
+  python -m validate standard --incremental --max-staleness 1800
+  python -m validate watch --interval 10s --full-interval 15m
+  python -m validate certification --slo 3600 --check-budget 120
+  python -m validate smoke --list
+  python -m validate fleet --tier smoke sites/*/inventory/hosts.yml --workers 16
         """,
     )
 
     parser.add_argument(
         "tier",
         nargs="?",
-        default="standard",
         help="Validation tier: smoke, standard, comprehensive, certification (default: standard)",
     )
     parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the registered checks (of the tier, if given) instead of running them",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
         "--json",
         action="store_true",
         help="Output JSON instead of colored text",
     )
+    output.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Stream JSON Lines events (one per check, phase and summary) as they happen",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -89,54 +916,124 @@ Examples:
         action="store_true",
         help="Continue validation even if Phase 1 fails",
     )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--record",
+        metavar="FILE",
+        help="Record every command result to FILE (.gz suffix compresses)",
+    )
+    source.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="Answer commands from a recording instead of the network",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=0.0,
+        metavar="X",
+        help="Pace replay at X times the recorded speed (default: 0, instant)",
+    )
+    source.add_argument(
+        "--simulate",
+        type=int,
+        metavar="N",
+        help="Validate a simulated mesh of N nodes instead of the real one",
+    )
+    parser.add_argument(
+        "--sim-topology",
+        choices=TOPOLOGIES,
+        default="ring",
+        help="Topology of the simulated mesh (default: ring)",
+    )
 
-    args = parser.parse_args(argv)
-    tier = parse_tier(args.tier)
-
-    # Create runner
-    runner = create_runner(tier)
+    parser.add_argument(
+        "--slo",
+        type=float,
+        metavar="SECONDS",
+        help="Time the run may take before it fails, 0 for unlimited (default: the tier's)",
+    )
+    parser.add_argument(
+        "--check-budget",
+        type=float,
+        metavar="SECONDS",
+        help=f"Time a check may take before it times out, 0 for unlimited "
+        f"(default: {CHECK_BUDGET_S:g})",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse passing results of checks whose inputs have not changed",
+    )
+    parser.add_argument(
+        "--result-cache",
+        metavar="FILE",
+        help=f"Result cache for --incremental (default: {RESULT_CACHE})",
+    )
+    parser.add_argument(
+        "--max-staleness",
+        type=float,
+        default=INCREMENTAL_MAX_AGE_S,
+        metavar="SECONDS",
+        help=f"Oldest result --incremental may reuse (default: {INCREMENTAL_MAX_AGE_S:g})",
+    )
+    parser.add_argument(
+        "--history-db",
+        metavar="FILE",
+        help=f"Record the run in this history database (default: {HISTORY_DB})",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record the run in the history database",
+    )
+    parser.add_argument(
+        "--stream-socket",
+        metavar="PATH",
+        help="Serve the JSON Lines events live on a Unix socket",
+    )
+    parser.add_argument(
+        "--stream-sse",
+        metavar="[HOST:]PORT",
+        help="Serve the events live as server-sent events at http://HOST:PORT/events",
+    )
 
-    # Create reporter
-    reporter: Union[ConsoleReporter, JSONReporter]
-    if args.json:
-        reporter = JSONReporter()
-    else:
-        reporter = ConsoleReporter(
-            color=not args.no_color,
-            verbose=args.verbose,
-        )
+    args = parser.parse_args(argv)
+    if args.list:
+        return list_checks(parse_tier(args.tier) if args.tier else None, args.json)
+    tier = parse_tier(args.tier or "standard")
 
-    # Print header if using console reporter
-    if isinstance(reporter, ConsoleReporter):
-        reporter.header(tier)
+    try:
+        configure_transport(args)
+        cache = open_cache(args)
+        streams = open_streams(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
 
-    # Run validation with real-time output for console
-    if isinstance(reporter, ConsoleReporter):
-        current_phase = [0]  # Mutable for closure
+    from validate.core.runner import create_runner
+    from validate.reporters.console import ConsoleReporter
+    from validate.reporters.json import JSONReporter
+    from validate.reporters.jsonl import JSONLReporter
 
-        def on_phase_start(phase_num: int, name: str) -> None:
-            if phase_num != current_phase[0]:
-                reporter.phase_start(phase_num, name)
-                current_phase[0] = phase_num
+    # Create runner
+    runner = create_runner(tier, cache=cache, slo_s=args.slo, check_budget_s=args.check_budget)
 
-        def on_check_complete(check: CheckResult) -> None:
-            reporter.check_result(check)
+    # Live reporters see every event as it happens
+    reporters: List[LiveReporter] = []
+    if args.jsonl or streams:
+        reporters.append(JSONLReporter(output=sys.stdout if args.jsonl else None, sinks=streams))
+    if not args.json and not args.jsonl:
+        reporters.append(ConsoleReporter(color=not args.no_color, verbose=args.verbose))
 
-        def on_phase_complete(phase: PhaseResult) -> None:
-            reporter.phase_end(phase)
+    result = run_live(runner, reporters, abort_on_phase1_fail=not args.continue_on_fail)
 
-        # Run with callbacks
-        result = runner.run(
-            abort_on_phase1_fail=not args.continue_on_fail,
-            on_check_complete=on_check_complete,
-            on_phase_complete=on_phase_complete,
-        )
+    # JSON mode outputs one document at the end
+    if args.json:
+        JSONReporter().report(result)
 
-        reporter.footer(result)
-    else:
-        # JSON mode - just run and output at end
-        result = runner.run(abort_on_phase1_fail=not args.continue_on_fail)
-        reporter.report(result)
+    save_cache(cache)
+    save_history(args, result)
 
     # Return exit code
     return 0 if result.passed else 1
@@ -12,14 +12,236 @@ Categories:
 - failover: Link, WAN, node failover
 - wireless: 802.11s mesh, 802.11r roaming, BLA
 - performance: Latency, stress testing
+
+CHECKS declares every built-in check for the registry (see
+validate.core.registry). Check modules are not imported here; each is
+imported the first time one of its checks runs.
 """
 
-from validate.checks import batman, connectivity, failover, performance, wireless
+from typing import List
+
+from validate.config import (
+    CHECK_BUDGET_S,
+    CONVERGENCE_HOLD_S,
+    LATENCY_PROBE_COUNT,
+    LATENCY_PROBE_INTERVAL_S,
+    STRESS_DURATION_S,
+    THROUGHPUT_DURATION_S,
+    THROUGHPUT_MODES,
+)
+from validate.core.registry import DISRUPTIVE, CheckSpec
+from validate.core.results import Tier
 
-__all__ = [
-    "connectivity",
-    "batman",
-    "failover",
-    "wireless",
-    "performance",
+_BATMAN_DEPS = ["batman.module"]
+_VLAN_INPUTS = ["addresses", "uci:network"]
+
+CHECKS: List[CheckSpec] = [
+    # Phase 1: Prerequisites (must pass to continue)
+    CheckSpec("connectivity.ping", "validate.checks.connectivity:check_ping", 1, cost_s=2),
+    CheckSpec("connectivity.ssh", "validate.checks.connectivity:check_ssh", 1, cost_s=2),
+    CheckSpec("batman.module", "validate.checks.batman:check_module", 1),
+    # Phase 2: Foundation (batman tables are meaningless without the module)
+    CheckSpec(
+        "batman.interfaces",
+        "validate.checks.batman:check_interfaces",
+        2,
+        Tier.STANDARD,
+        depends_on=_BATMAN_DEPS,
+        inputs=["links"],
+    ),
+    CheckSpec(
+        "batman.neighbors",
+        "validate.checks.batman:check_neighbors",
+        2,
+        Tier.STANDARD,
+        depends_on=_BATMAN_DEPS,
+        inputs=["batman:neighbors"],
+    ),
+    CheckSpec(
+        "batman.originators",
+        "validate.checks.batman:check_originators",
+        2,
+        Tier.STANDARD,
+        depends_on=_BATMAN_DEPS,
+        inputs=["batman:originators"],
+    ),
+    CheckSpec(
+        "batman.gateways",
+        "validate.checks.batman:check_gateways",
+        2,
+        Tier.STANDARD,
+        depends_on=_BATMAN_DEPS,
+        inputs=["batman:gateways"],
+    ),
+    # Phase 3: Network
+    CheckSpec(
+        "vlans.mesh", "validate.checks.vlans:check_mesh_vlan", 3, Tier.STANDARD, inputs=["links"]
+    ),
+    CheckSpec(
+        "vlans.client",
+        "validate.checks.vlans:check_client_vlan",
+        3,
+        Tier.STANDARD,
+        inputs=_VLAN_INPUTS,
+    ),
+    # Phase 4: Services
+    CheckSpec(
+        "vlans.management",
+        "validate.checks.vlans:check_management_vlan",
+        4,
+        Tier.COMPREHENSIVE,
+        inputs=_VLAN_INPUTS,
+    ),
+    CheckSpec(
+        "vlans.iot",
+        "validate.checks.vlans:check_iot_vlan",
+        4,
+        Tier.COMPREHENSIVE,
+        inputs=_VLAN_INPUTS,
+    ),
+    CheckSpec(
+        "vlans.guest",
+        "validate.checks.vlans:check_guest_vlan",
+        4,
+        Tier.COMPREHENSIVE,
+        inputs=_VLAN_INPUTS,
+    ),
+    CheckSpec(
+        "services.dhcp",
+        "validate.checks.services:check_dhcp",
+        4,
+        Tier.COMPREHENSIVE,
+        inputs=["uci:dhcp", "processes"],
+    ),
+    CheckSpec(
+        "services.firewall",
+        "validate.checks.services:check_firewall",
+        4,
+        Tier.COMPREHENSIVE,
+        inputs=["uci:firewall", "processes"],
+    ),
+    CheckSpec(
+        "security.ssh",
+        "validate.checks.security:check_ssh_hardening",
+        4,
+        Tier.COMPREHENSIVE,
+        inputs=["uci:dropbear", "processes", "files:ssh"],
+    ),
+    CheckSpec(
+        "security.https",
+        "validate.checks.security:check_https",
+        4,
+        Tier.COMPREHENSIVE,
+        inputs=["uci:uhttpd", "files:https"],
+    ),
+    CheckSpec(
+        "wan.connectivity",
+        "validate.checks.wan:check_connectivity",
+        4,
+        Tier.COMPREHENSIVE,
+        cost_s=3,
+    ),
+    CheckSpec("wan.dns", "validate.checks.wan:check_dns", 4, Tier.COMPREHENSIVE, cost_s=2),
+    CheckSpec(
+        "infrastructure.switches",
+        "validate.checks.infrastructure:check_switches",
+        4,
+        Tier.COMPREHENSIVE,
+        cost_s=2,
+    ),
+    # Phase 5: Certification
+    CheckSpec(
+        "failover.link",
+        "validate.checks.failover:check_link_failover",
+        5,
+        Tier.CERTIFICATION,
+        depends_on=["batman.neighbors"],
+        cost_s=2,
+    ),
+    CheckSpec(
+        "failover.wan",
+        "validate.checks.failover:check_wan_failover",
+        5,
+        Tier.CERTIFICATION,
+        depends_on=["batman.gateways"],
+        cost_s=2,
+    ),
+    CheckSpec(
+        "failover.node",
+        "validate.checks.failover:check_node_failover",
+        5,
+        Tier.CERTIFICATION,
+        depends_on=["batman.originators"],
+        cost_s=2,
+    ),
+    CheckSpec(
+        "wireless.mesh", "validate.checks.wireless:check_mesh_wireless", 5, Tier.CERTIFICATION
+    ),
+    CheckSpec(
+        "wireless.roaming",
+        "validate.checks.wireless:check_roaming",
+        5,
+        Tier.CERTIFICATION,
+        inputs=["uci:wireless"],
+    ),
+    CheckSpec(
+        "wireless.bla",
+        "validate.checks.wireless:check_bla",
+        5,
+        Tier.CERTIFICATION,
+        inputs=["batman:bla"],
+    ),
+    # Probe-based measurements would skew each other if run together
+    CheckSpec(
+        "performance.latency",
+        "validate.checks.performance:check_latency",
+        5,
+        Tier.CERTIFICATION,
+        resources=["icmp-probe"],
+        cost_s=3,
+    ),
+    CheckSpec(
+        "performance.stress",
+        "validate.checks.performance:check_stress_ping",
+        5,
+        Tier.CERTIFICATION,
+        resources=["icmp-probe"],
+        budget_s=STRESS_DURATION_S + CHECK_BUDGET_S,
+        cost_s=STRESS_DURATION_S + 2,
+    ),
+    CheckSpec(
+        "performance.latency_matrix",
+        "validate.checks.performance:check_latency_matrix",
+        5,
+        Tier.CERTIFICATION,
+        depends_on=["batman.neighbors"],
+        resources=["icmp-probe"],
+        cost_s=LATENCY_PROBE_COUNT * LATENCY_PROBE_INTERVAL_S + 2,
+    ),
+    # Saturates mesh links, so nothing else may run alongside it; its length
+    # grows with the number of links (the cost is per link), so only the SLO
+    # bounds it
+    CheckSpec(
+        "performance.throughput",
+        "validate.checks.performance:check_throughput",
+        5,
+        Tier.CERTIFICATION,
+        depends_on=["batman.neighbors"],
+        resources=[DISRUPTIVE],
+        budget_s=0,
+        cost_s=len(THROUGHPUT_MODES) * (THROUGHPUT_DURATION_S + 2),
+    ),
+    # Takes a mesh link down, so it runs alone after everything else
+    CheckSpec(
+        "failover.convergence",
+        "validate.checks.failover:check_link_convergence",
+        5,
+        Tier.CERTIFICATION,
+        depends_on=["failover.link"],
+        resources=[DISRUPTIVE],
+        budget_s=CONVERGENCE_HOLD_S + CHECK_BUDGET_S,
+        cost_s=CONVERGENCE_HOLD_S + 5,
+    ),
 ]
+
+__all__ = ["CHECKS"]
@@ -11,9 +11,12 @@ Tier 2 (Standard):
 - check_gateways: All gateways advertising
 """
 
+from dataclasses import asdict
+
 from validate.config import NODES, THRESHOLDS
-from validate.core.executor import NodeExecutor
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.fanout import fan_out
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+from validate.core.snapshot import get_snapshot
 
 
 def check_module() -> CheckResult:
@@ -29,28 +32,29 @@ def check_module() -> CheckResult:
         message="",
     )
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-        rc, stdout, stderr = executor.run("lsmod | grep -q batman_adv")
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        snapshot = get_snapshot(node_name)
+        rc, version, _ = snapshot.get("batman_version")
 
-        if rc == 0:
-            # Get batman version
-            rc2, version, _ = executor.run("cat /sys/module/batman_adv/version 2>/dev/null")
-            version_str = version.strip() if rc2 == 0 else "unknown"
+        if snapshot.module_loaded("batman_adv"):
+            version_str = version.strip() if rc == 0 else "unknown"
 
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"v{version_str}",
                 data={"version": version_str},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="batman-adv not loaded",
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -75,39 +79,39 @@ def check_interfaces() -> CheckResult:
         message="",
     )
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         # Check bat0 exists and has UP flag (look for <...UP...> in flags)
-        rc, stdout, stderr = executor.run("ip link show bat0 2>/dev/null")
+        stdout = get_snapshot(node_name).link("bat0") or ""
 
-        if rc == 0 and "<" in stdout and "UP" in stdout.split("<")[1].split(">")[0]:
-            # Get bat0 MAC
-            rc2, mac_out, _ = executor.run(
-                "ip link show bat0 | grep -o 'link/ether [^ ]*' | cut -d' ' -f2"
-            )
-            mac = mac_out.strip() if rc2 == 0 else ""
+        if "<" in stdout and "UP" in stdout.split("<")[1].split(">")[0]:
+            # Get bat0 MAC from the same output
+            mac = ""
+            if "link/ether " in stdout:
+                mac = stdout.split("link/ether ", 1)[1].split()[0]
 
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message="bat0 UP",
                 data={"mac": mac} if mac else {},
             )
-        elif rc == 0:
+        elif stdout:
             # bat0 exists but not UP
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="bat0 exists but DOWN",
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="bat0 not found",
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -133,47 +137,39 @@ def check_neighbors() -> CheckResult:
     )
 
     min_neighbors = THRESHOLDS.get("min_neighbors", 2)
-    total_neighbors = 0
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-
-        # Count neighbors (exclude header line)
-        rc, stdout, stderr = executor.run("batctl n 2>/dev/null | tail -n +3 | wc -l")
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        snapshot = get_snapshot(node_name)
+        rc, _, stderr = snapshot.get("neighbors")
 
         if rc != 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"batctl failed: {stderr.strip()}",
             )
-            continue
-
-        try:
-            count = int(stdout.strip())
-            total_neighbors += count
-
-            if count >= min_neighbors:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.PASS,
-                    message=f"{count} neighbors",
-                    data={"neighbor_count": count},
-                )
-            else:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.FAIL,
-                    message=f"Only {count} neighbors (need {min_neighbors}+)",
-                    data={"neighbor_count": count},
-                )
-        except ValueError:
-            result.add_node_result(
+
+        # One entry per (hard interface, neighbor)
+        count = len(snapshot.neighbor_table.entries)
+
+        if count >= min_neighbors:
+            return NodeResult(
+                node=node_name,
+                status=CheckStatus.PASS,
+                message=f"{count} neighbors",
+                data={"neighbor_count": count},
+            )
+        else:
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
-                message=f"Invalid output: {stdout.strip()}",
+                message=f"Only {count} neighbors (need {min_neighbors}+)",
+                data={"neighbor_count": count},
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -206,54 +202,38 @@ def check_originators() -> CheckResult:
     # Each node sees others, not itself
     min_originators = len(NODES) - 1
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-
-        # Get originators and count unique MACs (first column)
-        # Lines with * are selected routes, others are alternate routes
-        rc, stdout, stderr = executor.run("batctl o 2>/dev/null")
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        # Count unique originators; each may be listed with several routes
+        snapshot = get_snapshot(node_name)
+        rc, _, stderr = snapshot.get("originators")
 
         if rc != 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"batctl failed: {stderr.strip()}",
             )
-            continue
-
-        # Count unique originator MACs (lines starting with * or MAC address)
-        # Format: "   mac:addr  time  (throughput) next-hop [iface]" or "* mac..."
-        originators = set()
-        for line in stdout.strip().split("\n"):
-            line = line.strip()
-            # Skip header lines
-            if not line or "MainIF" in line or "B.A.T.M.A.N" in line or "Originator" in line:
-                continue
-            # Extract first MAC from line (starts with * or MAC)
-            if line.startswith("*"):
-                parts = line[1:].strip().split()
-            else:
-                parts = line.split()
-            if parts and ":" in parts[0]:
-                originators.add(parts[0])
-
-        count = len(originators)
+
+        count = len(snapshot.originator_table.originators)
 
         if count >= min_originators:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"{count} originators",
                 data={"originator_count": count},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"Only {count} originators (need {min_originators}+)",
                 data={"originator_count": count},
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -286,29 +266,22 @@ def check_gateways() -> CheckResult:
     expected_visible = len(gateway_nodes) - 1  # Each sees others, not itself
 
     # Check from first node
-    executor = NodeExecutor("node1")
-    rc, stdout, stderr = executor.run("batctl gwl 2>/dev/null")
+    snapshot = get_snapshot(next(iter(NODES)))
+    rc, _, stderr = snapshot.get("gateways")
 
     if rc != 0:
         result.status = CheckStatus.FAIL
         result.message = f"batctl gwl failed: {stderr.strip()}"
         return result
 
-    # Parse gateway list
-    # Format: "  Router  ( throughput) Next Hop [outgoingIf]: Bandwidth"
-    gateways = []
-    for line in stdout.strip().split("\n"):
-        line = line.strip()
-        # Skip header lines
-        if not line or "MainIF" in line or "B.A.T.M.A.N" in line or "Router" in line:
-            continue
-        # Gateway lines have MAC addresses and bandwidth info
-        if ":" in line and ("MBit" in line or "/" in line):
-            gateways.append(line)
-
+    gateways = snapshot.gateway_table.entries
     gateway_count = len(gateways)
     total_gateways = gateway_count + 1  # Plus self
-    result.data = {"gateway_count": gateway_count, "total": total_gateways, "gateways": gateways}
+    result.data = {
+        "gateway_count": gateway_count,
+        "total": total_gateways,
+        "gateways": [asdict(gateway) for gateway in gateways],
+    }
 
     if gateway_count >= expected_visible:
         result.status = CheckStatus.PASS
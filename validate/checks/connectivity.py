@@ -9,14 +9,18 @@ Tier 1 (Smoke):
 from pathlib import Path
 
 from validate.config import MESH_SOURCE_INTERFACE, NODES, get_ssh_key_path
-from validate.core.executor import run_local, ssh_command
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.executor import get_transport, ping_hosts, ssh_command_async
+from validate.core.fanout import fan_out, fan_out_async
+from validate.core.health import is_connection_failure
+from validate.core.results import CheckResult, CheckStatus, NodeResult
 
 
-def check_ping() -> CheckResult:  # noqa: C901
+def check_ping() -> CheckResult:
     """
     Check that all nodes respond to ping.
 
+    All nodes are pinged at once (see ping_hosts).
+
     Returns:
         CheckResult with per-node ping status.
     """
@@ -26,43 +30,32 @@ def check_ping() -> CheckResult:  # noqa: C901
         message="",
     )
 
-    # Build ping command with optional source interface
-    ping_opts = "-c 3 -W 2"
-    if MESH_SOURCE_INTERFACE:
-        ping_opts += f" -I {MESH_SOURCE_INTERFACE}"
-
-    latencies = []
-    for node_name, node_info in NODES.items():
-        rc, stdout, stderr = run_local(f"ping {ping_opts} {node_info.ip}")
-
-        if rc == 0:
-            # Parse average latency from ping output
-            # Example: rtt min/avg/max/mdev = 0.123/0.456/0.789/0.111 ms
-            avg_ms = None
-            for line in stdout.split("\n"):
-                if "avg" in line and "/" in line:
-                    parts = line.split("=")[-1].split("/")
-                    if len(parts) >= 2:
-                        try:
-                            avg_ms = float(parts[1])
-                            latencies.append(avg_ms)
-                        except ValueError:
-                            pass
-                    break
-
-            result.add_node_result(
+    stats = ping_hosts(
+        [info.ip for info in NODES.values()], count=3, timeout_s=2, interface=MESH_SOURCE_INTERFACE
+    )
+
+    def check_node(node_name: str) -> NodeResult:
+        """Judge a single node's replies."""
+        node_stats = stats[NODES[node_name].ip]
+        avg_ms = node_stats.avg
+
+        if node_stats.received:
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"{avg_ms:.1f}ms" if avg_ms else "OK",
                 data={"latency_ms": avg_ms} if avg_ms else {},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
-                message=f"Ping failed: {stderr.strip() or 'no response'}",
+                message="Ping failed: no response",
             )
 
+    fan_out(result, check_node)
+    latencies = [r.data["latency_ms"] for r in result.nodes.values() if "latency_ms" in r.data]
+
     result.aggregate_status()
 
     if result.passed and latencies:
@@ -77,7 +70,7 @@ def check_ping() -> CheckResult:  # noqa: C901
     return result
 
 
-def check_ssh() -> CheckResult:
+async def check_ssh() -> CheckResult:
     """
     Check SSH access to all nodes.
 
@@ -90,30 +83,36 @@ def check_ssh() -> CheckResult:
         message="",
     )
 
-    # First check SSH key exists
+    # First check SSH key exists (replayed runs never use it)
     ssh_key = get_ssh_key_path()
-    if not Path(ssh_key).exists():
+    if get_transport().live and not Path(ssh_key).exists():
         result.status = CheckStatus.FAIL
         result.message = f"SSH key not found: {ssh_key}"
         return result
 
-    for node_name, node_info in NODES.items():
-        rc, stdout, stderr = ssh_command(node_info.ip, "echo ok", timeout=10)
+    async def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        node_info = NODES[node_name]
+        rc, stdout, stderr = await ssh_command_async(node_info.ip, "echo ok", timeout=10)
 
         if rc == 0 and "ok" in stdout:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message="SSH OK",
             )
         else:
             error = stderr.strip() if stderr else "Connection failed"
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"SSH failed: {error}",
+                # Lets the runner open the node's circuit for later phases
+                data={"unreachable": is_connection_failure(rc, stderr)},
             )
 
+    await fan_out_async(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -5,11 +5,22 @@ Tier 4 (Certification):
 - check_link_failover: Ring survives single link failure
 - check_wan_failover: WAN failover works correctly
 - check_node_failover: Mesh survives node failure
+- check_link_convergence: Time to reroute around (and fail back to) a downed link
+
+Link and node failover are judged on the whole-mesh topology graph
+(validate.core.topology), so a node with two neighbors that still sits
+behind a single critical link or node is reported.
 """
 
-from validate.config import NODES
+from typing import Any, Dict, Optional
+
+from validate.config import CONVERGENCE_HOLD_S, CONVERGENCE_PROBE_PPS, NODES, THRESHOLDS
+from validate.core.convergence import Convergence, ProbePlan, analyze, build_probe_script
 from validate.core.executor import NodeExecutor
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.fanout import fan_out
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+from validate.core.snapshot import clear_snapshots, get_snapshot
+from validate.core.topology import MAX_EDGE_CONNECTIVITY, WIRED, Link, MeshGraph, build_topology
 
 
 def check_link_failover() -> CheckResult:  # noqa: C901
@@ -34,54 +45,89 @@ def check_link_failover() -> CheckResult:  # noqa: C901
 
     min_neighbors = 2
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-
-        # Count neighbors
-        rc, stdout, stderr = executor.run("batctl n 2>/dev/null | tail -n +3 | wc -l")
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        snapshot = get_snapshot(node_name)
+        rc, _, stderr = snapshot.get("neighbors")
 
         if rc != 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"batctl failed: {stderr.strip()}",
             )
-            continue
-
-        try:
-            count = int(stdout.strip())
-
-            if count >= min_neighbors:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.PASS,
-                    message=f"{count} paths available",
-                    data={"neighbor_count": count},
-                )
-            else:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.FAIL,
-                    message=f"Only {count} path (need {min_neighbors}+ for redundancy)",
-                    data={"neighbor_count": count},
-                )
-        except ValueError:
-            result.add_node_result(
+
+        count = len(snapshot.neighbor_table.entries)
+
+        if count >= min_neighbors:
+            return NodeResult(
+                node=node_name,
+                status=CheckStatus.PASS,
+                message=f"{count} paths available",
+                data={"neighbor_count": count},
+            )
+        else:
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
-                message=f"Invalid output: {stdout.strip()}",
+                message=f"Only {count} path (need {min_neighbors}+ for redundancy)",
+                data={"neighbor_count": count},
             )
 
+    fan_out(result, check_node)
+
+    # A node can have two neighbors and still hang off a single critical link
+    graph = build_topology(result.nodes)
+    bridges = graph.bridges()
+    for link in bridges:
+        for node_name in (link.a, link.b):
+            node_result = result.nodes.get(node_name)
+            if node_result is None or node_result.status == CheckStatus.FAIL:
+                continue
+            node_result.status = CheckStatus.FAIL
+            node_result.message = f"Link {link.label} is a single point of failure"
+
+    # How much worse the reroute is if a node's preferred first link fails
+    for node_name, node_result in result.nodes.items():
+        delta = _alternate_cost_delta(graph, node_name)
+        if delta is not None:
+            node_result.data["alternate_cost_delta"] = delta
+
+    connectivity = graph.edge_connectivity()
+    result.data = {
+        "edge_connectivity": connectivity,
+        "bridges": [link.label for link in bridges],
+        "links": len(graph.links),
+    }
+
     result.aggregate_status()
 
     if result.passed:
-        result.message = "All nodes have redundant paths"
+        result.message = f"All nodes have redundant paths ({_k_connected(connectivity)})"
+    elif bridges:
+        result.message = f"{len(bridges)} link(s) would partition the mesh if they failed"
     else:
         result.message = "Some nodes lack redundant paths for failover"
 
     return result
 
 
+def _alternate_cost_delta(graph: MeshGraph, node: str) -> Optional[float]:
+    """Worst extra path cost from a node to a peer once its first link fails."""
+    deltas = [
+        cost.alternate_cost - cost.cost
+        for cost in graph.path_costs(node).values()
+        if cost.alternate_cost is not None
+    ]
+    return round(max(deltas), 3) if deltas else None
+
+
+def _k_connected(connectivity: int) -> str:
+    """Describe an edge connectivity capped at MAX_EDGE_CONNECTIVITY."""
+    suffix = "+" if connectivity >= MAX_EDGE_CONNECTIVITY else ""
+    return f"{connectivity}{suffix}-edge-connected"
+
+
 def check_wan_failover() -> CheckResult:  # noqa: C901
     """
     Check that WAN failover is configured and working.
@@ -107,36 +153,31 @@ def check_wan_failover() -> CheckResult:  # noqa: C901
         return result
 
     # Check each gateway can reach internet
-    working_gateways = 0
-
-    for node_name in gateway_nodes:
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         executor = NodeExecutor(node_name)
 
         # Check internet connectivity
         rc, stdout, stderr = executor.run("ping -c 2 -W 3 8.8.8.8")
 
         if rc == 0:
-            working_gateways += 1
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message="WAN active",
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.WARN,
                 message="WAN unreachable",
             )
 
-    # Check gateway selection from a client perspective
-    executor = NodeExecutor("node1")
-    rc, stdout, stderr = executor.run("batctl gwl 2>/dev/null | grep -c MBit")
+    fan_out(result, check_node, nodes=gateway_nodes)
+    working_gateways = sum(1 for r in result.nodes.values() if r.status == CheckStatus.PASS)
 
-    try:
-        visible_gateways = int(stdout.strip()) if rc == 0 else 0
-    except ValueError:
-        visible_gateways = 0
+    # Check gateway selection from a client perspective
+    visible_gateways = len(get_snapshot(next(iter(NODES))).gateway_table.entries)
 
     result.data = {
         "total_gateways": len(gateway_nodes),
@@ -178,55 +219,171 @@ def check_node_failover() -> CheckResult:  # noqa: C901
     node_count = len(NODES)
     expected_originators = node_count - 1  # Each sees all others
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         # Get originator count
-        rc, stdout, stderr = executor.run("batctl o 2>/dev/null")
+        snapshot = get_snapshot(node_name)
+        rc, _, stderr = snapshot.get("originators")
 
         if rc != 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"batctl failed: {stderr.strip()}",
             )
-            continue
-
-        # Count unique originators
-        originators = set()
-        for line in stdout.strip().split("\n"):
-            line = line.strip()
-            if not line or "MainIF" in line or "B.A.T.M.A.N" in line or "Originator" in line:
-                continue
-            if line.startswith("*"):
-                parts = line[1:].strip().split()
-            else:
-                parts = line.split()
-            if parts and ":" in parts[0]:
-                originators.add(parts[0])
 
-        count = len(originators)
+        count = len(snapshot.originator_table.originators)
 
         if count >= expected_originators:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"Sees all {count} peers",
                 data={"originator_count": count},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"Only sees {count}/{expected_originators} peers",
                 data={"originator_count": count},
             )
 
+    fan_out(result, check_node)
+
+    # Full visibility today says nothing about losing a cut vertex tomorrow
+    articulation = build_topology(result.nodes).articulation_points()
+    for node_name in sorted(articulation):
+        node_result = result.nodes.get(node_name)
+        if node_result is not None and node_result.status != CheckStatus.FAIL:
+            node_result.status = CheckStatus.FAIL
+            node_result.message = "Failure of this node would partition the mesh"
+    result.data = {"articulation_points": sorted(articulation)}
+
     result.aggregate_status()
 
     if result.passed:
         result.message = f"Full mesh connectivity ({node_count} nodes)"
+    elif articulation:
+        result.message = f"{len(articulation)} node(s) would partition the mesh if they failed"
     else:
         result.message = "Incomplete mesh - node failure could partition network"
 
     return result
+
+
+def _convergence_link() -> Optional[Link]:
+    """Pick a wired link the mesh should survive losing (not a bridge)."""
+    graph = build_topology()
+    bridges = {link.id for link in graph.bridges()}
+    for link in graph.links:
+        if link.kind == WIRED and link.id not in bridges:
+            return link
+    return None
+
+
+def check_link_convergence() -> CheckResult:
+    """
+    Measure how quickly traffic reroutes around a failed mesh link.
+
+    Streams timestamped probes between the two ends of a redundant wired
+    link, takes the link down and back up, and derives the outage window,
+    packets lost, time-to-reroute and failback time from sequence gaps.
+    Fails if rerouting takes longer than THRESHOLDS["max_convergence_ms"].
+
+    Returns:
+        CheckResult with convergence measurements.
+    """
+    result = CheckResult(
+        category="failover.convergence",
+        status=CheckStatus.PASS,
+        message="",
+    )
+    max_ms = THRESHOLDS.get("max_convergence_ms", 2000)
+
+    link = _convergence_link()
+    if link is None:
+        result.status = CheckStatus.SKIP
+        result.message = "No redundant wired link to fail"
+        return result
+
+    plan = ProbePlan(
+        iface=link.a_iface,
+        target_ip=NODES[link.b].ip,
+        pps=CONVERGENCE_PROBE_PPS,
+        hold_s=CONVERGENCE_HOLD_S,
+    )
+    _, stdout, stderr = NodeExecutor(link.a).run(build_probe_script(plan), plan.timeout_s)
+    # Link state changed under any snapshot taken so far
+    clear_snapshots()
+
+    try:
+        measured = analyze(stdout, plan)
+    except ValueError as e:
+        result.add_node_result(link.a, CheckStatus.FAIL, f"Probe failed: {stderr.strip() or e}")
+        result.aggregate_status()
+        result.message = f"Could not measure convergence on {link.label}"
+        return result
+
+    result.nodes[link.a] = _convergence_node_result(link.a, measured, max_ms)
+    result.data = {"link": link.label, "max_convergence_ms": max_ms, **_convergence_data(measured)}
+    result.aggregate_status()
+
+    if measured.reroute_ms is None:
+        result.message = f"Traffic did not reroute around {link.label}"
+    else:
+        result.message = (
+            f"{link.label}: rerouted in {measured.reroute_ms:.0f}ms "
+            f"({measured.lost} packets lost, max: {max_ms}ms)"
+        )
+    return result
+
+
+def _convergence_data(measured: Convergence) -> Dict[str, Any]:
+    """Flatten measurements for result data."""
+    return {
+        "packets_sent": measured.sent,
+        "packets_lost": measured.lost,
+        "outage_ms": measured.outage_ms,
+        "reroute_ms": measured.reroute_ms,
+        "failback_outage_ms": measured.failback_outage_ms,
+        "failback_ms": measured.failback_ms,
+    }
+
+
+def _convergence_node_result(node: str, measured: Convergence, max_ms: int) -> NodeResult:
+    """Judge one convergence measurement against the threshold."""
+    data = _convergence_data(measured)
+    if measured.reroute_ms is None:
+        return NodeResult(
+            node=node,
+            status=CheckStatus.FAIL,
+            message=f"No reroute while link was down ({measured.outage_ms:.0f}ms outage)",
+            data=data,
+        )
+    if measured.reroute_ms > max_ms:
+        return NodeResult(
+            node=node,
+            status=CheckStatus.FAIL,
+            message=f"Rerouted in {measured.reroute_ms:.0f}ms, exceeds {max_ms}ms",
+            data=data,
+        )
+    if measured.failback_ms is None or measured.failback_outage_ms > max_ms:
+        return NodeResult(
+            node=node,
+            status=CheckStatus.WARN,
+            message=(
+                f"Rerouted in {measured.reroute_ms:.0f}ms but failback "
+                + ("never completed" if measured.failback_ms is None else "was slow")
+                + f" ({measured.failback_outage_ms:.0f}ms outage)"
+            ),
+            data=data,
+        )
+    return NodeResult(
+        node=node,
+        status=CheckStatus.PASS,
+        message=(
+            f"Rerouted in {measured.reroute_ms:.0f}ms, failback in {measured.failback_ms:.0f}ms"
+        ),
+        data=data,
+    )
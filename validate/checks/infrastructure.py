@@ -8,19 +8,20 @@ Tier 3 (Comprehensive):
 import os
 
 from validate.config import SWITCHES
-from validate.core.executor import run_local
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.executor import ping_hosts
+from validate.core.fanout import fan_out
+from validate.core.results import CheckResult, CheckStatus, NodeResult
 
 # Source interface for switches (via untagged enp5s0 with host routes)
 # Switches respond on untagged VLAN, not VLAN 10
 SWITCH_SOURCE_INTERFACE = os.environ.get("SWITCH_SOURCE_INTERFACE", "enp5s0")
 
 
-def check_switches() -> CheckResult:  # noqa: C901
+def check_switches() -> CheckResult:
     """
     Check that all managed switches are reachable.
 
-    Pings each switch in the SWITCHES configuration.
+    Pings every switch in the SWITCHES configuration at once.
 
     Returns:
         CheckResult with switch reachability status.
@@ -36,61 +37,46 @@ def check_switches() -> CheckResult:  # noqa: C901
         result.message = "No switches configured"
         return result
 
-    reachable = 0
     total = len(SWITCHES)
 
-    # Build ping options with source interface for switches
-    ping_opts = "-c 2 -W 2"
-    if SWITCH_SOURCE_INTERFACE:
-        ping_opts += f" -I {SWITCH_SOURCE_INTERFACE}"
+    stats = ping_hosts(
+        [info["ip"] for info in SWITCHES.values() if info.get("ip")],
+        count=2,
+        timeout_s=2,
+        interface=SWITCH_SOURCE_INTERFACE,
+    )
 
-    for switch_name, switch_info in SWITCHES.items():
+    def check_switch(switch_name: str) -> NodeResult:
+        """Judge a single switch's replies."""
+        switch_info = SWITCHES[switch_name]
         ip = switch_info.get("ip", "")
         description = switch_info.get("description", switch_name)
 
         if not ip:
-            result.add_node_result(
+            return NodeResult(
                 node=switch_name,
                 status=CheckStatus.SKIP,
                 message="No IP configured",
             )
-            continue
-
-        # Ping the switch
-        rc, stdout, _ = run_local(f"ping {ping_opts} {ip}")
-
-        if rc == 0:
-            reachable += 1
-            # Parse latency
-            latency = None
-            for line in stdout.split("\n"):
-                if "avg" in line and "/" in line:
-                    parts = line.split("=")[-1].split("/")
-                    if len(parts) >= 2:
-                        try:
-                            latency = float(parts[1])
-                        except ValueError:
-                            pass
-                    break
-
-            result.add_node_result(
+
+        latency = stats[ip].avg
+        if latency is not None:
+            return NodeResult(
                 node=switch_name,
                 status=CheckStatus.PASS,
-                message=(
-                    f"{description} ({ip}) - {latency:.1f}ms"
-                    if latency
-                    else f"{description} ({ip})"
-                ),
-                data={"ip": ip, "latency_ms": latency},
+                message=f"{description} ({ip}) - {latency:.1f}ms",
+                data={"ip": ip, "latency_ms": round(latency, 3)},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=switch_name,
                 status=CheckStatus.FAIL,
                 message=f"{description} ({ip}) unreachable",
                 data={"ip": ip},
             )
 
+    fan_out(result, check_switch, nodes=SWITCHES)
+
     result.aggregate_status()
 
     if result.passed:
@@ -6,20 +6,49 @@ Tier 3 (Comprehensive):
 
 Tier 4 (Certification):
 - check_stress_ping: Extended ping test with packet loss measurement
+- check_throughput: iperf3 throughput matrix between all nodes and the host
+- check_latency_matrix: Node-to-node latency percentiles, per path type
 """
 
-import re
-
-from validate.config import MESH_SOURCE_INTERFACE, NODES, THRESHOLDS
-from validate.core.executor import run_local
-from validate.core.results import CheckResult, CheckStatus
-
-
-def check_latency() -> CheckResult:  # noqa: C901
+from dataclasses import asdict
+from typing import Any, Dict, List, Tuple
+
+from validate.config import (
+    LATENCY_PROBE_COUNT,
+    LATENCY_PROBE_INTERVAL_S,
+    MESH_SOURCE_INTERFACE,
+    NODES,
+    STRESS_DURATION_S,
+    STRESS_RATE_PPS,
+    THRESHOLDS,
+    THROUGHPUT_DURATION_S,
+    THROUGHPUT_MODES,
+    THROUGHPUT_STREAMS,
+    THROUGHPUT_UDP_MBPS,
+)
+from validate.core.engine import run_sync
+from validate.core.executor import NodeExecutor, ping_hosts
+from validate.core.fanout import fan_out
+from validate.core.latency import (
+    ROUTED,
+    LatencyMatrix,
+    LatencyTarget,
+    build_probe_script,
+    parse_probe_output,
+    plan_targets,
+)
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+from validate.core.stress import StressAnalyzer
+from validate.core.throughput import HOST, Measurement, plan_jobs, run_matrix
+from validate.core.topology import WIRED, build_topology
+from validate.parsers.ping import PingStats
+
+
+def check_latency() -> CheckResult:
     """
     Check inter-node latency is within acceptable thresholds.
 
-    Pings each node and verifies latency is under the configured max.
+    Pings every node at once and verifies latency is under the configured max.
 
     Returns:
         CheckResult with latency measurements.
@@ -31,57 +60,39 @@ def check_latency() -> CheckResult:  # noqa: C901
     )
 
     max_latency = THRESHOLDS.get("max_latency_ms", 50)
-    latencies = []
-
-    # Build ping options
-    ping_opts = "-c 5 -W 2"
-    if MESH_SOURCE_INTERFACE:
-        ping_opts += f" -I {MESH_SOURCE_INTERFACE}"
-
-    for node_name, node_info in NODES.items():
-        rc, stdout, stderr = run_local(f"ping {ping_opts} {node_info.ip}")
-
-        if rc == 0:
-            # Parse average latency
-            avg_ms = None
-            for line in stdout.split("\n"):
-                if "avg" in line and "/" in line:
-                    parts = line.split("=")[-1].split("/")
-                    if len(parts) >= 2:
-                        try:
-                            avg_ms = float(parts[1])
-                            latencies.append(avg_ms)
-                        except ValueError:
-                            pass
-                    break
-
-            if avg_ms is not None:
-                if avg_ms <= max_latency:
-                    result.add_node_result(
-                        node=node_name,
-                        status=CheckStatus.PASS,
-                        message=f"{avg_ms:.1f}ms (max: {max_latency}ms)",
-                        data={"latency_ms": avg_ms},
-                    )
-                else:
-                    result.add_node_result(
-                        node=node_name,
-                        status=CheckStatus.WARN,
-                        message=f"{avg_ms:.1f}ms exceeds {max_latency}ms threshold",
-                        data={"latency_ms": avg_ms},
-                    )
-            else:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.WARN,
-                    message="Could not parse latency",
-                )
-        else:
-            result.add_node_result(
+
+    stats = ping_hosts(
+        [info.ip for info in NODES.values()], count=5, timeout_s=2, interface=MESH_SOURCE_INTERFACE
+    )
+
+    def check_node(node_name: str) -> NodeResult:
+        """Judge a single node's replies."""
+        node_stats = stats[NODES[node_name].ip]
+        avg_ms = node_stats.avg
+
+        if avg_ms is None:
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="Ping failed",
             )
+        data = {"latency_ms": round(avg_ms, 3), "p99_ms": node_stats.p99}
+        if avg_ms <= max_latency:
+            return NodeResult(
+                node=node_name,
+                status=CheckStatus.PASS,
+                message=f"{avg_ms:.1f}ms (max: {max_latency}ms)",
+                data=data,
+            )
+        return NodeResult(
+            node=node_name,
+            status=CheckStatus.WARN,
+            message=f"{avg_ms:.1f}ms exceeds {max_latency}ms threshold",
+            data=data,
+        )
+
+    fan_out(result, check_node)
+    latencies = [r.data["latency_ms"] for r in result.nodes.values() if "latency_ms" in r.data]
 
     result.aggregate_status()
 
@@ -98,15 +109,38 @@ def check_latency() -> CheckResult:  # noqa: C901
     return result
 
 
-def check_stress_ping() -> CheckResult:  # noqa: C901
+def _judge_stress(analysis: StressAnalyzer) -> Tuple[CheckStatus, str]:
+    """Status and message for one node's stress analysis."""
+    max_loss = THRESHOLDS.get("max_packet_loss_pct", 5)
+    max_outage = THRESHOLDS.get("max_outage_ms", 300)
+    loss_pct, outage = analysis.loss_pct, analysis.longest_outage_ms
+
+    if not analysis.received:
+        return CheckStatus.FAIL, "Ping test failed"
+    if loss_pct > max_loss:
+        return CheckStatus.FAIL, f"{loss_pct:.1f}% loss exceeds {max_loss}% threshold"
+    if outage > max_outage:
+        return CheckStatus.FAIL, (
+            f"{outage:.0f}ms outage ({analysis.longest_burst} lost in a row) "
+            f"exceeds {max_outage}ms"
+        )
+    bursts = sum(analysis.bursts.values())
+    detail = f", {bursts} burst(s), longest {outage:.0f}ms" if bursts else ""
+    return CheckStatus.PASS, f"{loss_pct:.1f}% loss ({analysis.sent} pings{detail})"
+
+
+def check_stress_ping() -> CheckResult:
     """
     Run extended ping test to measure packet loss under stress.
 
-    Sends 100 pings to each node and measures packet loss percentage.
-    Fails if loss exceeds the configured threshold (default 5%).
+    Pings every node at once for STRESS_DURATION_S at STRESS_RATE_PPS and
+    analyzes each packet's outcome as it settles (see StressAnalyzer), so
+    hour-long soaks run in constant memory. Fails if loss exceeds the
+    configured threshold (default 5%) or if any single outage - a run of
+    consecutive lost packets - lasts longer than max_outage_ms.
 
     Returns:
-        CheckResult with packet loss measurements.
+        CheckResult with packet loss, loss bursts, RTT histogram and trend.
     """
     result = CheckResult(
         category="performance.stress",
@@ -115,75 +149,37 @@ def check_stress_ping() -> CheckResult:  # noqa: C901
     )
 
     max_loss = THRESHOLDS.get("max_packet_loss_pct", 5)
-    ping_count = 100
-
-    # Build ping options - flood-like but controlled
-    ping_opts = f"-c {ping_count} -i 0.1 -W 2"
-    if MESH_SOURCE_INTERFACE:
-        ping_opts += f" -I {MESH_SOURCE_INTERFACE}"
-
-    total_sent = 0
-    total_received = 0
-
-    for node_name, node_info in NODES.items():
-        rc, stdout, stderr = run_local(f"ping {ping_opts} {node_info.ip}")
-
-        # Parse packet loss from output
-        # Example: "100 packets transmitted, 98 received, 2% packet loss"
-        loss_pct = None
-        received = None
-        transmitted = None
-
-        for line in stdout.split("\n"):
-            if "packet loss" in line.lower():
-                # Try to extract loss percentage
-                match = re.search(r"(\d+(?:\.\d+)?)\s*%\s*packet loss", line, re.IGNORECASE)
-                if match:
-                    loss_pct = float(match.group(1))
-
-                # Also extract transmitted/received counts
-                match2 = re.search(
-                    r"(\d+)\s+packets transmitted.*?(\d+)\s+received", line, re.IGNORECASE
-                )
-                if match2:
-                    transmitted = int(match2.group(1))
-                    received = int(match2.group(2))
-                break
-
-        if loss_pct is not None:
-            total_sent += transmitted or ping_count
-            total_received += received or int(ping_count * (100 - loss_pct) / 100)
-
-            if loss_pct <= max_loss:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.PASS,
-                    message=f"{loss_pct:.1f}% loss ({ping_count} pings)",
-                    data={"packet_loss_pct": loss_pct, "ping_count": ping_count},
-                )
-            else:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.FAIL,
-                    message=f"{loss_pct:.1f}% loss exceeds {max_loss}% threshold",
-                    data={"packet_loss_pct": loss_pct, "ping_count": ping_count},
-                )
-        else:
-            if rc == 0:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.PASS,
-                    message=f"{ping_count} pings OK",
-                    data={"ping_count": ping_count},
-                )
-                total_sent += ping_count
-                total_received += ping_count
-            else:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.FAIL,
-                    message="Ping test failed",
-                )
+    interval_s = 1 / max(1, STRESS_RATE_PPS)
+    ping_count = max(1, round(STRESS_DURATION_S * STRESS_RATE_PPS))
+
+    analyzers = {info.ip: StressAnalyzer(interval_s) for info in NODES.values()}
+    stats = ping_hosts(
+        list(analyzers),
+        count=ping_count,
+        interval_s=interval_s,
+        timeout_s=2,
+        interface=MESH_SOURCE_INTERFACE,
+        on_outcome=lambda address, seq, rtt: analyzers[address].add(seq, rtt),
+    )
+
+    def check_node(node_name: str) -> NodeResult:
+        """Judge a single node's packet loss."""
+        ip = NODES[node_name].ip
+        analysis = analyzers[ip]
+        analysis.finish(stats[ip].sent)
+        status, message = _judge_stress(analysis)
+        data = {
+            "packet_loss_pct": round(analysis.loss_pct, 1),
+            "ping_count": ping_count,
+            "packets_sent": analysis.sent,
+            "packets_received": analysis.received,
+            **analysis.summary(),
+        }
+        return NodeResult(node=node_name, status=status, message=message, data=data)
+
+    fan_out(result, check_node)
+    total_sent = sum(r.data.get("packets_sent", 0) for r in result.nodes.values())
+    total_received = sum(r.data.get("packets_received", 0) for r in result.nodes.values())
 
     result.aggregate_status()
 
@@ -200,3 +196,207 @@ def check_stress_ping() -> CheckResult:  # noqa: C901
         result.message = "Stress test could not complete"
 
     return result
+
+
+def _judge(measurement: Measurement) -> str:
+    """Problem with one measurement, or "" if it meets the thresholds."""
+    if not measurement.ok:
+        return measurement.error or "no result"
+    if measurement.mode == "udp":
+        max_loss = THRESHOLDS.get("max_packet_loss_pct", 5)
+        if (measurement.lost_pct or 0) > max_loss:
+            return f"{measurement.lost_pct:.1f}% UDP loss exceeds {max_loss}%"
+        return ""
+    minimum = THRESHOLDS["min_wired_mbps"] if measurement.wired else THRESHOLDS["min_wireless_mbps"]
+    slowest = min(m for m in (measurement.mbps, measurement.reverse_mbps) if m is not None)
+    if slowest < minimum:
+        return f"{slowest:.0f} Mbit/s below {minimum} Mbit/s"
+    return ""
+
+
+def check_throughput() -> CheckResult:
+    """
+    Measure iperf3 throughput between every node pair and from the host.
+
+    Runs each configured mode (THROUGHPUT_MODES) for every pair, overlapping
+    measurements that share no mesh link or endpoint. A node fails if any
+    measurement it takes part in misses the wired/wireless minimum (or the
+    UDP loss limit), or could not run.
+
+    Returns:
+        CheckResult with the throughput matrix in data.
+    """
+    result = CheckResult(
+        category="performance.throughput",
+        status=CheckStatus.PASS,
+        message="",
+    )
+
+    jobs = plan_jobs(build_topology(), modes=THROUGHPUT_MODES)
+    matrix = run_sync(
+        run_matrix(
+            jobs,
+            duration_s=THROUGHPUT_DURATION_S,
+            streams=THROUGHPUT_STREAMS,
+            udp_mbps=THROUGHPUT_UDP_MBPS,
+        )
+    )
+
+    problems: Dict[str, List[str]] = {name: [] for name in NODES}
+    for measurement in matrix.measurements:
+        problem = _judge(measurement)
+        if problem:
+            for end in (measurement.client, measurement.server):
+                if end != HOST:
+                    problems[end].append(
+                        f"{measurement.client}->{measurement.server} {measurement.mode}: {problem}"
+                    )
+
+    for name, node_problems in problems.items():
+        if node_problems:
+            result.add_node_result(name, CheckStatus.FAIL, "; ".join(node_problems[:3]))
+        else:
+            result.add_node_result(name, CheckStatus.PASS, "Throughput OK")
+
+    result.data = {
+        "matrix": {mode: matrix.table(mode) for mode in THROUGHPUT_MODES},
+        "measurements": [asdict(m) for m in matrix.measurements],
+        "elapsed_s": matrix.elapsed_s,
+        "serial_s": round(matrix.serial_s, 2),
+    }
+    result.aggregate_status()
+
+    failed = sum(1 for m in matrix.measurements if _judge(m))
+    total = len(matrix.measurements)
+    if result.passed:
+        result.message = f"{total} throughput measurements OK in {matrix.elapsed_s:.0f}s"
+    else:
+        result.message = f"{failed}/{total} throughput measurements below threshold"
+    return result
+
+
+def _routed_problem(target: LatencyTarget, stats: PingStats) -> Tuple[CheckStatus, str]:
+    """(status, problem) for a node-to-node result, or (PASS, "")."""
+    max_loss = THRESHOLDS.get("max_packet_loss_pct", 5)
+    max_latency = THRESHOLDS.get("max_latency_ms", 50)
+    if not stats.received:
+        return CheckStatus.FAIL, f"{target.peer} unreachable"
+    if stats.loss_pct > max_loss:
+        return CheckStatus.FAIL, f"{target.peer} {stats.loss_pct:.0f}% loss"
+    if (stats.p99 or 0) > max_latency:
+        return CheckStatus.WARN, f"{target.peer} p99 {stats.p99:.1f}ms > {max_latency}ms"
+    return CheckStatus.PASS, ""
+
+
+def _link_problem(target: LatencyTarget, stats: PingStats) -> Tuple[CheckStatus, str]:
+    """(status, problem) for a single-link result, or (PASS, "")."""
+    if not stats.received:
+        # Link-local probes need IPv6 on the hard interface; not a mesh fault
+        return CheckStatus.WARN, f"{target.label} link probe got no replies"
+    wired = target.kind == WIRED
+    limit = THRESHOLDS["max_wired_p50_ms"] if wired else THRESHOLDS["max_wireless_p50_ms"]
+    if (stats.p50 or 0) > limit:
+        return CheckStatus.WARN, f"{target.label} p50 {stats.p50:.1f}ms > {limit}ms"
+    max_jitter = THRESHOLDS["max_jitter_ms"]
+    if wired and (stats.jitter or 0) > max_jitter:
+        return CheckStatus.WARN, f"{target.label} jitter {stats.jitter:.2f}ms > {max_jitter}ms"
+    return CheckStatus.PASS, ""
+
+
+def _judge_latency(
+    node_name: str, targets: List[LatencyTarget], results: Dict[str, PingStats]
+) -> NodeResult:
+    """Combine one node's per-target results into a NodeResult."""
+    status = CheckStatus.PASS
+    problems: List[str] = []
+    for target in targets:
+        stats = results.get(target.label, PingStats())
+        judge = _routed_problem if target.kind == ROUTED else _link_problem
+        target_status, problem = judge(target, stats)
+        if problem:
+            problems.append(problem)
+            if target_status == CheckStatus.FAIL or status == CheckStatus.PASS:
+                status = target_status
+
+    routed = [results[t.label] for t in targets if t.kind == ROUTED and t.label in results]
+    pooled = PingStats(rtts=[rtt for stats in routed for rtt in stats.rtts])
+    data: Dict[str, Any] = {"peers": len(routed), **pooled.summary()}
+    if problems:
+        message = "; ".join(problems[:3]) + (
+            f" (+{len(problems) - 3} more)" if problems[3:] else ""
+        )
+    else:
+        message = f"p50 {pooled.p50 or 0:.2f}ms, p99 {pooled.p99 or 0:.2f}ms to {len(routed)} peers"
+    return NodeResult(node=node_name, status=status, message=message, data=data)
+
+
+def check_latency_matrix() -> CheckResult:
+    """
+    Measure latency between every pair of nodes, from the nodes themselves.
+
+    Each node pings every other node and each of its direct-link neighbors
+    (pinned to the wired or mesh0 interface) concurrently over one SSH
+    session. Per-packet RTTs give p50/p90/p99/max and jitter per pair and
+    per path type.
+
+    Returns:
+        CheckResult with the latency matrix in data.
+    """
+    result = CheckResult(
+        category="performance.latency_matrix",
+        status=CheckStatus.PASS,
+        message="",
+    )
+
+    graph = build_topology()
+    matrix = LatencyMatrix(targets={node: plan_targets(node, graph) for node in NODES})
+    timeout = int(LATENCY_PROBE_COUNT * LATENCY_PROBE_INTERVAL_S) + 15
+
+    def check_node(node_name: str) -> NodeResult:
+        """Run one node's probes."""
+        targets = matrix.targets[node_name]
+        script = build_probe_script(targets, LATENCY_PROBE_COUNT, LATENCY_PROBE_INTERVAL_S)
+        _, stdout, stderr = NodeExecutor(node_name).run(script, timeout)
+        results = parse_probe_output(stdout)
+        if not results:
+            return NodeResult(
+                node=node_name,
+                status=CheckStatus.FAIL,
+                message=f"Probe failed: {stderr.strip() or 'no output'}",
+            )
+        matrix.results[node_name] = results
+        return _judge_latency(node_name, targets, results)
+
+    fan_out(result, check_node)
+    result.aggregate_status()
+
+    by_kind = matrix.by_kind()
+    result.data = {
+        "matrix": {
+            source: {peer: stats.summary() for peer, stats in peers.items()}
+            for source, peers in matrix.pairs().items()
+        },
+        "links": {
+            source: {
+                t.label: {"kind": t.kind, **matrix.results[source][t.label].summary()}
+                for t in targets
+                if t.kind != ROUTED and t.label in matrix.results.get(source, {})
+            }
+            for source, targets in matrix.targets.items()
+        },
+        "by_kind": {kind: stats.summary() for kind, stats in by_kind.items()},
+    }
+
+    paths = ", ".join(
+        f"{kind} p50 {stats.p50:.2f}ms" for kind, stats in by_kind.items() if stats.p50 is not None
+    )
+    pooled = PingStats(
+        rtts=[rtt for peers in matrix.pairs().values() for s in peers.values() for rtt in s.rtts]
+    )
+    if pooled.rtts:
+        result.message = f"Mesh latency p50 {pooled.p50:.2f}ms, p99 {pooled.p99:.2f}ms" + (
+            f" ({paths})" if paths else ""
+        )
+    else:
+        result.message = "Could not measure mesh latency"
+    return result
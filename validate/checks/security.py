@@ -6,9 +6,10 @@ Tier 3 (Comprehensive):
 - check_https: TLS certificates valid for LuCI
 """
 
-from validate.config import NODES
 from validate.core.executor import NodeExecutor
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.fanout import fan_out
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+from validate.core.snapshot import get_snapshot
 
 
 def check_ssh_hardening() -> CheckResult:  # noqa: C901
@@ -29,19 +30,24 @@ def check_ssh_hardening() -> CheckResult:  # noqa: C901
         message="",
     )
 
-    for node_name in NODES:
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         executor = NodeExecutor(node_name)
+        snapshot = get_snapshot(node_name)
         issues = []
 
-        # Check for OpenSSH (sshd) or Dropbear
-        rc_sshd, _, _ = executor.run("pgrep sshd")
-        rc_dropbear, _, _ = executor.run("pgrep dropbear")
+        # Daemon state and UCI come from the snapshot; read files in one round trip
+        (rc_config, config, _), (rc_key, _, _) = executor.run_batch(
+            [
+                "cat /etc/ssh/sshd_config 2>/dev/null",
+                "test -f /etc/dropbear/authorized_keys || test -f /root/.ssh/authorized_keys",
+            ]
+        )
 
-        if rc_sshd == 0:
+        # Check for OpenSSH (sshd) or Dropbear
+        if snapshot.process_running("sshd", exact=False):
             # OpenSSH - check sshd_config
-            rc, config, _ = executor.run("cat /etc/ssh/sshd_config 2>/dev/null")
-
-            if rc == 0:
+            if rc_config == 0:
                 # Check PasswordAuthentication
                 if "PasswordAuthentication yes" in config:
                     issues.append("password auth enabled")
@@ -50,44 +56,39 @@ def check_ssh_hardening() -> CheckResult:  # noqa: C901
                 if "PermitRootLogin yes" in config:
                     issues.append("root password login allowed")
 
-        elif rc_dropbear == 0:
+        elif snapshot.process_running("dropbear", exact=False):
             # Dropbear - check UCI config
-            rc, passwd_auth, _ = executor.run(
-                "uci get dropbear.@dropbear[0].PasswordAuth 2>/dev/null"
-            )
+            passwd_auth = snapshot.uci_get("dropbear.@dropbear[0].PasswordAuth") or ""
             if "on" in passwd_auth.lower():
                 issues.append("password auth enabled")
 
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="No SSH daemon running",
             )
-            continue
 
         # Check for SSH key
-        rc_key, _, _ = executor.run(
-            "test -f /etc/dropbear/authorized_keys || test -f /root/.ssh/authorized_keys"
-        )
-
         if rc_key != 0:
             issues.append("no authorized_keys")
 
         if issues:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=", ".join(issues),
                 data={"issues": issues},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message="SSH hardened",
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -117,39 +118,38 @@ def check_https() -> CheckResult:
         message="",
     )
 
-    for node_name in NODES:
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         executor = NodeExecutor(node_name)
 
-        # Check certificate exists
-        rc_cert, _, _ = executor.run("test -f /etc/uhttpd.crt")
-        rc_key, _, _ = executor.run("test -f /etc/uhttpd.key")
+        (rc_cert, _, _), (rc_key, _, _), (rc_valid, cert_info, _) = executor.run_batch(
+            [
+                "test -f /etc/uhttpd.crt",
+                "test -f /etc/uhttpd.key",
+                "openssl x509 -in /etc/uhttpd.crt -noout -dates 2>/dev/null | grep notAfter",
+            ]
+        )
 
+        # Check certificate exists
         if rc_cert != 0 or rc_key != 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="TLS certificate missing",
             )
-            continue
 
         # Check uhttpd is listening on HTTPS
-        rc, listen, _ = executor.run("uci get uhttpd.main.listen_https 2>/dev/null")
-
-        if rc != 0 or not listen.strip():
-            result.add_node_result(
+        listen = get_snapshot(node_name).uci_get("uhttpd.main.listen_https") or ""
+        if not listen.strip():
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="HTTPS not configured in uhttpd",
             )
-            continue
 
         # Check certificate validity (basic check)
-        rc_valid, cert_info, _ = executor.run(
-            "openssl x509 -in /etc/uhttpd.crt -noout -dates 2>/dev/null | grep notAfter"
-        )
-
         if rc_valid == 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message="HTTPS enabled",
@@ -157,12 +157,14 @@ def check_https() -> CheckResult:
             )
         else:
             # Certificate exists but couldn't verify - still OK
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message="HTTPS enabled (cert check skipped)",
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -6,9 +6,10 @@ Tier 3 (Comprehensive):
 - check_firewall: Firewall zones configured and running
 """
 
-from validate.config import NODES
 from validate.core.executor import NodeExecutor
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.fanout import fan_out
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+from validate.core.snapshot import get_snapshot
 
 
 def check_dhcp() -> CheckResult:
@@ -24,42 +25,37 @@ def check_dhcp() -> CheckResult:
         message="",
     )
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        snapshot = get_snapshot(node_name)
 
         # Check dnsmasq is running
-        rc, stdout, _ = executor.run("pgrep -x dnsmasq")
-
-        if rc != 0:
-            result.add_node_result(
+        if not snapshot.process_running("dnsmasq"):
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="dnsmasq not running",
             )
-            continue
 
         # Check DHCP pools are configured
-        rc2, pools, _ = executor.run("uci show dhcp | grep -c 'dhcp\\.'")
-
-        try:
-            pool_count = int(pools.strip()) if pools.strip() else 0
-        except ValueError:
-            pool_count = 0
+        pool_count = len(snapshot.uci_lines("dhcp"))
 
         if pool_count > 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"dnsmasq running, {pool_count} config entries",
                 data={"config_entries": pool_count},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="dnsmasq running but no DHCP config",
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -87,41 +83,46 @@ def check_firewall() -> CheckResult:
     # Core zones: lan (clients), wan (internet), iot (devices), management (admin)
     expected_zones = ["lan", "wan", "iot", "management"]
 
-    for node_name in NODES:
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         executor = NodeExecutor(node_name)
 
-        # Check firewall is running (fw4 for OpenWrt 22.03+)
-        rc, stdout, _ = executor.run("pgrep -f 'fw4\\|firewall' || /etc/init.d/firewall status")
+        rc, _, _ = executor.run("pgrep -f 'fw4\\|firewall' || /etc/init.d/firewall status")
 
+        # Check firewall is running (fw4 for OpenWrt 22.03+)
         if rc != 0:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message="Firewall not running",
             )
-            continue
 
         # Check zones exist
-        rc2, zones_out, _ = executor.run("uci show firewall | grep '\\.name=' | cut -d= -f2")
-        zones = [z.strip().strip("'\"") for z in zones_out.split("\n") if z.strip()]
+        zones = [
+            line.split("=", 1)[1].strip().strip("'\"")
+            for line in get_snapshot(node_name).uci_lines("firewall")
+            if ".name=" in line
+        ]
 
         missing = [z for z in expected_zones if z not in zones]
 
         if not missing:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"Firewall running, {len(zones)} zones",
                 data={"zones": zones},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"Missing zones: {', '.join(missing)}",
                 data={"zones": zones, "missing": missing},
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
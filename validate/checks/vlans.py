@@ -11,9 +11,17 @@ Tier 3 (Comprehensive):
 - check_guest_vlan: VLAN 20 (10.11.20.0/24)
 """
 
+import re
+
 from validate.config import NODES, VLANS
-from validate.core.executor import NodeExecutor
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.fanout import fan_out
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+from validate.core.snapshot import get_snapshot
+
+
+def _grep(text: str, pattern: str, flags: int = 0) -> str:
+    """Return the lines of text matching a regex, like grep -E."""
+    return "\n".join(line for line in text.splitlines() if re.search(pattern, line, flags))
 
 
 def check_mesh_vlan() -> CheckResult:
@@ -31,13 +39,13 @@ def check_mesh_vlan() -> CheckResult:
 
     vlan_id = VLANS.get("mesh", {}).get("id", 100)
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         # Check for VLAN interfaces
-        rc, stdout, _ = executor.run(f"ip link show | grep -E 'lan[34]\\.{vlan_id}'")
+        _, links, _ = get_snapshot(node_name).get("links")
+        stdout = _grep(links, rf"lan[34]\.{vlan_id}")
 
-        if rc == 0:
+        if stdout:
             # Count VLAN interfaces found
             interfaces = [
                 line.split(":")[1].strip().split("@")[0]
@@ -46,26 +54,28 @@ def check_mesh_vlan() -> CheckResult:
             ]
 
             if len(interfaces) >= 2:
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.PASS,
                     message=f"VLAN {vlan_id} on {', '.join(interfaces)}",
                     data={"interfaces": interfaces},
                 )
             else:
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.FAIL,
                     message=f"Only {len(interfaces)} VLAN interfaces (need 2)",
                     data={"interfaces": interfaces},
                 )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"No VLAN {vlan_id} interfaces found",
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -96,34 +106,38 @@ def check_client_vlan() -> CheckResult:
     # Extract network prefix for grep pattern (e.g., "10.11.12" from "10.11.12.0/24")
     network_base = expected_network.split("/")[0].rsplit(".", 1)[0]
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        snapshot = get_snapshot(node_name)
+        _, addresses, _ = snapshot.get("addresses")
+        uci_network = "\n".join(snapshot.uci_lines("network"))
 
         # Check for VLAN interface or bridge with client VLAN
-        rc, stdout, _ = executor.run(f"ip addr show | grep -E '({network_base}|vlan.*{vlan_id})'")
+        stdout = _grep(addresses, f"({re.escape(network_base)}|vlan.*{vlan_id})")
 
-        if rc == 0 and stdout.strip():
-            result.add_node_result(
+        if stdout.strip():
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"Client VLAN {vlan_id} configured",
             )
         else:
             # Check UCI configuration
-            rc2, uci_out, _ = executor.run(f"uci show network | grep -i vlan.*{vlan_id}")
-            if rc2 == 0:
-                result.add_node_result(
+            if _grep(uci_network, f"vlan.*{vlan_id}", re.IGNORECASE):
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.PASS,
                     message=f"Client VLAN {vlan_id} in UCI",
                 )
             else:
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.FAIL,
                     message=f"Client VLAN {vlan_id} not found",
                 )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
@@ -163,38 +177,40 @@ def _check_network_vlan(vlan_name: str, category: str) -> CheckResult:
 
     network_base = expected_network.split("/")[0].rsplit(".", 1)[0] if expected_network else ""
 
-    for node_name, node_info in NODES.items():
-        executor = NodeExecutor(node_name)
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        node_info = NODES[node_name]
+        snapshot = get_snapshot(node_name)
+        _, addresses, _ = snapshot.get("addresses")
 
         # Check for network interface with expected IP range
         if network_base:
             expected_ip = f"{network_base}.{node_info.node_num}"
-            rc, stdout, _ = executor.run(f"ip addr show | grep '{expected_ip}/'")
-
-            if rc == 0:
-                result.add_node_result(
+            if f"{expected_ip}/" in addresses:
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.PASS,
                     message=f"{expected_ip} configured",
                     data={"ip": expected_ip},
                 )
-                continue
 
         # Fallback: check UCI for VLAN
-        rc2, uci_out, _ = executor.run(f"uci show network | grep -i '{vlan_name}'")
-        if rc2 == 0:
-            result.add_node_result(
+        uci_network = "\n".join(snapshot.uci_lines("network"))
+        if _grep(uci_network, re.escape(vlan_name), re.IGNORECASE):
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"VLAN {vlan_id} in UCI",
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.FAIL,
                 message=f"VLAN {vlan_id} ({vlan_name}) not found",
             )
 
+    fan_out(result, check_node)
+
     result.aggregate_status()
 
     if result.passed:
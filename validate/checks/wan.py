@@ -6,12 +6,12 @@ Tier 3 (Comprehensive):
 - check_dns: DNS resolution working
 """
 
-from validate.config import NODES
-from validate.core.executor import NodeExecutor
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.executor import AsyncNodeExecutor
+from validate.core.fanout import fan_out_async
+from validate.core.results import CheckResult, CheckStatus, NodeResult
 
 
-def check_connectivity() -> CheckResult:  # noqa: C901
+async def check_connectivity() -> CheckResult:  # noqa: C901
     """
     Check internet connectivity from mesh nodes.
 
@@ -28,15 +28,14 @@ def check_connectivity() -> CheckResult:  # noqa: C901
 
     test_targets = ["8.8.8.8", "1.1.1.1"]
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
+    async def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        executor = AsyncNodeExecutor(node_name)
 
         # Try each target
-        connected = False
         for target in test_targets:
-            rc, stdout, _ = executor.run(f"ping -c 2 -W 3 {target}")
+            rc, stdout, _ = await executor.run(f"ping -c 2 -W 3 {target}")
             if rc == 0:
-                connected = True
                 # Extract latency
                 latency = None
                 for line in stdout.split("\n"):
@@ -49,20 +48,20 @@ def check_connectivity() -> CheckResult:  # noqa: C901
                                 pass
                         break
 
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.PASS,
                     message=f"WAN OK ({latency:.1f}ms)" if latency else "WAN OK",
                     data={"target": target, "latency_ms": latency},
                 )
-                break
 
-        if not connected:
-            result.add_node_result(
-                node=node_name,
-                status=CheckStatus.FAIL,
-                message="No internet connectivity",
-            )
+        return NodeResult(
+            node=node_name,
+            status=CheckStatus.FAIL,
+            message="No internet connectivity",
+        )
+
+    await fan_out_async(result, check_node)
 
     result.aggregate_status()
 
@@ -75,7 +74,7 @@ def check_connectivity() -> CheckResult:  # noqa: C901
     return result
 
 
-def check_dns() -> CheckResult:
+async def check_dns() -> CheckResult:
     """
     Check DNS resolution is working.
 
@@ -92,40 +91,39 @@ def check_dns() -> CheckResult:
 
     test_domains = ["google.com", "cloudflare.com"]
 
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
+    async def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
+        executor = AsyncNodeExecutor(node_name)
 
         # Try to resolve domains
-        resolved = False
         for domain in test_domains:
             # Use nslookup or host command
-            rc, stdout, _ = executor.run(f"nslookup {domain} 2>/dev/null | grep -i address")
+            rc, stdout, _ = await executor.run(f"nslookup {domain} 2>/dev/null | grep -i address")
 
             if rc == 0 and stdout.strip():
-                resolved = True
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.PASS,
                     message="DNS resolution OK",
                     data={"test_domain": domain},
                 )
-                break
 
-        if not resolved:
-            # Try with dig as fallback
-            rc2, dig_out, _ = executor.run(f"dig +short {test_domains[0]} 2>/dev/null")
-            if rc2 == 0 and dig_out.strip():
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.PASS,
-                    message="DNS resolution OK",
-                )
-            else:
-                result.add_node_result(
-                    node=node_name,
-                    status=CheckStatus.FAIL,
-                    message="DNS resolution failed",
-                )
+        # Try with dig as fallback
+        rc2, dig_out, _ = await executor.run(f"dig +short {test_domains[0]} 2>/dev/null")
+        if rc2 == 0 and dig_out.strip():
+            return NodeResult(
+                node=node_name,
+                status=CheckStatus.PASS,
+                message="DNS resolution OK",
+            )
+        else:
+            return NodeResult(
+                node=node_name,
+                status=CheckStatus.FAIL,
+                message="DNS resolution failed",
+            )
+
+    await fan_out_async(result, check_node)
 
     result.aggregate_status()
 
@@ -7,9 +7,13 @@ Tier 4 (Certification):
 - check_bla: Bridge Loop Avoidance enabled
 """
 
+import re
+
 from validate.config import NODES
 from validate.core.executor import NodeExecutor
-from validate.core.results import CheckResult, CheckStatus
+from validate.core.fanout import fan_out
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+from validate.core.snapshot import get_snapshot
 
 
 def check_mesh_wireless() -> CheckResult:  # noqa: C901
@@ -30,14 +34,14 @@ def check_mesh_wireless() -> CheckResult:  # noqa: C901
         message="",
     )
 
-    wireless_mesh_count = 0
-
-    for node_name in NODES:
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         executor = NodeExecutor(node_name)
+        rc, stdout, _ = executor.run("iw dev mesh0 info 2>/dev/null")
+        hardifs = get_snapshot(node_name).hardif_table.entries
+        wireless_ifs = [h.name for h in hardifs if re.search(r"wlan|phy|radio", h.name)]
 
         # Check if mesh0 interface exists (802.11s)
-        rc, stdout, stderr = executor.run("iw dev mesh0 info 2>/dev/null")
-
         if rc == 0:
             # Parse mesh info
             mesh_id = None
@@ -53,52 +57,47 @@ def check_mesh_wireless() -> CheckResult:  # noqa: C901
                     if len(parts) >= 2:
                         channel = parts[1]
 
-            wireless_mesh_count += 1
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"mesh0 active (SSID: {mesh_id}, ch: {channel})",
                 data={"mesh_id": mesh_id, "channel": channel, "type": "802.11s"},
             )
-            continue
 
         # Check for any wireless interface in batman mesh
-        rc2, stdout2, _ = executor.run("batctl if 2>/dev/null | grep -E 'wlan|phy|radio' | head -1")
-
-        if rc2 == 0 and stdout2.strip():
-            wireless_mesh_count += 1
-            iface = stdout2.strip().split()[0] if stdout2.strip() else "unknown"
-            result.add_node_result(
+        if wireless_ifs:
+            iface = wireless_ifs[0]
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"Wireless in batman: {iface}",
                 data={"interface": iface, "type": "batman-wireless"},
             )
-            continue
 
         # No wireless mesh found - check if wired mesh is working
-        rc3, stdout3, _ = executor.run("batctl if 2>/dev/null | wc -l")
-        try:
-            iface_count = int(stdout3.strip()) if rc3 == 0 else 0
-        except ValueError:
-            iface_count = 0
+        iface_count = len(hardifs)
 
         if iface_count >= 2:
             # Wired mesh is working, wireless is optional
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.PASS,
                 message=f"Wired mesh active ({iface_count} interfaces)",
                 data={"interface_count": iface_count, "type": "wired-only"},
             )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.WARN,
                 message="No wireless mesh, limited wired interfaces",
                 data={"interface_count": iface_count},
             )
 
+    fan_out(result, check_node)
+    wireless_mesh_count = sum(
+        1 for r in result.nodes.values() if r.data.get("type") in ("802.11s", "batman-wireless")
+    )
+
     result.aggregate_status()
 
     if wireless_mesh_count == len(NODES):
@@ -129,44 +128,45 @@ def check_roaming() -> CheckResult:  # noqa: C901
         message="",
     )
 
-    ft_configured = 0
-
-    for node_name in NODES:
-        executor = NodeExecutor(node_name)
-
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         # Check for 802.11r configuration in wireless config
         # Look for ieee80211r option in client AP configuration
-        rc, stdout, stderr = executor.run(
-            "uci show wireless 2>/dev/null | grep -E 'ieee80211r|ft_over_ds|ft_psk_generate'"
+        stdout = "\n".join(
+            line
+            for line in get_snapshot(node_name).uci_lines("wireless")
+            if re.search(r"ieee80211r|ft_over_ds|ft_psk_generate", line)
         )
 
-        if rc == 0 and stdout.strip():
+        if stdout.strip():
             # Parse the output to check if 802.11r is enabled
             has_11r = "ieee80211r='1'" in stdout or "ieee80211r=1" in stdout
 
             if has_11r:
-                ft_configured += 1
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.PASS,
                     message="802.11r enabled",
                     data={"ieee80211r": True},
                 )
             else:
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.WARN,
                     message="802.11r config found but not enabled",
                     data={"ieee80211r": False},
                 )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.WARN,
                 message="No 802.11r configuration found",
                 data={"ieee80211r": False},
             )
 
+    fan_out(result, check_node)
+    ft_configured = sum(1 for r in result.nodes.values() if r.data.get("ieee80211r"))
+
     result.aggregate_status()
 
     if ft_configured == len(NODES):
@@ -198,55 +198,54 @@ def check_bla() -> CheckResult:
         message="",
     )
 
-    all_have_bla = True
-
-    for node_name in NODES:
+    def check_node(node_name: str) -> NodeResult:
+        """Check a single node."""
         executor = NodeExecutor(node_name)
 
-        # Check BLA status
-        rc, stdout, stderr = executor.run(
-            "batctl meshif bat0 bla 2>/dev/null || batctl bla 2>/dev/null"
+        # Check BLA status, with sysfs as the alternate method
+        (rc, stdout, _), (rc2, stdout2, _) = executor.run_batch(
+            [
+                "batctl meshif bat0 bla 2>/dev/null || batctl bla 2>/dev/null",
+                "cat /sys/class/net/bat0/mesh/bridge_loop_avoidance 2>/dev/null",
+            ]
         )
 
-        if rc != 0:
-            # Try alternate method - check sysfs
-            rc2, stdout2, _ = executor.run(
-                "cat /sys/class/net/bat0/mesh/bridge_loop_avoidance 2>/dev/null"
-            )
-            if rc2 == 0:
-                stdout = stdout2
-                rc = 0
+        if rc != 0 and rc2 == 0:
+            stdout = stdout2
+            rc = 0
 
         if rc == 0:
             status_line = stdout.strip().lower()
             if "enabled" in status_line or status_line == "1":
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.PASS,
                     message="BLA enabled",
                     data={"bla_enabled": True},
                 )
             elif "disabled" in status_line or status_line == "0":
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.WARN,
                     message="BLA disabled",
                     data={"bla_enabled": False},
                 )
-                all_have_bla = False
             else:
-                result.add_node_result(
+                return NodeResult(
                     node=node_name,
                     status=CheckStatus.WARN,
                     message=f"BLA status unclear: {status_line}",
                 )
         else:
-            result.add_node_result(
+            return NodeResult(
                 node=node_name,
                 status=CheckStatus.WARN,
                 message="Could not check BLA status",
+                data={"bla_enabled": None},
             )
-            all_have_bla = False
+
+    fan_out(result, check_node)
+    all_have_bla = all(r.data.get("bla_enabled", True) for r in result.nodes.values())
 
     result.aggregate_status()
 
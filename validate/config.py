@@ -1,53 +1,21 @@
 """
 Network configuration constants for validation framework.
 
-Ported from tests/live/conftest.py for standalone use.
+Ported from tests/live/conftest.py for standalone use. The node list itself
+comes from the Ansible inventory (validate.inventory).
 """
 
 import os
-from dataclasses import dataclass
-from typing import Dict
-
-
-@dataclass
-class NodeInfo:
-    """Information about a mesh node."""
-
-    name: str
-    ip: str
-    node_num: int
-    gw_mode: str  # "server" or "client"
-    lan3_peer: str  # Node connected to LAN3
-    lan4_peer: str  # Node connected to LAN4
-
-
-# Node configuration matching the actual deployment
-NODES: Dict[str, NodeInfo] = {
-    "node1": NodeInfo(
-        name="mesh-node1",
-        ip="10.11.12.1",
-        node_num=1,
-        gw_mode="server",
-        lan3_peer="node2",
-        lan4_peer="node3",
-    ),
-    "node2": NodeInfo(
-        name="mesh-node2",
-        ip="10.11.12.2",
-        node_num=2,
-        gw_mode="server",
-        lan3_peer="node1",
-        lan4_peer="node3",
-    ),
-    "node3": NodeInfo(
-        name="mesh-node3",
-        ip="10.11.12.3",
-        node_num=3,
-        gw_mode="server",
-        lan3_peer="node2",
-        lan4_peer="node1",
-    ),
-}
+from typing import MutableMapping
+
+from validate.inventory import NodeInfo, NodeRegistry
+
+__all__ = ["NODES", "NodeInfo"]
+
+
+# Mesh nodes, loaded from the Ansible inventory on first access
+# (see validate.inventory; MESH_INVENTORY selects another inventory file)
+NODES: MutableMapping[str, NodeInfo] = NodeRegistry()
 
 # Network configuration
 NETWORK_CONFIG = {
@@ -63,6 +31,28 @@ NETWORK_CONFIG = {
 # Set to None to use default routing, or specify interface name
 MESH_SOURCE_INTERFACE = os.environ.get("MESH_SOURCE_INTERFACE", "enp5s0.200")
 
+# SSH connection multiplexing. When enabled, one master connection per node is
+# kept open for the whole run and every command is sent over it.
+SSH_MULTIPLEX = os.environ.get("MESH_SSH_MULTIPLEX", "1") != "0"
+
+# Idle seconds before an orphaned master connection exits on its own
+SSH_CONTROL_PERSIST = int(os.environ.get("MESH_SSH_CONTROL_PERSIST", "600"))
+
+# Maximum nodes a check queries concurrently
+MAX_PARALLEL_NODES = int(os.environ.get("MESH_MAX_PARALLEL_NODES", "8"))
+
+# Maximum checks the runner executes concurrently within a phase
+MAX_PARALLEL_CHECKS = int(os.environ.get("MESH_MAX_PARALLEL_CHECKS", "4"))
+
+# Maximum commands (ssh or local subprocesses) in flight at once
+MAX_INFLIGHT_COMMANDS = int(os.environ.get("MESH_MAX_INFLIGHT_COMMANDS", "256"))
+
+# Consecutive connection failures before a node's circuit opens
+CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("MESH_CIRCUIT_THRESHOLD", "2"))
+
+# Seconds an open circuit waits before letting a trial command through
+CIRCUIT_RESET_S = float(os.environ.get("MESH_CIRCUIT_RESET_S", "60"))
+
 # VLAN configuration
 VLANS = {
     "mesh": {"id": 100, "interfaces": ["lan3.100", "lan4.100"]},
@@ -88,9 +78,76 @@ THRESHOLDS = {
     "min_gateways": 3,
     "max_latency_ms": 50,
     "max_packet_loss_pct": 5,
+    "max_outage_ms": 300,
     "switch_response_timeout_ms": 200,
+    "max_convergence_ms": int(os.environ.get("MESH_MAX_CONVERGENCE_MS", "2000")),
+    "min_wired_mbps": 400,
+    "min_wireless_mbps": 50,
+    "max_wired_p50_ms": 2,
+    "max_wireless_p50_ms": 10,
+    "max_jitter_ms": 1,
 }
 
+# Time budgets: seconds each tier may take (its SLO; a run over it fails)
+# and the default seconds each check may take, 0 for unlimited. Checks that
+# overrun are stopped and reported as TIMEOUT.
+TIER_SLO_S = {
+    "smoke": float(os.environ.get("MESH_SLO_SMOKE_S", "30")),
+    "standard": float(os.environ.get("MESH_SLO_STANDARD_S", "180")),
+    "comprehensive": float(os.environ.get("MESH_SLO_COMPREHENSIVE_S", "600")),
+    "certification": float(os.environ.get("MESH_SLO_CERTIFICATION_S", "1800")),
+}
+CHECK_BUDGET_S = float(os.environ.get("MESH_CHECK_BUDGET_S", "60"))
+
+# Ping soak (performance.stress): test length and packets per second per node
+STRESS_DURATION_S = float(os.environ.get("MESH_STRESS_DURATION_S", "10"))
+STRESS_RATE_PPS = float(os.environ.get("MESH_STRESS_PPS", "10"))
+
+# Link-failover convergence probe (failover.convergence): packets per second
+# and how long the mesh link is held down
+CONVERGENCE_PROBE_PPS = int(os.environ.get("MESH_CONVERGENCE_PPS", "100"))
+CONVERGENCE_HOLD_S = float(os.environ.get("MESH_CONVERGENCE_HOLD_S", "5"))
+
+# iperf3 throughput matrix (performance.throughput): modes to measure, seconds
+# per run, streams for tcp-multi and offered rate (Mbit/s) for udp
+THROUGHPUT_MODES = os.environ.get("MESH_THROUGHPUT_MODES", "tcp,tcp-multi,bidir,udp").split(",")
+THROUGHPUT_DURATION_S = int(os.environ.get("MESH_THROUGHPUT_DURATION_S", "10"))
+THROUGHPUT_STREAMS = int(os.environ.get("MESH_THROUGHPUT_STREAMS", "4"))
+THROUGHPUT_UDP_MBPS = int(os.environ.get("MESH_THROUGHPUT_UDP_MBPS", "100"))
+
+# Node-to-node latency matrix (performance.latency_matrix): pings per target
+# and seconds between them
+LATENCY_PROBE_COUNT = int(os.environ.get("MESH_LATENCY_COUNT", "50"))
+LATENCY_PROBE_INTERVAL_S = float(os.environ.get("MESH_LATENCY_INTERVAL_S", "0.05"))
+
+# Validation history database (python -m validate history)
+HISTORY_DB = os.path.expanduser(
+    os.environ.get("MESH_HISTORY_DB", "~/.local/share/mesh-validate/history.db")
+)
+
+# Incremental runs (--incremental): where reused results are kept, and the
+# oldest result that may be reused
+RESULT_CACHE = os.path.expanduser(
+    os.environ.get("MESH_RESULT_CACHE", "~/.cache/mesh-validate/results.json")
+)
+INCREMENTAL_MAX_AGE_S = float(os.environ.get("MESH_INCREMENTAL_MAX_AGE_S", "3600"))
+
+# Metrics exporter (python -m validate export): default seconds between runs
+# of each tier
+EXPORT_INTERVAL_S = float(os.environ.get("MESH_EXPORT_INTERVAL_S", "300"))
+
+# Watch mode (python -m validate watch): seconds between polls of the routing
+# state, seconds between full runs, and the smallest TQ decrease reported
+WATCH_INTERVAL_S = float(os.environ.get("MESH_WATCH_INTERVAL_S", "10"))
+WATCH_FULL_INTERVAL_S = float(os.environ.get("MESH_WATCH_FULL_INTERVAL_S", "900"))
+WATCH_TQ_DROP = int(os.environ.get("MESH_WATCH_TQ_DROP", "50"))
+
+# Fleet mode (python -m validate fleet): sites validated at once, each in its
+# own worker process, and the commands each site may have in flight. Memory
+# on the control host grows with FLEET_WORKERS, not with the number of sites.
+FLEET_WORKERS = int(os.environ.get("MESH_FLEET_WORKERS", "8"))
+FLEET_SITE_INFLIGHT = int(os.environ.get("MESH_FLEET_SITE_INFLIGHT", "32"))
+
 
 def get_ssh_key_path() -> str:
     """Get the SSH key path from environment or default."""
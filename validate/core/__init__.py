@@ -4,18 +4,86 @@ Core validation framework components.
 Provides execution, result handling, and orchestration.
 """
 
-from validate.core.executor import NodeExecutor, run_local, run_on_node, ssh_command
-from validate.core.results import CheckResult, CheckStatus, PhaseResult, ValidationResult
-from validate.core.runner import ValidationRunner
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from validate.core.engine import run_sync
+    from validate.core.executor import (
+        AsyncNodeExecutor,
+        NodeExecutor,
+        close_sessions,
+        get_transport,
+        run_local,
+        run_local_async,
+        run_on_node,
+        run_on_node_async,
+        set_transport,
+        ssh_command,
+        ssh_command_async,
+    )
+    from validate.core.fanout import fan_out, fan_out_async
+    from validate.core.results import CheckResult, CheckStatus, PhaseResult, ValidationResult
+    from validate.core.runner import ValidationRunner
+    from validate.core.snapshot import NodeSnapshot, get_snapshot, refresh_snapshot
+
+# Exported name -> module defining it. Modules are imported on first use, so
+# importing one core module (or listing checks) doesn't start the engine.
+_EXPORTS = {
+    "run_sync": "validate.core.engine",
+    "AsyncNodeExecutor": "validate.core.executor",
+    "NodeExecutor": "validate.core.executor",
+    "close_sessions": "validate.core.executor",
+    "get_transport": "validate.core.executor",
+    "run_local": "validate.core.executor",
+    "run_local_async": "validate.core.executor",
+    "run_on_node": "validate.core.executor",
+    "run_on_node_async": "validate.core.executor",
+    "set_transport": "validate.core.executor",
+    "ssh_command": "validate.core.executor",
+    "ssh_command_async": "validate.core.executor",
+    "fan_out": "validate.core.fanout",
+    "fan_out_async": "validate.core.fanout",
+    "CheckResult": "validate.core.results",
+    "CheckStatus": "validate.core.results",
+    "PhaseResult": "validate.core.results",
+    "ValidationResult": "validate.core.results",
+    "ValidationRunner": "validate.core.runner",
+    "NodeSnapshot": "validate.core.snapshot",
+    "get_snapshot": "validate.core.snapshot",
+    "refresh_snapshot": "validate.core.snapshot",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name's module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 
 __all__ = [
+    "run_sync",
+    "AsyncNodeExecutor",
     "NodeExecutor",
+    "close_sessions",
+    "get_transport",
     "run_local",
+    "run_local_async",
     "run_on_node",
+    "run_on_node_async",
+    "set_transport",
     "ssh_command",
+    "ssh_command_async",
+    "fan_out",
+    "fan_out_async",
     "CheckResult",
     "CheckStatus",
     "PhaseResult",
     "ValidationResult",
     "ValidationRunner",
+    "NodeSnapshot",
+    "get_snapshot",
+    "refresh_snapshot",
 ]
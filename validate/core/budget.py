@@ -0,0 +1,75 @@
+"""
+Time budgets for running checks.
+
+The runner gives every check a deadline: the check's own budget, capped by
+what is left of the tier's SLO. The deadline is held in a context variable,
+which follows the check into its worker thread and into every command it
+submits to the engine loop, so the executor can preempt commands instead of
+letting a hung one run out its full timeout:
+
+- a command's timeout is cut to the time left before the deadline
+- once the deadline has passed, commands are refused without running
+
+At the deadline the runner stops waiting and reports the check as TIMEOUT.
+An async check is cancelled; a sync check cannot be, so its worker thread is
+abandoned, and winds down quickly because its remaining commands are
+refused.
+"""
+
+import contextlib
+import math
+import time
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Returned (as stderr, with rc -1) for commands refused after the deadline
+BUDGET_EXHAUSTED = "Check time budget exhausted"
+
+# Monotonic time by which the current check must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("check_deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Set the deadline of the current context (and of tasks and copied
+    contexts created inside it).
+
+    Args:
+        seconds: Time allowed from now (None for no deadline).
+    """
+    token = _deadline.set(None if seconds is None else time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Get the time left before the current deadline.
+
+    Returns:
+        Seconds (negative once passed), or None without a deadline.
+    """
+    until = _deadline.get()
+    return None if until is None else until - time.monotonic()
+
+
+def command_timeout(timeout: int) -> Optional[int]:
+    """
+    Cap a command's timeout to the current deadline.
+
+    Args:
+        timeout: The command's own timeout in seconds.
+
+    Returns:
+        The timeout to use, or None if the deadline has passed and the
+        command should not run.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        return None
+    return min(timeout, max(1, math.ceil(left)))
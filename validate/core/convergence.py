@@ -0,0 +1,219 @@
+"""
+Link-failover convergence measurement.
+
+A single shell script runs on the source node so that the probe stream and
+the link events share one clock (``/proc/uptime``) and the link is restored
+even if the SSH session drops:
+
+1. start a fixed-rate ping (e.g. 100 pps) to the target node
+2. take the mesh interface down, hold it down, bring it back up
+3. poll ``batctl n`` until the neighbor is re-learned on the interface
+4. print the event times and the ping output
+
+With a fixed send interval, every sequence number maps to a send time, so
+sequence gaps give the exact outage window, packets lost, time-to-reroute
+after the link fails and the loss window on failback.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# First line of the probe script (the simulator recognizes it)
+PROBE_MARKER = "# mesh-convergence-probe"
+
+# Loss starting this close to a link event is attributed to it; later gaps
+# are ordinary packet loss (the uptime clock itself has 10ms resolution)
+EVENT_SLACK_S = 0.1
+
+_EVENT_RE = re.compile(r"^EVENT (?P<name>\w+) (?P<uptime>\d+(?:\.\d+)?)\s*$")
+# busybox ("seq=0") and iputils ("icmp_seq=1") reply lines
+_REPLY_RE = re.compile(r"bytes from .*?\b(?P<kind>icmp_seq|seq)=(?P<seq>\d+)\b")
+
+
+@dataclass
+class ProbePlan:
+    """Timing of one convergence measurement."""
+
+    iface: str
+    target_ip: str
+    pps: int = 100
+    lead_s: float = 1.0  # Probe runs this long before the link goes down
+    hold_s: float = 5.0  # Link stays down this long
+    tail_s: float = 4.0  # Probe keeps running this long after restore
+    rejoin_timeout_s: float = 30.0
+
+    @property
+    def interval_s(self) -> float:
+        """Seconds between probe packets."""
+        return 1.0 / self.pps
+
+    @property
+    def count(self) -> int:
+        """Probe packets sent over the whole measurement."""
+        return int(round((self.lead_s + self.hold_s + self.tail_s) * self.pps))
+
+    @property
+    def timeout_s(self) -> int:
+        """Upper bound on the script's run time, for the SSH command timeout."""
+        return int(self.lead_s + self.hold_s + self.tail_s + self.rejoin_timeout_s) + 10
+
+
+@dataclass
+class Convergence:
+    """Outcome of one convergence measurement."""
+
+    sent: int
+    received: int
+    interval_ms: float
+    outage_ms: float = 0.0  # Loss window after the link went down
+    reroute_ms: Optional[float] = None  # Link down until traffic flowed again
+    failback_outage_ms: float = 0.0  # Loss window after the link came back
+    failback_ms: Optional[float] = None  # Link up until the neighbor was re-learned
+    gaps: List[Tuple[int, int]] = field(default_factory=list)  # (first seq, length)
+
+    @property
+    def lost(self) -> int:
+        """Probe packets lost over the whole measurement."""
+        return self.sent - self.received
+
+
+def build_probe_script(plan: ProbePlan) -> str:
+    """
+    Build the remote measurement script.
+
+    The link is brought back up whenever the script exits, including when
+    the SSH session drops (SIGHUP) or its output pipe breaks (SIGPIPE).
+
+    Args:
+        plan: What to probe and for how long.
+
+    Returns:
+        POSIX sh script (busybox compatible) printing ``EVENT <name>
+        <uptime>`` lines followed by the ping output.
+    """
+    rejoin_polls = int(plan.rejoin_timeout_s * 10)
+    return "\n".join(
+        [
+            f"{PROBE_MARKER} iface={plan.iface} target={plan.target_ip} "
+            f"pps={plan.pps} lead={plan.lead_s:g} hold={plan.hold_s:g}",
+            f"IF={plan.iface}",
+            "OUT=/tmp/convergence.$$",
+            "now() { cut -d' ' -f1 /proc/uptime; }",
+            "trap 'ip link set $IF up; rm -f $OUT' EXIT",
+            "trap 'exit 1' HUP INT TERM PIPE",
+            'echo "EVENT start $(now)"',
+            f"ping -i {plan.interval_s:g} -c {plan.count} -W 1 {plan.target_ip} >$OUT 2>&1 &",
+            "PROBE=$!",
+            f"sleep {plan.lead_s:g}",
+            'echo "EVENT down $(now)"',
+            "ip link set $IF down",
+            f"sleep {plan.hold_s:g}",
+            "ip link set $IF up",
+            'echo "EVENT up $(now)"',
+            "n=0",
+            f"while [ $n -lt {rejoin_polls} ]; do",
+            '  batctl n 2>/dev/null | grep -q "^ *$IF[[:space:]]" && break',
+            "  sleep 0.1; n=$((n + 1))",
+            "done",
+            f'[ $n -lt {rejoin_polls} ] && echo "EVENT rejoined $(now)"',
+            "wait $PROBE",
+            "cat $OUT",
+        ]
+    )
+
+
+def parse_probe_output(output: str) -> Tuple[Dict[str, float], List[int]]:
+    """
+    Split probe script output into events and received sequence numbers.
+
+    Args:
+        output: Script stdout.
+
+    Returns:
+        Tuple of (event name -> uptime seconds, received sequence numbers
+        renumbered from 0).
+    """
+    events: Dict[str, float] = {}
+    seqs: List[int] = []
+    base = 0
+    for line in output.splitlines():
+        event = _EVENT_RE.match(line)
+        if event:
+            events[event["name"]] = float(event["uptime"])
+            continue
+        reply = _REPLY_RE.search(line)
+        if reply:
+            base = 1 if reply["kind"] == "icmp_seq" else 0  # iputils counts from 1
+            seqs.append(int(reply["seq"]))
+    return events, sorted({seq - base for seq in seqs})
+
+
+def _gaps(received: List[int], sent: int) -> List[Tuple[int, int]]:
+    """Runs of missing sequence numbers as (first seq, length)."""
+    gaps = []
+    expected = 0
+    for seq in received + [sent]:
+        if seq > expected:
+            gaps.append((expected, seq - expected))
+        expected = max(expected, seq + 1)
+    return gaps
+
+
+def _gap_at(gaps: List[Tuple[int, int]], seq: int, slack: int) -> Optional[Tuple[int, int]]:
+    """The gap beginning within slack packets of seq, if any."""
+    for first, length in gaps:
+        if abs(first - seq) <= slack:
+            return first, length
+    return None
+
+
+def analyze(output: str, plan: ProbePlan) -> Convergence:
+    """
+    Compute convergence figures from probe script output.
+
+    Args:
+        output: Script stdout.
+        plan: Plan the script was built from.
+
+    Returns:
+        Convergence measurements.
+
+    Raises:
+        ValueError: If the output lacks the start/down/up events.
+    """
+    events, received = parse_probe_output(output)
+    missing = [name for name in ("start", "down", "up") if name not in events]
+    if missing:
+        raise ValueError(f"Probe output missing events: {', '.join(missing)}")
+
+    interval_ms = plan.interval_s * 1000
+    sent = plan.count
+    received = [seq for seq in received if seq < sent]
+
+    def seq_at(event: str) -> int:
+        return int(math.ceil((events[event] - events["start"]) / plan.interval_s))
+
+    down_seq, up_seq = seq_at("down"), seq_at("up")
+    gaps = _gaps(received, sent)
+    result = Convergence(sent=sent, received=len(received), interval_ms=interval_ms, gaps=gaps)
+
+    slack = int(math.ceil(EVENT_SLACK_S / plan.interval_s))
+
+    outage = _gap_at(gaps, down_seq, slack)
+    if outage is None:
+        result.reroute_ms = 0.0
+    else:
+        first, length = outage
+        result.outage_ms = length * interval_ms
+        if first + length < up_seq:
+            result.reroute_ms = max(0, first + length - down_seq) * interval_ms
+        # else: traffic only resumed once the link was back
+
+    failback = _gap_at(gaps, up_seq, slack)
+    if failback is not None:
+        result.failback_outage_ms = failback[1] * interval_ms
+    if "rejoined" in events:
+        result.failback_ms = round((events["rejoined"] - events["up"]) * 1000, 1)
+    return result
@@ -0,0 +1,168 @@
+"""
+Shared asyncio engine for remote and local command execution.
+
+All commands run as asyncio subprocesses. Synchronous callers (the existing
+executor API, sync checks running in worker threads) submit coroutines to a
+single background event loop with run_sync(), so a whole validation run -
+async checks, sync checks and every command they issue - shares one loop.
+
+The number of commands in flight is bounded per loop (MAX_INFLIGHT_COMMANDS),
+which caps the number of live ssh client processes and buffered outputs no
+matter how many nodes or checks are fanned out.
+"""
+
+import asyncio
+import os
+import signal
+import threading
+import weakref
+from typing import Any, Coroutine, Optional, Tuple, TypeVar
+
+from validate.config import MAX_INFLIGHT_COMMANDS
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+# Tighter bound on commands in flight per loop, if set (see limit_commands)
+_max_inflight: Optional[int] = None
+
+# Per-loop command semaphores; asyncio primitives are bound to one loop
+_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def engine_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background engine loop, starting it on first use.
+
+    Returns:
+        Running event loop owned by a daemon thread.
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="validate-engine", daemon=True)
+            thread.start()
+            _loop, _loop_thread = loop, thread
+        return _loop
+
+
+def in_engine_thread() -> bool:
+    """Return True if called from the engine loop's own thread."""
+    return _loop_thread is not None and threading.current_thread() is _loop_thread
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the engine loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result (exceptions are re-raised).
+
+    Raises:
+        RuntimeError: If called from the engine loop thread, where blocking
+            would deadlock; await the coroutine there instead.
+    """
+    if in_engine_thread():
+        coro.close()
+        raise RuntimeError("run_sync() called from the engine loop; await instead")
+    return asyncio.run_coroutine_threadsafe(coro, engine_loop()).result()
+
+
+def command_slots() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding in-flight commands on the running loop.
+
+    Returns:
+        Semaphore with MAX_INFLIGHT_COMMANDS slots (or fewer, see
+        limit_commands).
+    """
+    loop = asyncio.get_running_loop()
+    slots = _slots.get(loop)
+    if slots is None:
+        limit = MAX_INFLIGHT_COMMANDS if _max_inflight is None else _max_inflight
+        slots = asyncio.Semaphore(max(1, min(MAX_INFLIGHT_COMMANDS, limit)))
+        _slots[loop] = slots
+    return slots
+
+
+def limit_commands(limit: Optional[int]) -> None:
+    """
+    Allow fewer commands in flight than MAX_INFLIGHT_COMMANDS.
+
+    Fleet workers use this so that many sites validated at once stay within
+    the control host's process and memory limits. Applies to loops whose
+    semaphore is created afterwards.
+
+    Args:
+        limit: Most commands in flight at once (at least 1), or None to
+            lift the limit.
+    """
+    global _max_inflight
+    _max_inflight = None if limit is None else max(1, limit)
+
+
+async def run_process(
+    *args: str, timeout: float, shell: bool = False, capture_stdout: bool = True
+) -> Tuple[int, str, str]:
+    """
+    Run a subprocess and collect its output, within a command slot.
+
+    Args:
+        args: Program and arguments, or a single shell string if shell=True.
+        timeout: Seconds before the process is killed.
+        shell: Run args[0] through the shell.
+        capture_stdout: Pipe stdout back; when False it goes to /dev/null
+            (for processes that daemonize and would hold the pipe open).
+
+    Returns:
+        Tuple of (return_code, stdout, stderr). Timeouts and spawn failures
+        return -1 with the error in stderr.
+    """
+    async with command_slots():
+        stdout_pipe = asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL
+        try:
+            if shell:
+                proc = await asyncio.create_subprocess_shell(
+                    args[0],
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=stdout_pipe,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True,
+                )
+            else:
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=stdout_pipe,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True,
+                )
+        except Exception as e:
+            return -1, "", str(e)
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            # Kill the whole group: a shell's children would otherwise keep
+            # the pipes (and this coroutine) open until they exit
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+            await proc.wait()
+            return -1, "", f"Command timed out after {timeout:g}s"
+
+        return (
+            proc.returncode if proc.returncode is not None else -1,
+            (stdout or b"").decode(errors="replace"),
+            (stderr or b"").decode(errors="replace"),
+        )
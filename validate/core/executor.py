@@ -2,12 +2,258 @@
 SSH execution utilities for network validation.
 
 Ported from tests/live/conftest.py for standalone use.
+
+SSH connections are multiplexed: the first command sent to a node opens a
+master connection (OpenSSH ControlMaster) and every later command reuses it,
+so only the first call per node pays for the key exchange. Masters are torn
+down at interpreter exit (see close_sessions).
+
+Every command is an asyncio subprocess (see validate.core.engine). The
+``*_async`` functions and AsyncNodeExecutor are the native API; the plain
+functions and NodeExecutor are thin wrappers that run them on the shared
+engine loop, for use from synchronous checks.
+
+Commands go through the active transport (set_transport). SSHTransport runs
+them for real; see validate.core.transport for record and replay.
 """
 
+import asyncio
+import atexit
+import os
+import re
+import shutil
 import subprocess
-from typing import List, Tuple
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from validate.config import NODES, SSH_CONTROL_PERSIST, SSH_MULTIPLEX, get_ssh_key_path
+from validate.core import icmp
+from validate.core.budget import BUDGET_EXHAUSTED, command_timeout
+from validate.core.engine import run_process, run_sync
+from validate.core.health import circuit, is_connection_failure
+from validate.core.timing import record_command
+from validate.core.transport import Transport
+from validate.parsers.ping import PingStats
+
+# Directory holding the ControlPath sockets for this process
+_control_dir: Optional[str] = None
+
+# Nodes a master connection has been opened (or attempted) for
+_masters: Set[str] = set()
+# Idle seconds before a master exits (see keep_sessions)
+_control_persist = SSH_CONTROL_PERSIST
+_state_lock = threading.Lock()
+
+# Per-loop, per-node locks so concurrent callers don't race to open a master
+_master_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _ssh_options() -> List[str]:
+    """Common SSH options for all node connections."""
+    return [
+        "-o",
+        "StrictHostKeyChecking=no",
+        "-o",
+        "UserKnownHostsFile=/dev/null",
+        "-o",
+        "ConnectTimeout=10",
+        "-o",
+        "BatchMode=yes",
+        "-i",
+        get_ssh_key_path(),
+    ]
+
+
+def _control_path(node_ip: str) -> str:
+    """
+    Get the ControlPath socket for a node, creating the socket directory.
+
+    Args:
+        node_ip: IP address of the node.
+
+    Returns:
+        Path to the node's control socket.
+    """
+    global _control_dir
+    with _state_lock:
+        if _control_dir is None:
+            _control_dir = tempfile.mkdtemp(prefix="mesh-ssh-")
+            atexit.register(close_sessions)
+        return os.path.join(_control_dir, node_ip)
+
+
+def _master_lock(node_ip: str) -> asyncio.Lock:
+    """Get the lock guarding master setup for a node on the running loop."""
+    locks = _master_locks.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(node_ip, asyncio.Lock())
 
-from validate.config import NODES, get_ssh_key_path
+
+async def _ensure_master(node_ip: str, timeout: int) -> Tuple[bool, str]:
+    """
+    Open the master connection for a node if it is not already running.
+
+    Args:
+        node_ip: IP address of the node.
+        timeout: Connection timeout in seconds.
+
+    Returns:
+        Tuple of (success, error message).
+    """
+    control_path = _control_path(node_ip)
+
+    async with _master_lock(node_ip):
+        if os.path.exists(control_path):
+            return True, ""
+
+        with _state_lock:
+            _masters.add(node_ip)
+
+        # -f backgrounds the master once authenticated; stdio goes to
+        # /dev/null so the detached process doesn't hold our pipes open.
+        cmd = [
+            "ssh",
+            *_ssh_options(),
+            "-o",
+            "ControlMaster=yes",
+            "-o",
+            f"ControlPath={control_path}",
+            "-o",
+            f"ControlPersist={_control_persist}",
+            "-M",
+            "-N",
+            "-f",
+            f"root@{node_ip}",
+        ]
+        rc, _, stderr = await run_process(*cmd, timeout=timeout, capture_stdout=False)
+        if rc != 0:
+            return False, stderr
+        return True, ""
+
+
+def ssh_args(node_ip: str) -> List[str]:
+    """
+    Build the ssh argument list (without the remote command) for a node.
+
+    Args:
+        node_ip: IP address of the node.
+
+    Returns:
+        Argument list starting with "ssh".
+    """
+    opts = _ssh_options()
+    if SSH_MULTIPLEX:
+        # ControlMaster=no: reuse the master if present, otherwise ssh
+        # silently falls back to a direct connection.
+        opts += [
+            "-o",
+            "ControlMaster=no",
+            "-o",
+            f"ControlPath={_control_path(node_ip)}",
+        ]
+    return ["ssh", *opts, f"root@{node_ip}"]
+
+
+class SSHTransport(Transport):
+    """Runs commands for real: over (multiplexed) ssh, or in a local shell."""
+
+    async def ssh(self, node_ip: str, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Run a command on a node over ssh."""
+        if SSH_MULTIPLEX:
+            ok, error = await _ensure_master(node_ip, timeout)
+            if not ok:
+                return 255, "", error
+
+        return await run_process(*ssh_args(node_ip), command, timeout=timeout)
+
+    async def local(self, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Run a shell command on the validation host."""
+        return await run_process(command, timeout=timeout, shell=True)
+
+    async def ping(
+        self,
+        addresses: Sequence[str],
+        count: int,
+        interval_s: float,
+        timeout_s: float,
+        interface: str,
+        on_outcome: Optional[icmp.Outcome] = None,
+    ) -> Dict[str, PingStats]:
+        """Ping in-process over an ICMP socket, falling back to ping subprocesses."""
+        if icmp.native_error() is None:
+            try:
+                return await icmp.ping_native(
+                    addresses, count, interval_s, timeout_s, interface, on_outcome
+                )
+            except (OSError, ValueError):
+                pass
+        return await super().ping(addresses, count, interval_s, timeout_s, interface, on_outcome)
+
+    def close(self) -> None:
+        """Tear down master connections."""
+        close_sessions()
+
+
+_transport: Transport = SSHTransport()
+
+
+def get_transport() -> Transport:
+    """Get the transport commands are currently sent through."""
+    return _transport
+
+
+def set_transport(transport: Transport) -> Transport:
+    """
+    Send all later commands through a different transport.
+
+    Args:
+        transport: Transport to use (e.g. a RecordingTransport).
+
+    Returns:
+        The previously active transport (not closed).
+    """
+    global _transport
+    previous, _transport = _transport, transport
+    return previous
+
+
+async def ssh_command_async(node_ip: str, command: str, timeout: int = 30) -> Tuple[int, str, str]:
+    """
+    Execute a command on a node via SSH, asynchronously.
+
+    Args:
+        node_ip: IP address of the node.
+        command: Command to execute.
+        timeout: Command timeout in seconds.
+
+    Returns:
+        Tuple of (return_code, stdout, stderr). While the node's circuit is
+        open, returns 255 immediately without contacting the node; once the
+        calling check's time budget is used up, returns -1 without running
+        (see validate.core.budget).
+    """
+    capped = command_timeout(timeout)
+    if capped is None:
+        return -1, "", BUDGET_EXHAUSTED
+    breaker = circuit(node_ip)
+    if not breaker.allow():
+        return 255, "", f"Node {node_ip} unreachable (circuit open)"
+
+    started = time.monotonic()
+    rc, stdout, stderr = await _transport.ssh(node_ip, command, capped)
+    failed = is_connection_failure(rc, stderr)
+    record_command(node_ip, time.monotonic() - started, failed)
+    if not failed:
+        breaker.record_success()
+    elif capped == timeout:
+        # A command cut short by the check's budget says nothing about the node
+        breaker.record_failure()
+    return rc, stdout, stderr
 
 
 def ssh_command(node_ip: str, command: str, timeout: int = 30) -> Tuple[int, str, str]:
@@ -22,29 +268,74 @@ def ssh_command(node_ip: str, command: str, timeout: int = 30) -> Tuple[int, str
     Returns:
         Tuple of (return_code, stdout, stderr).
     """
-    ssh_key = get_ssh_key_path()
-    ssh_opts = [
-        "-o",
-        "StrictHostKeyChecking=no",
-        "-o",
-        "UserKnownHostsFile=/dev/null",
-        "-o",
-        "ConnectTimeout=10",
-        "-o",
-        "BatchMode=yes",
-        "-i",
-        ssh_key,
-    ]
+    return run_sync(ssh_command_async(node_ip, command, timeout))
+
+
+def keep_sessions(idle_s: int) -> None:
+    """
+    Keep master connections open through idle gaps of at least idle_s.
+
+    Long-running callers that run commands in bursts (e.g. the metrics
+    exporter between scheduled runs) use this so each burst reuses the
+    connections of the last one. Applies to masters opened afterwards.
+
+    Args:
+        idle_s: Idle seconds a master must survive (never lowers
+            SSH_CONTROL_PERSIST).
+    """
+    global _control_persist
+    _control_persist = max(SSH_CONTROL_PERSIST, int(idle_s))
+
+
+def close_sessions() -> None:
+    """
+    Tear down all master connections opened by this process.
 
-    cmd = ["ssh", *ssh_opts, f"root@{node_ip}", command]
+    Registered with atexit when the first master is opened; safe to call
+    more than once.
+    """
+    global _control_dir
+    with _state_lock:
+        control_dir = _control_dir
+        nodes = list(_masters)
+        _control_dir = None
+        _masters.clear()
+
+    if control_dir is None:
+        return
+
+    for node_ip in nodes:
+        control_path = os.path.join(control_dir, node_ip)
+        if not os.path.exists(control_path):
+            continue
+        try:
+            subprocess.run(
+                ["ssh", "-o", f"ControlPath={control_path}", "-O", "exit", f"root@{node_ip}"],
+                capture_output=True,
+                timeout=5,
+            )
+        except Exception:
+            pass
+
+    shutil.rmtree(control_dir, ignore_errors=True)
+
+
+async def run_on_node_async(node: str, command: str, timeout: int = 30) -> Tuple[int, str, str]:
+    """
+    Execute a command on a named node, asynchronously.
+
+    Args:
+        node: Node name (node1, node2, node3).
+        command: Command to execute.
+        timeout: Command timeout in seconds.
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        return result.returncode, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return -1, "", f"Command timed out after {timeout}s"
-    except Exception as e:
-        return -1, "", str(e)
+    Returns:
+        Tuple of (return_code, stdout, stderr).
+    """
+    node_info = NODES.get(node)
+    if not node_info:
+        return -1, "", f"Unknown node: {node}"
+    return await ssh_command_async(node_info.ip, command, timeout)
 
 
 def run_on_node(node: str, command: str, timeout: int = 30) -> Tuple[int, str, str]:
@@ -65,6 +356,185 @@ def run_on_node(node: str, command: str, timeout: int = 30) -> Tuple[int, str, s
     return ssh_command(node_info.ip, command, timeout)
 
 
+def _batch_script(commands: Sequence[str], token: str) -> str:
+    """
+    Build a shell script that runs commands in sequence with framed output.
+
+    Each command runs in its own subshell (so ``exit`` only ends that command)
+    and is framed by marker lines carrying the command index::
+
+        <token>:<i>:OUT     stdout of command i
+        <token>:<i>:ERR     stderr of command i
+        <token>:<i>:RC <rc>
+
+    Args:
+        commands: Commands to run.
+        token: Unique marker prefix that cannot appear in command output.
+
+    Returns:
+        Script suitable for a single remote shell invocation.
+    """
+    lines = ["_e=$(mktemp 2>/dev/null || echo /tmp/.validate.$$)"]
+    for i, command in enumerate(commands):
+        lines.append(f"printf '\\n%s\\n' '{token}:{i}:OUT'")
+        lines.append(f'( {command}\n) 2>"$_e"; _r=$?')
+        lines.append(f"printf '\\n%s\\n' '{token}:{i}:ERR'")
+        lines.append('cat "$_e"')
+        lines.append(f"printf '\\n%s %s\\n' '{token}:{i}:RC' \"$_r\"")
+    lines.append('rm -f "$_e"')
+    return "\n".join(lines)
+
+
+_BATCH_TOKEN_RE = re.compile(r"'(__VALIDATE_\w+):0:OUT'")
+_BATCH_COMMAND_RE = re.compile(r'^\( (.*?)\n\) 2>"\$_e"; _r=\$\?$', re.MULTILINE | re.DOTALL)
+
+
+def _split_batch_script(script: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    Recover the token and commands from a script built by _batch_script.
+
+    For transports that emulate a remote shell instead of running one.
+
+    Args:
+        script: Command string received by a transport.
+
+    Returns:
+        Tuple of (token, commands), or None if script is not a batch.
+    """
+    match = _BATCH_TOKEN_RE.search(script)
+    if not match or not script.startswith("_e=$(mktemp"):
+        return None
+    return match.group(1), _BATCH_COMMAND_RE.findall(script)
+
+
+def _format_batch_output(results: Sequence[Tuple[int, str, str]], token: str) -> str:
+    """
+    Frame per-command results the way a shell running _batch_script would.
+
+    Args:
+        results: (return_code, stdout, stderr) for each command.
+        token: Marker prefix from the batch script.
+
+    Returns:
+        Combined stdout that _parse_batch_output splits back into results.
+    """
+    parts = []
+    for i, (rc, stdout, stderr) in enumerate(results):
+        parts.append(f"\n{token}:{i}:OUT\n{stdout}")
+        parts.append(f"\n{token}:{i}:ERR\n{stderr}")
+        parts.append(f"\n{token}:{i}:RC {rc}\n")
+    return "".join(parts)
+
+
+def _parse_batch_output(
+    stdout: str, stderr: str, token: str, count: int
+) -> List[Tuple[int, str, str]]:
+    """
+    Split framed batch output back into per-command results.
+
+    Commands whose frame is missing or incomplete (connection lost, batch
+    timed out) get return code -1 and the batch's stderr.
+
+    Args:
+        stdout: Combined stdout of the batch script.
+        stderr: stderr of the ssh invocation itself.
+        token: Marker prefix used when building the script.
+        count: Number of commands in the batch.
+
+    Returns:
+        List of (return_code, stdout, stderr) tuples, one per command.
+    """
+    results: List[Tuple[int, str, str]] = []
+    pos = 0
+    for i in range(count):
+        out_marker = f"\n{token}:{i}:OUT\n"
+        err_marker = f"\n{token}:{i}:ERR\n"
+        rc_marker = f"\n{token}:{i}:RC "
+
+        out_start = stdout.find(out_marker, pos)
+        err_start = stdout.find(err_marker, out_start) if out_start >= 0 else -1
+        rc_start = stdout.find(rc_marker, err_start) if err_start >= 0 else -1
+        rc_end = stdout.find("\n", rc_start + len(rc_marker)) if rc_start >= 0 else -1
+
+        if rc_end < 0:
+            error = stderr.strip() or "Batch output truncated"
+            results.extend((-1, "", error) for _ in range(count - i))
+            break
+
+        cmd_out = stdout[out_start + len(out_marker) : err_start]
+        cmd_err = stdout[err_start + len(err_marker) : rc_start]
+        try:
+            rc = int(stdout[rc_start + len(rc_marker) : rc_end])
+        except ValueError:
+            rc = -1
+        results.append((rc, cmd_out, cmd_err))
+        pos = rc_end
+
+    return results
+
+
+def run_batch_on_node(
+    node: str, commands: Sequence[str], timeout: int = 30
+) -> List[Tuple[int, str, str]]:
+    """
+    Execute several commands on a named node in one remote shell invocation.
+
+    Args:
+        node: Node name (node1, node2, node3).
+        commands: Commands to execute, in order.
+        timeout: Timeout for the whole batch in seconds.
+
+    Returns:
+        List of (return_code, stdout, stderr) tuples, one per command.
+    """
+    if not commands:
+        return []
+
+    token = f"__VALIDATE_{uuid.uuid4().hex}"
+    rc, stdout, stderr = run_on_node(node, _batch_script(commands, token), timeout)
+    return _parse_batch_output(stdout, stderr, token, len(commands))
+
+
+async def run_batch_on_node_async(
+    node: str, commands: Sequence[str], timeout: int = 30
+) -> List[Tuple[int, str, str]]:
+    """
+    Execute several commands on a named node in one round trip, asynchronously.
+
+    Args:
+        node: Node name (node1, node2, node3).
+        commands: Commands to execute, in order.
+        timeout: Timeout for the whole batch in seconds.
+
+    Returns:
+        List of (return_code, stdout, stderr) tuples, one per command.
+    """
+    if not commands:
+        return []
+
+    token = f"__VALIDATE_{uuid.uuid4().hex}"
+    rc, stdout, stderr = await run_on_node_async(node, _batch_script(commands, token), timeout)
+    return _parse_batch_output(stdout, stderr, token, len(commands))
+
+
+async def run_local_async(command: str, timeout: int = 30) -> Tuple[int, str, str]:
+    """
+    Execute a command locally, asynchronously.
+
+    Args:
+        command: Command to execute (as shell string).
+        timeout: Command timeout in seconds.
+
+    Returns:
+        Tuple of (return_code, stdout, stderr); -1 without running once the
+        calling check's time budget is used up.
+    """
+    capped = command_timeout(timeout)
+    if capped is None:
+        return -1, "", BUDGET_EXHAUSTED
+    return await _transport.local(command, capped)
+
+
 def run_local(command: str, timeout: int = 30) -> Tuple[int, str, str]:
     """
     Execute a command locally.
@@ -76,15 +546,64 @@ def run_local(command: str, timeout: int = 30) -> Tuple[int, str, str]:
     Returns:
         Tuple of (return_code, stdout, stderr).
     """
-    try:
-        result = subprocess.run(
-            command, shell=True, capture_output=True, text=True, timeout=timeout
-        )
-        return result.returncode, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return -1, "", f"Command timed out after {timeout}s"
-    except Exception as e:
-        return -1, "", str(e)
+    return run_sync(run_local_async(command, timeout))
+
+
+async def ping_hosts_async(
+    addresses: Sequence[str],
+    count: int = 3,
+    interval_s: float = 1.0,
+    timeout_s: float = 2.0,
+    interface: str = "",
+    on_outcome: Optional[icmp.Outcome] = None,
+) -> Dict[str, PingStats]:
+    """
+    Ping addresses from the validation host concurrently.
+
+    Uses the in-process ICMP engine (validate.core.icmp) where the kernel
+    allows it, otherwise one ping subprocess per address.
+
+    Args:
+        addresses: Target addresses.
+        count: Echo requests per address.
+        interval_s: Seconds between requests.
+        timeout_s: Seconds to wait for each reply.
+        interface: Source interface ("" for default routing).
+        on_outcome: Called on the engine loop with (address, sequence, RTT ms
+            or None if lost) for every packet, instead of keeping RTTs.
+
+    Returns:
+        Address to per-packet statistics.
+    """
+    return await _transport.ping(addresses, count, interval_s, timeout_s, interface, on_outcome)
+
+
+def ping_hosts(
+    addresses: Sequence[str],
+    count: int = 3,
+    interval_s: float = 1.0,
+    timeout_s: float = 2.0,
+    interface: str = "",
+    on_outcome: Optional[icmp.Outcome] = None,
+) -> Dict[str, PingStats]:
+    """
+    Ping addresses from the validation host concurrently.
+
+    Args:
+        addresses: Target addresses.
+        count: Echo requests per address.
+        interval_s: Seconds between requests.
+        timeout_s: Seconds to wait for each reply.
+        interface: Source interface ("" for default routing).
+        on_outcome: Called on the engine loop with (address, sequence, RTT ms
+            or None if lost) for every packet, instead of keeping RTTs.
+
+    Returns:
+        Address to per-packet statistics.
+    """
+    return run_sync(
+        ping_hosts_async(addresses, count, interval_s, timeout_s, interface, on_outcome)
+    )
 
 
 class NodeExecutor:
@@ -113,6 +632,19 @@ class NodeExecutor:
         """
         return run_on_node(self.node, command, timeout)
 
+    def run_batch(self, commands: Sequence[str], timeout: int = 30) -> List[Tuple[int, str, str]]:
+        """
+        Execute several commands on this node in a single round trip.
+
+        Args:
+            commands: Commands to execute, in order.
+            timeout: Timeout for the whole batch in seconds.
+
+        Returns:
+            List of (return_code, stdout, stderr) tuples, one per command.
+        """
+        return run_batch_on_node(self.node, commands, timeout)
+
     def run_ok(self, command: str, timeout: int = 30) -> str:
         """
         Execute command and raise on failure, return stdout.
@@ -198,6 +730,94 @@ class NodeExecutor:
         return rc == 0
 
 
+class AsyncNodeExecutor:
+    """Async counterpart of NodeExecutor, for use in async checks."""
+
+    def __init__(self, node: str):
+        """
+        Initialize with node name.
+
+        Args:
+            node: Node name (node1, node2, node3).
+        """
+        self.node = node
+        self.node_info = NODES[node]
+
+    async def run(self, command: str, timeout: int = 30) -> Tuple[int, str, str]:
+        """
+        Execute command on this node.
+
+        Args:
+            command: Command to execute.
+            timeout: Command timeout in seconds.
+
+        Returns:
+            Tuple of (return_code, stdout, stderr).
+        """
+        return await run_on_node_async(self.node, command, timeout)
+
+    async def run_batch(
+        self, commands: Sequence[str], timeout: int = 30
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Execute several commands on this node in a single round trip.
+
+        Args:
+            commands: Commands to execute, in order.
+            timeout: Timeout for the whole batch in seconds.
+
+        Returns:
+            List of (return_code, stdout, stderr) tuples, one per command.
+        """
+        return await run_batch_on_node_async(self.node, commands, timeout)
+
+    async def run_ok(self, command: str, timeout: int = 30) -> str:
+        """
+        Execute command and raise on failure, return stdout.
+
+        Args:
+            command: Command to execute.
+            timeout: Command timeout in seconds.
+
+        Returns:
+            stdout as string.
+
+        Raises:
+            RuntimeError: If command fails.
+        """
+        rc, stdout, stderr = await self.run(command, timeout)
+        if rc != 0:
+            raise RuntimeError(f"Command failed on {self.node}: {command}\nstderr: {stderr}")
+        return stdout
+
+    async def batctl(self, args: str, timeout: int = 30) -> str:
+        """
+        Execute batctl command and return output.
+
+        Args:
+            args: Arguments to pass to batctl.
+            timeout: Command timeout in seconds.
+
+        Returns:
+            Command output as string.
+        """
+        return await self.run_ok(f"batctl {args}", timeout)
+
+    async def ping(self, target: str, count: int = 3) -> bool:
+        """
+        Ping a target from this node.
+
+        Args:
+            target: Target IP or hostname.
+            count: Number of ping packets.
+
+        Returns:
+            True if ping succeeds.
+        """
+        rc, _, _ = await self.run(f"ping -c {count} -W 2 {target}")
+        return rc == 0
+
+
 def get_all_executors() -> List["NodeExecutor"]:
     """Get executors for all nodes."""
     return [NodeExecutor(node) for node in NODES]
@@ -0,0 +1,120 @@
+"""
+Scheduled validation runs for the metrics exporter.
+
+The Exporter runs each configured tier on its own interval, one run at a
+time (runs share node state, circuit breakers and SSH sessions), and keeps
+the latest result of every tier. Scrapes never trigger a run: after each
+run the exporter calls on_update, which re-renders the metrics once, so a
+scrape only returns what was already rendered.
+
+SSH master connections are kept open across the idle gaps between runs
+(see executor.keep_sessions), so after the first run every run reuses them.
+"""
+
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from validate.core.executor import keep_sessions
+from validate.core.results import Tier, ValidationResult
+from validate.core.runner import create_runner
+
+
+@dataclass
+class TierState:
+    """Schedule and latest outcome of one tier."""
+
+    tier: Tier
+    interval_s: float
+    next_run: float = 0.0  # Monotonic time the tier is next due
+    runs: int = 0
+    errors: int = 0  # Runs that raised instead of producing a result
+    result: Optional[ValidationResult] = None
+
+
+class Exporter:
+    """Runs tiers on a schedule and holds their latest results."""
+
+    def __init__(
+        self,
+        schedule: Sequence[Tuple[Tier, float]],
+        on_update: Optional[Callable[["Exporter"], None]] = None,
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            schedule: (tier, interval in seconds) pairs; every tier is due
+                immediately.
+            on_update: Called after every run (also after a failed one).
+
+        Raises:
+            ValueError: If the schedule is empty or an interval is not positive.
+        """
+        if not schedule:
+            raise ValueError("Nothing to schedule")
+        if any(interval <= 0 for _, interval in schedule):
+            raise ValueError("Intervals must be positive")
+        self.tiers = [TierState(tier, interval) for tier, interval in schedule]
+        self.on_update = on_update
+        self._lock = threading.Lock()
+        keep_sessions(int(2 * max(interval for _, interval in schedule)))
+
+    def states(self) -> List[TierState]:
+        """Get a consistent copy of every tier's state."""
+        with self._lock:
+            return [TierState(**vars(state)) for state in self.tiers]
+
+    def run_tier(self, state: TierState) -> None:
+        """
+        Run one tier now and store its result.
+
+        A run that raises is counted as an error and keeps the previous
+        result, so one bad run does not take the exporter down.
+
+        Args:
+            state: The tier to run.
+        """
+        try:
+            result: Optional[ValidationResult] = create_runner(state.tier).run()
+        except Exception:
+            traceback.print_exc()
+            result = None
+        with self._lock:
+            state.runs += 1
+            if result is None:
+                state.errors += 1
+            else:
+                state.result = result
+            state.next_run = time.monotonic() + state.interval_s
+        if self.on_update is not None:
+            self.on_update(self)
+
+    def run_due(self) -> float:
+        """
+        Run every tier that is due, most overdue first.
+
+        Returns:
+            Seconds until the next tier is due.
+        """
+        for state in sorted(self.tiers, key=lambda s: s.next_run):
+            if state.next_run <= time.monotonic():
+                self.run_tier(state)
+        return max(0.0, min(s.next_run for s in self.tiers) - time.monotonic())
+
+    def run_once(self) -> None:
+        """Run every tier once, in schedule order."""
+        for state in self.tiers:
+            self.run_tier(state)
+
+    def serve(self, stop: threading.Event) -> None:
+        """
+        Run tiers on schedule until stop is set.
+
+        Args:
+            stop: Event that ends the loop (checked between runs).
+        """
+        while not stop.is_set():
+            stop.wait(self.run_due())
@@ -0,0 +1,129 @@
+"""
+Concurrent per-node fan-out for checks.
+
+Checks describe the work for one node as a function returning a NodeResult;
+fan_out() runs it for every node in a bounded thread pool and merges the
+results into the CheckResult in node order, so output is deterministic no
+matter which node answers first.
+
+Async checks use fan_out_async(), which runs the per-node coroutines on the
+current event loop. No thread is needed per node; concurrency is bounded by
+the engine's in-flight command limit instead.
+
+Nodes whose circuit breaker is open are not checked at all; they get an
+ERROR result carrying the time the circuit has been open (``circuit_open_s``),
+so a check never passes while one of its nodes is unreachable.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from validate.config import MAX_PARALLEL_NODES, NODES
+from validate.core.health import node_circuit
+from validate.core.results import CheckResult, CheckStatus, NodeResult
+
+# Per-node check body: node name in, NodeResult out
+NodeCheck = Callable[[str], NodeResult]
+AsyncNodeCheck = Callable[[str], Awaitable[NodeResult]]
+
+
+def _error_result(node: str, error: BaseException) -> NodeResult:
+    """Build the ERROR result for a node whose check body raised."""
+    return NodeResult(node=node, status=CheckStatus.ERROR, message=f"Check error: {error}")
+
+
+def _circuit_errors(names: List[str]) -> Dict[str, NodeResult]:
+    """Build ERROR results for nodes whose circuit is open."""
+    errors: Dict[str, NodeResult] = {}
+    for name in names:
+        breaker = node_circuit(name)
+        if breaker is not None and breaker.is_open():
+            open_s = round(breaker.open_s, 1)
+            errors[name] = NodeResult(
+                node=name,
+                status=CheckStatus.ERROR,
+                message=f"Node unreachable (circuit open {open_s:.0f}s)",
+                data={"circuit_open_s": open_s},
+            )
+    return errors
+
+
+def fan_out(
+    result: CheckResult,
+    check_node: NodeCheck,
+    nodes: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Run a per-node check body concurrently and merge the node results.
+
+    An exception raised for one node becomes an ERROR result for that node
+    only. The caller still calls result.aggregate_status().
+
+    Args:
+        result: CheckResult to add node results to.
+        check_node: Function performing the check for one node.
+        nodes: Node names to check (default: all NODES).
+        max_workers: Pool size (default: MAX_PARALLEL_NODES).
+    """
+    names = list(NODES if nodes is None else nodes)
+    unreachable = _circuit_errors(names)
+    live = [name for name in names if name not in unreachable]
+
+    futures = {}
+    if live:
+        workers = max(1, min(max_workers or MAX_PARALLEL_NODES, len(live)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate-node") as pool:
+            # Each node runs in a copy of the caller's context, so the check's
+            # deadline (validate.core.budget) follows it into the pool
+            futures = {
+                name: pool.submit(contextvars.copy_context().run, check_node, name) for name in live
+            }
+
+    for name in names:
+        if name in unreachable:
+            result.nodes[name] = unreachable[name]
+            continue
+        try:
+            node_result = futures[name].result()
+        except Exception as e:
+            node_result = _error_result(name, e)
+        result.nodes[name] = node_result
+
+
+async def fan_out_async(
+    result: CheckResult,
+    check_node: AsyncNodeCheck,
+    nodes: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Run an async per-node check body concurrently and merge the node results.
+
+    Same contract as fan_out(): results are merged in node order and an
+    exception for one node becomes an ERROR result for that node only.
+
+    Args:
+        result: CheckResult to add node results to.
+        check_node: Coroutine function performing the check for one node.
+        nodes: Node names to check (default: all NODES).
+    """
+    names = list(NODES if nodes is None else nodes)
+    unreachable = _circuit_errors(names)
+    live = [name for name in names if name not in unreachable]
+    outcomes = dict(
+        zip(
+            live,
+            await asyncio.gather(*(check_node(name) for name in live), return_exceptions=True),
+        )
+    )
+
+    for name in names:
+        outcome = unreachable.get(name) or outcomes[name]
+        if isinstance(outcome, NodeResult):
+            result.nodes[name] = outcome
+        elif isinstance(outcome, Exception):
+            result.nodes[name] = _error_result(name, outcome)
+        else:
+            raise outcome  # Cancellation and other BaseExceptions propagate
@@ -0,0 +1,330 @@
+"""
+Fleet mode: validate many mesh sites concurrently.
+
+Each site is a copy of the mesh with its own Ansible inventory. The node
+registry, SSH master connections, circuit breakers and the engine loop are
+all per process, so every site is validated in a worker process of its own:
+the worker points NODES at the site's inventory, runs the tier and returns
+a compact SiteResult. Workers are spawned fresh for each site
+(max_tasks_per_child=1), so nothing carries over from one site to the next
+and a site's memory goes back to the system when it finishes.
+
+Memory on the control host is bounded by the number of workers, not the
+number of sites: at most FLEET_WORKERS sites are in flight, each running at
+most FLEET_SITE_INFLIGHT commands (and so ssh clients) at once, and the
+parent keeps only each site's rollup (status, counts and failed checks)
+unless full results are asked for.
+"""
+
+import contextlib
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from validate.config import FLEET_SITE_INFLIGHT, FLEET_WORKERS, NODES
+from validate.core.engine import limit_commands
+from validate.core.executor import close_sessions
+from validate.core.results import CheckStatus, Tier, ValidationResult
+from validate.core.runner import create_runner
+
+# Path components that don't name a site (the repo's own inventory layout)
+_GENERIC_PARTS = {"", "hosts", "inventory", "openwrt-mesh-ansible"}
+
+
+@dataclass(frozen=True)
+class Site:
+    """A mesh site: a name and the inventory describing its nodes."""
+
+    name: str
+    inventory: Optional[str] = None  # None only for simulated sites
+
+
+def parse_site(spec: str, simulated: bool = False) -> Site:
+    """
+    Parse a site given as NAME=INVENTORY or INVENTORY.
+
+    Without a name, the site is named after the inventory's path (e.g.
+    sites/alpha/inventory/hosts.yml is "alpha"). Simulated sites need no
+    inventory, so a bare NAME is enough.
+
+    Args:
+        spec: Site specification.
+        simulated: Sites will be simulated meshes.
+
+    Returns:
+        The site.
+
+    Raises:
+        ValueError: If the spec is empty or no name can be derived.
+    """
+    name, sep, inventory = spec.partition("=")
+    if not sep and simulated:
+        name, inventory = spec, ""
+    elif not sep:
+        path = Path(spec)
+        parts = [path.stem, *(parent.name for parent in path.parents)]
+        name = next((part for part in parts if part not in _GENERIC_PARTS), "")
+        inventory = spec
+    if not name or not (inventory or simulated):
+        raise ValueError(f"Invalid site {spec!r}: expected NAME=INVENTORY or INVENTORY")
+    return Site(name, inventory or None)
+
+
+@dataclass
+class SiteOptions:
+    """How each site is validated."""
+
+    slo_s: Optional[float] = None  # None: the tier's SLO
+    check_budget_s: Optional[float] = None  # None: CHECK_BUDGET_S
+    abort_on_phase1_fail: bool = True
+    inflight: int = FLEET_SITE_INFLIGHT  # Commands in flight per site
+    details: bool = False  # Keep each site's full result
+    simulate: Optional[int] = None  # Nodes per simulated site
+    sim_topology: str = "ring"
+
+
+@dataclass
+class SiteResult:
+    """Outcome of validating one site."""
+
+    site: str
+    status: CheckStatus  # PASS or FAIL, or ERROR if the site could not be validated
+    message: str = ""
+    total_checks: int = 0
+    passed_checks: int = 0
+    failed_checks: List[Dict[str, str]] = field(default_factory=list)
+    duration_ms: int = 0
+    peak_rss_kb: int = 0  # Peak memory of the site's worker
+    result: Optional[Dict[str, Any]] = None  # Full result, with SiteOptions.details
+
+    @property
+    def passed(self) -> bool:
+        """Return True if the site passed."""
+        return self.status == CheckStatus.PASS
+
+    @classmethod
+    def from_validation(cls, site: str, result: ValidationResult, details: bool) -> "SiteResult":
+        """
+        Roll up a site's validation result.
+
+        Args:
+            site: Site name.
+            result: The site's validation result.
+            details: Keep the full result as well.
+
+        Returns:
+            The site's result.
+        """
+        failed = result.failed_check_list
+        if result.aborted:
+            message = f"Aborted: {result.abort_reason}"
+        elif failed:
+            message = f"{len(failed)} check(s) failed"
+        elif result.slo_exceeded:
+            message = f"Took longer than the {result.slo_s:g}s SLO"
+        else:
+            message = "All checks passed"
+        return cls(
+            site=site,
+            status=CheckStatus.PASS if result.passed else CheckStatus.FAIL,
+            message=message,
+            total_checks=result.total_checks,
+            passed_checks=result.passed_checks,
+            failed_checks=[
+                {"category": c.category, "status": c.status.value, "message": c.message}
+                for c in failed
+            ],
+            duration_ms=result.duration_ms,
+            result=result.to_dict() if details else None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data: Dict[str, Any] = {
+            "site": self.site,
+            "status": self.status.value,
+            "message": self.message,
+            "summary": {
+                "total": self.total_checks,
+                "passed": self.passed_checks,
+                "failed": len(self.failed_checks),
+            },
+            "failed_checks": self.failed_checks,
+            "duration_ms": self.duration_ms,
+            "peak_rss_kb": self.peak_rss_kb,
+        }
+        if self.result is not None:
+            data["result"] = self.result
+        return data
+
+
+@dataclass
+class FleetResult:
+    """Results of every site in a fleet run."""
+
+    tier: Tier
+    sites: List[SiteResult] = field(default_factory=list)
+    timestamp: datetime = field(default_factory=datetime.now)
+    duration_ms: int = 0
+    workers: int = 0
+
+    @property
+    def passed(self) -> bool:
+        """Return True if every site passed."""
+        return bool(self.sites) and all(site.passed for site in self.sites)
+
+    def count(self, status: CheckStatus) -> int:
+        """Number of sites with a status."""
+        return sum(1 for site in self.sites if site.status == status)
+
+    def failing_checks(self) -> Dict[str, List[str]]:
+        """
+        Find the checks that failed anywhere in the fleet.
+
+        Returns:
+            Check category -> sites where it failed, most widespread first.
+        """
+        failing: Dict[str, List[str]] = {}
+        for site in self.sites:
+            for check in site.failed_checks:
+                failing.setdefault(check["category"], []).append(site.site)
+        return dict(sorted(failing.items(), key=lambda item: (-len(item[1]), item[0])))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "tier": self.tier.name.lower(),
+            "result": "PASS" if self.passed else "FAIL",
+            "timestamp": self.timestamp.isoformat(),
+            "duration_ms": self.duration_ms,
+            "workers": self.workers,
+            "summary": {
+                "sites": len(self.sites),
+                "passed": self.count(CheckStatus.PASS),
+                "failed": self.count(CheckStatus.FAIL),
+                "error": self.count(CheckStatus.ERROR),
+            },
+            "failing_checks": self.failing_checks(),
+            "sites": [site.to_dict() for site in self.sites],
+        }
+
+
+def validate_site(site: Site, tier: Tier, options: SiteOptions) -> SiteResult:
+    """
+    Validate one site (runs in a fleet worker process).
+
+    Args:
+        site: Site to validate.
+        tier: Validation tier.
+        options: How to validate it.
+
+    Returns:
+        The site's result; ERROR if its inventory cannot be loaded or the
+        run fails outright.
+    """
+    start = time.monotonic()
+    limit_commands(options.inflight)
+    try:
+        with contextlib.ExitStack() as stack:
+            if options.simulate:
+                from validate.core.simulator import SimulatedMesh, simulate
+
+                mesh = SimulatedMesh(size=options.simulate, topology=options.sim_topology)
+                stack.enter_context(simulate(mesh))
+            else:
+                # The worker is a fresh process, so NODES has not loaded yet
+                os.environ["MESH_INVENTORY"] = site.inventory or ""
+                len(NODES)  # Load now, so a bad inventory is the site's error
+            runner = create_runner(tier, slo_s=options.slo_s, check_budget_s=options.check_budget_s)
+            result = runner.run(abort_on_phase1_fail=options.abort_on_phase1_fail)
+        site_result = SiteResult.from_validation(site.name, result, options.details)
+    except Exception as e:
+        site_result = SiteResult(site.name, CheckStatus.ERROR, f"{type(e).__name__}: {e}")
+    finally:
+        close_sessions()
+    site_result.duration_ms = int((time.monotonic() - start) * 1000)
+    site_result.peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return site_result
+
+
+class FleetRunner:
+    """Validates a set of sites concurrently, one worker process per site."""
+
+    def __init__(
+        self,
+        sites: Sequence[Site],
+        tier: Tier = Tier.STANDARD,
+        workers: int = FLEET_WORKERS,
+        options: Optional[SiteOptions] = None,
+    ):
+        """
+        Initialize the fleet runner.
+
+        Args:
+            sites: Sites to validate.
+            tier: Validation tier run at every site.
+            workers: Most sites validated at once.
+            options: How each site is validated.
+
+        Raises:
+            ValueError: If no sites are given or two share a name.
+        """
+        names = [site.name for site in sites]
+        if not names:
+            raise ValueError("No sites to validate")
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate site names: {', '.join(duplicates)}")
+        self.sites = list(sites)
+        self.tier = tier
+        self.workers = max(1, min(workers, len(self.sites)))
+        self.options = options or SiteOptions()
+
+    def run(self, on_site_complete: Optional[Callable[[SiteResult], None]] = None) -> FleetResult:
+        """
+        Validate every site.
+
+        Args:
+            on_site_complete: Callback as each site finishes (in completion
+                order).
+
+        Returns:
+            FleetResult with the sites in the order given.
+        """
+        start = time.monotonic()
+        results: Dict[str, SiteResult] = {}
+        # Spawned, not forked: the parent may already run the engine thread
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        )
+        try:
+            futures = {
+                pool.submit(validate_site, site, self.tier, self.options): site
+                for site in self.sites
+            }
+            for future in as_completed(futures):
+                site = futures[future]
+                try:
+                    site_result = future.result()
+                except Exception as e:  # Worker killed (e.g. out of memory) or pool broken
+                    site_result = SiteResult(site.name, CheckStatus.ERROR, f"Worker failed: {e}")
+                results[site.name] = site_result
+                if on_site_complete:
+                    on_site_complete(site_result)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        return FleetResult(
+            tier=self.tier,
+            sites=[results[site.name] for site in self.sites],
+            duration_ms=int((time.monotonic() - start) * 1000),
+            workers=self.workers,
+        )
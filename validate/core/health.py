@@ -0,0 +1,201 @@
+"""
+Per-node circuit breakers.
+
+A node that has stopped answering would otherwise cost every later command
+a full connect timeout. Each node gets a circuit breaker fed with connection
+outcomes from the executor (and with unreachable verdicts from checks):
+
+- CLOSED: commands run normally. CIRCUIT_FAILURE_THRESHOLD consecutive
+  connection failures (ssh exit 255) open the circuit.
+- OPEN: commands fail immediately and fan_out() reports the node as ERROR.
+  After CIRCUIT_RESET_S the circuit goes half-open.
+- HALF_OPEN: a single trial command is let through. Success closes the
+  circuit, failure re-opens it for another CIRCUIT_RESET_S.
+
+Breakers are keyed by node IP and reset at the start of every run.
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import Dict, Optional
+
+from validate.config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_S, NODES
+
+
+class CircuitState(Enum):
+    """State of a node's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Tracks connection health for one node."""
+
+    def __init__(
+        self,
+        threshold: Optional[int] = None,
+        reset_s: Optional[float] = None,
+    ):
+        """
+        Initialize a closed circuit.
+
+        Args:
+            threshold: Consecutive failures that open the circuit
+                (default: CIRCUIT_FAILURE_THRESHOLD).
+            reset_s: Seconds before an open circuit allows a trial call
+                (default: CIRCUIT_RESET_S).
+        """
+        self.threshold = max(1, threshold or CIRCUIT_FAILURE_THRESHOLD)
+        self.reset_s = CIRCUIT_RESET_S if reset_s is None else reset_s
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._closed_open_s = 0.0  # Open time from earlier, now-closed spells
+        self._lock = threading.Lock()
+
+    @property
+    def open_s(self) -> float:
+        """Total seconds this circuit has spent open or half-open."""
+        with self._lock:
+            current = time.time() - self.opened_at if self.state != CircuitState.CLOSED else 0.0
+            return self._closed_open_s + current
+
+    def is_open(self) -> bool:
+        """
+        Check whether calls to the node should be short-circuited.
+
+        Does not change state; an open circuit past its reset time reports
+        False so the next call can act as the half-open trial.
+        """
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                return time.time() - self.opened_at < self.reset_s
+            return self.state == CircuitState.HALF_OPEN
+
+    def allow(self) -> bool:
+        """
+        Decide whether a call may proceed, claiming the half-open trial.
+
+        Returns:
+            True if the caller should run its command.
+        """
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.OPEN and time.time() - self.opened_at >= self.reset_s:
+                self.state = CircuitState.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a call that reached the node."""
+        with self._lock:
+            if self.state != CircuitState.CLOSED:
+                self._closed_open_s += time.time() - self.opened_at
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a call that could not reach the node."""
+        with self._lock:
+            self.failures += 1
+            if self.state == CircuitState.HALF_OPEN:
+                # Trial failed: stay open for another reset period
+                self.state = CircuitState.OPEN
+                self.opened_at = time.time()
+            elif self.state == CircuitState.CLOSED and self.failures >= self.threshold:
+                self._open()
+
+    def trip(self) -> None:
+        """Open the circuit immediately (e.g. a check found the node down)."""
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                self._open()
+
+    def _open(self) -> None:
+        """Move to OPEN; caller holds the lock."""
+        self.state = CircuitState.OPEN
+        self.opened_at = time.time()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit(node_ip: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for a node, creating it on first use.
+
+    Args:
+        node_ip: IP address of the node.
+
+    Returns:
+        The node's CircuitBreaker.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(node_ip)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[node_ip] = breaker
+        return breaker
+
+
+def node_circuit(node: str) -> Optional[CircuitBreaker]:
+    """
+    Get the circuit breaker for a named node.
+
+    Args:
+        node: Node name (node1, node2, node3).
+
+    Returns:
+        The node's CircuitBreaker, or None for names that are not mesh nodes.
+    """
+    node_info = NODES.get(node)
+    return circuit(node_info.ip) if node_info else None
+
+
+def is_connection_failure(rc: int, stderr: str) -> bool:
+    """
+    Classify an ssh result as a connection failure rather than a command one.
+
+    Only the connect phase counts: ssh exits 255 when it cannot reach or
+    authenticate to the node, and the executor reports a master connection
+    that could not be set up the same way. A command that overruns its own
+    timeout (rc -1) on a working connection says nothing about the node;
+    long-running commands (iperf3, stress) must not open its circuit.
+
+    Args:
+        rc: Return code from ssh_command.
+        stderr: stderr from ssh_command.
+
+    Returns:
+        True for ssh's own errors (exit 255).
+    """
+    return rc == 255
+
+
+def circuit_summary() -> Dict[str, float]:
+    """
+    Get the time each node's circuit has spent open.
+
+    Returns:
+        Node name (or IP, for unnamed hosts) to open seconds, for nodes
+        whose circuit has opened at least once.
+    """
+    names = {info.ip: name for name, info in NODES.items()}
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {
+        names.get(ip, ip): round(breaker.open_s, 1)
+        for ip, breaker in breakers.items()
+        if breaker.open_s > 0
+    }
+
+
+def reset_circuits() -> None:
+    """Forget all node health (called by the runner at the start of a run)."""
+    with _breakers_lock:
+        _breakers.clear()
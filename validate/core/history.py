@@ -0,0 +1,408 @@
+"""
+Validation history: every run persisted to a local SQLite database.
+
+Tables:
+
+- ``runs``: one row per run (time, tier, result, counts, duration)
+- ``checks``: one row per check result, with its duration
+- ``node_results``: one row per node result, with each tracked metric
+  (METRICS) in its own column
+
+Rows in ``checks`` and ``node_results`` repeat their run's time and tier,
+so a metric's series for one check and node is a single index range scan.
+That keeps trend queries over a year of five-minute runs (tens of millions
+of node rows) in the millisecond range.
+
+find_regressions() compares the latest run with a rolling baseline of the
+runs before it. A value counts as a regression when it is worse than the
+baseline median by more than Z robust standard deviations (scaled median
+absolute deviation) and by more than the metric's minimum meaningful
+change. The median and MAD are used so that earlier outliers do not
+inflate the baseline.
+"""
+
+import os
+import sqlite3
+import statistics
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from validate.core.results import ValidationResult
+
+
+@dataclass(frozen=True)
+class Metric:
+    """A tracked numeric result and which direction is bad."""
+
+    name: str
+    higher_is_worse: bool
+    min_change: float  # Smallest change worth reporting, in the metric's unit
+
+
+# Node-level metrics stored as columns of node_results (from NodeResult.data)
+METRICS = (
+    Metric("latency_ms", True, 1.0),
+    Metric("p50_ms", True, 1.0),
+    Metric("p99_ms", True, 2.0),
+    Metric("jitter_ms", True, 0.5),
+    Metric("packet_loss_pct", True, 1.0),
+    Metric("longest_outage_ms", True, 100.0),
+    Metric("neighbor_count", False, 1.0),
+    Metric("originator_count", False, 1.0),
+    Metric("gateway_count", False, 1.0),
+)
+
+# Check-level duration, from the checks table
+DURATION = Metric("duration_ms", True, 1000.0)
+
+METRIC_BY_NAME = {metric.name: metric for metric in (*METRICS, DURATION)}
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    tier TEXT NOT NULL,
+    result TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    aborted INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_tier_ts ON runs (tier, ts);
+CREATE TABLE IF NOT EXISTS checks (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    ts REAL NOT NULL,
+    tier TEXT NOT NULL,
+    category TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (run_id, category)
+);
+CREATE INDEX IF NOT EXISTS checks_category_ts ON checks (category, ts);
+CREATE TABLE IF NOT EXISTS node_results (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    ts REAL NOT NULL,
+    tier TEXT NOT NULL,
+    category TEXT NOT NULL,
+    node TEXT NOT NULL,
+    status TEXT NOT NULL,
+    {", ".join(f"{metric.name} REAL" for metric in METRICS)},
+    PRIMARY KEY (run_id, category, node)
+);
+CREATE INDEX IF NOT EXISTS node_results_category_node_ts ON node_results (category, node, ts);
+CREATE INDEX IF NOT EXISTS node_results_node_ts ON node_results (node, ts);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+
+@dataclass
+class Regression:
+    """A metric in the latest run that is significantly worse than its baseline."""
+
+    category: str
+    node: str  # "" for check-level metrics
+    metric: str
+    value: float
+    baseline: float  # Median of the baseline runs
+    spread: float  # Robust standard deviation of the baseline
+    z: float  # Deviation in the bad direction, in units of spread
+    samples: int  # Baseline runs compared against
+
+    @property
+    def change_pct(self) -> Optional[float]:
+        """Change from the baseline, in percent (None for a zero baseline)."""
+        return 100 * (self.value - self.baseline) / self.baseline if self.baseline else None
+
+
+def _number(value: Any) -> Optional[float]:
+    """A metric value as float, or None if it is not numeric."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class HistoryStore:
+    """Reads and writes the validation history database."""
+
+    def __init__(self, path: str):
+        """
+        Open (creating if needed) a history database.
+
+        Args:
+            path: Database file (``:memory:`` for a throwaway store).
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened.
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        self.db.close()
+
+    def record(self, result: ValidationResult) -> int:
+        """
+        Store one run.
+
+        Args:
+            result: Finished validation result.
+
+        Returns:
+            The run's id.
+        """
+        ts = result.timestamp.timestamp()
+        tier = result.tier.name.lower()
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (ts, tier, result, duration_ms, aborted, total, passed, failed)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    ts,
+                    tier,
+                    "PASS" if result.passed else "FAIL",
+                    result.duration_ms,
+                    int(result.aborted),
+                    result.total_checks,
+                    result.passed_checks,
+                    result.failed_checks,
+                ),
+            )
+            run_id = int(cursor.lastrowid or 0)
+            checks = result.all_checks
+            self.db.executemany(
+                "INSERT OR REPLACE INTO checks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, ts, tier, c.category, c.status.value, c.duration_ms, c.message)
+                    for c in checks
+                ],
+            )
+            placeholders = ", ".join("?" * (6 + len(METRICS)))
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO node_results VALUES ({placeholders})",
+                [
+                    (run_id, ts, tier, c.category, node, n.status.value)
+                    + tuple(_number(n.data.get(metric.name)) for metric in METRICS)
+                    for c in checks
+                    for node, n in c.nodes.items()
+                ],
+            )
+        return run_id
+
+    def runs(self, tier: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Most recent runs, newest first.
+
+        Args:
+            tier: Only runs of this tier (e.g. "standard").
+            limit: Maximum runs.
+
+        Returns:
+            One dict per run with the runs table's columns.
+        """
+        where, params = ("WHERE tier = ?", [tier]) if tier else ("", [])
+        cursor = self.db.execute(
+            f"SELECT * FROM runs {where} ORDER BY ts DESC LIMIT ?", (*params, limit)
+        )
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def series(
+        self,
+        metric: str,
+        category: str,
+        node: str = "",
+        tier: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[float, float]]:
+        """
+        One metric's values over time for a check (and node).
+
+        Args:
+            metric: A METRICS name, or "duration_ms" for check duration.
+            category: Check category.
+            node: Node name (ignored for duration_ms).
+            tier: Only runs of this tier.
+            since: Earliest run time (Unix seconds).
+            until: Only runs before this time.
+            limit: Only the most recent values.
+
+        Returns:
+            (run time, value) pairs, oldest first; runs without a value are
+            left out.
+
+        Raises:
+            ValueError: For an unknown metric.
+        """
+        if metric not in METRIC_BY_NAME:
+            raise ValueError(f"Unknown metric: {metric}")
+        params: List[Any] = [category]
+        if metric == DURATION.name:
+            table, where = "checks", ["category = ?"]
+        else:
+            table, where = "node_results", ["category = ?", "node = ?"]
+            params.append(node)
+        where.append(f"{metric} IS NOT NULL")
+        for clause, value in (("tier = ?", tier), ("ts >= ?", since), ("ts < ?", until)):
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+        query = f"SELECT ts, {metric} FROM {table} WHERE {' AND '.join(where)} ORDER BY ts DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [
+            (ts, float(value)) for ts, value in reversed(self.db.execute(query, params).fetchall())
+        ]
+
+    def trend(
+        self,
+        metric: str,
+        category: str,
+        node: str = "",
+        bucket_s: float = 86400,
+        since: Optional[float] = None,
+        tier: Optional[str] = None,
+    ) -> List[Dict[str, float]]:
+        """
+        A metric aggregated per time bucket (e.g. per day).
+
+        Args:
+            metric: A METRICS name, or "duration_ms".
+            category: Check category.
+            node: Node name (ignored for duration_ms).
+            bucket_s: Bucket width in seconds.
+            since: Earliest run time.
+            tier: Only runs of this tier.
+
+        Returns:
+            Per bucket, oldest first: start, count, avg, min, max.
+        """
+        buckets: Dict[int, List[float]] = {}
+        for ts, value in self.series(metric, category, node, tier=tier, since=since):
+            buckets.setdefault(int(ts // bucket_s), []).append(value)
+        return [
+            {
+                "start": index * bucket_s,
+                "count": len(values),
+                "avg": sum(values) / len(values),
+                "min": min(values),
+                "max": max(values),
+            }
+            for index, values in sorted(buckets.items())
+        ]
+
+    def latest_run(self, tier: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The most recent run (of a tier), or None."""
+        runs = self.runs(tier=tier, limit=1)
+        return runs[0] if runs else None
+
+    def run_values(self, run_id: int) -> List[Tuple[str, str, str, float]]:
+        """
+        Every metric value recorded in one run.
+
+        Args:
+            run_id: Run id.
+
+        Returns:
+            (category, node, metric, value) tuples; node is "" for durations.
+        """
+        values: List[Tuple[str, str, str, float]] = []
+        columns = ", ".join(metric.name for metric in METRICS)
+        for row in self.db.execute(
+            f"SELECT category, node, {columns} FROM node_results WHERE run_id = ?", (run_id,)
+        ):
+            for metric, value in zip(METRICS, row[2:]):
+                if value is not None:
+                    values.append((row[0], row[1], metric.name, float(value)))
+        for category, duration in self.db.execute(
+            "SELECT category, duration_ms FROM checks WHERE run_id = ?", (run_id,)
+        ):
+            values.append((category, "", DURATION.name, float(duration)))
+        return values
+
+
+def judge(
+    metric: Metric, value: float, baseline: Iterable[float], z: float
+) -> Optional[Regression]:
+    """
+    Decide whether one value is a significant regression from its baseline.
+
+    Args:
+        metric: Metric being compared.
+        value: Latest value.
+        baseline: Earlier values.
+        z: Robust z-score threshold.
+
+    Returns:
+        Regression (with empty category/node) or None.
+    """
+    samples = list(baseline)
+    median = statistics.median(samples)
+    spread = 1.4826 * statistics.median(abs(v - median) for v in samples)
+    worse_by = (value - median) if metric.higher_is_worse else (median - value)
+    if worse_by < metric.min_change:
+        return None
+    score = worse_by / spread if spread else float("inf")
+    if score < z:
+        return None
+    return Regression(
+        category="",
+        node="",
+        metric=metric.name,
+        value=value,
+        baseline=median,
+        spread=round(spread, 3),
+        z=round(score, 2),
+        samples=len(samples),
+    )
+
+
+def find_regressions(
+    store: HistoryStore,
+    tier: Optional[str] = None,
+    baseline_runs: int = 50,
+    min_samples: int = 10,
+    z: float = 3.0,
+) -> List[Regression]:
+    """
+    Compare the latest run with the runs before it.
+
+    Args:
+        store: History to read.
+        tier: Only consider runs of this tier (default: the latest run's).
+        baseline_runs: How many earlier values form the rolling baseline.
+        min_samples: Fewest baseline values needed to judge a metric.
+        z: Robust z-score a regression must exceed.
+
+    Returns:
+        Regressions, worst first.
+    """
+    latest = store.latest_run(tier)
+    if latest is None:
+        return []
+    regressions: List[Regression] = []
+    for category, node, name, value in store.run_values(latest["id"]):
+        baseline = [
+            v
+            for _, v in store.series(
+                name, category, node, tier=latest["tier"], until=latest["ts"], limit=baseline_runs
+            )
+        ]
+        if len(baseline) < min_samples:
+            continue
+        regression = judge(METRIC_BY_NAME[name], value, baseline, z)
+        if regression is not None:
+            regression.category, regression.node = category, node
+            regressions.append(regression)
+    return sorted(regressions, key=lambda r: r.z, reverse=True)
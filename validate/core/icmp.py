@@ -0,0 +1,255 @@
+"""
+Concurrent ICMP echo probing from the validation host.
+
+ping_native() pings any number of IPv4 targets from one unprivileged ICMP
+datagram socket (``SOCK_DGRAM``/``IPPROTO_ICMP``) driven by the event loop:
+each round sends one echo request to every target, and replies are matched
+by (source address, sequence number) against per-packet send timestamps.
+Duplicates and replies arriving after the per-packet timeout are dropped,
+as ping does.
+
+The kernel only allows these sockets for groups within
+``net.ipv4.ping_group_range``; where that (or binding to the source
+interface) is refused, ping_native() raises OSError and the transport falls
+back to one ``ping`` subprocess per target (see Transport.ping).
+"""
+
+import asyncio
+import ipaddress
+import socket
+import struct
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from validate.parsers.ping import PingStats
+
+# Per-packet result callback: (address, sequence, RTT in ms or None if lost)
+Outcome = Callable[[str, int, Optional[float]], None]
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+
+# Payload size matching ping's default (64-byte ICMP message)
+PAYLOAD_SIZE = 56
+
+# Why native probing last failed, so later probes go straight to the fallback
+_native_error: Optional[str] = None
+
+
+def echo_request(seq: int) -> bytes:
+    """
+    Build an ICMP echo request.
+
+    Identifier and checksum are left zero: on a ping socket the kernel sets
+    the identifier to the socket's port and computes the checksum.
+
+    Args:
+        seq: Sequence number (wrapped to 16 bits).
+
+    Returns:
+        ICMP message bytes.
+    """
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, 0, seq & 0xFFFF)
+    return header + bytes(range(PAYLOAD_SIZE))
+
+
+def parse_echo_reply(packet: bytes) -> Optional[int]:
+    """
+    Extract the sequence number from an ICMP echo reply.
+
+    Args:
+        packet: Data read from a ping socket (ICMP header onward).
+
+    Returns:
+        Sequence number, or None if the packet is not an echo reply.
+    """
+    if len(packet) < 8 or packet[0] != ICMP_ECHO_REPLY:
+        return None
+    seq: int = struct.unpack("!H", packet[6:8])[0]
+    return seq
+
+
+def native_error() -> Optional[str]:
+    """Why native probing is unavailable, or None if it has not failed."""
+    return _native_error
+
+
+def _open_socket(interface: str) -> socket.socket:
+    """Open a non-blocking ping socket, bound to an interface if given."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    try:
+        if interface:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, interface.encode())
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class _Probe:
+    """In-flight requests and results of one ping_native() run."""
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        addresses: List[str],
+        timeout_s: float,
+        on_outcome: Optional[Outcome] = None,
+    ):
+        self.sock = sock
+        self.timeout_s = timeout_s
+        self.on_outcome = on_outcome
+        # (address, 16-bit wire sequence) -> (sequence, send time)
+        self.in_flight: Dict[Tuple[str, int], Tuple[int, float]] = {}
+        self.stats = {address: PingStats() for address in addresses}
+        # Replies by sequence, kept only when not streaming to on_outcome
+        self.replies: Dict[str, Dict[int, float]] = {address: {} for address in addresses}
+        self.drained = asyncio.Event()
+
+    def _settle(self, address: str, seq: int, rtt: Optional[float]) -> None:
+        """Record one packet's outcome."""
+        if rtt is not None:
+            self.stats[address].received += 1
+        if self.on_outcome is not None:
+            self.on_outcome(address, seq, rtt)
+        elif rtt is not None:
+            self.replies[address][seq] = rtt
+        if not self.in_flight:
+            self.drained.set()
+
+    def send(self, address: str, seq: int) -> None:
+        """Send one echo request, recording when it left."""
+        self.in_flight[(address, seq & 0xFFFF)] = (seq, time.monotonic())
+        self.stats[address].sent += 1
+        self.drained.clear()
+        try:
+            self.sock.sendto(echo_request(seq), (address, 0))
+        except OSError:
+            # Unreachable right now (e.g. no route): counts as a lost packet
+            del self.in_flight[(address, seq & 0xFFFF)]
+            self._settle(address, seq, None)
+
+    def expire(self, now: float) -> None:
+        """Settle requests whose reply is overdue as lost."""
+        for key, (seq, sent) in list(self.in_flight.items()):
+            if now - sent > self.timeout_s:
+                del self.in_flight[key]
+                self._settle(key[0], seq, None)
+
+    def on_readable(self) -> None:
+        """Read every queued reply and record its RTT."""
+        while True:
+            try:
+                packet, source = self.sock.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # ICMP errors (e.g. host unreachable) surface here; ignore
+                continue
+            now = time.monotonic()
+            wire_seq = parse_echo_reply(packet)
+            # Duplicates and already-expired requests are no longer in flight
+            request = self.in_flight.pop((source[0], -1 if wire_seq is None else wire_seq), None)
+            if request is not None:
+                seq, sent = request
+                rtt = (now - sent) * 1000
+                self._settle(source[0], seq, rtt if rtt <= self.timeout_s * 1000 else None)
+
+    async def run(self, count: int, interval_s: float) -> None:
+        """Send count rounds to every target, then wait for the last replies."""
+        for seq in range(count):
+            if seq:
+                await asyncio.sleep(interval_s)
+            self.expire(time.monotonic())
+            for address in self.stats:
+                self.send(address, seq)
+        if self.in_flight:
+            try:
+                await asyncio.wait_for(self.drained.wait(), self.timeout_s)
+            except asyncio.TimeoutError:
+                pass
+        self.expire(float("inf"))
+
+
+async def ping_native(
+    addresses: Sequence[str],
+    count: int = 3,
+    interval_s: float = 1.0,
+    timeout_s: float = 2.0,
+    interface: str = "",
+    on_outcome: Optional[Outcome] = None,
+) -> Dict[str, PingStats]:
+    """
+    Ping IPv4 addresses concurrently from one ICMP datagram socket.
+
+    Memory use depends only on the number of requests in flight, so long
+    runs can stream every outcome to on_outcome instead of keeping RTTs.
+
+    Args:
+        addresses: IPv4 addresses to ping.
+        count: Echo requests per address.
+        interval_s: Seconds between rounds.
+        timeout_s: Seconds to wait for each reply.
+        interface: Source interface to bind to ("" for default routing).
+        on_outcome: Called with (address, sequence, RTT ms or None if lost)
+            as each packet settles (not necessarily in sequence order).
+
+    Returns:
+        Address to PingStats; RTTs in sequence order, or empty when
+        streaming to on_outcome.
+
+    Raises:
+        OSError: If ping sockets are not permitted or the interface cannot
+            be bound; the reason is kept for native_error().
+        ValueError: If an address is not an IPv4 literal.
+    """
+    global _native_error
+    targets = list(dict.fromkeys(addresses))
+    for address in targets:
+        if not isinstance(ipaddress.ip_address(address), ipaddress.IPv4Address):
+            raise ValueError(f"Not an IPv4 address: {address}")
+
+    try:
+        sock = _open_socket(interface)
+    except OSError as e:
+        _native_error = f"ICMP datagram socket unavailable: {e}"
+        raise
+
+    loop = asyncio.get_running_loop()
+    probe = _Probe(sock, targets, timeout_s, on_outcome)
+    loop.add_reader(sock.fileno(), probe.on_readable)
+    try:
+        await probe.run(count, interval_s)
+    finally:
+        loop.remove_reader(sock.fileno())
+        sock.close()
+
+    for address, replies in probe.replies.items():
+        probe.stats[address].rtts = [replies[seq] for seq in sorted(replies)]
+    return probe.stats
+
+
+def ping_command(
+    address: str, count: int, interval_s: float, timeout_s: float, interface: str
+) -> str:
+    """
+    Build the equivalent ``ping`` command line for the subprocess fallback.
+
+    Args:
+        address: Target address.
+        count: Echo requests.
+        interval_s: Seconds between requests (omitted when 1, ping's default).
+        timeout_s: Seconds to wait for each reply.
+        interface: Source interface ("" for default routing).
+
+    Returns:
+        Command string.
+    """
+    options = f"-c {count}"
+    if interval_s != 1:
+        options += f" -i {interval_s:g}"
+    options += f" -W {timeout_s:g}"
+    if interface:
+        options += f" -I {interface}"
+    return f"ping {options} {address}"
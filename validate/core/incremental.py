@@ -0,0 +1,253 @@
+"""
+Incremental validation: reuse check results whose inputs have not changed.
+
+A check registered with ``inputs`` names the pieces of node state its
+verdict depends on (see FINGERPRINT_COMMANDS): UCI packages, batctl tables,
+links and addresses, running processes, a few files. At the start of an
+incremental run the runner fetches a digest of every input in use with one
+batched call per node; large outputs (``uci export``, files) are hashed on
+the node, and small volatile ones (batctl tables, ps) are normalized here
+first so timers, TQ and memory use don't count as changes.
+
+A check is reused when its fingerprint (the digests of its inputs on every
+node, plus the node list and thresholds) matches the last time it passed
+and that result is younger than the maximum staleness. Only PASS results
+are reused, and checks without inputs (live measurements, prerequisites)
+always run. Reused results keep their original content and carry their age
+in ``cached_s``.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence
+
+from validate.config import INCREMENTAL_MAX_AGE_S, NODES, THRESHOLDS, VLANS
+from validate.core.executor import run_batch_on_node_async
+from validate.core.results import CheckResult, CheckStatus
+from validate.core.snapshot import SNAPSHOT_COMMANDS
+from validate.parsers.batctl import parse_gateways, parse_neighbors, parse_originators
+
+CACHE_FORMAT = "mesh-validate-results"
+CACHE_VERSION = 1
+
+# UCI packages checks read
+UCI_PACKAGES = ("network", "wireless", "dhcp", "firewall", "dropbear", "uhttpd")
+
+# Input name -> command whose output identifies that piece of node state
+FINGERPRINT_COMMANDS: Dict[str, str] = {
+    **{f"uci:{package}": f"uci export {package} 2>/dev/null | md5sum" for package in UCI_PACKAGES},
+    "batman:neighbors": SNAPSHOT_COMMANDS["neighbors"],
+    "batman:originators": SNAPSHOT_COMMANDS["originators"],
+    "batman:gateways": SNAPSHOT_COMMANDS["gateways"],
+    "batman:bla": "cat /sys/class/net/bat0/mesh/bridge_loop_avoidance 2>/dev/null",
+    "links": "ip link show | md5sum",
+    "addresses": "ip addr show",
+    "processes": "ps w",
+    "files:ssh": (
+        "md5sum /etc/ssh/sshd_config /etc/dropbear/authorized_keys"
+        " /root/.ssh/authorized_keys 2>/dev/null"
+    ),
+    "files:https": "md5sum /etc/uhttpd.crt /etc/uhttpd.key 2>/dev/null",
+}
+
+
+def _neighbors(stdout: str) -> str:
+    """Neighbor identities, without last-seen times or throughput."""
+    entries = parse_neighbors(stdout).entries
+    return "\n".join(sorted(f"{n.hardif} {n.neighbor}" for n in entries))
+
+
+def _originators(stdout: str) -> str:
+    """Best route per originator, without last-seen times or link quality."""
+    entries = parse_originators(stdout).entries
+    return "\n".join(
+        sorted(f"{o.originator} {o.next_hop} {o.outgoing_if}" for o in entries if o.best)
+    )
+
+
+def _gateways(stdout: str) -> str:
+    """Visible gateways and the selected one."""
+    entries = parse_gateways(stdout).entries
+    return "\n".join(sorted(f"{g.router} {g.best}" for g in entries))
+
+
+def _addresses(stdout: str) -> str:
+    """ip addr output without the address lifetime countdowns."""
+    return "\n".join(line for line in stdout.splitlines() if "_lft" not in line)
+
+
+def _processes(stdout: str) -> str:
+    """PID and command line of every process, without memory use or state."""
+    rows = (line.split(None, 4) for line in stdout.splitlines()[1:])
+    return "\n".join(sorted(f"{row[0]} {row[4]}" for row in rows if len(row) == 5))
+
+
+# Input name -> reduces the command output to what identifies the state
+_NORMALIZERS: Dict[str, Callable[[str], str]] = {
+    "batman:neighbors": _neighbors,
+    "batman:originators": _originators,
+    "batman:gateways": _gateways,
+    "addresses": _addresses,
+    "processes": _processes,
+}
+
+
+def _digest(text: str) -> str:
+    """Short stable hash of text."""
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+async def collect_fingerprints(inputs: Collection[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Fetch the digest of each input from every node, one batched call per node.
+
+    Args:
+        inputs: Input names (keys of FINGERPRINT_COMMANDS).
+
+    Returns:
+        Node name -> input -> digest. Inputs whose command could not be run
+        (node unreachable, batch cut short) are left out.
+
+    Raises:
+        ValueError: For an unknown input name.
+    """
+    names = sorted(inputs)
+    unknown = [name for name in names if name not in FINGERPRINT_COMMANDS]
+    if unknown:
+        raise ValueError(f"Unknown check inputs: {', '.join(unknown)}")
+    commands = [FINGERPRINT_COMMANDS[name] for name in names]
+
+    async def collect(node: str) -> Dict[str, str]:
+        results = await run_batch_on_node_async(node, commands)
+        digests = {}
+        for name, (rc, stdout, _) in zip(names, results):
+            if rc == -1:
+                continue  # Not run: connection lost or batch timed out
+            normalize = _NORMALIZERS.get(name)
+            digests[name] = _digest(f"{rc}\n{normalize(stdout) if normalize else stdout}")
+        return digests
+
+    if not names:
+        return {}
+    nodes = list(NODES)
+    collected = await asyncio.gather(*(collect(node) for node in nodes))
+    return dict(zip(nodes, collected))
+
+
+def fingerprint(inputs: Sequence[str], fingerprints: Dict[str, Dict[str, str]]) -> Optional[str]:
+    """
+    Combine a check's input digests across all nodes.
+
+    The node list and validation thresholds are included, so reconfiguring
+    the validator also invalidates cached results.
+
+    Args:
+        inputs: The check's input names.
+        fingerprints: Digests from collect_fingerprints().
+
+    Returns:
+        The check's fingerprint, or None if any digest is missing.
+    """
+    parts: List[Any] = [
+        sorted((name, info.ip, info.gw_mode) for name, info in NODES.items()),
+        THRESHOLDS,
+        VLANS,
+    ]
+    for node in sorted(NODES):
+        for name in sorted(inputs):
+            value = fingerprints.get(node, {}).get(name)
+            if value is None:
+                return None
+            parts.append([node, name, value])
+    return _digest(json.dumps(parts, sort_keys=True))
+
+
+class ResultCache:
+    """Passing check results from earlier runs, keyed by check fingerprint."""
+
+    def __init__(self, path: str, max_age_s: float = INCREMENTAL_MAX_AGE_S):
+        """
+        Load the cache (an unreadable or missing file starts it empty).
+
+        Args:
+            path: Cache file.
+            max_age_s: Oldest result that may be reused, in seconds.
+        """
+        self.path = path
+        self.max_age_s = max_age_s
+        self.hits = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") == CACHE_FORMAT and data.get("version") == CACHE_VERSION:
+                self._entries = dict(data.get("checks", {}))
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def lookup(self, category: str, fingerprint: str) -> Optional[CheckResult]:
+        """
+        Get a reusable result for a check.
+
+        Args:
+            category: Check category.
+            fingerprint: The check's current fingerprint.
+
+        Returns:
+            The cached result with cached_s set, or None on a miss.
+        """
+        entry = self._entries.get(category)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+        age = time.time() - float(entry.get("time", 0))
+        if not 0 <= age <= self.max_age_s:
+            return None
+        try:
+            result = CheckResult.from_dict(entry["result"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        result.cached_s = age
+        self.hits += 1
+        return result
+
+    def store(self, category: str, fingerprint: str, result: CheckResult) -> None:
+        """
+        Remember a freshly run result (only a PASS is kept).
+
+        Args:
+            category: Check category.
+            fingerprint: The check's fingerprint when it ran.
+            result: The check's result.
+        """
+        if result.status != CheckStatus.PASS:
+            self._entries.pop(category, None)
+            return
+        self._entries[category] = {
+            "fingerprint": fingerprint,
+            "time": time.time(),
+            "result": result.to_dict(),
+        }
+
+    def save(self) -> None:
+        """
+        Write the cache, replacing the file atomically.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        data = {"format": CACHE_FORMAT, "version": CACHE_VERSION, "checks": self._entries}
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".results-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
@@ -0,0 +1,170 @@
+"""
+Node-to-node latency matrix.
+
+Every node pings every other node itself, so the figures describe the mesh
+rather than the workstation's path to each node. Each node runs all of its
+pings concurrently from one script over a single SSH session:
+
+- one routed ping per peer node (its mesh IP; batman-adv picks the path)
+- one ping per direct link to the neighbor's IPv6 link-local address on
+  that hard interface, which pins the probe to that link - wired lan3/lan4
+  or the mesh0 wireless backup
+
+Per-packet RTTs are kept for p50/p90/p99/max and jitter.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from validate.config import NODES
+from validate.core.snapshot import get_snapshot
+from validate.core.topology import MeshGraph
+from validate.parsers.ping import PingStats, parse_ping
+
+# First line of the probe script (the simulator recognizes it)
+PROBE_MARKER = "# mesh-latency-probe"
+
+# Kind of a routed (node IP) target; link targets use the topology link kind
+ROUTED = "routed"
+
+_SECTION = "@@@ "
+
+
+@dataclass
+class LatencyTarget:
+    """One address a node pings."""
+
+    peer: str
+    address: str
+    kind: str = ROUTED
+    iface: str = ""  # Hard interface the probe is pinned to (link targets)
+
+    @property
+    def label(self) -> str:
+        """Unique name within one node's probe, e.g. ``node2`` or ``node2@lan3.100``."""
+        return f"{self.peer}@{self.iface}" if self.iface else self.peer
+
+
+@dataclass
+class LatencyMatrix:
+    """Latency from every node to every target."""
+
+    # source -> target label -> stats
+    results: Dict[str, Dict[str, PingStats]] = field(default_factory=dict)
+    targets: Dict[str, List[LatencyTarget]] = field(default_factory=dict)
+
+    def pairs(self) -> Dict[str, Dict[str, PingStats]]:
+        """Routed node-to-node results: source -> peer -> stats."""
+        return {
+            source: {t.peer: self.results[source][t.label] for t in targets if t.kind == ROUTED}
+            for source, targets in self.targets.items()
+            if source in self.results
+        }
+
+    def by_kind(self) -> Dict[str, PingStats]:
+        """Per-link results pooled by link kind (e.g. wired vs wireless)."""
+        pooled: Dict[str, PingStats] = {}
+        for source, targets in self.targets.items():
+            for target in targets:
+                stats = self.results.get(source, {}).get(target.label)
+                if target.kind == ROUTED or stats is None:
+                    continue
+                total = pooled.setdefault(target.kind, PingStats())
+                total.sent += stats.sent
+                total.received += stats.received
+                total.rtts.extend(stats.rtts)
+        return pooled
+
+
+def link_local(mac: str) -> str:
+    """
+    IPv6 link-local address derived from a MAC (modified EUI-64).
+
+    Args:
+        mac: ``aa:bb:cc:dd:ee:ff``.
+
+    Returns:
+        ``fe80::a8bb:ccff:fedd:eeff``.
+    """
+    octets = [int(part, 16) for part in mac.split(":")]
+    octets[0] ^= 0x02
+    eui = octets[:3] + [0xFF, 0xFE] + octets[3:]
+    groups = [f"{eui[i] << 8 | eui[i + 1]:x}" for i in range(0, 8, 2)]
+    return "fe80::" + ":".join(groups)
+
+
+def plan_targets(node: str, graph: Optional[MeshGraph] = None) -> List[LatencyTarget]:
+    """
+    Targets one node should ping.
+
+    Args:
+        node: Source node.
+        graph: Mesh topology for per-link targets (None: routed targets only).
+
+    Returns:
+        Routed targets for every other node, then one per direct link.
+    """
+    targets = [LatencyTarget(peer=peer, address=info.ip) for peer, info in NODES.items()]
+    targets = [target for target in targets if target.peer != node]
+    if graph is None:
+        return targets
+
+    for peer, link in graph.neighbors(node):
+        local_iface = link.a_iface if link.a == node else link.b_iface
+        peer_iface = link.b_iface if link.a == node else link.a_iface
+        mac = get_snapshot(peer).interface_macs.get(peer_iface)
+        if local_iface and mac:
+            targets.append(
+                LatencyTarget(peer=peer, address=link_local(mac), kind=link.kind, iface=local_iface)
+            )
+    return targets
+
+
+def build_probe_script(targets: List[LatencyTarget], count: int, interval_s: float) -> str:
+    """
+    Build the script one node runs to ping all its targets at once.
+
+    Args:
+        targets: From plan_targets().
+        count: Pings per target.
+        interval_s: Seconds between pings to one target.
+
+    Returns:
+        POSIX sh script printing ``@@@ <label>`` then that target's ping output.
+    """
+    lines = [
+        f"{PROBE_MARKER} count={count}",
+        "D=/tmp/latency.$$",
+        "mkdir -p $D",
+        "trap 'rm -rf $D' EXIT",
+    ]
+    for target in targets:
+        options = f"-c {count} -i {interval_s:g} -W 1"
+        if target.iface:
+            options = f"-6 {options} -I {target.iface}"
+        lines.append(f'ping {options} {target.address} >"$D/{target.label}" 2>&1 &')
+    lines += [
+        "wait",
+        'for f in $D/*; do echo "' + _SECTION + '${f##*/}"; cat "$f"; done',
+    ]
+    return "\n".join(lines)
+
+
+def parse_probe_output(output: str) -> Dict[str, PingStats]:
+    """
+    Split probe script output into per-target ping statistics.
+
+    Args:
+        output: Script stdout.
+
+    Returns:
+        Target label to PingStats.
+    """
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for line in output.splitlines():
+        if line.startswith(_SECTION):
+            current = sections.setdefault(line[len(_SECTION) :].strip(), [])
+        elif current is not None:
+            current.append(line)
+    return {label: parse_ping("\n".join(lines)) for label, lines in sections.items()}
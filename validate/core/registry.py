@@ -0,0 +1,192 @@
+"""
+Check registry: every check the runner knows, described without importing it.
+
+A CheckSpec records what the runner needs to schedule a check (category,
+phase, minimum tier, dependencies, exclusive resources, incremental inputs,
+time budget) plus a typical run time, and names the check function as
+"module:function". The module is imported only when the check runs, so
+building a runner or listing checks loads no check bodies, and a tier never
+imports the checks it skips.
+
+The built-in checks are declared in validate.checks.CHECKS. Other packages
+add checks through the "mesh_validate.checks" entry point group; each entry
+point names a sequence of CheckSpec, or a function returning one, e.g. in
+the plugin's pyproject.toml:
+
+    [project.entry-points."mesh_validate.checks"]
+    ups = "mesh_ups.registry:CHECKS"
+
+The module an entry point names is imported whenever checks are listed or
+a runner is built, so it should hold only the specs, not the checks.
+register() adds checks at runtime (when embedding the runner, or in tests).
+"""
+
+import importlib
+import warnings
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from validate.core.results import Tier
+
+ENTRY_POINT_GROUP = "mesh_validate.checks"
+
+# Resource that excludes every other check while held
+DISRUPTIVE = "disruptive"
+
+# Phase number -> (name, lowest tier that shows it)
+PHASES: Dict[int, Tuple[str, Tier]] = {
+    1: ("Prerequisites", Tier.SMOKE),
+    2: ("Foundation", Tier.SMOKE),
+    3: ("Network", Tier.SMOKE),
+    4: ("Services", Tier.COMPREHENSIVE),
+    5: ("Certification", Tier.CERTIFICATION),
+}
+
+
+@dataclass
+class CheckSpec:
+    """A check's metadata and where to find its function."""
+
+    category: str  # e.g., "connectivity.ping"
+    target: str  # "module:function"
+    phase: int
+    min_tier: Tier = Tier.SMOKE
+    depends_on: List[str] = field(default_factory=list)
+    resources: List[str] = field(default_factory=list)
+    inputs: List[str] = field(default_factory=list)
+    budget_s: Optional[float] = None  # None: the runner's default
+    cost_s: float = 1.0  # Typical run time on a small mesh
+    source: str = "builtin"  # Entry point (plugin) or "runtime" that added it
+
+    def load(self) -> Callable[[], Any]:
+        """
+        Import the check function.
+
+        Returns:
+            The function (sync or async).
+
+        Raises:
+            ImportError: If the module cannot be imported.
+            AttributeError: If the module has no such function.
+            ValueError: If target is not "module:function".
+        """
+        return resolve(self.target)
+
+
+def resolve(target: str) -> Callable[[], Any]:
+    """
+    Import a "module:function" reference.
+
+    Args:
+        target: Module path and attribute, separated by a colon.
+
+    Returns:
+        The referenced callable.
+
+    Raises:
+        ImportError: If the module cannot be imported.
+        AttributeError: If the module has no such attribute.
+        ValueError: If target is malformed or names something not callable.
+    """
+    module_name, _, attr = target.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Check target must be 'module:function', got {target!r}")
+    func = getattr(importlib.import_module(module_name), attr)
+    if not callable(func):
+        raise ValueError(f"Check target {target!r} is not callable")
+    return func  # type: ignore[no-any-return]
+
+
+def phase_name(phase: int) -> str:
+    """Name of a phase (plugins may use numbers beyond the built-in ones)."""
+    return PHASES[phase][0] if phase in PHASES else f"Phase {phase}"
+
+
+# Checks added with register(), in order
+_runtime: List[CheckSpec] = []
+
+
+def register(*specs: CheckSpec) -> None:
+    """
+    Add checks to the registry at runtime.
+
+    Args:
+        specs: Checks to add.
+
+    Raises:
+        ValueError: If a category is already registered.
+    """
+    known = {spec.category for spec in check_specs()}
+    for spec in specs:
+        if spec.category in known:
+            raise ValueError(f"Check already registered: {spec.category}")
+        known.add(spec.category)
+        _runtime.append(replace(spec, source="runtime") if spec.source == "builtin" else spec)
+
+
+def unregister(category: str) -> None:
+    """
+    Remove a check added with register() (others are left alone).
+
+    Args:
+        category: Check category.
+    """
+    _runtime[:] = [spec for spec in _runtime if spec.category != category]
+
+
+@lru_cache(maxsize=1)
+def plugin_specs() -> Tuple[CheckSpec, ...]:
+    """
+    Load the checks of every installed plugin (once per process).
+
+    A plugin that fails to load, or declares something other than specs,
+    is skipped with a warning rather than failing every run.
+
+    Returns:
+        The plugins' checks, in entry point order.
+    """
+    specs: List[CheckSpec] = []
+    for point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            declared = point.load()
+            declared = declared() if callable(declared) else declared
+            loaded = list(declared)
+            if not all(isinstance(spec, CheckSpec) for spec in loaded):
+                raise TypeError("expected a sequence of CheckSpec")
+        except Exception as e:
+            warnings.warn(f"Check plugin {point.name!r} not loaded: {e}", RuntimeWarning)
+            continue
+        specs.extend(replace(spec, source=point.name) for spec in loaded)
+    return tuple(specs)
+
+
+def check_specs(tier: Optional[Tier] = None) -> List[CheckSpec]:
+    """
+    Get every registered check: built-in, then plugins, then runtime.
+
+    A plugin check whose category is already taken is skipped with a
+    warning.
+
+    Args:
+        tier: Only checks that run at this tier (default: all).
+
+    Returns:
+        Check specs in registration order.
+    """
+    from validate.checks import CHECKS  # Specs only; no check bodies
+
+    specs: List[CheckSpec] = []
+    seen = set()
+    for spec in [*CHECKS, *plugin_specs(), *_runtime]:
+        if spec.category in seen:
+            warnings.warn(
+                f"Check {spec.category} from {spec.source} ignored: already registered",
+                RuntimeWarning,
+            )
+            continue
+        seen.add(spec.category)
+        if tier is None or tier.value >= spec.min_tier.value:
+            specs.append(spec)
+    return specs
@@ -18,6 +18,7 @@ class CheckStatus(Enum):
     WARN = "WARN"  # Degraded but not failed (optional features)
     SKIP = "SKIP"
     ERROR = "ERROR"
+    TIMEOUT = "TIMEOUT"  # Overran its time budget (or the tier's SLO)
 
 
 class Tier(Enum):
@@ -50,6 +51,7 @@ class CheckResult:
     nodes: Dict[str, NodeResult] = field(default_factory=dict)
     data: Dict[str, Any] = field(default_factory=dict)
     diagnostics: Optional[str] = None
+    cached_s: Optional[float] = None  # Age of a reused result (incremental runs)
 
     @property
     def passed(self) -> bool:
@@ -58,8 +60,8 @@ class CheckResult:
 
     @property
     def failed(self) -> bool:
-        """Return True if check failed or has error status."""
-        return self.status in (CheckStatus.FAIL, CheckStatus.ERROR)
+        """Return True if check failed, has error status or timed out."""
+        return self.status in (CheckStatus.FAIL, CheckStatus.ERROR, CheckStatus.TIMEOUT)
 
     def add_node_result(
         self,
@@ -81,10 +83,12 @@ class CheckResult:
         if not self.nodes:
             return
 
-        # Aggregate based on worst status (ERROR > FAIL > WARN > SKIP > PASS)
+        # Aggregate based on worst status (ERROR > TIMEOUT > FAIL > WARN > SKIP > PASS)
         statuses = [n.status for n in self.nodes.values()]
         if any(s == CheckStatus.ERROR for s in statuses):
             self.status = CheckStatus.ERROR
+        elif any(s == CheckStatus.TIMEOUT for s in statuses):
+            self.status = CheckStatus.TIMEOUT
         elif any(s == CheckStatus.FAIL for s in statuses):
             self.status = CheckStatus.FAIL
         elif any(s == CheckStatus.WARN for s in statuses):
@@ -97,6 +101,62 @@ class CheckResult:
             # Mix of PASS and SKIP
             self.status = CheckStatus.PASS
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        result: Dict[str, Any] = {
+            "category": self.category,
+            "status": self.status.value,
+            "message": self.message,
+            "duration_ms": self.duration_ms,
+            "nodes": {
+                k: {
+                    "status": v.status.value,
+                    "message": v.message,
+                    "data": v.data,
+                }
+                for k, v in self.nodes.items()
+            },
+            "data": self.data,
+            "diagnostics": self.diagnostics,
+        }
+        if self.cached_s is not None:
+            result["cached_s"] = round(self.cached_s, 1)
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CheckResult":
+        """
+        Rebuild a result from to_dict() output.
+
+        Args:
+            data: Serialized result.
+
+        Returns:
+            The CheckResult.
+
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If a status is unknown.
+        """
+        return cls(
+            category=data["category"],
+            status=CheckStatus(data["status"]),
+            message=data.get("message", ""),
+            duration_ms=data.get("duration_ms", 0),
+            nodes={
+                node: NodeResult(
+                    node=node,
+                    status=CheckStatus(n["status"]),
+                    message=n.get("message", ""),
+                    data=n.get("data", {}),
+                )
+                for node, n in data.get("nodes", {}).items()
+            },
+            data=data.get("data", {}),
+            diagnostics=data.get("diagnostics"),
+            cached_s=data.get("cached_s"),
+        )
+
 
 @dataclass
 class PhaseResult:
@@ -106,12 +166,20 @@ class PhaseResult:
     name: str
     checks: List[CheckResult] = field(default_factory=list)
     duration_ms: int = 0
+    budget_s: Optional[float] = None  # Tier SLO the phase's time counts against
 
     @property
     def passed(self) -> bool:
         """Check if all checks in this phase passed."""
         return all(c.passed for c in self.checks)
 
+    @property
+    def budget_pct(self) -> Optional[float]:
+        """Share of the tier's SLO this phase took, in percent."""
+        if not self.budget_s:
+            return None
+        return round(self.duration_ms / (self.budget_s * 10), 1)
+
     @property
     def passed_count(self) -> int:
         """Number of passed checks."""
@@ -127,6 +195,32 @@ class PhaseResult:
         """Total number of checks."""
         return len(self.checks)
 
+    def to_dict(self, include_checks: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Args:
+            include_checks: Include every check result; when False, only
+                the pass/fail counts.
+        """
+        data: Dict[str, Any] = {
+            "phase": self.phase,
+            "name": self.name,
+            "duration_ms": self.duration_ms,
+        }
+        if self.budget_pct is not None:
+            data["budget_pct"] = self.budget_pct
+        if include_checks:
+            data["checks"] = [c.to_dict() for c in self.checks]
+        else:
+            data["result"] = "PASS" if self.passed else "FAIL"
+            data["summary"] = {
+                "total": self.total_count,
+                "passed": self.passed_count,
+                "failed": self.failed_count,
+            }
+        return data
+
 
 @dataclass
 class ValidationResult:
@@ -138,11 +232,18 @@ class ValidationResult:
     duration_ms: int = 0
     aborted: bool = False
     abort_reason: str = ""
+    circuit_open_s: Dict[str, float] = field(default_factory=dict)  # node -> seconds
+    slo_s: Optional[float] = None  # Time the tier is allowed (None: unlimited)
 
     @property
     def passed(self) -> bool:
-        """Check all phases completed successfully without abort."""
-        return not self.aborted and all(p.passed for p in self.phases)
+        """Check all phases completed successfully, without abort, within the SLO."""
+        return not self.aborted and not self.slo_exceeded and all(p.passed for p in self.phases)
+
+    @property
+    def slo_exceeded(self) -> bool:
+        """Return True if the run took longer than the tier's SLO."""
+        return self.slo_s is not None and self.duration_ms > self.slo_s * 1000
 
     @property
     def status(self) -> CheckStatus:
@@ -190,31 +291,8 @@ class ValidationResult:
                 "passed": self.passed_checks,
                 "failed": self.failed_checks,
             },
-            "phases": [
-                {
-                    "phase": p.phase,
-                    "name": p.name,
-                    "duration_ms": p.duration_ms,
-                    "checks": [
-                        {
-                            "category": c.category,
-                            "status": c.status.value,
-                            "message": c.message,
-                            "duration_ms": c.duration_ms,
-                            "nodes": {
-                                k: {
-                                    "status": v.status.value,
-                                    "message": v.message,
-                                    "data": v.data,
-                                }
-                                for k, v in c.nodes.items()
-                            },
-                            "data": c.data,
-                            "diagnostics": c.diagnostics,
-                        }
-                        for c in p.checks
-                    ],
-                }
-                for p in self.phases
-            ],
+            "circuit_open_s": self.circuit_open_s,
+            "slo_s": self.slo_s,
+            "slo_exceeded": self.slo_exceeded,
+            "phases": [p.to_dict() for p in self.phases],
         }
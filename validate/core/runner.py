@@ -2,16 +2,75 @@
 Validation runner with phase orchestration.
 
 Executes validation checks in ordered phases with proper dependency handling.
+
+Within a phase, checks run in parallel (up to MAX_PARALLEL_CHECKS at once)
+subject to two declared constraints:
+
+- depends_on: categories that must complete first. If a dependency did not
+  pass, the dependent check is reported as SKIP without running, and the
+  SKIP propagates to its own dependents.
+- resources: named resources (e.g. "node1-lan3") a check needs exclusive use
+  of. Checks sharing a resource never overlap. The special resource
+  "disruptive" means the check runs with no other check in flight.
+
+Every check has a time budget (CHECK_BUDGET_S unless registered with its
+own) and the whole tier an SLO (TIER_SLO_S). A check that overruns its
+budget, or what is left of the SLO, is stopped and reported as TIMEOUT.
+A disruptive check is instead left to finish, so that it restores the mesh
+before other checks run, and is then reported as TIMEOUT. Checks not
+started before the SLO is used up are reported as TIMEOUT without running,
+and a run that takes longer than its SLO fails (see validate.core.budget).
+
+Checks may also declare inputs, the node state their verdict depends on.
+Given a ResultCache, the runner reuses a check's last PASS while those
+inputs are unchanged (see validate.core.incremental).
+
+Phases are driven from the shared engine event loop. Check functions may be
+plain functions (run in a worker thread) or coroutine functions (awaited on
+the loop); both kinds are scheduled together under the same constraints.
+create_runner() takes its checks from the registry (validate.core.registry)
+as "module:function" references, imported when the check first runs.
 """
 
+import asyncio
+import contextvars
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Tuple
-
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union, cast
+
+from validate.config import CHECK_BUDGET_S, MAX_PARALLEL_CHECKS, TIER_SLO_S
+from validate.core import budget
+from validate.core.engine import run_sync
+from validate.core.health import circuit_summary, node_circuit, reset_circuits
+from validate.core.incremental import ResultCache, collect_fingerprints, fingerprint
+from validate.core.registry import DISRUPTIVE, PHASES, check_specs, phase_name, resolve
 from validate.core.results import CheckResult, CheckStatus, PhaseResult, Tier, ValidationResult
+from validate.core.snapshot import clear_snapshots
+
+# Type aliases for check functions
+SyncCheckFunc = Callable[[], CheckResult]
+AsyncCheckFunc = Callable[[], Awaitable[CheckResult]]
+CheckFunc = Union[SyncCheckFunc, AsyncCheckFunc]
+
 
-# Type alias for check functions
-CheckFunc = Callable[[], CheckResult]
+@dataclass
+class RegisteredCheck:
+    """A check registered with the runner, with its scheduling constraints."""
+
+    category: str
+    func: Union[CheckFunc, str]  # Or "module:function", imported when run
+    depends_on: List[str] = field(default_factory=list)
+    resources: List[str] = field(default_factory=list)
+    inputs: List[str] = field(default_factory=list)
+    budget_s: Optional[float] = None  # None: the runner's default
+
+    @property
+    def disruptive(self) -> bool:
+        """Return True if the check must run alone."""
+        return DISRUPTIVE in self.resources
 
 
 class ValidationRunner:
@@ -22,15 +81,37 @@ class ValidationRunner:
     to pass before continuing to subsequent phases.
     """
 
-    def __init__(self, tier: Tier = Tier.STANDARD):
+    def __init__(
+        self,
+        tier: Tier = Tier.STANDARD,
+        max_parallel: Optional[int] = None,
+        cache: Optional[ResultCache] = None,
+        slo_s: Optional[float] = None,
+        check_budget_s: Optional[float] = None,
+    ):
         """
         Initialize validation runner.
 
         Args:
             tier: Validation tier to run (determines which checks).
+            max_parallel: Maximum concurrent checks per phase
+                (default: MAX_PARALLEL_CHECKS).
+            cache: Reuse unchanged checks' results from this cache
+                (incremental run); the caller saves it.
+            slo_s: Seconds the whole run may take (default: the tier's
+                TIER_SLO_S; 0 for unlimited).
+            check_budget_s: Seconds a check may take unless registered with
+                its own budget (default: CHECK_BUDGET_S; 0 for unlimited).
         """
         self.tier = tier
-        self._phases: Dict[int, Tuple[str, List[Tuple[str, CheckFunc]]]] = {}
+        self.max_parallel = max(1, max_parallel or MAX_PARALLEL_CHECKS)
+        self.cache = cache
+        self.slo_s = _limit(TIER_SLO_S.get(tier.name.lower(), 0) if slo_s is None else slo_s)
+        self.check_budget_s = _limit(CHECK_BUDGET_S if check_budget_s is None else check_budget_s)
+        self._deadline: Optional[float] = None  # Monotonic end of the SLO
+        self._phases: Dict[int, Tuple[str, List[RegisteredCheck]]] = {}
+        self._results: Dict[str, CheckResult] = {}
+        self._fingerprints: Dict[str, Dict[str, str]] = {}
 
     def register_phase(self, phase_num: int, name: str) -> None:
         """
@@ -47,8 +128,12 @@ class ValidationRunner:
         self,
         phase_num: int,
         category: str,
-        check_func: CheckFunc,
+        check_func: Union[CheckFunc, str],
         min_tier: Tier = Tier.SMOKE,
+        depends_on: Optional[List[str]] = None,
+        resources: Optional[List[str]] = None,
+        inputs: Optional[List[str]] = None,
+        budget_s: Optional[float] = None,
     ) -> None:
         """
         Register a check function to a phase.
@@ -56,8 +141,18 @@ class ValidationRunner:
         Args:
             phase_num: Phase to add check to.
             category: Check category (e.g., "connectivity.ping").
-            check_func: Function that performs the check.
+            check_func: Function that performs the check, or a
+                "module:function" reference imported when it runs.
             min_tier: Minimum tier required to run this check.
+            depends_on: Categories that must pass before this check runs.
+                Dependencies not registered for this tier are ignored.
+            resources: Resources this check needs exclusive use of
+                (e.g., "disruptive", "node1-lan3").
+            inputs: Node state the check's verdict depends on (keys of
+                incremental.FINGERPRINT_COMMANDS); without inputs the check
+                always runs, even in incremental runs.
+            budget_s: Seconds the check may take (default: the runner's
+                check budget; 0 for no limit beyond the tier's SLO).
         """
         if self.tier.value < min_tier.value:
             return  # Skip checks above our tier
@@ -65,21 +160,60 @@ class ValidationRunner:
         if phase_num not in self._phases:
             self.register_phase(phase_num, f"Phase {phase_num}")
 
-        self._phases[phase_num][1].append((category, check_func))
+        self._phases[phase_num][1].append(
+            RegisteredCheck(
+                category=category,
+                func=check_func,
+                depends_on=list(depends_on or []),
+                resources=list(resources or []),
+                inputs=list(inputs or []),
+                budget_s=budget_s,
+            )
+        )
 
     def run(
         self,
         abort_on_phase1_fail: bool = True,
         on_check_complete: Optional[Callable[[CheckResult], None]] = None,
         on_phase_complete: Optional[Callable[[PhaseResult], None]] = None,
+        on_phase_start: Optional[Callable[[int, str], None]] = None,
     ) -> ValidationResult:
         """
         Execute all registered checks in phase order.
 
+        Runs run_async() on the engine loop; callbacks are invoked from the
+        engine loop thread.
+
         Args:
             abort_on_phase1_fail: If True, abort if any Phase 1 check fails.
             on_check_complete: Callback after each check completes.
             on_phase_complete: Callback after each phase completes.
+            on_phase_start: Callback with (phase number, name) before each phase.
+
+        Returns:
+            ValidationResult with all phase and check results.
+        """
+        return run_sync(
+            self.run_async(
+                abort_on_phase1_fail, on_check_complete, on_phase_complete, on_phase_start
+            )
+        )
+
+    async def run_async(
+        self,
+        abort_on_phase1_fail: bool = True,
+        on_check_complete: Optional[Callable[[CheckResult], None]] = None,
+        on_phase_complete: Optional[Callable[[PhaseResult], None]] = None,
+        on_phase_start: Optional[Callable[[int, str], None]] = None,
+    ) -> ValidationResult:
+        """
+        Execute all registered checks in phase order on the running loop.
+
+        Args:
+            abort_on_phase1_fail: If True, abort if any Phase 1 check fails.
+            on_check_complete: Callback after each check completes.
+            on_phase_complete: Callback after each phase completes.
+            on_phase_start: Callback with (phase number, name) before each phase.
 
         Returns:
             ValidationResult with all phase and check results.
@@ -87,15 +221,26 @@ class ValidationRunner:
         result = ValidationResult(
             tier=self.tier,
             timestamp=datetime.now(),
+            slo_s=self.slo_s,
         )
 
         start_time = time.time()
+        self._deadline = None if self.slo_s is None else time.monotonic() + self.slo_s
+        self._results = {}
+        reset_circuits()
+        self._fingerprints = {}
+        if self.cache is not None:
+            inputs = {i for _, checks in self._phases.values() for c in checks for i in c.inputs}
+            self._fingerprints = await collect_fingerprints(inputs)
 
         # Execute phases in order
         for phase_num in sorted(self._phases.keys()):
             phase_name, checks = self._phases[phase_num]
 
-            phase_result = self._run_phase(
+            if on_phase_start:
+                on_phase_start(phase_num, phase_name)
+
+            phase_result = await self._run_phase(
                 phase_num=phase_num,
                 name=phase_name,
                 checks=checks,
@@ -116,53 +261,257 @@ class ValidationRunner:
                 )
                 break
 
+        result.circuit_open_s = circuit_summary()
         result.duration_ms = int((time.time() - start_time) * 1000)
         return result
 
-    def _run_phase(
+    async def _run_phase(
         self,
         phase_num: int,
         name: str,
-        checks: List[Tuple[str, CheckFunc]],
+        checks: List[RegisteredCheck],
         on_check_complete: Optional[Callable[[CheckResult], None]] = None,
     ) -> PhaseResult:
         """
-        Execute all checks in a phase.
+        Execute all checks in a phase, in parallel where constraints allow.
+
+        Checks are started in registration order as soon as their
+        dependencies are done and their resources are free. Results are
+        appended (and reported) in completion order.
 
         Args:
             phase_num: Phase number.
             name: Phase name.
-            checks: List of (category, check_func) tuples.
+            checks: Registered checks in this phase.
             on_check_complete: Callback after each check.
 
         Returns:
             PhaseResult with all check results.
         """
-        phase_result = PhaseResult(phase=phase_num, name=name)
+        phase_result = PhaseResult(phase=phase_num, name=name, budget_s=self.slo_s)
         phase_start = time.time()
 
-        for category, check_func in checks:
-            check_start = time.time()
+        # Each phase reads node state collected no earlier than its start
+        clear_snapshots()
 
-            try:
-                check_result = check_func()
-                check_result.category = category  # Ensure category is set
-            except Exception as e:
-                check_result = CheckResult(
-                    category=category,
-                    status=CheckStatus.ERROR,
-                    message=f"Check error: {e}",
-                )
+        registered = {c.category for _, phase_checks in self._phases.values() for c in phase_checks}
 
-            check_result.duration_ms = int((time.time() - check_start) * 1000)
+        def complete(check_result: CheckResult) -> None:
+            _trip_unreachable(check_result)
+            self._results[check_result.category] = check_result
             phase_result.checks.append(check_result)
-
             if on_check_complete:
                 on_check_complete(check_result)
 
+        # Sync checks block, so each gets a worker thread
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_parallel, thread_name_prefix="validate-check"
+        )
+        try:
+            await self._run_checks(list(checks), registered, complete, pool)
+        finally:
+            # Sync checks abandoned at their deadline may still be winding
+            # down; wait for them off the loop, which their commands need
+            await asyncio.to_thread(pool.shutdown)
+
         phase_result.duration_ms = int((time.time() - phase_start) * 1000)
         return phase_result
 
+    async def _run_checks(
+        self,
+        pending: List[RegisteredCheck],
+        registered: Set[str],
+        complete: Callable[[CheckResult], None],
+        pool: ThreadPoolExecutor,
+    ) -> None:
+        """
+        Start checks as constraints allow and complete them as they finish.
+
+        Args:
+            pending: Checks to run, in registration order (consumed).
+            registered: All registered categories (for ignoring unknown deps).
+            complete: Records a check's result.
+            pool: Worker threads for sync checks.
+        """
+        running: Dict["asyncio.Task[CheckResult]", RegisteredCheck] = {}
+        while pending or running:
+            skipped, ready = self._schedule(pending, list(running.values()), registered)
+
+            for check, failed in skipped:
+                pending.remove(check)
+                complete(
+                    CheckResult(
+                        category=check.category,
+                        status=CheckStatus.SKIP,
+                        message=f"Skipped: dependency failed ({', '.join(failed)})",
+                    )
+                )
+
+            for check in ready:
+                pending.remove(check)
+                running[asyncio.ensure_future(self._execute_check(check, pool))] = check
+
+            if skipped and not running:
+                continue  # Skips may have settled other checks' dependencies
+
+            if not running:
+                # Remaining checks wait on dependencies that can never
+                # complete in this phase (later phase or a cycle)
+                for check in pending:
+                    complete(
+                        CheckResult(
+                            category=check.category,
+                            status=CheckStatus.SKIP,
+                            message="Skipped: dependencies not run",
+                        )
+                    )
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                del running[future]
+                complete(future.result())
+
+    def _schedule(
+        self,
+        pending: List[RegisteredCheck],
+        running: List[RegisteredCheck],
+        registered: Set[str],
+    ) -> Tuple[List[Tuple[RegisteredCheck, List[str]]], List[RegisteredCheck]]:
+        """
+        Decide which pending checks to skip and which to start now.
+
+        Args:
+            pending: Checks not yet started, in registration order.
+            running: Checks currently in flight.
+            registered: All registered categories (for ignoring unknown deps).
+
+        Returns:
+            Tuple of (checks to skip with their failed dependencies,
+            checks to start).
+        """
+        skipped: List[Tuple[RegisteredCheck, List[str]]] = []
+        ready: List[RegisteredCheck] = []
+        held: Set[str] = {r for c in running for r in c.resources}
+        exclusive = any(c.disruptive for c in running)
+        in_flight = len(running)
+
+        for check in pending:
+            deps = [d for d in check.depends_on if d in registered]
+            if any(d not in self._results for d in deps):
+                continue  # Waiting on a dependency
+
+            failed = [d for d in deps if not self._results[d].passed]
+            if failed:
+                skipped.append((check, failed))
+                continue
+
+            if exclusive or in_flight >= self.max_parallel:
+                break
+            if check.disruptive:
+                if in_flight:
+                    break  # Don't let later checks overtake it
+                exclusive = True
+            elif held & set(check.resources):
+                continue
+
+            ready.append(check)
+            held.update(check.resources)
+            in_flight += 1
+
+        return skipped, ready
+
+    def _budget(self, check: RegisteredCheck) -> Optional[float]:
+        """
+        Seconds a check may run from now: its budget, capped by what is left of the SLO.
+
+        Args:
+            check: Check about to start.
+
+        Returns:
+            Seconds (zero or less once the SLO is used up), or None for no limit.
+        """
+        own = self.check_budget_s if check.budget_s is None else _limit(check.budget_s)
+        if self._deadline is None:
+            return own
+        left = self._deadline - time.monotonic()
+        return left if own is None else min(own, left)
+
+    async def _call(self, check: RegisteredCheck, pool: ThreadPoolExecutor) -> CheckResult:
+        """Run a check function: awaited on the loop, or in a worker thread if sync."""
+        if isinstance(check.func, str):
+            # First run: import the check's module off the loop
+            check.func = cast(CheckFunc, await asyncio.to_thread(resolve, check.func))
+        func = check.func
+        if asyncio.iscoroutinefunction(func):
+            return await cast(AsyncCheckFunc, func)()
+        # The copied context carries the check's deadline into the worker thread
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, context.run, cast(SyncCheckFunc, func))
+
+    async def _execute_check(self, check: RegisteredCheck, pool: ThreadPoolExecutor) -> CheckResult:
+        """
+        Run a single check, converting exceptions to ERROR results.
+
+        In an incremental run, a check whose inputs are unchanged since it
+        last passed returns the cached result instead of running. A check
+        that overruns its time budget is reported as TIMEOUT.
+
+        Args:
+            check: Registered check to run.
+            pool: Worker threads for sync checks.
+
+        Returns:
+            CheckResult with duration set.
+        """
+        check_start = time.time()
+
+        key = None
+        if self.cache is not None and check.inputs:
+            key = fingerprint(check.inputs, self._fingerprints)
+            cached = self.cache.lookup(check.category, key) if key else None
+            if cached is not None:
+                return cached
+
+        allowed = self._budget(check)
+        if allowed is not None and allowed <= 0:
+            return CheckResult(
+                category=check.category,
+                status=CheckStatus.TIMEOUT,
+                message=f"Not run: {self.tier.name.lower()} SLO of {self.slo_s:g}s used up",
+            )
+
+        # Disruptive checks are never cut off: they restore what they changed
+        # before returning, and hold the mesh exclusively until they do
+        limit = asyncio.timeout(None if check.disruptive else allowed)
+        try:
+            async with limit:
+                with budget.deadline(None if check.disruptive else allowed):
+                    check_result = await self._call(check, pool)
+            check_result.category = check.category  # Ensure category is set
+            if check.disruptive:
+                check_result = _overran(check_result, allowed, time.time() - check_start)
+        except Exception as e:
+            if isinstance(e, TimeoutError) and limit.expired() and allowed is not None:
+                check_result = CheckResult(
+                    category=check.category,
+                    status=CheckStatus.TIMEOUT,
+                    message=f"Timed out after {round(allowed, 1):g}s",
+                    data={"budget_s": allowed},
+                )
+            else:
+                check_result = CheckResult(
+                    category=check.category,
+                    status=CheckStatus.ERROR,
+                    message=f"Check error: {e}",
+                )
+
+        check_result.duration_ms = int((time.time() - check_start) * 1000)
+        if key and self.cache is not None:
+            self.cache.store(check.category, key, check_result)
+        return check_result
+
     def get_phase_names(self) -> List[Tuple[int, str]]:
         """Get list of registered phases."""
         return [(num, self._phases[num][0]) for num in sorted(self._phases.keys())]
@@ -172,80 +521,72 @@ class ValidationRunner:
         return sum(len(checks) for _, checks in self._phases.values())
 
 
-def create_runner(tier: Tier) -> ValidationRunner:
+def _limit(seconds: float) -> Optional[float]:
+    """A time limit, with 0 (or less) and infinity meaning none."""
+    return seconds if 0 < seconds < math.inf else None
+
+
+def _overran(check_result: CheckResult, allowed: Optional[float], ran_s: float) -> CheckResult:
+    """The TIMEOUT result of a check that finished past its budget, or its own result."""
+    if allowed is None or ran_s <= allowed:
+        return check_result
+    return CheckResult(
+        category=check_result.category,
+        status=CheckStatus.TIMEOUT,
+        message=f"Overran its {round(allowed, 1):g}s budget (took {ran_s:.1f}s)",
+        nodes=check_result.nodes,
+        data={"budget_s": allowed},
+    )
+
+
+def _trip_unreachable(check_result: CheckResult) -> None:
+    """Open the circuit of every node a check found unreachable."""
+    for node, node_result in check_result.nodes.items():
+        if node_result.data.get("unreachable"):
+            breaker = node_circuit(node)
+            if breaker is not None:
+                breaker.trip()
+
+
+def create_runner(
+    tier: Tier,
+    cache: Optional[ResultCache] = None,
+    slo_s: Optional[float] = None,
+    check_budget_s: Optional[float] = None,
+) -> ValidationRunner:
     """
     Create a validation runner pre-configured with all checks for the tier.
 
     Args:
         tier: Validation tier to run.
+        cache: Result cache for an incremental run.
+        slo_s: Seconds the run may take (default: the tier's SLO; 0 for
+            unlimited).
+        check_budget_s: Default seconds per check (default: CHECK_BUDGET_S;
+            0 for unlimited).
 
     Returns:
         Configured ValidationRunner instance.
     """
-    # Import checks here to avoid circular imports
-    from validate.checks import batman, connectivity
-
-    runner = ValidationRunner(tier=tier)
+    runner = ValidationRunner(tier=tier, cache=cache, slo_s=slo_s, check_budget_s=check_budget_s)
 
-    # Phase 1: Prerequisites (must pass to continue)
-    runner.register_phase(1, "Prerequisites")
-    runner.register_check(1, "connectivity.ping", connectivity.check_ping, Tier.SMOKE)
-    runner.register_check(1, "connectivity.ssh", connectivity.check_ssh, Tier.SMOKE)
-    runner.register_check(1, "batman.module", batman.check_module, Tier.SMOKE)
+    # Phases shown at this tier, even if none of their checks run at it
+    for phase, (name, min_tier) in sorted(PHASES.items()):
+        if tier.value >= min_tier.value:
+            runner.register_phase(phase, name)
 
-    # Phase 2: Foundation
-    runner.register_phase(2, "Foundation")
-    runner.register_check(2, "batman.interfaces", batman.check_interfaces, Tier.STANDARD)
-    runner.register_check(2, "batman.neighbors", batman.check_neighbors, Tier.STANDARD)
-    runner.register_check(2, "batman.originators", batman.check_originators, Tier.STANDARD)
-    runner.register_check(2, "batman.gateways", batman.check_gateways, Tier.STANDARD)
-
-    # Phase 3: Network (Tier 2+)
-    runner.register_phase(3, "Network")
-
-    # Import more checks for higher tiers
-    if tier.value >= Tier.STANDARD.value:
-        from validate.checks import vlans
-
-        runner.register_check(3, "vlans.mesh", vlans.check_mesh_vlan, Tier.STANDARD)
-        runner.register_check(3, "vlans.client", vlans.check_client_vlan, Tier.STANDARD)
-
-    # Phase 4: Services (Tier 3+)
-    if tier.value >= Tier.COMPREHENSIVE.value:
-        from validate.checks import infrastructure, security, services, wan
-
-        runner.register_phase(4, "Services")
-        runner.register_check(
-            4, "vlans.management", vlans.check_management_vlan, Tier.COMPREHENSIVE
-        )
-        runner.register_check(4, "vlans.iot", vlans.check_iot_vlan, Tier.COMPREHENSIVE)
-        runner.register_check(4, "vlans.guest", vlans.check_guest_vlan, Tier.COMPREHENSIVE)
-        runner.register_check(4, "services.dhcp", services.check_dhcp, Tier.COMPREHENSIVE)
-        runner.register_check(4, "services.firewall", services.check_firewall, Tier.COMPREHENSIVE)
-        runner.register_check(4, "security.ssh", security.check_ssh_hardening, Tier.COMPREHENSIVE)
-        runner.register_check(4, "security.https", security.check_https, Tier.COMPREHENSIVE)
-        runner.register_check(4, "wan.connectivity", wan.check_connectivity, Tier.COMPREHENSIVE)
-        runner.register_check(4, "wan.dns", wan.check_dns, Tier.COMPREHENSIVE)
-        runner.register_check(
-            4, "infrastructure.switches", infrastructure.check_switches, Tier.COMPREHENSIVE
-        )
-
-    # Phase 5: Certification (Tier 4)
-    if tier.value >= Tier.CERTIFICATION.value:
-        from validate.checks import failover, performance, wireless
-
-        runner.register_phase(5, "Certification")
-        runner.register_check(5, "failover.link", failover.check_link_failover, Tier.CERTIFICATION)
-        runner.register_check(5, "failover.wan", failover.check_wan_failover, Tier.CERTIFICATION)
-        runner.register_check(5, "failover.node", failover.check_node_failover, Tier.CERTIFICATION)
-        runner.register_check(5, "wireless.mesh", wireless.check_mesh_wireless, Tier.CERTIFICATION)
-        runner.register_check(5, "wireless.roaming", wireless.check_roaming, Tier.CERTIFICATION)
-        runner.register_check(5, "wireless.bla", wireless.check_bla, Tier.CERTIFICATION)
-        runner.register_check(
-            5, "performance.latency", performance.check_latency, Tier.CERTIFICATION
-        )
+    # Check modules are imported as their checks run
+    for spec in check_specs(tier):
+        runner.register_phase(spec.phase, phase_name(spec.phase))
         runner.register_check(
-            5, "performance.stress", performance.check_stress_ping, Tier.CERTIFICATION
+            spec.phase,
+            spec.category,
+            spec.target,
+            spec.min_tier,
+            depends_on=spec.depends_on,
+            resources=spec.resources,
+            inputs=spec.inputs,
+            budget_s=spec.budget_s,
         )
 
     return runner
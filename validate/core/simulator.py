@@ -0,0 +1,1058 @@
+"""
+Simulated mesh backend for running the framework without hardware.
+
+SimulatedMesh models a configurable topology of N nodes (wired lan3/lan4
+VLAN-100 links plus 802.11s mesh0 links). SimulatedTransport answers the
+commands the checks issue with output synthesized in the same formats the
+real routers produce (batctl o/n/gwl/if and their JSON forms, ip link/addr,
+uci show, lsmod, ps, ping), so every check runs against it unchanged.
+
+Latency, packet loss, node and link failures and arbitrary command failures
+can be injected at any time; routing tables are recomputed from the live
+topology.
+
+Usage::
+
+    mesh = SimulatedMesh(size=100, topology="ring")
+    with simulate(mesh):
+        result = create_runner(Tier.STANDARD).run()
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from validate.config import NODES, SWITCHES, VLANS, NodeInfo
+from validate.core import executor, latency
+from validate.core.convergence import PROBE_MARKER
+from validate.core.snapshot import clear_snapshots
+from validate.core.transport import Transport
+
+TOPOLOGIES = ("ring", "line", "full")
+
+BATMAN_VERSION = "2023.1"
+
+# Interface index used in the last MAC octet
+_IFACE_INDEX = {"bat0": 0, "mesh0": 1, "lan3.100": 3, "lan4.100": 4, "br-lan": 5}
+
+Result = Tuple[int, str, str]
+
+# Files a provisioned node has
+_NODE_FILES = {"/etc/dropbear/authorized_keys", "/etc/uhttpd.crt", "/etc/uhttpd.key"}
+
+# Round-trip time added by one wired or wireless (mesh0) hop, in ms
+WIRED_HOP_MS = 0.3
+WIRELESS_HOP_MS = 1.5
+
+# iperf3 capacity of a wired hop and of the shared 802.11s medium (Mbit/s)
+WIRED_MBPS = 940.0
+WIRELESS_MBPS = 150.0
+
+
+@dataclass
+class SimLink:
+    """A link between two simulated nodes."""
+
+    a: str
+    b: str
+    iface_a: str
+    iface_b: str
+    up: bool = True
+
+    def end(self, node: str) -> Tuple[str, str, str]:
+        """Get (local iface, peer, peer iface) as seen from one end."""
+        if node == self.a:
+            return self.iface_a, self.b, self.iface_b
+        return self.iface_b, self.a, self.iface_a
+
+
+@dataclass
+class SimNode:
+    """State of one simulated node."""
+
+    name: str
+    num: int
+    ip: str
+    gw_mode: str
+    up: bool = True
+    wan_up: bool = True
+    latency_ms: float = 0.5
+    loss_pct: float = 0.0
+    loss_burst: bool = False  # Lose packets in one run instead of spread out
+    # Substring of a command -> forced result
+    command_failures: Dict[str, Result] = field(default_factory=dict)
+    # UCI option -> value set on top of the provisioned configuration
+    uci: Dict[str, str] = field(default_factory=dict)
+
+    def mac(self, iface: str) -> str:
+        """Get the MAC address of one of the node's interfaces."""
+        return f"02:ba:{self.num >> 8:02x}:{self.num & 0xFF:02x}:00:{_IFACE_INDEX[iface]:02x}"
+
+
+class SimulatedMesh:
+    """A simulated mesh: nodes, links and injected faults."""
+
+    def __init__(
+        self,
+        size: int = 3,
+        topology: str = "ring",
+        gateways: int = 3,
+        wireless_hops: int = 1,
+        latency_ms: float = 0.5,
+        jitter_ms: float = 0.1,
+        loss_pct: float = 0.0,
+        command_latency_ms: float = 0.0,
+        batctl_json: bool = True,
+        seed: int = 0,
+        reroute_ms: float = 300.0,
+        rejoin_ms: float = 1500.0,
+    ):
+        """
+        Build a mesh.
+
+        Args:
+            size: Number of nodes (node1..nodeN).
+            topology: "ring" (wired ring), "line" (wired chain) or "full"
+                (wired ring, every node in wireless range of every other).
+            gateways: Number of nodes, from node1 up, with gw_mode=server.
+            wireless_hops: For ring/line, mesh0 links reach nodes up to this
+                many positions away.
+            latency_ms: Base round-trip time from the validation host.
+            jitter_ms: Random variation added to each ping reply.
+            loss_pct: Default packet loss for pings to every node.
+            command_latency_ms: Delay before each remote command answers.
+            batctl_json: Answer ``batctl oj/nj/gwj``; False simulates a batctl
+                without JSON output.
+            seed: Seed for latency jitter and timing fields.
+            reroute_ms: Traffic loss after a mesh link goes down, before
+                batman-adv switches to an alternate path.
+            rejoin_ms: Time for a restored link's neighbor to be re-learned.
+
+        Raises:
+            ValueError: For an unknown topology or a size below 1.
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology: {topology} (expected one of {TOPOLOGIES})")
+        if size < 1:
+            raise ValueError("Simulated mesh needs at least one node")
+
+        self.topology = topology
+        self.jitter_ms = jitter_ms
+        self.command_latency_ms = command_latency_ms
+        self.batctl_json = batctl_json
+        self.reroute_ms = reroute_ms
+        self.rejoin_ms = rejoin_ms
+        self.rng = random.Random(seed)
+
+        self.nodes: Dict[str, SimNode] = {}
+        for num in range(1, size + 1):
+            name = f"node{num}"
+            self.nodes[name] = SimNode(
+                name=name,
+                num=num,
+                ip=f"10.11.{12 + (num - 1) // 254}.{(num - 1) % 254 + 1}",
+                gw_mode="server" if num <= gateways else "client",
+                latency_ms=latency_ms,
+                loss_pct=loss_pct,
+            )
+        self.by_ip = {node.ip: node for node in self.nodes.values()}
+        self.links = self._build_links(wireless_hops)
+        self._adjacency: Dict[str, List[SimLink]] = {name: [] for name in self.nodes}
+        for link in self.links:
+            self._adjacency[link.a].append(link)
+            self._adjacency[link.b].append(link)
+        self._routes: Dict[str, Dict[str, Tuple[str, str, int]]] = {}
+
+    def _build_links(self, wireless_hops: int) -> List[SimLink]:
+        """Create wired and wireless links for the topology."""
+        names = list(self.nodes)
+        n = len(names)
+        links: List[SimLink] = []
+
+        # Wired: lan4 of each node to lan3 of the next
+        wired_count = n if self.topology != "line" else n - 1
+        if n > 1:
+            for i in range(wired_count):
+                links.append(SimLink(names[i], names[(i + 1) % n], "lan4.100", "lan3.100"))
+
+        # Wireless: mesh0 to every node within range
+        for i in range(n):
+            for j in range(i + 1, n):
+                distance = j - i if self.topology == "line" else min(j - i, n - (j - i))
+                if self.topology == "full" or distance <= wireless_hops:
+                    links.append(SimLink(names[i], names[j], "mesh0", "mesh0"))
+        return links
+
+    def node_infos(self) -> Dict[str, NodeInfo]:
+        """Get NodeInfo entries for every simulated node."""
+        infos = {}
+        for name, node in self.nodes.items():
+            ports = {
+                iface.split(".")[0]: peer
+                for iface, peer, _ in (link.end(name) for link in self._adjacency[name])
+                if iface != "mesh0"
+            }
+            infos[name] = NodeInfo(
+                name=f"mesh-{name}",
+                ip=node.ip,
+                node_num=node.num,
+                gw_mode=node.gw_mode,
+                lan3_peer=ports.get("lan3", ""),
+                lan4_peer=ports.get("lan4", ""),
+                roles=("gateway",) if node.gw_mode == "server" else ("client",),
+                mesh_ports=ports,
+            )
+        return infos
+
+    # Fault injection
+
+    def _changed(self) -> None:
+        """Invalidate cached routes after a topology change."""
+        self._routes.clear()
+
+    def fail_node(self, name: str) -> None:
+        """Take a node off the network entirely."""
+        self.nodes[name].up = False
+        self._changed()
+
+    def restore_node(self, name: str) -> None:
+        """Bring a failed node back."""
+        self.nodes[name].up = True
+        self._changed()
+
+    def fail_link(self, a: str, b: str, iface: Optional[str] = None) -> None:
+        """
+        Take down the link(s) between two nodes.
+
+        Args:
+            a: One end.
+            b: Other end.
+            iface: Only links using this interface on node a (default: all).
+        """
+        for link in self._links_between(a, b, iface):
+            link.up = False
+        self._changed()
+
+    def restore_link(self, a: str, b: str, iface: Optional[str] = None) -> None:
+        """Bring link(s) between two nodes back up."""
+        for link in self._links_between(a, b, iface):
+            link.up = True
+        self._changed()
+
+    def _links_between(self, a: str, b: str, iface: Optional[str]) -> List[SimLink]:
+        """Find links joining two nodes."""
+        return [
+            link
+            for link in self._adjacency[a]
+            if link.end(a)[1] == b and (iface is None or link.end(a)[0] == iface)
+        ]
+
+    def set_latency(self, name: str, latency_ms: float) -> None:
+        """Set the round-trip time to a node."""
+        self.nodes[name].latency_ms = latency_ms
+
+    def set_loss(self, name: str, loss_pct: float, burst: bool = False) -> None:
+        """
+        Set the packet loss for pings to a node.
+
+        Args:
+            name: Node name.
+            loss_pct: Percentage of pings lost.
+            burst: Lose them all in one run mid-test (an outage) rather than
+                at random.
+        """
+        self.nodes[name].loss_pct = loss_pct
+        self.nodes[name].loss_burst = burst
+
+    def fail_wan(self, name: str) -> None:
+        """Cut a gateway's uplink."""
+        self.nodes[name].wan_up = False
+
+    def fail_command(
+        self, name: str, pattern: str, rc: int = 1, stdout: str = "", stderr: str = ""
+    ) -> None:
+        """
+        Force commands containing pattern to return a fixed result on a node.
+
+        Args:
+            name: Node name.
+            pattern: Substring matched against each command.
+            rc: Return code to report.
+            stdout: stdout to report.
+            stderr: stderr to report.
+        """
+        self.nodes[name].command_failures[pattern] = (rc, stdout, stderr)
+
+    def set_uci(self, name: str, key: str, value: str) -> None:
+        """
+        Change (or add) a UCI option on a node.
+
+        Args:
+            name: Node name.
+            key: Option, e.g. "network.lan.ipaddr".
+            value: New value (unquoted).
+        """
+        self.nodes[name].uci[key] = value
+
+    # Routing
+
+    def neighbors(self, name: str) -> List[Tuple[str, str, str]]:
+        """Get (local iface, peer, peer iface) for every working link of a node."""
+        result = []
+        for link in self._adjacency[name]:
+            if link.up:
+                iface, peer, peer_iface = link.end(name)
+                if self.nodes[peer].up:
+                    result.append((iface, peer, peer_iface))
+        return result
+
+    def interfaces(self, name: str) -> List[str]:
+        """Get the mesh interfaces a node has links on (working or not)."""
+        return sorted({link.end(name)[0] for link in self._adjacency[name]})
+
+    def routes(self, name: str) -> Dict[str, Tuple[str, str, int]]:
+        """
+        Get shortest-path routes from a node (cached until the topology changes).
+
+        Returns:
+            Destination -> (next-hop node, outgoing iface, hop count).
+            Wired links are preferred over wireless at equal hop count.
+        """
+        cached = self._routes.get(name)
+        if cached is not None:
+            return cached
+
+        routes: Dict[str, Tuple[str, str, int]] = {}
+        queue = deque([name])
+        seen = {name}
+        while queue:
+            current = queue.popleft()
+            hops = routes[current][2] if current != name else 0
+            for iface, peer, _ in sorted(self.neighbors(current), key=lambda e: e[0] == "mesh0"):
+                if peer in seen:
+                    continue
+                seen.add(peer)
+                first_hop = (peer, iface) if current == name else routes[current][:2]
+                routes[peer] = (first_hop[0], first_hop[1], hops + 1)
+                queue.append(peer)
+
+        self._routes[name] = routes
+        return routes
+
+    def reachable_gateway(self, name: str) -> bool:
+        """Check if a node can reach a gateway with a working uplink."""
+        node = self.nodes[name]
+        if node.gw_mode == "server" and node.wan_up:
+            return True
+        return any(
+            self.nodes[dest].gw_mode == "server" and self.nodes[dest].wan_up
+            for dest in self.routes(name)
+        )
+
+
+def _batman_header(node: SimNode) -> str:
+    """First line of batctl table output."""
+    return (
+        f"[B.A.T.M.A.N. adv {BATMAN_VERSION}, MainIF/MAC: mesh0/{node.mac('mesh0')} "
+        f"(bat0/{node.mac('bat0')} BATMAN_IV)]"
+    )
+
+
+def _seen(row: Dict[str, object]) -> str:
+    """Format a row's last-seen time the way batctl text tables do."""
+    msecs = int(str(row["last_seen_msecs"]))
+    return f"{msecs // 1000:4d}.{msecs % 1000:03d}s"
+
+
+def _mbit(value: object) -> str:
+    """Format a bandwidth in units of 100 kbit/s as batctl does."""
+    tenths = int(str(value))
+    return f"{tenths // 10}.{tenths % 10}"
+
+
+def _tq(hops: int) -> int:
+    """Transmit quality as batman-adv IV reports it, decaying per hop."""
+    return max(1, int(255 * 0.92 ** (hops - 1)))
+
+
+def _ping_output(target: str, count: int, replies: Dict[int, float]) -> str:
+    """Format iputils ping output for replies by 0-based sequence number."""
+    rtts = list(replies.values())
+    received = len(rtts)
+    lines = [f"PING {target} ({target}) 56(84) bytes of data."]
+    lines += [
+        f"64 bytes from {target}: icmp_seq={seq + 1} ttl=64 time={rtt:.3f} ms"
+        for seq, rtt in replies.items()
+    ]
+    loss = 100 * (count - received) / count if count else 0
+    lines += [
+        "",
+        f"--- {target} ping statistics ---",
+        f"{count} packets transmitted, {received} received, {loss:g}% packet loss, "
+        f"time {max(0, count - 1) * 1000}ms",
+    ]
+    if rtts:
+        mean = sum(rtts) / len(rtts)
+        mdev = (sum((r - mean) ** 2 for r in rtts) / len(rtts)) ** 0.5
+        lines.append(
+            f"rtt min/avg/max/mdev = {min(rtts):.3f}/{mean:.3f}/{max(rtts):.3f}/{mdev:.3f} ms"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class SimulatedTransport(Transport):
+    """Answers commands from a SimulatedMesh instead of real nodes."""
+
+    live = False
+
+    def __init__(self, mesh: SimulatedMesh):
+        """
+        Serve a mesh.
+
+        Args:
+            mesh: Mesh whose state the answers are synthesized from.
+        """
+        self.mesh = mesh
+        self._handlers: List[Tuple[Pattern[str], Callable[[SimNode, "re.Match[str]"], Result]]]
+        self._handlers = [
+            (re.compile(r"^(.+?) \| md5sum$"), self._md5sum_pipe),
+            (re.compile(r"^batctl (?:meshif bat0 )?(o|originators)$"), self._batctl_o),
+            (re.compile(r"^batctl (?:meshif bat0 )?(n|neighbors)$"), self._batctl_n),
+            (re.compile(r"^batctl (?:meshif bat0 )?(gwl|gateways)$"), self._batctl_gwl),
+            (re.compile(r"^batctl (?:meshif bat0 )?(oj|nj|gwj)$"), self._batctl_json),
+            (re.compile(r"^batctl (?:meshif bat0 )?(if|interface)$"), self._batctl_if),
+            (re.compile(r"^batctl (?:meshif bat0 )?bla$"), lambda n, m: (0, "enabled\n", "")),
+            (re.compile(r"^ip link(?: show)?(?: (\S+))?$"), self._ip_link),
+            (re.compile(r"^ip addr(?: show)?$"), self._ip_addr),
+            (re.compile(r"^uci show$"), lambda n, m: (0, self._uci(n), "")),
+            (re.compile(r"^uci get (\S+)$"), self._uci_get),
+            (re.compile(r"^uci export (\S+)$"), self._uci_export),
+            (re.compile(r"^lsmod$"), self._lsmod),
+            (re.compile(r"^cat /sys/module/batman_adv/version$"), self._batman_version),
+            (re.compile(r"^cat /sys/class/net/bat0/mesh/bridge_loop_avoidance$"), self._one),
+            (re.compile(r"^ps(?: w)?$"), self._ps),
+            (re.compile(r"^ping (.*?)(\S+)$"), self._remote_ping),
+            (re.compile(r"^nslookup (\S+)(?: \| grep -i address)?$"), self._nslookup),
+            (re.compile(r"^iw dev mesh0 info$"), self._iw_mesh0),
+            (re.compile(r"^test -[fe] (\S+)$"), self._test_file),
+            (re.compile(r"^md5sum (.+)$"), self._md5sum_files),
+            (re.compile(r"^echo (.*)$"), lambda n, m: (0, m.group(1).strip("'\"") + "\n", "")),
+            (re.compile(r"^pgrep .*|^/etc/init\.d/\S+ status$"), lambda n, m: (0, "1\n", "")),
+            (re.compile(r"^openssl x509 .*notAfter$"), self._cert_dates),
+            (re.compile(rf"^{PROBE_MARKER} (.*)", re.S), self._convergence_probe),
+            (re.compile(rf"^{latency.PROBE_MARKER} (.*)", re.S), self._latency_probe),
+            (re.compile(r"^iperf3 -s\b"), lambda n, m: (0, "", "")),
+            (re.compile(r"^iperf3 -c (\S+)(.*)$"), self._remote_iperf),
+        ]
+
+    # Transport interface
+
+    async def ssh(self, node_ip: str, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Answer a remote command as the simulated node would."""
+        node = self.mesh.by_ip.get(node_ip)
+        if node is None or not node.up:
+            return 255, "", f"ssh: connect to host {node_ip} port 22: Connection timed out"
+        if self.mesh.command_latency_ms:
+            await asyncio.sleep(self.mesh.command_latency_ms / 1000)
+
+        batch = executor._split_batch_script(command)
+        if batch is None:
+            return self._run(node, command)
+        token, commands = batch
+        return 0, executor._format_batch_output([self._run(node, c) for c in commands], token), ""
+
+    async def local(self, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Answer a command run on the validation host (ping and iperf3 are simulated)."""
+        iperf = re.match(r"^iperf3 -c (\S+)(.*)$", command.strip())
+        if iperf:
+            node = self.mesh.by_ip.get(iperf.group(1))
+            capacity = WIRED_MBPS if node is not None and node.up else None
+            return self._iperf(iperf.group(2), capacity)
+        match = re.match(r"^ping (.*?)(\S+)$", command.strip())
+        if not match:
+            return 127, "", f"sh: {command.split()[0]}: not simulated\n"
+        return self._ping(match.group(1), match.group(2), self._local_target(match.group(2)))
+
+    # Command dispatch
+
+    def _run(self, node: SimNode, command: str) -> Result:
+        """Run a (possibly ||-chained) shell command on a node."""
+        for pattern, forced in node.command_failures.items():
+            if pattern in command:
+                return forced
+
+        result: Result = (127, "", "")
+        for part in command.split(" || "):
+            part = re.sub(r"\s*2>(?:/dev/null|&1)", "", part).strip()
+            result = self._dispatch(node, part)
+            if result[0] == 0:
+                break
+        return result
+
+    def _dispatch(self, node: SimNode, command: str) -> Result:
+        """Answer a single command."""
+        for pattern, handler in self._handlers:
+            match = pattern.match(command)
+            if match:
+                return handler(node, match)
+        return 127, "", f"sh: {command.split()[0] if command else ''}: not found\n"
+
+    # batctl
+
+    def _originator_rows(self, node: SimNode) -> List[Dict[str, object]]:
+        """Originator routes as batctl oj rows: best route, plus alternates via neighbors."""
+        neighbors = self.mesh.neighbors(node.name)
+        direct: Dict[str, List[Tuple[str, str, str]]] = {}
+        for iface, peer, peer_iface in neighbors:
+            direct.setdefault(peer, []).append((iface, peer, peer_iface))
+        peer_ifaces = {(peer, iface): peer_iface for iface, peer, peer_iface in neighbors}
+
+        rows: List[Dict[str, object]] = []
+        for dest, (hop, iface, hops) in self.mesh.routes(node.name).items():
+            dest_mac = self.mesh.nodes[dest].mac("mesh0")
+            seen = int(self.mesh.rng.uniform(100, 900))
+            rows.append(
+                {
+                    "orig_address": dest_mac,
+                    "neigh_address": self.mesh.nodes[hop].mac(peer_ifaces[(hop, iface)]),
+                    "hard_ifname": iface,
+                    "last_seen_msecs": seen,
+                    "tq": _tq(hops),
+                    "best": True,
+                }
+            )
+            for alt_iface, peer, peer_iface in direct.get(dest, []):
+                if alt_iface != iface:
+                    rows.append(
+                        {
+                            "orig_address": dest_mac,
+                            "neigh_address": self.mesh.nodes[peer].mac(peer_iface),
+                            "hard_ifname": alt_iface,
+                            "last_seen_msecs": seen,
+                            "tq": _tq(2),
+                        }
+                    )
+        return rows
+
+    def _neighbor_rows(self, node: SimNode) -> List[Dict[str, object]]:
+        """Working links as batctl nj rows."""
+        return [
+            {
+                "hard_ifname": iface,
+                "neigh_address": self.mesh.nodes[peer].mac(peer_iface),
+                "last_seen_msecs": int(self.mesh.rng.uniform(100, 900)),
+            }
+            for iface, peer, peer_iface in self.mesh.neighbors(node.name)
+        ]
+
+    def _gateway_rows(self, node: SimNode) -> List[Dict[str, object]]:
+        """Reachable gateway servers as batctl gwj rows, best first."""
+        routes = self.mesh.routes(node.name)
+        peer_ifaces = {(p, i): pi for i, p, pi in self.mesh.neighbors(node.name)}
+        gateways = sorted(
+            (hops, dest, hop, iface)
+            for dest, (hop, iface, hops) in routes.items()
+            if self.mesh.nodes[dest].gw_mode == "server"
+        )
+        rows: List[Dict[str, object]] = []
+        for i, (hops, dest, hop, iface) in enumerate(gateways):
+            row: Dict[str, object] = {
+                "orig_address": self.mesh.nodes[dest].mac("mesh0"),
+                "router": self.mesh.nodes[hop].mac(peer_ifaces[(hop, iface)]),
+                "hard_ifname": iface,
+                "bandwidth_down": 1000,
+                "bandwidth_up": 200,
+                "tq": _tq(hops),
+            }
+            if i == 0:
+                row["best"] = True
+            rows.append(row)
+        return rows
+
+    def _batctl_json(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """batctl oj/nj/gwj: the same tables as JSON."""
+        if not self.mesh.batctl_json:
+            return 1, "", f"batctl: unknown command '{match.group(1)}'\n"
+        rows = {
+            "oj": self._originator_rows,
+            "nj": self._neighbor_rows,
+            "gwj": self._gateway_rows,
+        }[
+            match.group(1)
+        ](node)
+        return 0, json.dumps(rows) + "\n", ""
+
+    def _batctl_o(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """batctl originators, text form."""
+        lines = [
+            _batman_header(node),
+            "   Originator        last-seen (#/255) Nexthop           [outgoingIF]",
+        ]
+        for row in self._originator_rows(node):
+            lines.append(
+                f"{' *' if row.get('best') else '  '} {row['orig_address']} "
+                f"{_seen(row)}   ({row['tq']:3d}) {row['neigh_address']} "
+                f"[{row['hard_ifname']:>10}]"
+            )
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _batctl_n(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """batctl neighbors, text form."""
+        lines = [_batman_header(node), "IF             Neighbor              last-seen"]
+        for row in self._neighbor_rows(node):
+            lines.append(f"{row['hard_ifname']:>15}\t  {row['neigh_address']} {_seen(row)}")
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _batctl_gwl(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """batctl gateways, text form."""
+        lines = [
+            _batman_header(node),
+            "  Router            ( TQ) Next Hop          [outgoingIf]  Bandwidth",
+        ]
+        for row in self._gateway_rows(node):
+            lines.append(
+                f"{'*' if row.get('best') else ' '} {row['orig_address']} ({row['tq']:3d}) "
+                f"{row['router']} [{row['hard_ifname']:>10}]: "
+                f"{_mbit(row['bandwidth_down'])}/{_mbit(row['bandwidth_up'])} MBit"
+            )
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _batctl_if(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """batctl if: hard interfaces attached to bat0."""
+        ifaces = self.mesh.interfaces(node.name)
+        return 0, "".join(f"{iface}: active\n" for iface in ifaces), ""
+
+    # ip
+
+    def _link_up(self, node: SimNode, iface: str) -> bool:
+        """Check if any working link uses an interface."""
+        return any(i == iface for i, _, _ in self.mesh.neighbors(node.name))
+
+    def _ip_link(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """ip link show [DEVICE]."""
+        up = "<BROADCAST,MULTICAST,UP,LOWER_UP>"
+        down = "<NO-CARRIER,BROADCAST,MULTICAST,UP>"
+        entries = [
+            ("lo", "<LOOPBACK,UP,LOWER_UP>", "UNKNOWN", "loopback 00:00:00:00:00:00"),
+            ("lan3", up, "UP", f"ether {node.mac('lan3.100')}"),
+            ("lan4", up, "UP", f"ether {node.mac('lan4.100')}"),
+        ]
+        for iface in ("lan3.100", "lan4.100", "mesh0"):
+            ok = self._link_up(node, iface)
+            name = f"{iface}@{iface.split('.')[0]}" if "." in iface else iface
+            entries.append(
+                (
+                    name,
+                    up if ok else down,
+                    "UP" if ok else "LOWERLAYERDOWN",
+                    f"ether {node.mac(iface)}",
+                )
+            )
+        entries += [
+            ("bat0", "<BROADCAST,MULTICAST,UP,LOWER_UP>", "UNKNOWN", f"ether {node.mac('bat0')}"),
+            ("br-lan", up, "UP", f"ether {node.mac('br-lan')}"),
+        ]
+
+        lines = []
+        for index, (name, flags, state, link) in enumerate(entries, 1):
+            if match.group(1) and name.split("@")[0] != match.group(1):
+                continue
+            lines.append(
+                f"{index}: {name}: {flags} mtu 1500 qdisc noqueue state {state} "
+                f"mode DEFAULT group default qlen 1000"
+            )
+            brd = "00:00:00:00:00:00" if link.startswith("loopback") else "ff:ff:ff:ff:ff:ff"
+            lines.append(f"    link/{link} brd {brd}")
+        if not lines:
+            return 1, "", f'Device "{match.group(1)}" does not exist.\n'
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _ip_addr(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """ip addr show (addresses only)."""
+        lines = [
+            "1: lo: <LOOPBACK,UP,LOWER_UP> mtu 65536 qdisc noqueue state UNKNOWN qlen 1000",
+            "    inet 127.0.0.1/8 scope host lo",
+            "2: br-lan: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc noqueue state UP "
+            "qlen 1000",
+            f"    inet {node.ip}/24 brd {node.ip.rsplit('.', 1)[0]}.255 scope global br-lan",
+        ]
+        for index, vlan in enumerate(("iot", "guest", "management"), 3):
+            network = str(VLANS.get(vlan, {}).get("network", ""))
+            if not network:
+                continue
+            base = network.split("/")[0].rsplit(".", 1)[0]
+            lines += [
+                f"{index}: br-{vlan}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc noqueue "
+                f"state UP qlen 1000",
+                f"    inet {base}.{node.num}/24 brd {base}.255 scope global br-{vlan}",
+            ]
+        return 0, "\n".join(lines) + "\n", ""
+
+    # uci
+
+    def _uci(self, node: SimNode) -> str:
+        """uci show for the packages the checks read."""
+        lines = [
+            "network.loopback=interface",
+            "network.loopback.device='lo'",
+            "network.lan=interface",
+            "network.lan.device='br-lan'",
+            "network.lan.proto='static'",
+            f"network.lan.ipaddr='{node.ip}'",
+            "network.bat0=interface",
+            "network.bat0.proto='batadv'",
+            f"network.bat0.gw_mode='{node.gw_mode}'",
+        ]
+        for port in ("lan3", "lan4"):
+            lines += [
+                f"network.{port}_100=device",
+                f"network.{port}_100.type='8021q'",
+                f"network.{port}_100.ifname='{port}'",
+                f"network.{port}_100.vid='100'",
+                f"network.{port}_100.name='{port}.100'",
+            ]
+        for zone in ("iot", "guest", "management"):
+            lines += [f"network.{zone}=interface", f"network.{zone}.device='br-{zone}'"]
+        for vlan in VLANS.values():
+            vid = vlan.get("id")
+            lines += [f"network.vlan_{vid}=bridge-vlan", f"network.vlan_{vid}.vlan='{vid}'"]
+        for index, zone in enumerate(("lan", "wan", "iot", "guest", "management")):
+            lines += [f"firewall.@zone[{index}]=zone", f"firewall.@zone[{index}].name='{zone}'"]
+        lines += [
+            "wireless.mesh0=wifi-iface",
+            "wireless.mesh0.mode='mesh'",
+            "wireless.mesh0.mesh_id='mesh'",
+            "wireless.client5=wifi-iface",
+            "wireless.client5.mode='ap'",
+            "wireless.client5.ieee80211r='1'",
+            "wireless.client5.ft_over_ds='0'",
+            "wireless.client5.ft_psk_generate_local='1'",
+            "dhcp.lan=dhcp",
+            "dhcp.lan.interface='lan'",
+            "dhcp.lan.start='100'",
+            "dhcp.lan.limit='150'",
+            "dropbear.@dropbear[0]=dropbear",
+            "dropbear.@dropbear[0].PasswordAuth='off'",
+            "dropbear.@dropbear[0].RootPasswordAuth='off'",
+            "uhttpd.main=uhttpd",
+            "uhttpd.main.listen_https='0.0.0.0:443'",
+            "uhttpd.main.cert='/etc/uhttpd.crt'",
+            "uhttpd.main.key='/etc/uhttpd.key'",
+        ]
+        options = dict(line.split("=", 1) for line in lines)
+        options.update((key, f"'{value}'") for key, value in node.uci.items())
+        return "".join(f"{key}={value}\n" for key, value in options.items())
+
+    def _uci_export(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """uci export <package> (as uci show lines; only its hash is compared)."""
+        prefix = f"{match.group(1)}."
+        lines = [line for line in self._uci(node).splitlines() if line.startswith(prefix)]
+        if not lines:
+            return 1, "", "uci: Entry not found\n"
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _uci_get(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """uci get <key>."""
+        prefix = f"{match.group(1)}="
+        for line in self._uci(node).splitlines():
+            if line.startswith(prefix):
+                return 0, line[len(prefix) :].strip("'") + "\n", ""
+        return 1, "", "uci: Entry not found\n"
+
+    # System state
+
+    def _lsmod(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """lsmod with batman-adv loaded."""
+        return (
+            0,
+            "Module                  Size  Used by\n"
+            "batman_adv            245760  0\n"
+            "cfg80211              282624  2 mac80211,mt76\n",
+            "",
+        )
+
+    def _batman_version(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """batman-adv module version."""
+        return 0, f"{BATMAN_VERSION}\n", ""
+
+    def _one(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """A sysfs flag that is set."""
+        return 0, "1\n", ""
+
+    def _ps(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """ps w with the daemons an OpenWrt node runs."""
+        return (
+            0,
+            "  PID USER       VSZ STAT COMMAND\n"
+            "    1 root      1664 S    /sbin/procd\n"
+            " 1187 root      1108 S    /usr/sbin/dropbear -F -P /var/run/dropbear.1.pid -p 22\n"
+            " 1532 dnsmasq   1460 S    /usr/sbin/dnsmasq -C /var/etc/dnsmasq.conf.cfg01411c -k\n"
+            " 1610 root      1884 S    /usr/sbin/uhttpd -f -h /www -r mesh -p 0.0.0.0:80\n"
+            " 1702 root      2400 S    /usr/sbin/hostapd -s -g /var/run/hostapd/global\n",
+            "",
+        )
+
+    def _iw_mesh0(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """iw dev mesh0 info."""
+        return (
+            0,
+            "Interface mesh0\n"
+            "\tifindex 12\n"
+            f"\taddr {node.mac('mesh0')}\n"
+            "\ttype mesh point\n"
+            "\twiphy 1\n"
+            "\tchannel 36 (5180 MHz), width: 80 MHz, center1: 5210 MHz\n"
+            "\ttxpower 20.00 dBm\n",
+            "",
+        )
+
+    def _test_file(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """test -f for the files a provisioned node has."""
+        return (0 if match.group(1) in _NODE_FILES else 1), "", ""
+
+    def _md5sum_files(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """md5sum of the files a provisioned node has (content fixed per node and path)."""
+        lines, rc = [], 0
+        for path in match.group(1).split():
+            if path not in _NODE_FILES:
+                rc = 1
+                continue
+            lines.append(f"{hashlib.md5(f'{node.name}:{path}'.encode()).hexdigest()}  {path}")
+        return rc, "".join(f"{line}\n" for line in lines), ""
+
+    def _md5sum_pipe(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """<command> | md5sum."""
+        _, stdout, _ = self._dispatch(node, match.group(1))
+        return 0, f"{hashlib.md5(stdout.encode()).hexdigest()}  -\n", ""
+
+    def _cert_dates(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """openssl x509 -dates, filtered to notAfter."""
+        return 0, "notAfter=Dec 31 23:59:59 2035 GMT\n", ""
+
+    # Network
+
+    def _nslookup(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """DNS lookup through the mesh gateway."""
+        if not self.mesh.reachable_gateway(node.name):
+            return 1, "", ";; connection timed out; no servers could be reached\n"
+        return 0, "Address: 127.0.0.1#53\nAddress: 142.250.74.46\n", ""
+
+    def _remote_ping(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """ping from a node: mesh peers by route, internet via any gateway."""
+        target = match.group(2)
+        peer = self.mesh.by_ip.get(target)
+        if peer is not None:
+            routes = self.mesh.routes(node.name)
+            if peer.name == node.name:
+                rtt = 0.05
+            elif peer.name in routes:
+                rtt = 0.6 * routes[peer.name][2]
+            else:
+                rtt = None
+        else:
+            rtt = 12.0 if self.mesh.reachable_gateway(node.name) else None
+        return self._ping(match.group(1), target, rtt)
+
+    def _convergence_probe(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """Run the link-failover convergence script against the simulated links."""
+        params = dict(re.findall(r"(\w+)=(\S+)", match.group(1).splitlines()[0]))
+        count_match = re.search(r"-c (\d+)", match.group(1))
+        count = int(count_match.group(1)) if count_match else 0
+        interval = 1 / int(params["pps"])
+        lead, hold = float(params["lead"]), float(params["hold"])
+        peer = self.mesh.by_ip.get(params["target"])
+
+        links = [
+            link
+            for link in self.mesh._adjacency[node.name]
+            if link.up and link.end(node.name)[0] == params["iface"]
+        ]
+        reachable_before = peer is not None and peer.name in self.mesh.routes(node.name)
+        for link in links:
+            link.up = False
+        self.mesh._changed()
+        reachable_during = peer is not None and peer.name in self.mesh.routes(node.name)
+        for link in links:
+            link.up = True
+        self.mesh._changed()
+
+        reroute_at = lead + self.mesh.reroute_ms / 1000
+        lines = [f"EVENT start {1000:.2f}", f"EVENT down {1000 + lead:.2f}"]
+        lines.append(f"EVENT up {1000 + lead + hold:.2f}")
+        if links:
+            lines.append(f"EVENT rejoined {1000 + lead + hold + self.mesh.rejoin_ms / 1000:.2f}")
+        lines.append(f"PING {params['target']} ({params['target']}): 56 data bytes")
+        for seq in range(count):
+            sent_at = seq * interval
+            if lead <= sent_at < lead + hold:
+                ok = reachable_during and sent_at >= reroute_at
+            else:
+                ok = reachable_before
+            if ok:
+                lines.append(f"64 bytes from {params['target']}: seq={seq} ttl=64 time=0.612 ms")
+        return 0, "\n".join(lines) + "\n", ""
+
+    def _remote_iperf(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """iperf3 client on a node: capacity of the routed path to the server."""
+        peer = self.mesh.by_ip.get(match.group(1))
+        capacity = None
+        if peer is not None and peer.up:
+            ifaces = self._path_ifaces(node.name, peer.name)
+            if ifaces is not None:
+                wireless = sum(1 for iface in ifaces if iface == "mesh0")
+                # Wireless hops share one channel; wired hops run at line rate
+                capacity = WIRELESS_MBPS / wireless if wireless else WIRED_MBPS
+        return self._iperf(match.group(2), capacity, half_duplex=capacity != WIRED_MBPS)
+
+    def _latency_probe(self, node: SimNode, match: "re.Match[str]") -> Result:
+        """Run the latency matrix script: every target answered in busybox format."""
+        count_match = re.search(r"count=(\d+)", match.group(1))
+        count = int(count_match.group(1)) if count_match else 0
+        sections = []
+        for line in match.group(1).splitlines():
+            probe = re.match(r'^ping (.*) (\S+) >"\$D/([^"]+)" &$', line)
+            if not probe:
+                continue
+            label = probe.group(3)
+            peer, _, iface = label.partition("@")
+            if iface:
+                up = any(p == peer for i, p, _ in self.mesh.neighbors(node.name) if i == iface)
+                ifaces: Optional[List[str]] = [iface] if up else None
+            else:
+                ifaces = self._path_ifaces(node.name, peer) if self.mesh.nodes[peer].up else None
+            sections.append(f"@@@ {label}\n" + self._busybox_ping(probe.group(2), count, ifaces))
+        return 0, "".join(sections), ""
+
+    def _busybox_ping(self, target: str, count: int, ifaces: Optional[List[str]]) -> str:
+        """busybox ping output over a path of hard interfaces (None: unreachable)."""
+        lines = [f"PING {target} ({target}): 56 data bytes"]
+        received = 0
+        if ifaces is not None:
+            base = sum(WIRELESS_HOP_MS if i == "mesh0" else WIRED_HOP_MS for i in ifaces)
+            for seq in range(count):
+                rtt = base + self.mesh.rng.uniform(0, self.mesh.jitter_ms)
+                lines.append(f"64 bytes from {target}: seq={seq} ttl=64 time={rtt:.3f} ms")
+            received = count
+        loss = 100 * (count - received) // count if count else 0
+        lines += [
+            "",
+            f"--- {target} ping statistics ---",
+            f"{count} packets transmitted, {received} packets received, {loss}% packet loss",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _path_ifaces(self, source: str, dest: str) -> Optional[List[str]]:
+        """Outgoing interfaces hop by hop along the route, or None if unreachable."""
+        ifaces = []
+        current = source
+        while current != dest:
+            route = self.mesh.routes(current).get(dest)
+            if route is None:
+                return None
+            ifaces.append(route[1])
+            current = route[0]
+        return ifaces
+
+    def _iperf(self, options: str, capacity: Optional[float], half_duplex: bool = False) -> Result:
+        """Synthesize iperf3 -J output for a path of the given capacity."""
+        if capacity is None:
+            error = {"start": {}, "error": "unable to connect to server: No route to host"}
+            return 1, json.dumps(error), ""
+
+        length = re.search(r"-t (\d+)", options)
+        duration = int(length.group(1)) if length else 10
+        bidir = "--bidir" in options
+        udp = re.search(r"-u -b (\d+)M", options)
+        rate = capacity / 2 if bidir and half_duplex else capacity
+        lost = 0.0
+        if udp:
+            offered = float(udp.group(1))
+            lost = max(0.0, (offered - rate) / offered * 100)
+            rate = min(rate, offered)
+
+        samples = [rate * self.mesh.rng.uniform(0.97, 1.0) for _ in range(duration)]
+        mean_bps = sum(samples) / len(samples) * 1e6
+        data: Dict[str, object] = {
+            "start": {},
+            "intervals": [
+                {"sum": {"start": i, "end": i + 1, "bits_per_second": mbps * 1e6}}
+                for i, mbps in enumerate(samples)
+            ],
+        }
+        if udp:
+            data["end"] = {
+                "sum": {"bits_per_second": mean_bps, "jitter_ms": 0.05, "lost_percent": lost}
+            }
+        else:
+            end: Dict[str, object] = {
+                "sum_sent": {"bits_per_second": mean_bps, "retransmits": 0},
+                "sum_received": {"bits_per_second": mean_bps},
+            }
+            if bidir:
+                end["sum_received_bidir_reverse"] = {"bits_per_second": mean_bps}
+            data["end"] = end
+        return 0, json.dumps(data), ""
+
+    def _local_target(self, target: str) -> Optional[float]:
+        """Round-trip time from the validation host, or None if unreachable."""
+        node = self.mesh.by_ip.get(target)
+        if node is not None:
+            return node.latency_ms if node.up else None
+        if any(info.get("ip") == target for info in SWITCHES.values()):
+            return 0.3
+        return None
+
+    def _ping(self, options: str, target: str, rtt: Optional[float]) -> Result:
+        """Synthesize ping output for a target with a given base RTT."""
+        count_match = re.search(r"-c\s*(\d+)", options)
+        count = int(count_match.group(1)) if count_match else 3
+
+        node = self.mesh.by_ip.get(target)
+        lost = count if rtt is None else int(round(count * (node.loss_pct if node else 0) / 100))
+        if node is not None and node.loss_burst:
+            start = (count - lost) // 2
+            dropped = set(range(start, start + lost))
+        else:
+            dropped = set(self.mesh.rng.sample(range(count), lost))
+        replies = {
+            seq: max(0.01, (rtt or 0) + self.mesh.rng.uniform(-1, 1) * self.mesh.jitter_ms)
+            for seq in range(count)
+            if seq not in dropped
+        }
+        return (0 if replies else 1), _ping_output(target, count, replies), ""
+
+
+@contextmanager
+def simulate(mesh: SimulatedMesh) -> Iterator[SimulatedTransport]:
+    """
+    Point the framework at a simulated mesh for the duration of a block.
+
+    Replaces the contents of NODES in place (every module sees the simulated
+    nodes) and installs a SimulatedTransport; both are restored on exit.
+    Cached node snapshots are dropped on the way in and out.
+
+    Args:
+        mesh: Mesh to simulate.
+
+    Yields:
+        The installed SimulatedTransport.
+    """
+    saved_nodes = dict(NODES)
+    transport = SimulatedTransport(mesh)
+    previous = executor.set_transport(transport)
+    NODES.clear()
+    NODES.update(mesh.node_infos())
+    clear_snapshots()
+    try:
+        yield transport
+    finally:
+        executor.set_transport(previous)
+        NODES.clear()
+        NODES.update(saved_nodes)
+        clear_snapshots()
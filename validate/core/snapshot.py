@@ -0,0 +1,275 @@
+"""
+Per-node state snapshots shared by all checks.
+
+Many checks read the same node state (batctl tables, interface list, UCI
+configuration). A NodeSnapshot gathers all of it in a single batched remote
+call per node; checks then read from the cached snapshot instead of issuing
+their own commands.
+
+The runner clears the cache at the start of every phase, so each phase sees
+state no older than the phase itself. A cached snapshot is shared by every
+check in the phase, so it is collected outside the time budget of the check
+that happens to ask first (see validate.core.budget); the batched call is
+bounded by its own timeout instead. Checks that disrupt the mesh and need
+fresh data afterwards call refresh_snapshot().
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+from validate.core import budget
+from validate.core.executor import NodeExecutor
+from validate.parsers.batctl import (
+    GatewayTable,
+    HardIfTable,
+    NeighborTable,
+    OriginatorTable,
+    parse_gateways,
+    parse_hardifs,
+    parse_neighbors,
+    parse_originators,
+)
+
+# Commands gathered into every snapshot, keyed by snapshot field name
+SNAPSHOT_COMMANDS: Dict[str, str] = {
+    # JSON tables where batctl supports them, text otherwise (see validate.parsers.batctl)
+    "originators": "batctl oj 2>/dev/null || batctl o 2>/dev/null",
+    "neighbors": "batctl nj 2>/dev/null || batctl n 2>/dev/null",
+    "gateways": "batctl gwj 2>/dev/null || batctl gwl 2>/dev/null",
+    "hardifs": "batctl if 2>/dev/null",
+    "links": "ip link show",
+    "addresses": "ip addr show",
+    "uci": "uci show 2>/dev/null",
+    "modules": "lsmod",
+    "batman_version": "cat /sys/module/batman_adv/version 2>/dev/null",
+    "processes": "ps w",
+}
+
+_snapshots: Dict[str, "NodeSnapshot"] = {}
+_node_locks: Dict[str, threading.Lock] = {}
+_cache_lock = threading.Lock()
+
+
+@dataclass
+class NodeSnapshot:
+    """Point-in-time state of a single node."""
+
+    node: str
+    outputs: Dict[str, Tuple[int, str, str]] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def age_s(self) -> float:
+        """Seconds since the snapshot was collected."""
+        return time.time() - self.timestamp
+
+    def get(self, key: str) -> Tuple[int, str, str]:
+        """
+        Get the raw result of a snapshot command.
+
+        Args:
+            key: Snapshot field name (see SNAPSHOT_COMMANDS).
+
+        Returns:
+            Tuple of (return_code, stdout, stderr).
+        """
+        return self.outputs.get(key, (-1, "", f"Not in snapshot: {key}"))
+
+    # Parsed batctl tables, computed once per snapshot and shared by all checks.
+    # Empty when the command failed; check get() for the error.
+
+    @cached_property
+    def originator_table(self) -> OriginatorTable:
+        """Parsed originator table."""
+        rc, stdout, _ = self.get("originators")
+        return parse_originators(stdout) if rc == 0 else OriginatorTable()
+
+    @cached_property
+    def neighbor_table(self) -> NeighborTable:
+        """Parsed neighbor table."""
+        rc, stdout, _ = self.get("neighbors")
+        return parse_neighbors(stdout) if rc == 0 else NeighborTable()
+
+    @cached_property
+    def gateway_table(self) -> GatewayTable:
+        """Parsed gateway list."""
+        rc, stdout, _ = self.get("gateways")
+        return parse_gateways(stdout) if rc == 0 else GatewayTable()
+
+    @cached_property
+    def hardif_table(self) -> HardIfTable:
+        """Parsed hard interface list."""
+        rc, stdout, _ = self.get("hardifs")
+        return parse_hardifs(stdout) if rc == 0 else HardIfTable()
+
+    def uci_lines(self, package: str) -> List[str]:
+        """
+        Get ``uci show`` lines for a single package.
+
+        Args:
+            package: UCI package name (e.g., "network", "wireless").
+
+        Returns:
+            Lines of the form ``package.section.option=value``.
+        """
+        _, stdout, _ = self.get("uci")
+        prefix = f"{package}."
+        return [line for line in stdout.splitlines() if line.startswith(prefix)]
+
+    def uci_get(self, key: str) -> Optional[str]:
+        """
+        Get a UCI value, with quotes stripped.
+
+        Args:
+            key: Full UCI key (e.g., "uhttpd.main.listen_https").
+
+        Returns:
+            Value string, or None if the key is not set.
+        """
+        package = key.split(".", 1)[0]
+        for line in self.uci_lines(package):
+            name, _, value = line.partition("=")
+            if name == key:
+                return value.strip("'\"")
+        return None
+
+    def link(self, name: str) -> Optional[str]:
+        """
+        Get the ``ip link show`` block for a single interface.
+
+        Args:
+            name: Interface name (e.g., "bat0").
+
+        Returns:
+            The interface's lines, or None if it does not exist.
+        """
+        _, stdout, _ = self.get("links")
+        block: List[str] = []
+        for line in stdout.splitlines():
+            if line[:1].isdigit():
+                if block:
+                    break
+                ifname = line.split(":", 2)[1].strip().split("@")[0]
+                if ifname == name:
+                    block.append(line)
+            elif block:
+                block.append(line)
+        return "\n".join(block) if block else None
+
+    @cached_property
+    def interface_macs(self) -> Dict[str, str]:
+        """
+        Get the MAC address of every interface in ``ip link show``.
+
+        Returns:
+            Interface name (without ``@parent``) to lowercase MAC.
+        """
+        _, stdout, _ = self.get("links")
+        macs: Dict[str, str] = {}
+        ifname = ""
+        for line in stdout.splitlines():
+            if line[:1].isdigit():
+                ifname = line.split(":", 2)[1].strip().split("@")[0]
+            elif ifname and "link/ether " in line:
+                macs[ifname] = line.split("link/ether ", 1)[1].split()[0].lower()
+        return macs
+
+    def module_loaded(self, module: str) -> bool:
+        """Check if a kernel module appears in lsmod output."""
+        _, stdout, _ = self.get("modules")
+        return any(line.split()[:1] == [module] for line in stdout.splitlines())
+
+    def process_running(self, name: str, exact: bool = True) -> bool:
+        """
+        Check if a process is running, like ``pgrep [-x] name``.
+
+        Args:
+            name: Process name.
+            exact: Require an exact name match (pgrep -x).
+
+        Returns:
+            True if a matching process was running.
+        """
+        _, stdout, _ = self.get("processes")
+        lines = stdout.splitlines()
+        if not lines or "COMMAND" not in lines[0]:
+            return False
+
+        # BusyBox widens columns past their header for large values, so the
+        # command is the fifth whitespace-separated field, not a fixed offset
+        for line in lines[1:]:
+            fields = line.split(None, 4)
+            if len(fields) < 5:
+                continue
+            proc = fields[-1].split()[0].rsplit("/", 1)[-1].strip("[]:")
+            if proc == name or (not exact and name in proc):
+                return True
+        return False
+
+
+def collect_snapshot(node: str, timeout: int = 30) -> NodeSnapshot:
+    """
+    Collect a fresh snapshot from a node in one remote call.
+
+    Args:
+        node: Node name (node1, node2, node3).
+        timeout: Timeout for the batched call in seconds.
+
+    Returns:
+        New NodeSnapshot (not stored in the cache).
+    """
+    keys = list(SNAPSHOT_COMMANDS)
+    results = NodeExecutor(node).run_batch([SNAPSHOT_COMMANDS[k] for k in keys], timeout)
+    return NodeSnapshot(node=node, outputs=dict(zip(keys, results)))
+
+
+def _node_lock(node: str) -> threading.Lock:
+    """Get the lock serializing snapshot collection for a node."""
+    with _cache_lock:
+        return _node_locks.setdefault(node, threading.Lock())
+
+
+def get_snapshot(node: str) -> NodeSnapshot:
+    """
+    Get the cached snapshot for a node, collecting it on first use.
+
+    Args:
+        node: Node name (node1, node2, node3).
+
+    Returns:
+        Cached NodeSnapshot.
+    """
+    with _node_lock(node):
+        snapshot = _snapshots.get(node)
+        if snapshot is None:
+            with budget.deadline(None):
+                snapshot = collect_snapshot(node)
+            _snapshots[node] = snapshot
+        return snapshot
+
+
+def refresh_snapshot(node: str) -> NodeSnapshot:
+    """
+    Re-collect a node's snapshot, replacing the cached one.
+
+    Use after a disruptive action when a check needs current state.
+
+    Args:
+        node: Node name (node1, node2, node3).
+
+    Returns:
+        Fresh NodeSnapshot.
+    """
+    with _node_lock(node), budget.deadline(None):
+        snapshot = collect_snapshot(node)
+        _snapshots[node] = snapshot
+        return snapshot
+
+
+def clear_snapshots() -> None:
+    """Drop all cached snapshots (called by the runner at each phase start)."""
+    with _cache_lock:
+        _snapshots.clear()
@@ -0,0 +1,239 @@
+"""
+Streaming packet-loss and RTT analysis for ping soaks.
+
+StressAnalyzer consumes one outcome per packet (RTT, or None if lost) and
+keeps only running aggregates, so memory stays constant however long the
+soak runs:
+
+- loss bursts: a histogram of run lengths of consecutive lost packets and
+  the longest outage (burst length x send interval), which tells one long
+  black hole apart from the same loss spread thinly
+- RTT distribution: a fixed-bucket histogram (percentiles are read from it,
+  accurate to the bucket), plus exact min/mean/max
+- RTT trend: per-window loss and RTT over the test (at most MAX_WINDOWS
+  windows; adjacent windows merge as the run grows) and a least-squares
+  slope of RTT over time
+
+Outcomes may arrive slightly out of order (a reply can overtake an earlier
+packet's timeout); a small reorder buffer puts them back in sequence.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Upper bounds (ms) of the RTT histogram buckets; the last bucket is open
+RTT_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+MAX_WINDOWS = 60
+
+
+@dataclass
+class _Window:
+    """Aggregates for one stretch of the test."""
+
+    sent: int = 0
+    received: int = 0
+    rtt_sum: float = 0.0
+    rtt_max: float = 0.0
+
+    def merge(self, other: "_Window") -> "_Window":
+        """Combine with the following window."""
+        return _Window(
+            sent=self.sent + other.sent,
+            received=self.received + other.received,
+            rtt_sum=self.rtt_sum + other.rtt_sum,
+            rtt_max=max(self.rtt_max, other.rtt_max),
+        )
+
+
+class StressAnalyzer:
+    """Running loss-burst, RTT-distribution and trend statistics for one target."""
+
+    def __init__(self, interval_s: float, window_packets: int = 10):
+        """
+        Start an empty analysis.
+
+        Args:
+            interval_s: Seconds between packets (converts packet counts to time).
+            window_packets: Packets per trend window to begin with; doubles
+                whenever the run outgrows MAX_WINDOWS windows.
+        """
+        self.interval_s = interval_s
+        self.window_packets = max(1, window_packets)
+        self.sent = 0
+        self.received = 0
+        self.bursts: Dict[int, int] = {}  # burst length -> occurrences
+        self.longest_burst = 0
+        self.histogram = [0] * (len(RTT_BUCKETS_MS) + 1)
+        self.rtt_min: Optional[float] = None
+        self.rtt_max: Optional[float] = None
+        self.windows: List[_Window] = []
+        self._burst = 0
+        self._pending: Dict[int, Optional[float]] = {}
+        self._next_seq = 0
+        # Least-squares sums of (time s, RTT ms)
+        self._sx = self._sy = self._sxx = self._sxy = 0.0
+
+    def add(self, seq: int, rtt: Optional[float]) -> None:
+        """
+        Record one packet's outcome.
+
+        Args:
+            seq: Sequence number, from 0.
+            rtt: Round-trip time in ms, or None if the packet was lost.
+        """
+        if seq < self._next_seq:
+            return
+        self._pending[seq] = rtt
+        while self._next_seq in self._pending:
+            self._consume(self._pending.pop(self._next_seq))
+            self._next_seq += 1
+
+    def finish(self, sent: Optional[int] = None) -> None:
+        """
+        Settle every outstanding packet, counting those never reported as lost.
+
+        Args:
+            sent: Packets sent in total (default: up to the highest sequence seen).
+        """
+        last = max(self._pending, default=self._next_seq - 1) + 1
+        for seq in range(self._next_seq, max(last, sent or 0)):
+            self._consume(self._pending.pop(seq, None))
+        self._next_seq = max(self._next_seq, last, sent or 0)
+        self._close_burst()
+
+    def _consume(self, rtt: Optional[float]) -> None:
+        """Fold the next in-sequence outcome into the aggregates."""
+        index = self.sent // self.window_packets
+        if index >= len(self.windows):
+            if len(self.windows) == MAX_WINDOWS:
+                self.windows = [a.merge(b) for a, b in zip(self.windows[::2], self.windows[1::2])]
+                self.window_packets *= 2
+                index = self.sent // self.window_packets
+            self.windows.append(_Window())
+        window = self.windows[index]
+        window.sent += 1
+        self.sent += 1
+
+        if rtt is None:
+            self._burst += 1
+            return
+        self._close_burst()
+        self.received += 1
+        window.received += 1
+        window.rtt_sum += rtt
+        window.rtt_max = max(window.rtt_max, rtt)
+        self.rtt_min = rtt if self.rtt_min is None else min(self.rtt_min, rtt)
+        self.rtt_max = rtt if self.rtt_max is None else max(self.rtt_max, rtt)
+        self.histogram[self._bucket(rtt)] += 1
+
+        t = (self.sent - 1) * self.interval_s
+        self._sx += t
+        self._sy += rtt
+        self._sxx += t * t
+        self._sxy += t * rtt
+
+    def _close_burst(self) -> None:
+        """End the current run of lost packets, if any."""
+        if self._burst:
+            self.bursts[self._burst] = self.bursts.get(self._burst, 0) + 1
+            self.longest_burst = max(self.longest_burst, self._burst)
+            self._burst = 0
+
+    @staticmethod
+    def _bucket(rtt: float) -> int:
+        """Index of the histogram bucket holding an RTT."""
+        for i, bound in enumerate(RTT_BUCKETS_MS):
+            if rtt <= bound:
+                return i
+        return len(RTT_BUCKETS_MS)
+
+    @property
+    def loss_pct(self) -> float:
+        """Packets lost, as a percentage of packets sent."""
+        return 100.0 * (self.sent - self.received) / self.sent if self.sent else 100.0
+
+    @property
+    def longest_outage_ms(self) -> float:
+        """Length of the longest run of lost packets, in ms of send time."""
+        return self.longest_burst * self.interval_s * 1000
+
+    @property
+    def rtt_avg(self) -> Optional[float]:
+        """Mean RTT (ms)."""
+        return self._sy / self.received if self.received else None
+
+    @property
+    def rtt_slope_ms_per_min(self) -> Optional[float]:
+        """Least-squares RTT trend over the run (ms per minute)."""
+        n = self.received
+        denominator = n * self._sxx - self._sx * self._sx
+        if n < 2 or denominator <= 0:
+            return None
+        return (n * self._sxy - self._sx * self._sy) / denominator * 60
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        RTT percentile read from the histogram.
+
+        Args:
+            pct: Percentile, 0-100.
+
+        Returns:
+            Upper bound of the bucket holding the percentile (the observed
+            maximum for the open last bucket), or None with no replies.
+        """
+        if not self.received:
+            return None
+        rank = max(1, math.ceil(pct / 100 * self.received))
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                bound = RTT_BUCKETS_MS[i] if i < len(RTT_BUCKETS_MS) else self.rtt_max
+                return min(float(bound or 0), self.rtt_max or 0.0)
+        return self.rtt_max
+
+    def trend(self) -> List[Dict[str, Any]]:
+        """
+        Loss and RTT per window over the run.
+
+        Returns:
+            One dict per window: start_s, loss_pct, avg_ms, max_ms.
+        """
+        rows = []
+        for i, window in enumerate(self.windows):
+            rows.append(
+                {
+                    "start_s": round(i * self.window_packets * self.interval_s, 1),
+                    "loss_pct": round(100.0 * (window.sent - window.received) / window.sent, 1),
+                    "avg_ms": (
+                        round(window.rtt_sum / window.received, 3) if window.received else None
+                    ),
+                    "max_ms": round(window.rtt_max, 3) if window.received else None,
+                }
+            )
+        return rows
+
+    def summary(self) -> Dict[str, Any]:
+        """Every statistic, rounded for reports."""
+        labels = [f"<={bound}ms" for bound in RTT_BUCKETS_MS] + [f">{RTT_BUCKETS_MS[-1]}ms"]
+        slope = self.rtt_slope_ms_per_min
+        return {
+            "sent": self.sent,
+            "received": self.received,
+            "loss_pct": round(self.loss_pct, 2),
+            "loss_bursts": sum(self.bursts.values()),
+            "burst_lengths": {str(length): n for length, n in sorted(self.bursts.items())},
+            "longest_burst": self.longest_burst,
+            "longest_outage_ms": round(self.longest_outage_ms, 1),
+            "min_ms": self.rtt_min,
+            "avg_ms": None if self.rtt_avg is None else round(self.rtt_avg, 3),
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.rtt_max,
+            "rtt_histogram": {label: n for label, n in zip(labels, self.histogram) if n},
+            "rtt_slope_ms_per_min": None if slope is None else round(slope, 3),
+            "trend": self.trend(),
+        }
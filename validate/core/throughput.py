@@ -0,0 +1,453 @@
+"""
+All-pairs iperf3 throughput matrix.
+
+plan_jobs() turns endpoints and modes into measurement jobs, each holding
+the resources it must use exclusively:
+
+- every mesh link on the least-cost path between the two nodes (from the
+  topology graph), so no two measurements ever share a physical link
+- both endpoint nodes, so a router's CPU serves one iperf3 at a time
+- ``host`` for workstation measurements (they share its uplink)
+
+run_matrix() starts every job whose resources are free as soon as it can,
+so measurements over disjoint parts of the mesh overlap and the whole
+matrix takes far less than the sum of its measurements. Waiting jobs are
+indexed by the resource that blocks them (JobQueue), so a finished
+measurement wakes only the jobs waiting on what it held.
+
+Modes:
+
+- ``tcp``: one TCP stream
+- ``tcp-multi``: THROUGHPUT_STREAMS parallel TCP streams
+- ``bidir``: one TCP stream each way at once (iperf3 --bidir)
+- ``udp``: UDP at a fixed offered rate, reporting loss and jitter
+"""
+
+import asyncio
+import heapq
+import json
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional
+
+from validate.config import NODES
+from validate.core.executor import run_local_async, run_on_node_async
+from validate.core.topology import WIRED, MeshGraph
+
+HOST = "host"
+
+MODES = ("tcp", "tcp-multi", "bidir", "udp")
+
+IPERF_PORT = 5201
+# Pid of the one-off server (a node serves one measurement at a time)
+IPERF_PIDFILE = f"/tmp/validate-iperf3-{IPERF_PORT}.pid"
+
+# Client attempts while a just-started server is not yet listening
+CONNECT_ATTEMPTS = 5
+CONNECT_RETRY_S = 0.2
+
+
+@dataclass
+class ThroughputJob:
+    """One iperf3 measurement to schedule."""
+
+    client: str  # Node name or HOST
+    server: str  # Node name
+    mode: str
+    resources: FrozenSet[str] = frozenset()
+    wired: bool = True  # Every link on the path is wired
+
+    @property
+    def key(self) -> str:
+        """Stable identifier, e.g. ``node1->node2/tcp``."""
+        return f"{self.client}->{self.server}/{self.mode}"
+
+
+@dataclass
+class Measurement:
+    """Result of one iperf3 run."""
+
+    client: str
+    server: str
+    mode: str
+    wired: bool = True
+    mbps: Optional[float] = None  # Client to server (received side for TCP)
+    reverse_mbps: Optional[float] = None  # Server to client (bidir only)
+    samples: List[float] = field(default_factory=list)  # Mbit/s per interval
+    retransmits: Optional[int] = None
+    jitter_ms: Optional[float] = None
+    lost_pct: Optional[float] = None
+    duration_s: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True if the run produced a measurement."""
+        return self.mbps is not None and not self.error
+
+
+@dataclass
+class ThroughputMatrix:
+    """Every measurement of one matrix run."""
+
+    measurements: List[Measurement] = field(default_factory=list)
+    elapsed_s: float = 0.0  # Wall time of the whole run
+
+    @property
+    def serial_s(self) -> float:
+        """Time the same measurements would take one after another."""
+        return sum(m.duration_s for m in self.measurements)
+
+    def get(self, client: str, server: str, mode: str) -> Optional[Measurement]:
+        """Find one measurement."""
+        for measurement in self.measurements:
+            if (measurement.client, measurement.server, measurement.mode) == (
+                client,
+                server,
+                mode,
+            ):
+                return measurement
+        return None
+
+    def table(self, mode: str) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Throughput for one mode as a nested dict.
+
+        Args:
+            mode: Measurement mode.
+
+        Returns:
+            client -> server -> Mbit/s (None if the run failed). For bidir,
+            the reverse direction is filled in as server -> client.
+        """
+        table: Dict[str, Dict[str, Optional[float]]] = {}
+        for m in self.measurements:
+            if m.mode != mode:
+                continue
+            table.setdefault(m.client, {})[m.server] = m.mbps
+            if m.reverse_mbps is not None:
+                table.setdefault(m.server, {})[m.client] = m.reverse_mbps
+        return table
+
+
+def plan_jobs(
+    graph: MeshGraph,
+    nodes: Optional[Iterable[str]] = None,
+    modes: Iterable[str] = MODES,
+    include_host: bool = True,
+) -> List[ThroughputJob]:
+    """
+    Build the measurement jobs for a matrix.
+
+    Every unordered node pair is measured once per mode (client is the
+    first node in order; bidir covers the reverse direction), plus
+    workstation to every node.
+
+    Args:
+        graph: Mesh topology, for the links each pair's traffic crosses.
+        nodes: Node names (default: all NODES).
+        modes: Modes to measure.
+        include_host: Also measure from the workstation.
+
+    Returns:
+        Jobs in a stable order.
+
+    Raises:
+        ValueError: For an unknown mode.
+    """
+    modes = list(modes)
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        raise ValueError(f"Unknown throughput mode(s): {', '.join(unknown)}")
+
+    names = list(NODES if nodes is None else nodes)
+    # Each pair's path (and so its resources) is the same in every mode
+    pairs = []
+    for i, client in enumerate(names):
+        for server in names[i + 1 :]:
+            path = graph.path(client, server) or []
+            resources = frozenset({f"link:{link.id}" for link in path} | {client, server})
+            pairs.append((client, server, resources, all(link.kind == WIRED for link in path)))
+
+    jobs: List[ThroughputJob] = []
+    for mode in modes:
+        jobs.extend(
+            ThroughputJob(client=client, server=server, mode=mode, resources=res, wired=wired)
+            for client, server, res, wired in pairs
+        )
+        if include_host:
+            for server in names:
+                jobs.append(
+                    ThroughputJob(
+                        client=HOST, server=server, mode=mode, resources=frozenset({HOST, server})
+                    )
+                )
+    return jobs
+
+
+class JobQueue:
+    """
+    Pending jobs, indexed by the resource that keeps them waiting.
+
+    Jobs needing exactly the same resources (one node pair in every mode)
+    can never overlap, so each such group queues in plan order and only its
+    first job competes for resources. A job that cannot start is parked on
+    one held resource it needs. Every job parked on a resource needs it, so
+    once the resource is freed at most one of them can take it: release()
+    tries them in plan order until one starts, re-parks those blocked by
+    something else, and leaves the rest parked. A finished measurement thus
+    wakes only jobs waiting on what it held, instead of every pending job
+    being rescanned. Resources are bits of an int, so each test is one AND.
+    """
+
+    def __init__(self, jobs: Iterable[ThroughputJob]):
+        """
+        Queue jobs, none of them started.
+
+        Args:
+            jobs: Jobs in plan order.
+        """
+        self.jobs = list(jobs)
+        self._pending = len(self.jobs)
+        self._held = 0  # Mask of resources held by running jobs
+
+        bits: Dict[str, int] = {}
+        groups: Dict[FrozenSet[str], Deque[int]] = {}
+        for index, job in enumerate(self.jobs):
+            groups.setdefault(job.resources, deque()).append(index)
+            for resource in sorted(job.resources):
+                bits.setdefault(resource, len(bits))
+        self._groups = {resources: group for group, resources in enumerate(groups)}
+        self._queues = list(groups.values())
+        self._bits = [sorted(bits[r] for r in resources) for resources in groups]
+        self._masks = [sum(1 << bit for bit in group_bits) for group_bits in self._bits]
+        self._group_of = [0] * len(self.jobs)
+        for group, queue in enumerate(self._queues):
+            for index in queue:
+                self._group_of[index] = group
+        self._parked: Dict[int, List[int]] = defaultdict(list)  # Bit -> heap of job indexes
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def _try(self, index: int) -> Optional[ThroughputJob]:
+        """Start a group's first job if its resources are free, or park it."""
+        group = self._group_of[index]
+        blocked = self._masks[group] & self._held
+        if blocked:
+            heapq.heappush(self._parked[(blocked & -blocked).bit_length() - 1], index)
+            return None
+        self._queues[group].popleft()
+        self._held |= self._masks[group]
+        self._pending -= 1
+        return self.jobs[index]
+
+    def start(self) -> List[ThroughputJob]:
+        """
+        Start every job that can run now (call once, before any release()).
+
+        Returns:
+            Started jobs, in plan order.
+        """
+        started = (self._try(index) for index in sorted(q[0] for q in self._queues if q))
+        return [job for job in started if job is not None]
+
+    def release(self, job: ThroughputJob) -> List[ThroughputJob]:
+        """
+        Free a finished job's resources and start jobs waiting on them.
+
+        Args:
+            job: Job that finished.
+
+        Returns:
+            Started jobs.
+        """
+        group = self._groups[job.resources]
+        self._held &= ~self._masks[group]
+        queue = self._queues[group]
+        if queue:  # The group's next job competes for what was just freed
+            heapq.heappush(self._parked[self._bits[group][0]], queue[0])
+        started: List[ThroughputJob] = []
+        for bit in self._bits[group]:
+            parked = self._parked.get(bit)
+            while parked and not self._held >> bit & 1:
+                taken = self._try(heapq.heappop(parked))
+                if taken is not None:
+                    started.append(taken)
+        return started
+
+
+def iperf_client_command(
+    server_ip: str, mode: str, duration_s: int, streams: int, udp_mbps: int
+) -> str:
+    """
+    Build the iperf3 client command for a mode.
+
+    Args:
+        server_ip: Server address.
+        mode: Measurement mode.
+        duration_s: Test length.
+        streams: Parallel streams for tcp-multi.
+        udp_mbps: Offered rate for udp.
+
+    Returns:
+        Command line producing JSON output.
+    """
+    options = {
+        "tcp": "",
+        "tcp-multi": f" -P {streams}",
+        "bidir": " --bidir",
+        "udp": f" -u -b {udp_mbps}M",
+    }[mode]
+    return f"iperf3 -c {server_ip} -p {IPERF_PORT} -t {duration_s} -i 1 -J{options}"
+
+
+def _mbps(bits_per_second: Any) -> float:
+    """Convert iperf3 bits/s to Mbit/s."""
+    return round(float(bits_per_second) / 1e6, 2)
+
+
+def parse_iperf_json(output: str, measurement: Measurement) -> Measurement:
+    """
+    Fill a measurement from iperf3 -J output.
+
+    Args:
+        output: iperf3 stdout.
+        measurement: Measurement to fill (returned for convenience).
+
+    Returns:
+        The measurement, with error set if iperf3 reported one.
+    """
+    try:
+        data: Dict[str, Any] = json.loads(output)
+    except json.JSONDecodeError:
+        measurement.error = "iperf3 produced no JSON output"
+        return measurement
+    if data.get("error"):
+        measurement.error = str(data["error"])
+        return measurement
+
+    measurement.samples = [
+        _mbps(interval["sum"]["bits_per_second"]) for interval in data.get("intervals", [])
+    ]
+    end = data.get("end", {})
+    if measurement.mode == "udp":
+        summary = end.get("sum", {})
+        measurement.mbps = _mbps(summary.get("bits_per_second", 0))
+        measurement.jitter_ms = summary.get("jitter_ms")
+        measurement.lost_pct = summary.get("lost_percent")
+    else:
+        measurement.mbps = _mbps(end.get("sum_received", {}).get("bits_per_second", 0))
+        measurement.retransmits = end.get("sum_sent", {}).get("retransmits")
+    if measurement.mode == "bidir":
+        reverse = end.get("sum_received_bidir_reverse", {})
+        measurement.reverse_mbps = _mbps(reverse.get("bits_per_second", 0))
+    return measurement
+
+
+def _client_refused(measurement: Measurement, stderr: str) -> bool:
+    """True if the server refused the client (it is not listening yet)."""
+    return "Connection refused" in f"{measurement.error} {stderr}"
+
+
+async def _run_client(job: ThroughputJob, command: str, timeout: int) -> Measurement:
+    """
+    Run the iperf3 client, retrying while the server is not yet listening.
+
+    iperf3 -D forks before its server listens, so the first connection can
+    be refused; a refused client is retried a few times.
+
+    Args:
+        job: Job being measured.
+        command: iperf3 client command.
+        timeout: Timeout of each attempt in seconds.
+
+    Returns:
+        The last attempt's measurement.
+    """
+    measurement = Measurement(client=job.client, server=job.server, mode=job.mode)
+    for attempt in range(CONNECT_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(CONNECT_RETRY_S)
+        if job.client == HOST:
+            rc, stdout, stderr = await run_local_async(command, timeout)
+        else:
+            rc, stdout, stderr = await run_on_node_async(job.client, command, timeout)
+        measurement = parse_iperf_json(
+            stdout,
+            Measurement(client=job.client, server=job.server, mode=job.mode, wired=job.wired),
+        )
+        if rc != 0 and not measurement.error:
+            measurement.error = stderr.strip() or f"iperf3 exited with {rc}"
+        if not _client_refused(measurement, stderr):
+            break
+    return measurement
+
+
+async def _measure(job: ThroughputJob, duration_s: int, streams: int, udp_mbps: int) -> Measurement:
+    """Start a one-off server, run the client and parse its JSON."""
+    measurement = Measurement(client=job.client, server=job.server, mode=job.mode, wired=job.wired)
+    start = time.monotonic()
+    timeout = duration_s + 20
+
+    rc, _, stderr = await run_on_node_async(
+        job.server, f"iperf3 -s -1 -D -p {IPERF_PORT} -I {IPERF_PIDFILE}", timeout=10
+    )
+    if rc != 0:
+        measurement.error = f"iperf3 server failed: {stderr.strip() or f'rc={rc}'}"
+        return measurement
+
+    command = iperf_client_command(NODES[job.server].ip, job.mode, duration_s, streams, udp_mbps)
+    try:
+        measurement = await _run_client(job, command, timeout)
+    finally:
+        if not measurement.ok:
+            # The one-off server exits after serving a client; if none got
+            # through, stop it so it doesn't hold the port
+            await run_on_node_async(
+                job.server, f"kill $(cat {IPERF_PIDFILE}) 2>/dev/null; rm -f {IPERF_PIDFILE}", 10
+            )
+    measurement.duration_s = round(time.monotonic() - start, 2)
+    return measurement
+
+
+async def run_matrix(
+    jobs: List[ThroughputJob],
+    duration_s: int = 10,
+    streams: int = 4,
+    udp_mbps: int = 100,
+) -> ThroughputMatrix:
+    """
+    Run measurement jobs, overlapping those with disjoint resources.
+
+    Args:
+        jobs: Jobs from plan_jobs().
+        duration_s: Length of each iperf3 run.
+        streams: Parallel streams for tcp-multi.
+        udp_mbps: Offered rate for udp.
+
+    Returns:
+        ThroughputMatrix with measurements in job order.
+    """
+    start = time.monotonic()
+    queue = JobQueue(jobs)
+    running: Dict["asyncio.Task[Measurement]", ThroughputJob] = {}
+    results: Dict[str, Measurement] = {}
+
+    ready = queue.start()
+    while ready or running:
+        for job in ready:
+            task = asyncio.ensure_future(_measure(job, duration_s, streams, udp_mbps))
+            running[task] = job
+        ready = []
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            job = running.pop(task)
+            results[job.key] = task.result()
+            ready.extend(queue.release(job))
+
+    return ThroughputMatrix(
+        measurements=[results[job.key] for job in jobs],
+        elapsed_s=round(time.monotonic() - start, 2),
+    )
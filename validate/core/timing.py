@@ -0,0 +1,92 @@
+"""
+Per-node command timings.
+
+The executor records the wall time of every remote command in a per-node
+histogram, along with how many of those commands failed to reach the node
+(ssh exit 255). Unlike circuit breakers, timings are not reset
+between runs: they are process-lifetime counters, as the metrics exporter
+(validate.reporters.metrics) expects.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from validate.config import NODES
+
+# Upper bounds (seconds) of the command duration histogram buckets
+COMMAND_BUCKETS_S = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class CommandTiming:
+    """Duration histogram and failure count for one node's commands."""
+
+    count: int = 0
+    sum_s: float = 0.0
+    failures: int = 0
+    # Non-cumulative count per COMMAND_BUCKETS_S bound, plus one for +Inf
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(COMMAND_BUCKETS_S) + 1))
+
+    def observe(self, duration_s: float, failed: bool = False) -> None:
+        """
+        Add one command.
+
+        Args:
+            duration_s: Wall time of the command.
+            failed: Whether the command failed to reach the node.
+        """
+        self.count += 1
+        self.sum_s += duration_s
+        self.failures += int(failed)
+        self.buckets[bisect.bisect_left(COMMAND_BUCKETS_S, duration_s)] += 1
+
+    def cumulative(self) -> List[int]:
+        """Commands at or under each bucket bound (the last is +Inf)."""
+        total, counts = 0, []
+        for count in self.buckets:
+            total += count
+            counts.append(total)
+        return counts
+
+
+_timings: Dict[str, CommandTiming] = {}
+_timings_lock = threading.Lock()
+
+
+def record_command(node_ip: str, duration_s: float, failed: bool = False) -> None:
+    """
+    Record one remote command.
+
+    Args:
+        node_ip: IP address of the node.
+        duration_s: Wall time of the command.
+        failed: Whether the command failed to reach the node.
+    """
+    with _timings_lock:
+        timing = _timings.get(node_ip)
+        if timing is None:
+            timing = _timings[node_ip] = CommandTiming()
+        timing.observe(duration_s, failed)
+
+
+def command_timings() -> Dict[str, CommandTiming]:
+    """
+    Get a copy of every node's command timings.
+
+    Returns:
+        Node name (or IP, for unnamed hosts) to its timings.
+    """
+    names = {info.ip: name for name, info in NODES.items()}
+    with _timings_lock:
+        return {
+            names.get(ip, ip): CommandTiming(t.count, t.sum_s, t.failures, list(t.buckets))
+            for ip, t in _timings.items()
+        }
+
+
+def reset_command_timings() -> None:
+    """Forget all recorded timings."""
+    with _timings_lock:
+        _timings.clear()
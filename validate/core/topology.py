@@ -0,0 +1,534 @@
+"""
+Mesh topology graph built from batman-adv tables.
+
+build_topology() turns every node's snapshot into one undirected multigraph:
+one Link per (hard interface, neighbor) pair seen in the neighbor tables,
+typed wired (lan3/lan4 VLAN 100) or wireless (mesh0), and weighted from the
+direct-route TQ (BATMAN_IV) or throughput (BATMAN_V) in the originator
+tables. Neighbor MACs are mapped back to nodes through each node's
+``ip link`` addresses.
+
+MeshGraph answers the redundancy questions the failover checks ask, all in
+O(V + E) from a single depth-first search:
+
+- bridges: links whose failure partitions the mesh
+- articulation points: nodes whose failure partitions the mesh
+- cut groups and edge connectivity (capped at 3): links are labelled by
+  XOR-hashing their covering cycles, and any two links sharing a label
+  together partition the mesh (exact with probability 1 - 2^-64)
+
+path_costs() adds best and alternate (first link avoided) path costs from
+a node via Dijkstra.
+"""
+
+import heapq
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from validate.config import NODES
+from validate.core.snapshot import NodeSnapshot, get_snapshot
+
+WIRED = "wired"
+WIRELESS = "wireless"
+OTHER = "other"
+
+# edge_connectivity() distinguishes 0, 1, 2 and "3 or more"
+MAX_EDGE_CONNECTIVITY = 3
+
+
+def link_kind(iface: str) -> str:
+    """
+    Classify a batman hard interface.
+
+    Args:
+        iface: Interface name (e.g. "lan3.100", "mesh0", "phy0-mesh0").
+
+    Returns:
+        WIRED, WIRELESS or OTHER.
+    """
+    if iface.startswith(("lan", "eth", "wan")):
+        return WIRED
+    if "mesh" in iface or iface.startswith(("wlan", "phy")):
+        return WIRELESS
+    return OTHER
+
+
+@dataclass
+class Link:
+    """One batman-adv link between two nodes."""
+
+    id: int
+    a: str
+    b: str
+    a_iface: str
+    b_iface: str = ""
+    kind: str = OTHER
+    tq: Optional[int] = None
+    throughput_mbit: Optional[float] = None
+
+    @property
+    def cost(self) -> float:
+        """
+        Routing cost: 1.0 for a perfect link, growing as quality drops.
+
+        255/TQ for BATMAN_IV, 1000/throughput (Mbit/s) for BATMAN_V, 1.0
+        if no metric was reported.
+        """
+        if self.throughput_mbit:
+            return 1000.0 / self.throughput_mbit
+        if self.tq:
+            return 255.0 / self.tq
+        return 1.0
+
+    def other(self, node: str) -> str:
+        """Get the far end of the link from node."""
+        return self.b if node == self.a else self.a
+
+    @property
+    def label(self) -> str:
+        """Human-readable ``node:iface-node:iface``."""
+        b_end = f"{self.b}:{self.b_iface}" if self.b_iface else self.b
+        return f"{self.a}:{self.a_iface}-{b_end}"
+
+
+@dataclass
+class PathCost:
+    """Best and alternate path from one node to another."""
+
+    destination: str
+    cost: float
+    hops: int
+    first_hop: str
+    alternate_cost: Optional[float] = None  # Best path avoiding the first link
+
+
+@dataclass
+class Connectivity:
+    """Result of the redundancy analysis."""
+
+    components: List[Set[str]] = field(default_factory=list)
+    bridges: List[Link] = field(default_factory=list)
+    articulation_points: Set[str] = field(default_factory=set)
+    # Links sharing a cycle-space label: any two of a group form a 2-link cut
+    cut_groups: List[List[Link]] = field(default_factory=list)
+    edge_connectivity: int = 0
+
+
+class MeshGraph:
+    """Undirected multigraph of mesh nodes and links."""
+
+    def __init__(self, nodes: Iterable[str] = ()):
+        """
+        Create a graph.
+
+        Args:
+            nodes: Node names to include even if they have no links.
+        """
+        self._adj: Dict[str, List[Link]] = {}
+        self.links: List[Link] = []
+        self._analysis: Optional[Connectivity] = None
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Node names in insertion order."""
+        return list(self._adj)
+
+    def add_node(self, node: str) -> None:
+        """Add a node (no-op if present)."""
+        self._adj.setdefault(node, [])
+
+    def add_link(
+        self,
+        a: str,
+        b: str,
+        a_iface: str,
+        b_iface: str = "",
+        tq: Optional[int] = None,
+        throughput_mbit: Optional[float] = None,
+    ) -> Optional[Link]:
+        """
+        Add a link between two nodes.
+
+        Args:
+            a: One end.
+            b: Other end.
+            a_iface: Hard interface on a.
+            b_iface: Hard interface on b, if known.
+            tq: Transmit quality (BATMAN_IV).
+            throughput_mbit: Estimated throughput (BATMAN_V).
+
+        Returns:
+            The new Link, or None for a self-loop.
+        """
+        if a == b:
+            return None
+        self.add_node(a)
+        self.add_node(b)
+        link = Link(
+            id=len(self.links),
+            a=a,
+            b=b,
+            a_iface=a_iface,
+            b_iface=b_iface,
+            kind=link_kind(a_iface),
+            tq=tq,
+            throughput_mbit=throughput_mbit,
+        )
+        self.links.append(link)
+        self._adj[a].append(link)
+        self._adj[b].append(link)
+        self._analysis = None
+        return link
+
+    def neighbors(self, node: str) -> List[Tuple[str, Link]]:
+        """Get (peer, link) for every link of a node."""
+        return [(link.other(node), link) for link in self._adj.get(node, [])]
+
+    def degree(self, node: str) -> int:
+        """Number of links at a node."""
+        return len(self._adj.get(node, []))
+
+    # Redundancy analysis
+
+    def analyze(self) -> Connectivity:
+        """
+        Compute components, bridges, articulation points and cut pairs.
+
+        Returns:
+            Connectivity (cached until the graph changes).
+        """
+        if self._analysis is None:
+            self._analysis = _Analysis(self).run()
+        return self._analysis
+
+    def bridges(self) -> List[Link]:
+        """Links whose failure partitions the mesh."""
+        return self.analyze().bridges
+
+    def articulation_points(self) -> Set[str]:
+        """Nodes whose failure partitions the mesh."""
+        return self.analyze().articulation_points
+
+    def edge_connectivity(self) -> int:
+        """
+        Minimum number of links whose failure partitions the mesh.
+
+        Returns:
+            0 (already partitioned or fewer than two nodes), 1, 2, or
+            MAX_EDGE_CONNECTIVITY meaning "that many or more".
+        """
+        return self.analyze().edge_connectivity
+
+    def is_connected(self) -> bool:
+        """Check if every node can reach every other."""
+        return len(self.analyze().components) <= 1
+
+    # Paths
+
+    def shortest_paths(
+        self, source: str, exclude_link: Optional[int] = None
+    ) -> Dict[str, Tuple[float, int, Optional[Link]]]:
+        """
+        Dijkstra from a node over link costs.
+
+        Args:
+            source: Start node.
+            exclude_link: Link id to treat as failed.
+
+        Returns:
+            Destination to (cost, hops, first link) for every reachable node
+            (the source maps to (0, 0, None)).
+        """
+        best: Dict[str, Tuple[float, int, Optional[Link]]] = {source: (0.0, 0, None)}
+        heap: List[Tuple[float, int, str]] = [(0.0, 0, source)]
+        done: Set[str] = set()
+        while heap:
+            cost, hops, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            done.add(node)
+            first = best[node][2]
+            for peer, link in self.neighbors(node):
+                if link.id == exclude_link or peer in done:
+                    continue
+                new_cost = cost + link.cost
+                if peer not in best or new_cost < best[peer][0]:
+                    best[peer] = (new_cost, hops + 1, first or link)
+                    heapq.heappush(heap, (new_cost, hops + 1, peer))
+        return best
+
+    def path(self, source: str, dest: str) -> Optional[List[Link]]:
+        """
+        Links along the least-cost path between two nodes.
+
+        Args:
+            source: Start node.
+            dest: End node.
+
+        Returns:
+            Links in order from source (empty if source == dest), or None if
+            dest is unreachable.
+        """
+        best: Dict[str, float] = {source: 0.0}
+        via: Dict[str, Link] = {}
+        heap: List[Tuple[float, str]] = [(0.0, source)]
+        done: Set[str] = set()
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if node == dest:
+                break
+            if node in done:
+                continue
+            done.add(node)
+            for peer, link in self.neighbors(node):
+                new_cost = cost + link.cost
+                if peer not in done and new_cost < best.get(peer, float("inf")):
+                    best[peer] = new_cost
+                    via[peer] = link
+                    heapq.heappush(heap, (new_cost, peer))
+        if dest not in best:
+            return None
+
+        links: List[Link] = []
+        node = dest
+        while node != source:
+            links.append(via[node])
+            node = via[node].other(node)
+        return links[::-1]
+
+    def path_costs(self, source: str) -> Dict[str, PathCost]:
+        """
+        Best path, and the best alternate if its first link fails, to every node.
+
+        Runs one Dijkstra plus one per distinct first link (at most the
+        source's degree).
+
+        Args:
+            source: Start node.
+
+        Returns:
+            Destination to PathCost for every node reachable from source.
+        """
+        best = self.shortest_paths(source)
+        alternates: Dict[int, Dict[str, Tuple[float, int, Optional[Link]]]] = {}
+        result: Dict[str, PathCost] = {}
+        for dest, (cost, hops, first) in best.items():
+            if first is None:
+                continue
+            if first.id not in alternates:
+                alternates[first.id] = self.shortest_paths(source, exclude_link=first.id)
+            alternate = alternates[first.id].get(dest)
+            result[dest] = PathCost(
+                destination=dest,
+                cost=round(cost, 3),
+                hops=hops,
+                first_hop=first.other(source),
+                alternate_cost=round(alternate[0], 3) if alternate else None,
+            )
+        return result
+
+
+class _Analysis:
+    """One iterative DFS computing Tarjan low-links and cycle-space hashes."""
+
+    def __init__(self, graph: MeshGraph):
+        self.graph = graph
+        self.disc: Dict[str, int] = {}
+        self.low: Dict[str, int] = {}
+        self.parent_link: Dict[str, Optional[Link]] = {}
+        self.order: List[str] = []  # DFS preorder
+        self.hash: Dict[str, int] = {}  # XOR of back-link labels at each node
+        self.labels: Dict[int, int] = {}  # Link id -> cycle-space label
+        self.rng = random.Random(0)
+        self.result = Connectivity()
+
+    def run(self) -> Connectivity:
+        """Analyze every component."""
+        for root in self.graph.nodes:
+            if root not in self.disc:
+                self.result.components.append(self._dfs(root))
+        self._label_tree_links()
+        self._collect_cuts()
+        return self.result
+
+    def _visit(self, node: str, via: Optional[Link]) -> None:
+        """Record discovery of a node."""
+        self.disc[node] = self.low[node] = len(self.order)
+        self.parent_link[node] = via
+        self.hash[node] = 0
+        self.order.append(node)
+
+    def _dfs(self, root: str) -> Set[str]:
+        """Iterative DFS from root; returns the component."""
+        start = len(self.order)
+        self._visit(root, None)
+        root_children = 0
+        stack = [(root, iter(self.graph.neighbors(root)))]
+        while stack:
+            node, pending = stack[-1]
+            for peer, link in pending:
+                via = self.parent_link[node]
+                if via is not None and link.id == via.id:
+                    continue
+                if peer not in self.disc:
+                    self._visit(peer, link)
+                    root_children += node == root
+                    stack.append((peer, iter(self.graph.neighbors(peer))))
+                    break
+                self.low[node] = min(self.low[node], self.disc[peer])
+                if self.disc[peer] < self.disc[node]:
+                    # Back link to an ancestor: give it a random label
+                    label = self.rng.getrandbits(64) or 1
+                    self.labels[link.id] = label
+                    self.hash[node] ^= label
+                    self.hash[peer] ^= label
+            else:
+                stack.pop()
+                if stack:
+                    self._finish(node, stack[-1][0])
+
+        if root_children > 1:
+            self.result.articulation_points.add(root)
+        return set(self.order[start:])
+
+    def _finish(self, child: str, parent: str) -> None:
+        """Propagate low-link from a finished child to its DFS parent."""
+        self.low[parent] = min(self.low[parent], self.low[child])
+        if self.low[child] > self.disc[parent]:
+            link = self.parent_link[child]
+            assert link is not None
+            self.result.bridges.append(link)
+        if self.low[child] >= self.disc[parent] and self.parent_link[parent] is not None:
+            self.result.articulation_points.add(parent)
+
+    def _label_tree_links(self) -> None:
+        """Label each tree link with the XOR of the back links covering it."""
+        for node in reversed(self.order):
+            link = self.parent_link[node]
+            if link is not None:
+                self.labels[link.id] = self.hash[node]
+                self.hash[link.other(node)] ^= self.hash[node]
+
+    def _collect_cuts(self) -> None:
+        """Group non-bridge links by label: equal labels form 2-link cuts."""
+        groups: Dict[int, List[Link]] = {}
+        for link in self.graph.links:
+            label = self.labels.get(link.id, 0)
+            if label:
+                groups.setdefault(label, []).append(link)
+        self.result.cut_groups = [group for group in groups.values() if len(group) > 1]
+
+        if len(self.graph.nodes) < 2 or len(self.result.components) > 1:
+            self.result.edge_connectivity = 0
+        elif self.result.bridges:
+            self.result.edge_connectivity = 1
+        elif self.result.cut_groups:
+            self.result.edge_connectivity = 2
+        else:
+            self.result.edge_connectivity = MAX_EDGE_CONNECTIVITY
+
+
+# Graph construction from snapshots
+
+_cache_lock = threading.Lock()
+_cache: Optional[Tuple[Tuple[Tuple[str, int, float], ...], MeshGraph]] = None
+
+
+def _mac_owners(snapshots: Dict[str, NodeSnapshot]) -> Dict[str, Tuple[str, str]]:
+    """Map every interface MAC to (node, interface), preferring batman hard interfaces."""
+    owners: Dict[str, Tuple[str, str]] = {}
+    for node, snapshot in snapshots.items():
+        hardifs = {entry.name for entry in snapshot.hardif_table.entries}
+        for iface, mac in snapshot.interface_macs.items():
+            if mac not in owners or iface in hardifs:
+                owners[mac] = (node, iface)
+    return owners
+
+
+def _direct_metrics(
+    snapshot: NodeSnapshot, owners: Dict[str, Tuple[str, str]]
+) -> Dict[Tuple[str, str], Tuple[Optional[int], Optional[float]]]:
+    """Get (tq, throughput) of one-hop routes, keyed by (outgoing iface, neighbor MAC)."""
+    metrics: Dict[Tuple[str, str], Tuple[Optional[int], Optional[float]]] = {}
+    for entry in snapshot.originator_table.entries:
+        origin = owners.get(entry.originator.lower())
+        hop = owners.get(entry.next_hop.lower())
+        if origin and hop and origin[0] == hop[0]:
+            metrics[(entry.outgoing_if, entry.next_hop.lower())] = (
+                entry.tq,
+                entry.throughput_mbit,
+            )
+    return metrics
+
+
+def graph_from_snapshots(snapshots: Dict[str, NodeSnapshot]) -> MeshGraph:
+    """
+    Build the mesh graph from node snapshots.
+
+    A link seen from both ends is added once; its metric is the worse of
+    the two directions.
+
+    Args:
+        snapshots: Node name to snapshot.
+
+    Returns:
+        MeshGraph containing every snapshot's node.
+    """
+    graph = MeshGraph(snapshots)
+    owners = _mac_owners(snapshots)
+    seen: Dict[frozenset[str], Link] = {}
+
+    for node, snapshot in snapshots.items():
+        metrics = _direct_metrics(snapshot, owners)
+        for entry in snapshot.neighbor_table.entries:
+            mac = entry.neighbor.lower()
+            owner = owners.get(mac)
+            if owner is None:
+                continue
+            tq, throughput = metrics.get((entry.hardif, mac), (None, entry.throughput_mbit))
+            local_mac = snapshot.interface_macs.get(entry.hardif, f"{node}/{entry.hardif}")
+            key = frozenset((local_mac, mac))
+
+            link = seen.get(key)
+            if link is None:
+                new = graph.add_link(node, owner[0], entry.hardif, owner[1], tq, throughput)
+                if new is not None:
+                    seen[key] = new
+                continue
+            # Second direction: keep the worse metric
+            if tq is not None:
+                link.tq = min(tq, link.tq) if link.tq is not None else tq
+            if throughput is not None:
+                link.throughput_mbit = (
+                    min(throughput, link.throughput_mbit) if link.throughput_mbit else throughput
+                )
+    return graph
+
+
+def build_topology(nodes: Optional[Iterable[str]] = None) -> MeshGraph:
+    """
+    Build the mesh graph from the current (cached) node snapshots.
+
+    The graph is cached until any snapshot changes, so checks in the same
+    phase share one graph.
+
+    Args:
+        nodes: Node names (default: all NODES).
+
+    Returns:
+        MeshGraph of the mesh.
+    """
+    global _cache
+    snapshots = {node: get_snapshot(node) for node in (NODES if nodes is None else nodes)}
+    key = tuple((node, id(snapshot), snapshot.timestamp) for node, snapshot in snapshots.items())
+    with _cache_lock:
+        if _cache is not None and _cache[0] == key:
+            return _cache[1]
+    graph = graph_from_snapshots(snapshots)
+    with _cache_lock:
+        _cache = (key, graph)
+    return graph
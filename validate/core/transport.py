@@ -0,0 +1,299 @@
+"""
+Command transports: how the executor actually runs a command.
+
+The executor sends every remote (ssh) and local command through the active
+Transport. The default, SSHTransport (in validate.core.executor), runs them
+for real. Two more transports make runs reproducible offline:
+
+- RecordingTransport wraps another transport and appends every
+  (target, command) -> (rc, stdout, stderr, duration) result to a JSON Lines
+  file (gzip-compressed if the name ends in ``.gz``).
+- ReplayTransport answers commands from such a file with no network access,
+  either instantly or paced at a multiple of the recorded durations.
+
+Host-side pings go through Transport.ping(). SSHTransport answers them
+in-process (validate.core.icmp); every other transport, including
+RecordingTransport, runs plain ``ping`` commands through local(), so they
+are recorded and replayed like any other command.
+
+Batch scripts embed a random framing token (see run_batch_on_node); it is
+normalized on record and substituted back on replay, so recorded batches
+match.
+"""
+
+import asyncio
+import gzip
+import json
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from typing import IO, Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from validate.core.icmp import Outcome, ping_command
+from validate.parsers.ping import PingStats, parse_ping, ping_outcomes
+
+# Target name used for commands run on the validation host itself
+LOCAL = "local"
+
+RECORDING_FORMAT = "mesh-validate-recording"
+RECORDING_VERSION = 1
+
+_TOKEN_RE = re.compile(r"__VALIDATE_[0-9a-f]{32}")
+_TOKEN_PLACEHOLDER = "__VALIDATE_TOKEN"
+
+# (return_code, stdout, stderr, duration_s)
+Recorded = Tuple[int, str, str, float]
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """Open a recording file, transparently handling gzip."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+class Transport(ABC):
+    """Runs commands on nodes and locally. Subclasses implement ssh() and local()."""
+
+    # False for transports that never touch the network (checks that verify
+    # local prerequisites such as the SSH key skip them)
+    live = True
+
+    @abstractmethod
+    async def ssh(self, node_ip: str, command: str, timeout: int) -> Tuple[int, str, str]:
+        """
+        Run a command on a node.
+
+        Args:
+            node_ip: IP address of the node.
+            command: Command to execute.
+            timeout: Command timeout in seconds.
+
+        Returns:
+            Tuple of (return_code, stdout, stderr).
+        """
+
+    @abstractmethod
+    async def local(self, command: str, timeout: int) -> Tuple[int, str, str]:
+        """
+        Run a shell command on the validation host.
+
+        Args:
+            command: Command to execute (as shell string).
+            timeout: Command timeout in seconds.
+
+        Returns:
+            Tuple of (return_code, stdout, stderr).
+        """
+
+    async def ping(
+        self,
+        addresses: Sequence[str],
+        count: int,
+        interval_s: float,
+        timeout_s: float,
+        interface: str,
+        on_outcome: Optional[Outcome] = None,
+    ) -> Dict[str, PingStats]:
+        """
+        Ping addresses from the validation host, all at once.
+
+        The default runs one ``ping`` command per address through local(),
+        so recordings, replays and simulations see ordinary ping commands.
+
+        Args:
+            addresses: Target addresses.
+            count: Echo requests per address.
+            interval_s: Seconds between requests.
+            timeout_s: Seconds to wait for each reply.
+            interface: Source interface ("" for default routing).
+            on_outcome: Called with (address, sequence, RTT ms or None if
+                lost) for every packet; the returned stats then carry no RTTs.
+
+        Returns:
+            Address to per-packet statistics.
+        """
+        targets = list(dict.fromkeys(addresses))
+        timeout = int(count * interval_s + timeout_s) + 5
+        outputs = await asyncio.gather(
+            *(
+                self.local(ping_command(a, count, interval_s, timeout_s, interface), timeout)
+                for a in targets
+            )
+        )
+        stats = {address: parse_ping(stdout) for address, (_, stdout, _) in zip(targets, outputs)}
+        for address, (_, stdout, _) in zip(targets, outputs):
+            # ping failed outright (e.g. bad interface): every packet lost
+            stats[address].sent = stats[address].sent or count
+            if on_outcome is not None:
+                outcomes = dict(ping_outcomes(stdout))
+                for seq in range(max(count, len(outcomes))):
+                    on_outcome(address, seq, outcomes.get(seq))
+                stats[address].rtts = []
+        return stats
+
+    def close(self) -> None:
+        """Release any resources held by the transport."""
+
+
+class RecordingTransport(Transport):
+    """Passes commands to another transport and records every result."""
+
+    def __init__(self, inner: Transport, path: str):
+        """
+        Start a new recording.
+
+        Args:
+            inner: Transport that actually runs the commands.
+            path: Output file (``.gz`` suffix for gzip).
+        """
+        self.inner = inner
+        self.live = inner.live
+        self.path = path
+        self._file: Optional[IO[str]] = _open(path, "w")
+        self._lock = threading.Lock()
+        self._write(
+            {"format": RECORDING_FORMAT, "version": RECORDING_VERSION, "created": time.time()}
+        )
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """Append one JSON line to the recording."""
+        with self._lock:
+            if self._file is not None:
+                self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                self._file.flush()
+
+    def _record(
+        self, target: str, command: str, result: Tuple[int, str, str], duration: float
+    ) -> None:
+        """Record one command result with its framing token normalized."""
+        rc, stdout, stderr = result
+        match = _TOKEN_RE.search(command)
+        if match:
+            token = match.group(0)
+            command = command.replace(token, _TOKEN_PLACEHOLDER)
+            stdout = stdout.replace(token, _TOKEN_PLACEHOLDER)
+        self._write(
+            {
+                "t": target,
+                "c": command,
+                "rc": rc,
+                "out": stdout,
+                "err": stderr,
+                "d": round(duration, 4),
+            }
+        )
+
+    async def ssh(self, node_ip: str, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Run a command on a node via the inner transport and record it."""
+        start = time.monotonic()
+        result = await self.inner.ssh(node_ip, command, timeout)
+        self._record(node_ip, command, result, time.monotonic() - start)
+        return result
+
+    async def local(self, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Run a local command via the inner transport and record it."""
+        start = time.monotonic()
+        result = await self.inner.local(command, timeout)
+        self._record(LOCAL, command, result, time.monotonic() - start)
+        return result
+
+    def close(self) -> None:
+        """Finish the recording file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self.inner.close()
+
+
+def load_recording(path: str) -> Dict[Tuple[str, str], List[Recorded]]:
+    """
+    Load a recording file.
+
+    Args:
+        path: Recording written by RecordingTransport.
+
+    Returns:
+        Mapping of (target, normalized command) to its results, in the
+        order they were recorded.
+
+    Raises:
+        ValueError: If the file is not a recording or has an unknown version.
+    """
+    entries: Dict[Tuple[str, str], List[Recorded]] = defaultdict(list)
+    with _open(path, "r") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"Not a validation recording: {path}")
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {header.get('version')}")
+
+        for line in f:
+            if not line.strip():
+                continue
+            e = json.loads(line)
+            entries[(e["t"], e["c"])].append((e["rc"], e["out"], e["err"], e["d"]))
+    return dict(entries)
+
+
+class ReplayTransport(Transport):
+    """Answers commands from a recording instead of running them."""
+
+    live = False
+
+    def __init__(self, path: str, speed: float = 0.0):
+        """
+        Load a recording for replay.
+
+        Repeated commands get their recorded results in order; once those
+        run out the last one is repeated. Commands missing from the
+        recording fail with return code -1.
+
+        Args:
+            path: Recording written by RecordingTransport.
+            speed: Pacing as a multiple of real time (1.0 = recorded
+                durations, 10.0 = ten times faster); 0 replays instantly.
+        """
+        self.path = path
+        self.speed = speed
+        self._responses: Dict[Tuple[str, str], Deque[Recorded]] = {
+            key: deque(results) for key, results in load_recording(path).items()
+        }
+        self._lock = threading.Lock()
+
+    def _next(self, target: str, command: str) -> Optional[Recorded]:
+        """Take the next recorded result for a command."""
+        with self._lock:
+            queue = self._responses.get((target, command))
+            if not queue:
+                return None
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    async def _replay(self, target: str, command: str) -> Tuple[int, str, str]:
+        """Serve one command from the recording."""
+        match = _TOKEN_RE.search(command)
+        token = match.group(0) if match else None
+        if token:
+            command = command.replace(token, _TOKEN_PLACEHOLDER)
+
+        recorded = self._next(target, command)
+        if recorded is None:
+            return -1, "", f"No recording for {target}: {command[:80]}"
+
+        rc, stdout, stderr, duration = recorded
+        if self.speed > 0:
+            await asyncio.sleep(duration / self.speed)
+        if token:
+            stdout = stdout.replace(_TOKEN_PLACEHOLDER, token)
+        return rc, stdout, stderr
+
+    async def ssh(self, node_ip: str, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Replay a command recorded for a node."""
+        return await self._replay(node_ip, command)
+
+    async def local(self, command: str, timeout: int) -> Tuple[int, str, str]:
+        """Replay a recorded local command."""
+        return await self._replay(LOCAL, command)
@@ -0,0 +1,425 @@
+"""
+Watch mode: continuous, low-overhead monitoring of the mesh.
+
+Every poll interval the Watcher reads only the cheap routing state of each
+node (originators, neighbors, gateways, batman hard interfaces and the bat0
+link) in one batched call per node over the node's kept-open SSH session,
+diffs it against the previous poll and reports what changed: nodes going
+down, bat0 or a hard interface going down, neighbors and originators lost or
+found, TQ drops, route changes and gateway switches. Nothing is reported
+while the mesh is steady.
+
+On the node a poll costs one shell running four batctl table dumps and one
+``ip link show bat0``, a few milliseconds of CPU on a DIR-1960 per interval.
+The full ``ip link show`` (for naming neighbors by their interface MACs) is
+only read the first time a node answers. A node that stopped answering is
+retried as often as its circuit breaker allows (validate.core.health).
+
+Heavier validation runs a full tier at a slower cadence (through an
+Exporter, in a background thread so polls keep going) and reports checks
+whose status changed between runs.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from validate.config import NODES, WATCH_FULL_INTERVAL_S, WATCH_TQ_DROP
+from validate.core.engine import run_sync
+from validate.core.executor import keep_sessions, run_batch_on_node_async
+from validate.core.exporter import Exporter
+from validate.core.results import CheckStatus, Tier
+from validate.core.snapshot import SNAPSHOT_COMMANDS, NodeSnapshot
+
+# Severities, in increasing order
+INFO = "info"
+WARNING = "warning"
+CRITICAL = "critical"
+
+# Commands of a poll, keyed by NodeSnapshot field name
+WATCH_COMMANDS: Dict[str, str] = {
+    "originators": SNAPSHOT_COMMANDS["originators"],
+    "neighbors": SNAPSHOT_COMMANDS["neighbors"],
+    "gateways": SNAPSHOT_COMMANDS["gateways"],
+    "hardifs": SNAPSHOT_COMMANDS["hardifs"],
+    "links": "ip link show bat0",
+}
+
+
+@dataclass
+class WatchEvent:
+    """One observed change."""
+
+    node: str  # "mesh" for full-run check changes
+    kind: str  # e.g. neighbor_lost, tq_drop, gateway_switch
+    severity: str
+    message: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for JSON serialization."""
+        return {
+            "node": self.node,
+            "kind": self.kind,
+            "severity": self.severity,
+            "message": self.message,
+            "data": self.data,
+        }
+
+
+@dataclass
+class NodeState:
+    """Routing state of a node at one poll (None: could not be read)."""
+
+    reachable: bool
+    bat0_up: Optional[bool] = None
+    hardifs: Optional[Dict[str, str]] = None  # Interface -> batctl status
+    neighbors: Optional[Set[Tuple[str, str]]] = None  # (hard interface, neighbor MAC)
+    originators: Optional[Dict[str, Tuple[Optional[int], str]]] = None  # MAC -> (TQ, next hop)
+    gateway: Optional[str] = None  # Selected gateway's originator MAC
+    gateways: Optional[Set[str]] = None
+
+
+def _ok(snapshot: NodeSnapshot, key: str) -> bool:
+    """Check whether a poll command succeeded."""
+    return snapshot.get(key)[0] == 0
+
+
+def _link_up(block: Optional[str]) -> bool:
+    """Check the UP flag of an ``ip link`` block."""
+    if block is None or "<" not in block:
+        return False
+    flags = block.split("<", 1)[1].split(">", 1)[0].split(",")
+    return "UP" in flags
+
+
+def node_state(snapshot: NodeSnapshot) -> NodeState:
+    """
+    Reduce a poll to the state that is diffed.
+
+    Args:
+        snapshot: The poll's command results.
+
+    Returns:
+        The node's state; unreachable if no command ran.
+    """
+    if all(rc == -1 for rc, _, _ in snapshot.outputs.values()):
+        return NodeState(reachable=False)
+    state = NodeState(reachable=True)
+    if snapshot.get("links")[0] != -1:
+        state.bat0_up = _link_up(snapshot.link("bat0"))
+    if _ok(snapshot, "hardifs"):
+        state.hardifs = {e.name: e.status for e in snapshot.hardif_table.entries}
+    if _ok(snapshot, "neighbors"):
+        neighbors = snapshot.neighbor_table.entries
+        state.neighbors = {(n.hardif, n.neighbor.lower()) for n in neighbors}
+    if _ok(snapshot, "originators"):
+        state.originators = {
+            o.originator.lower(): (o.tq, o.next_hop.lower())
+            for o in snapshot.originator_table.entries
+            if o.best
+        }
+    if _ok(snapshot, "gateways"):
+        gateways = snapshot.gateway_table.entries
+        state.gateways = {g.router.lower() for g in gateways}
+        state.gateway = next((g.router.lower() for g in gateways if g.best), None)
+    return state
+
+
+class _Differ:
+    """Events between two states of one node."""
+
+    def __init__(self, node: str, names: Dict[str, str], tq_drop: int):
+        """
+        Initialize the differ.
+
+        Args:
+            node: Node name.
+            names: MAC -> node name, for readable messages.
+            tq_drop: Smallest TQ decrease reported.
+        """
+        self.node = node
+        self.names = names
+        self.tq_drop = tq_drop
+        self.events: List[WatchEvent] = []
+
+    def name(self, mac: str) -> str:
+        """Node name owning a MAC, or the MAC itself."""
+        return self.names.get(mac, mac)
+
+    def add(self, kind: str, severity: str, message: str, **data: Any) -> None:
+        """Record one event."""
+        self.events.append(WatchEvent(self.node, kind, severity, message, data))
+
+    def diff(self, prev: NodeState, cur: NodeState) -> List[WatchEvent]:
+        """
+        Compare two polls.
+
+        Args:
+            prev: Previous state.
+            cur: Current state.
+
+        Returns:
+            Events, in a stable order.
+        """
+        if prev.reachable != cur.reachable:
+            if cur.reachable:
+                self.add("node_up", INFO, "node reachable again")
+            else:
+                self.add("node_down", CRITICAL, "node unreachable")
+            return self.events
+        if not cur.reachable:
+            return self.events
+        if prev.bat0_up is not None and cur.bat0_up is not None and prev.bat0_up != cur.bat0_up:
+            if cur.bat0_up:
+                self.add("bat0_up", INFO, "bat0 up")
+            else:
+                self.add("bat0_down", CRITICAL, "bat0 down")
+        if prev.hardifs is not None and cur.hardifs is not None:
+            self.hardifs(prev.hardifs, cur.hardifs)
+        if prev.neighbors is not None and cur.neighbors is not None:
+            self.neighbors(prev.neighbors, cur.neighbors)
+        if prev.originators is not None and cur.originators is not None:
+            self.originators(prev.originators, cur.originators)
+        if prev.gateways is not None and cur.gateways is not None:
+            self.gateways(prev.gateway, cur.gateway)
+        return self.events
+
+    def hardifs(self, prev: Dict[str, str], cur: Dict[str, str]) -> None:
+        """Hard interfaces that left or rejoined bat0."""
+        for iface in sorted(set(prev) | set(cur)):
+            was, now = prev.get(iface) == "active", cur.get(iface) == "active"
+            if was and not now:
+                self.add("hardif_down", WARNING, f"{iface} inactive", interface=iface)
+            elif now and not was:
+                self.add("hardif_up", INFO, f"{iface} active", interface=iface)
+
+    def neighbors(self, prev: Set[Tuple[str, str]], cur: Set[Tuple[str, str]]) -> None:
+        """Neighbors lost and found."""
+        for iface, mac in sorted(prev - cur):
+            self.add(
+                "neighbor_lost",
+                WARNING,
+                f"lost neighbor {self.name(mac)} on {iface}",
+                interface=iface,
+                neighbor=mac,
+            )
+        for iface, mac in sorted(cur - prev):
+            self.add(
+                "neighbor_found",
+                INFO,
+                f"new neighbor {self.name(mac)} on {iface}",
+                interface=iface,
+                neighbor=mac,
+            )
+
+    def originators(
+        self,
+        prev: Dict[str, Tuple[Optional[int], str]],
+        cur: Dict[str, Tuple[Optional[int], str]],
+    ) -> None:
+        """Originators lost and found, TQ drops and next-hop changes."""
+        for mac in sorted(set(prev) | set(cur)):
+            name = self.name(mac)
+            if mac not in cur:
+                self.add("originator_lost", WARNING, f"no route to {name}", originator=mac)
+                continue
+            if mac not in prev:
+                self.add("originator_found", INFO, f"route to {name}", originator=mac)
+                continue
+            (old_tq, old_hop), (new_tq, new_hop) = prev[mac], cur[mac]
+            if old_tq is not None and new_tq is not None and old_tq - new_tq >= self.tq_drop:
+                self.add(
+                    "tq_drop",
+                    WARNING,
+                    f"TQ to {name} fell from {old_tq} to {new_tq}",
+                    originator=mac,
+                    old=old_tq,
+                    new=new_tq,
+                )
+            if old_hop != new_hop:
+                self.add(
+                    "route_change",
+                    INFO,
+                    f"route to {name} now via {self.name(new_hop)} (was {self.name(old_hop)})",
+                    originator=mac,
+                    old=old_hop,
+                    new=new_hop,
+                )
+
+    def gateways(self, prev: Optional[str], cur: Optional[str]) -> None:
+        """Changes of the selected gateway."""
+        if prev == cur:
+            return
+        if cur is None:
+            self.add("gateway_lost", CRITICAL, "no gateway selected", old=prev)
+        elif prev is None:
+            self.add("gateway_found", INFO, f"gateway {self.name(cur)} selected", new=cur)
+        else:
+            self.add(
+                "gateway_switch",
+                WARNING,
+                f"gateway switched from {self.name(prev)} to {self.name(cur)}",
+                old=prev,
+                new=cur,
+            )
+
+
+def diff_states(
+    node: str,
+    prev: NodeState,
+    cur: NodeState,
+    names: Optional[Dict[str, str]] = None,
+    tq_drop: int = WATCH_TQ_DROP,
+) -> List[WatchEvent]:
+    """
+    Events describing how a node's state changed between two polls.
+
+    State that could not be read in either poll is not compared.
+
+    Args:
+        node: Node name.
+        prev: Previous state.
+        cur: Current state.
+        names: MAC -> node name, for readable messages.
+        tq_drop: Smallest TQ decrease reported.
+
+    Returns:
+        Events (empty when nothing changed).
+    """
+    return _Differ(node, names or {}, tq_drop).diff(prev, cur)
+
+
+class Watcher:
+    """Polls the mesh and reports changes."""
+
+    def __init__(
+        self,
+        interval_s: float,
+        on_event: Callable[[WatchEvent], None],
+        full_tier: Optional[Tier] = Tier.STANDARD,
+        full_interval_s: float = WATCH_FULL_INTERVAL_S,
+        tq_drop: int = WATCH_TQ_DROP,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            interval_s: Seconds between polls.
+            on_event: Called for every event (from the polling thread or,
+                for check changes, the full-run thread; never concurrently).
+            full_tier: Tier run at the slower cadence (None for polls only).
+            full_interval_s: Seconds between full runs.
+            tq_drop: Smallest TQ decrease reported.
+
+        Raises:
+            ValueError: If an interval is not positive.
+        """
+        if interval_s <= 0:
+            raise ValueError("Poll interval must be positive")
+        self.interval_s = interval_s
+        self.on_event = on_event
+        self.tq_drop = tq_drop
+        self.polls = 0
+        self.states: Dict[str, NodeState] = {}
+        self._names: Dict[str, str] = {}  # Interface MAC -> node name
+        self._checks: Dict[str, CheckStatus] = {}
+        self._emit_lock = threading.Lock()
+        self.exporter: Optional[Exporter] = None
+        if full_tier is not None:
+            self.exporter = Exporter([(full_tier, full_interval_s)], on_update=self._full_run)
+        keep_sessions(int(2 * interval_s))
+
+    def _emit(self, events: List[WatchEvent]) -> None:
+        """Pass events to the callback, one thread at a time."""
+        with self._emit_lock:
+            for event in events:
+                self.on_event(event)
+
+    async def _poll_node(self, node: str) -> NodeState:
+        """Read one node's state; the first successful poll also learns its MACs."""
+        prev = self.states.get(node)
+        commands = dict(WATCH_COMMANDS)
+        if prev is None or not prev.reachable:
+            commands["links"] = SNAPSHOT_COMMANDS["links"]
+        keys = list(commands)
+        results = await run_batch_on_node_async(node, [commands[k] for k in keys])
+        snapshot = NodeSnapshot(node=node, outputs=dict(zip(keys, results)))
+        state = node_state(snapshot)
+        if state.reachable and commands["links"] != WATCH_COMMANDS["links"]:
+            for mac in snapshot.interface_macs.values():
+                self._names[mac] = node
+        return state
+
+    def poll(self) -> List[WatchEvent]:
+        """
+        Poll every node once and report changes since the last poll.
+
+        The first poll only sets the baseline (reporting unreachable nodes).
+
+        Returns:
+            The events passed to on_event.
+        """
+
+        async def poll_all() -> List[NodeState]:
+            return list(await asyncio.gather(*(self._poll_node(node) for node in nodes)))
+
+        nodes = list(NODES)
+        states = run_sync(poll_all())
+        events: List[WatchEvent] = []
+        for node, state in zip(nodes, states):
+            prev = self.states.get(node)
+            if prev is None:
+                prev = NodeState(reachable=True)  # Baseline: only unreachability is news
+            events += diff_states(node, prev, state, self._names, self.tq_drop)
+            self.states[node] = state
+        self.polls += 1
+        self._emit(events)
+        return events
+
+    def _full_run(self, exporter: Exporter) -> None:
+        """Report checks whose status changed since the previous full run."""
+        result = exporter.states()[0].result
+        if result is None:
+            return
+        events = []
+        for check in result.all_checks:
+            prev = self._checks.get(check.category, CheckStatus.PASS)
+            self._checks[check.category] = check.status
+            if check.status == prev or check.status == CheckStatus.SKIP:
+                continue
+            if check.status == CheckStatus.PASS:
+                kind, severity = "check_recovered", INFO
+            else:
+                kind, severity = "check_failed", CRITICAL
+            message = f"{check.category}: {check.message or check.status.value}"
+            events.append(WatchEvent("mesh", kind, severity, message, {"check": check.category}))
+        self._emit(events)
+
+    def serve(self, stop: threading.Event, polls: Optional[int] = None) -> None:
+        """
+        Poll on schedule (and run the full tier in the background) until stop is set.
+
+        Args:
+            stop: Event that ends watching.
+            polls: Stop after this many polls (default: run until stopped).
+        """
+        full_runs: Optional[threading.Thread] = None
+        if self.exporter is not None:
+            full_runs = threading.Thread(
+                target=self.exporter.serve, args=(stop,), name="validate-watch-full", daemon=True
+            )
+            full_runs.start()
+        next_poll = time.monotonic()
+        while not stop.is_set():
+            self.poll()
+            if polls is not None and self.polls >= polls:
+                stop.set()
+                break
+            next_poll = max(next_poll + self.interval_s, time.monotonic())
+            stop.wait(next_poll - time.monotonic())
+        if full_runs is not None:
+            full_runs.join()
@@ -0,0 +1,302 @@
+"""
+Mesh node registry built from the Ansible inventory.
+
+The inventory (``openwrt-mesh-ansible/inventory/hosts.yml`` or the file named
+by MESH_INVENTORY) is the single source of truth for the mesh nodes. Every
+host in the ``mesh_nodes`` group becomes a NodeInfo, with variables merged
+Ansible-style: group_vars/all.yml, then the group_vars of each group the host
+belongs to, then inventory group vars, then host vars.
+
+Group vars that follow the repo's ``{{ lookup('env', 'X') | default('v', true) }}``
+convention are resolved against the environment; other templates are left
+as-is.
+
+The inventory is parsed once per process, on first access to NODES.
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+# Group whose hosts are mesh nodes
+MESH_GROUP = "mesh_nodes"
+
+# Defaults mirrored from group_vars/all.yml, used when a var is not set there
+DEFAULT_HOSTNAME_PREFIX = "mesh-node"
+DEFAULT_MANAGEMENT_NETWORK = "10.11.10.0/24"
+
+ANSIBLE_DIR = Path(__file__).resolve().parent.parent / "openwrt-mesh-ansible"
+
+_ENV_LOOKUP_RE = re.compile(
+    r"^\{\{\s*lookup\('env',\s*'(\w+)'\)\s*"
+    r"\|\s*default\('([^']*)'(?:,\s*true)?\)\s*((?:\|\s*\w+\s*)*)\}\}$"
+)
+
+
+@dataclass
+class NodeInfo:
+    """Information about a mesh node."""
+
+    name: str
+    ip: str
+    node_num: int
+    gw_mode: str  # "server" or "client"
+    lan3_peer: str  # Node connected to LAN3
+    lan4_peer: str  # Node connected to LAN4
+    roles: Tuple[str, ...] = ()  # Inventory groups the node belongs to
+    mesh_ports: Dict[str, str] = field(default_factory=dict)  # Wired port -> peer node
+    mgmt_ip: str = ""
+    mesh_mac: str = ""
+    hostvars: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def peers(self) -> List[str]:
+        """Nodes this one is cabled to, in port order."""
+        return [peer for _, peer in sorted(self.mesh_ports.items())]
+
+
+def inventory_path() -> Path:
+    """
+    Get the inventory file to load.
+
+    Returns:
+        MESH_INVENTORY if set, else the production inventory in this repo.
+    """
+    configured = os.environ.get("MESH_INVENTORY")
+    if configured:
+        return Path(configured).expanduser().resolve()
+    return ANSIBLE_DIR / "inventory" / "hosts.yml"
+
+
+def resolve_var(value: Any) -> Any:
+    """
+    Resolve the repo's env-lookup templates in a variable.
+
+    Handles ``{{ lookup('env', 'NAME') | default('value', true) }}`` with an
+    optional ``| int`` or ``| bool`` filter, recursing into dicts and lists.
+
+    Args:
+        value: Variable value as loaded from YAML.
+
+    Returns:
+        The resolved value; other templates are returned unchanged.
+    """
+    if isinstance(value, dict):
+        return {k: resolve_var(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [resolve_var(v) for v in value]
+    if not isinstance(value, str):
+        return value
+
+    match = _ENV_LOOKUP_RE.match(value.strip())
+    if not match:
+        return value
+    name, default, filters = match.groups()
+    resolved: Any = os.environ.get(name) or default
+    if "int" in filters:
+        resolved = int(resolved)
+    elif "bool" in filters:
+        resolved = str(resolved).lower() in ("1", "true", "yes", "on")
+    return resolved
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """Load a YAML mapping, returning an empty dict for missing/empty files."""
+    if not path.is_file():
+        return {}
+    import yaml  # Only needed once NODES is first read
+
+    with open(path, "r") as f:
+        data = yaml.safe_load(f)
+    return data if isinstance(data, dict) else {}
+
+
+def _group_vars(inventory: Path, group: str) -> Dict[str, Any]:
+    """Load group_vars/<group>.yml next to the inventory or its parent directory."""
+    merged: Dict[str, Any] = {}
+    for base in (inventory.parent.parent, inventory.parent):
+        for name in (f"{group}.yml", f"{group}.yaml"):
+            merged.update(_load_yaml(base / "group_vars" / name))
+    return merged
+
+
+def _walk(
+    name: str, group: Dict[str, Any], parents: Tuple[str, ...]
+) -> Iterator[Tuple[str, Dict[str, Any], Tuple[str, ...], List[Dict[str, Any]]]]:
+    """
+    Yield (host, host vars, groups, inline group vars) for every host in a group tree.
+
+    Groups are listed outermost first, matching Ansible's variable precedence.
+    """
+    group = group or {}
+    path = parents + (name,)
+    for host, host_vars in (group.get("hosts") or {}).items():
+        yield host, host_vars or {}, path, [group.get("vars") or {}]
+    for child, child_group in (group.get("children") or {}).items():
+        for host, host_vars, groups, inline in _walk(child, child_group, path):
+            yield host, host_vars, groups, [group.get("vars") or {}] + inline
+
+
+def _ring_ports(names: List[str]) -> Dict[str, Dict[str, str]]:
+    """Default cabling for nodes without mesh_ports: lan3 to the previous node, lan4 to the next."""
+    ports: Dict[str, Dict[str, str]] = {}
+    for i, name in enumerate(names):
+        if len(names) < 2:
+            ports[name] = {}
+        else:
+            ports[name] = {"lan3": names[i - 1], "lan4": names[(i + 1) % len(names)]}
+    return ports
+
+
+def _management_ip(network: str, node_ip: str) -> str:
+    """Management address: the management network prefix plus the node's last octet."""
+    prefix = network.split("/")[0].split(".")[:3]
+    return ".".join(prefix + [node_ip.split(".")[-1]])
+
+
+def load_inventory(path: Optional[Path] = None) -> Dict[str, NodeInfo]:
+    """
+    Build the node registry from an inventory file.
+
+    Args:
+        path: Inventory to load (default: inventory_path()).
+
+    Returns:
+        Mapping of inventory host name to NodeInfo, ordered by node_id.
+
+    Raises:
+        FileNotFoundError: If the inventory does not exist.
+        ValueError: If a mesh node has no address.
+    """
+    return dict(_load_inventory_cached(path or inventory_path()))
+
+
+@lru_cache(maxsize=None)
+def _load_inventory_cached(path: Path) -> Tuple[Tuple[str, NodeInfo], ...]:
+    """Parse an inventory once per process (see load_inventory)."""
+    if not path.is_file():
+        raise FileNotFoundError(f"Inventory not found: {path} (set MESH_INVENTORY)")
+
+    root = _load_yaml(path).get("all") or {}
+    all_vars = resolve_var({**_group_vars(path, "all"), **(root.get("vars") or {})})
+
+    hosts: Dict[str, Dict[str, Any]] = {}
+    roles: Dict[str, Tuple[str, ...]] = {}
+    group_files: Dict[str, Dict[str, Any]] = {}
+    for host, host_vars, groups, inline in _walk("all", root, ()):
+        if MESH_GROUP not in groups:
+            continue
+        merged = dict(all_vars)
+        for group, group_inline in zip(groups[1:], inline[1:]):
+            if group not in group_files:
+                group_files[group] = resolve_var(_group_vars(path, group))
+            merged.update(group_files[group])
+            merged.update(resolve_var(group_inline))
+        merged.update(resolve_var(host_vars))
+        hosts[host] = merged
+        roles[host] = groups[groups.index(MESH_GROUP) + 1 :]
+
+    names = sorted(hosts, key=lambda h: (int(hosts[h].get("node_id", 0)), h))
+    default_ports = _ring_ports(names)
+    mgmt_network = (
+        (all_vars.get("vlans") or {})
+        .get("management", {})
+        .get("network", DEFAULT_MANAGEMENT_NETWORK)
+    )
+
+    nodes = []
+    for num, host in enumerate(names, start=1):
+        hv = hosts[host]
+        ip = hv.get("node_ip") or hv.get("ansible_host")
+        if not ip:
+            raise ValueError(f"Mesh node {host} has no node_ip or ansible_host in {path}")
+        node_num = int(hv.get("node_id", num))
+        ports = dict(hv.get("mesh_ports") or default_ports[host])
+        nodes.append(
+            (
+                host,
+                NodeInfo(
+                    name=f"{hv.get('hostname_prefix', DEFAULT_HOSTNAME_PREFIX)}{node_num}",
+                    ip=str(ip),
+                    node_num=node_num,
+                    gw_mode="server" if hv.get("has_wan", True) else "client",
+                    lan3_peer=ports.get("lan3", ""),
+                    lan4_peer=ports.get("lan4", ""),
+                    roles=roles[host],
+                    mesh_ports=ports,
+                    mgmt_ip=_management_ip(mgmt_network, str(ip)),
+                    mesh_mac=str(hv.get("mesh_mac", "")),
+                    hostvars=hv,
+                ),
+            )
+        )
+    return tuple(nodes)
+
+
+class NodeRegistry(MutableMapping[str, NodeInfo]):
+    """
+    Lazily loaded mapping of node name to NodeInfo.
+
+    Behaves like a dict; the inventory is read on first access. Entries can
+    be replaced (e.g. by the simulator) and reload() re-reads the inventory.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Create an empty registry.
+
+        Args:
+            path: Inventory to load (default: inventory_path() at first access).
+        """
+        self._path = path
+        self._nodes: Optional[Dict[str, NodeInfo]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def nodes(self) -> Dict[str, NodeInfo]:
+        """The loaded node mapping."""
+        nodes = self._nodes
+        if nodes is None:
+            with self._lock:
+                if self._nodes is None:
+                    self._nodes = load_inventory(self._path)
+                nodes = self._nodes
+        return nodes
+
+    def reload(self, path: Optional[Path] = None) -> None:
+        """
+        Re-read the inventory on next access.
+
+        Args:
+            path: New inventory to load (default: keep the current one).
+        """
+        with self._lock:
+            if path is not None:
+                self._path = path
+            self._nodes = None
+            _load_inventory_cached.cache_clear()
+
+    def __getitem__(self, name: str) -> NodeInfo:
+        return self.nodes[name]
+
+    def __setitem__(self, name: str, info: NodeInfo) -> None:
+        self.nodes[name] = info
+
+    def __delitem__(self, name: str) -> None:
+        del self.nodes[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def clear(self) -> None:
+        self.nodes.clear()
+
+    def __repr__(self) -> str:
+        return f"NodeRegistry({self.nodes!r})"
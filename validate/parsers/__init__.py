@@ -0,0 +1,32 @@
+"""
+Parsers for command output collected from mesh nodes.
+
+Modules:
+- batctl: Originator, neighbor, gateway and hard interface tables
+- ping: Per-packet RTTs, percentiles and jitter
+"""
+
+from validate.parsers.batctl import (
+    GatewayTable,
+    HardIfTable,
+    NeighborTable,
+    OriginatorTable,
+    parse_gateways,
+    parse_hardifs,
+    parse_neighbors,
+    parse_originators,
+)
+from validate.parsers.ping import PingStats, parse_ping
+
+__all__ = [
+    "GatewayTable",
+    "HardIfTable",
+    "NeighborTable",
+    "OriginatorTable",
+    "PingStats",
+    "parse_gateways",
+    "parse_hardifs",
+    "parse_neighbors",
+    "parse_originators",
+    "parse_ping",
+]
@@ -0,0 +1,399 @@
+"""
+Parsers for batctl tables.
+
+Each parse_* function accepts the output of either batctl's JSON commands
+(``batctl oj``, ``nj``, ``gwj``; batman-adv 2020.x and later) or the classic
+text tables (``batctl o``, ``n``, ``gwl``, ``if``) and returns a typed table.
+The format is detected from the output itself, so snapshot commands can
+simply try the JSON form first and fall back to text.
+
+Both routing algorithms are handled: BATMAN_IV reports a transmit quality
+(TQ, 0-255), BATMAN_V an estimated throughput in Mbit/s.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+# Field pattern for a MAC address
+_MAC = r"[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5}"
+
+_HEADER_RE = re.compile(
+    r"^\[B\.A\.T\.M\.A\.N\. adv (?P<version>[^,]+), MainIF/MAC: (?P<main_if>[^/]+)/"
+    rf"(?P<main_mac>{_MAC}) \((?P<mesh_if>[^/]+)/(?P<mesh_mac>{_MAC})(?: (?P<algorithm>\w+))?\)\]"
+)
+_ORIGINATOR_RE = re.compile(
+    rf"^\s*(?P<best>\*)?\s*(?P<originator>{_MAC})\s+(?P<seen>\d+(?:\.\d+)?)s\s+"
+    rf"\(\s*(?P<metric>\d+(?:\.\d+)?)\)\s+(?P<next_hop>{_MAC})\s+\[\s*(?P<iface>[^\]\s]+)\s*\]"
+)
+# BATMAN_IV: "<iface>  <mac> <seen>s"; BATMAN_V: "<mac> <seen>s (<throughput>) [<iface>]"
+_NEIGHBOR_IV_RE = re.compile(
+    rf"^\s*(?P<iface>[^\s\[\]]+)\s+(?P<neighbor>{_MAC})\s+(?P<seen>\d+(?:\.\d+)?)s\s*$"
+)
+_NEIGHBOR_V_RE = re.compile(
+    rf"^\s*(?P<neighbor>{_MAC})\s+(?P<seen>\d+(?:\.\d+)?)s\s+"
+    rf"\(\s*(?P<throughput>\d+(?:\.\d+)?)\)\s+\[\s*(?P<iface>[^\]\s]+)\s*\]"
+)
+_GATEWAY_RE = re.compile(
+    rf"^\s*(?P<best>\*|=>)?\s*(?P<router>{_MAC})\s+\(\s*(?P<metric>\d+(?:\.\d+)?)\)\s+"
+    rf"(?P<next_hop>{_MAC})\s+\[\s*(?P<iface>[^\]\s]+)\s*\]:\s*"
+    r"(?P<down>\d+(?:\.\d+)?)(?:/(?P<up>\d+(?:\.\d+)?))?\s*MBit"
+)
+_HARDIF_RE = re.compile(r"^\s*(?P<name>[^:\s]+):\s*(?P<status>\S+)")
+
+
+@dataclass
+class BatmanHeader:
+    """First line of a batctl text table."""
+
+    version: str
+    main_if: str
+    main_mac: str
+    mesh_if: str
+    mesh_mac: str
+    algorithm: str = ""
+
+
+@dataclass
+class Originator:
+    """One route to an originator (batctl o)."""
+
+    originator: str
+    next_hop: str
+    outgoing_if: str
+    last_seen_s: float
+    tq: Optional[int] = None  # BATMAN_IV
+    throughput_mbit: Optional[float] = None  # BATMAN_V
+    best: bool = False
+
+
+@dataclass
+class Neighbor:
+    """One single-hop neighbor on one hard interface (batctl n)."""
+
+    neighbor: str
+    hardif: str
+    last_seen_s: float
+    throughput_mbit: Optional[float] = None  # BATMAN_V only
+
+
+@dataclass
+class Gateway:
+    """One gateway advertised in the mesh (batctl gwl)."""
+
+    router: str
+    next_hop: str
+    outgoing_if: str
+    bandwidth_down_mbit: Optional[float] = None
+    bandwidth_up_mbit: Optional[float] = None
+    tq: Optional[int] = None  # BATMAN_IV
+    throughput_mbit: Optional[float] = None  # BATMAN_V
+    best: bool = False
+
+
+@dataclass
+class HardIf:
+    """One hard interface attached to the mesh interface (batctl if)."""
+
+    name: str
+    status: str
+
+    @property
+    def active(self) -> bool:
+        """True if batman-adv is using the interface."""
+        return self.status == "active"
+
+
+@dataclass
+class OriginatorTable:
+    """Parsed originator table."""
+
+    entries: List[Originator] = field(default_factory=list)
+    header: Optional[BatmanHeader] = None
+    source: str = "text"  # "json" or "text"
+
+    @property
+    def originators(self) -> Set[str]:
+        """Unique originator MACs (each may have several routes)."""
+        return {entry.originator for entry in self.entries}
+
+    def best_routes(self) -> Dict[str, Originator]:
+        """
+        Get the selected route to each originator.
+
+        Returns:
+            Originator MAC to its best route (the first route listed if
+            none is flagged).
+        """
+        routes: Dict[str, Originator] = {}
+        for entry in self.entries:
+            if entry.best or entry.originator not in routes:
+                routes[entry.originator] = entry
+        return routes
+
+
+@dataclass
+class NeighborTable:
+    """Parsed neighbor table."""
+
+    entries: List[Neighbor] = field(default_factory=list)
+    header: Optional[BatmanHeader] = None
+    source: str = "text"
+
+    @property
+    def neighbors(self) -> Set[str]:
+        """Unique neighbor MACs."""
+        return {entry.neighbor for entry in self.entries}
+
+
+@dataclass
+class GatewayTable:
+    """Parsed gateway list."""
+
+    entries: List[Gateway] = field(default_factory=list)
+    header: Optional[BatmanHeader] = None
+    source: str = "text"
+
+    @property
+    def selected(self) -> Optional[Gateway]:
+        """The gateway currently in use, if any."""
+        return next((entry for entry in self.entries if entry.best), None)
+
+
+@dataclass
+class HardIfTable:
+    """Parsed hard interface list."""
+
+    entries: List[HardIf] = field(default_factory=list)
+
+    @property
+    def active(self) -> List[str]:
+        """Names of active hard interfaces."""
+        return [entry.name for entry in self.entries if entry.active]
+
+
+def _is_json(output: str) -> bool:
+    """Check whether output is JSON rather than a text table (whose header starts "[B.A.T")."""
+    text = output.lstrip()
+    return text[:1] == "{" or (text[:1] == "[" and text[1:].lstrip()[:1] in ("{", "]"))
+
+
+def _json_rows(output: str) -> List[Dict[str, Any]]:
+    """
+    Decode batctl JSON output: one array, or one object per line.
+
+    Raises:
+        ValueError: If the output is not valid JSON.
+    """
+    text = output.strip()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    rows = data if isinstance(data, list) else [data]
+    return [row for row in rows if isinstance(row, dict)]
+
+
+def _decimal(value: Any) -> Optional[float]:
+    """Convert a netlink value in units of 100 kbit/s to Mbit/s."""
+    return None if value is None else int(value) / 10
+
+
+def _seen_s(row: Dict[str, Any]) -> float:
+    """Last-seen time of a JSON row in seconds."""
+    return int(row.get("last_seen_msecs", 0)) / 1000
+
+
+def parse_header(output: str) -> Optional[BatmanHeader]:
+    """
+    Parse the ``[B.A.T.M.A.N. adv ...]`` line of a text table.
+
+    Args:
+        output: batctl text output.
+
+    Returns:
+        The header, or None if the output has none.
+    """
+    match = _HEADER_RE.match(output.lstrip())
+    if not match:
+        return None
+    return BatmanHeader(**{k: v or "" for k, v in match.groupdict().items()})
+
+
+def _metric(text: str, header: Optional[BatmanHeader]) -> Dict[str, Any]:
+    """Map a bracketed text metric to tq (BATMAN_IV) or throughput_mbit (BATMAN_V)."""
+    algorithm = header.algorithm if header else ""
+    if algorithm == "BATMAN_V" or (not algorithm and "." in text):
+        return {"throughput_mbit": float(text)}
+    return {"tq": int(float(text))}
+
+
+def _json_metric(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a JSON row's tq or throughput attribute."""
+    if "throughput" in row:
+        return {"throughput_mbit": _decimal(row["throughput"])}
+    if "tq" in row:
+        return {"tq": int(row["tq"])}
+    return {}
+
+
+def parse_originators(output: str) -> OriginatorTable:
+    """
+    Parse ``batctl oj`` or ``batctl o`` output.
+
+    Args:
+        output: Command stdout.
+
+    Returns:
+        OriginatorTable with one entry per route.
+
+    Raises:
+        ValueError: If JSON output is malformed.
+    """
+    if _is_json(output):
+        return OriginatorTable(
+            entries=[
+                Originator(
+                    originator=row.get("orig_address", ""),
+                    next_hop=row.get("neigh_address", ""),
+                    outgoing_if=row.get("hard_ifname", ""),
+                    last_seen_s=_seen_s(row),
+                    best=bool(row.get("best", False)),
+                    **_json_metric(row),
+                )
+                for row in _json_rows(output)
+            ],
+            source="json",
+        )
+
+    header = parse_header(output)
+    entries = []
+    for line in output.splitlines():
+        match = _ORIGINATOR_RE.match(line)
+        if match:
+            entries.append(
+                Originator(
+                    originator=match["originator"],
+                    next_hop=match["next_hop"],
+                    outgoing_if=match["iface"],
+                    last_seen_s=float(match["seen"]),
+                    best=match["best"] is not None,
+                    **_metric(match["metric"], header),
+                )
+            )
+    return OriginatorTable(entries=entries, header=header)
+
+
+def parse_neighbors(output: str) -> NeighborTable:
+    """
+    Parse ``batctl nj`` or ``batctl n`` output.
+
+    Args:
+        output: Command stdout.
+
+    Returns:
+        NeighborTable with one entry per (hard interface, neighbor).
+
+    Raises:
+        ValueError: If JSON output is malformed.
+    """
+    if _is_json(output):
+        return NeighborTable(
+            entries=[
+                Neighbor(
+                    neighbor=row.get("neigh_address", ""),
+                    hardif=row.get("hard_ifname", ""),
+                    last_seen_s=_seen_s(row),
+                    throughput_mbit=_decimal(row.get("throughput")),
+                )
+                for row in _json_rows(output)
+            ],
+            source="json",
+        )
+
+    entries = []
+    for line in output.splitlines():
+        match = _NEIGHBOR_IV_RE.match(line)
+        throughput = None
+        if not match:
+            match = _NEIGHBOR_V_RE.match(line)
+            if not match:
+                continue
+            throughput = float(match["throughput"])
+        entries.append(
+            Neighbor(
+                neighbor=match["neighbor"],
+                hardif=match["iface"],
+                last_seen_s=float(match["seen"]),
+                throughput_mbit=throughput,
+            )
+        )
+    return NeighborTable(entries=entries, header=parse_header(output))
+
+
+def parse_gateways(output: str) -> GatewayTable:
+    """
+    Parse ``batctl gwj`` or ``batctl gwl`` output.
+
+    Args:
+        output: Command stdout.
+
+    Returns:
+        GatewayTable with one entry per gateway.
+
+    Raises:
+        ValueError: If JSON output is malformed.
+    """
+    if _is_json(output):
+        return GatewayTable(
+            entries=[
+                Gateway(
+                    router=row.get("orig_address", ""),
+                    next_hop=row.get("router", ""),
+                    outgoing_if=row.get("hard_ifname", ""),
+                    bandwidth_down_mbit=_decimal(row.get("bandwidth_down")),
+                    bandwidth_up_mbit=_decimal(row.get("bandwidth_up")),
+                    best=bool(row.get("best", False)),
+                    **_json_metric(row),
+                )
+                for row in _json_rows(output)
+            ],
+            source="json",
+        )
+
+    header = parse_header(output)
+    entries = []
+    for line in output.splitlines():
+        match = _GATEWAY_RE.match(line)
+        if match:
+            entries.append(
+                Gateway(
+                    router=match["router"],
+                    next_hop=match["next_hop"],
+                    outgoing_if=match["iface"],
+                    bandwidth_down_mbit=float(match["down"]),
+                    bandwidth_up_mbit=float(match["up"]) if match["up"] else None,
+                    best=match["best"] is not None,
+                    **_metric(match["metric"], header),
+                )
+            )
+    return GatewayTable(entries=entries, header=header)
+
+
+def parse_hardifs(output: str) -> HardIfTable:
+    """
+    Parse ``batctl if`` output.
+
+    Args:
+        output: Command stdout (``<iface>: <status>`` per line).
+
+    Returns:
+        HardIfTable with one entry per interface.
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _HARDIF_RE.match(line)
+        if match:
+            entries.append(HardIf(name=match["name"], status=match["status"]))
+    return HardIfTable(entries=entries)
@@ -0,0 +1,157 @@
+"""
+Parser for ping output.
+
+Handles both ping implementations the framework meets: busybox on the
+nodes (``seq=0 ttl=64 time=0.512 ms``) and iputils on the workstation
+(``icmp_seq=1 ttl=64 time=0.512 ms``). Every reply's RTT is kept, so
+percentiles and jitter come from the individual packets rather than the
+min/avg/max summary line.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_REPLY_RE = re.compile(
+    r"bytes from .*?\b(?:icmp_)?seq=(?P<seq>\d+)\b.*?\btime[=<](?P<rtt>\d+(?:\.\d+)?) ?ms"
+)
+_SUMMARY_RE = re.compile(
+    r"(?P<sent>\d+) packets transmitted, (?P<received>\d+) (?:packets )?received"
+)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples (any order).
+        pct: Percentile, 0-100.
+
+    Returns:
+        The smallest sample with at least pct% of samples at or below it,
+        or None for no samples.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class PingStats:
+    """Per-packet RTTs and statistics from one ping run."""
+
+    sent: int = 0
+    received: int = 0
+    rtts: List[float] = field(default_factory=list)  # ms, in sequence order
+
+    @property
+    def loss_pct(self) -> float:
+        """Packets lost, as a percentage of packets sent."""
+        return 100.0 * (self.sent - self.received) / self.sent if self.sent else 100.0
+
+    @property
+    def avg(self) -> Optional[float]:
+        """Mean RTT (ms)."""
+        return sum(self.rtts) / len(self.rtts) if self.rtts else None
+
+    @property
+    def p50(self) -> Optional[float]:
+        """Median RTT (ms)."""
+        return percentile(self.rtts, 50)
+
+    @property
+    def p90(self) -> Optional[float]:
+        """90th percentile RTT (ms)."""
+        return percentile(self.rtts, 90)
+
+    @property
+    def p99(self) -> Optional[float]:
+        """99th percentile RTT (ms)."""
+        return percentile(self.rtts, 99)
+
+    @property
+    def max(self) -> Optional[float]:
+        """Slowest RTT (ms)."""
+        return max(self.rtts) if self.rtts else None
+
+    @property
+    def jitter(self) -> Optional[float]:
+        """Mean absolute difference between consecutive RTTs (ms), as in RFC 3550."""
+        if len(self.rtts) < 2:
+            return None
+        diffs = [abs(b - a) for a, b in zip(self.rtts, self.rtts[1:])]
+        return sum(diffs) / len(diffs)
+
+    def summary(self) -> Dict[str, Any]:
+        """Statistics (without the raw RTTs), rounded for reports."""
+        values = {
+            "p50_ms": self.p50,
+            "p90_ms": self.p90,
+            "p99_ms": self.p99,
+            "max_ms": self.max,
+            "jitter_ms": self.jitter,
+        }
+        return {
+            "sent": self.sent,
+            "received": self.received,
+            "loss_pct": round(self.loss_pct, 1),
+            **{k: None if v is None else round(v, 3) for k, v in values.items()},
+        }
+
+
+def _parse(output: str) -> Tuple[Dict[int, float], int, int]:
+    """
+    Unique replies by 0-based sequence number, plus the summary counts.
+
+    iputils numbers packets from 1, busybox from 0. Duplicate replies
+    (DUP!) would double-count a packet, so only the first is kept.
+    """
+    offset = 1 if "icmp_seq=" in output else 0
+    replies: Dict[int, float] = {}
+    sent = received = 0
+    for line in output.splitlines():
+        reply = _REPLY_RE.search(line)
+        if reply:
+            replies.setdefault(int(reply["seq"]) - offset, float(reply["rtt"]))
+            continue
+        summary = _SUMMARY_RE.search(line)
+        if summary:
+            sent, received = int(summary["sent"]), int(summary["received"])
+    if not sent and replies:
+        sent, received = max(replies) + 1, len(replies)
+    return replies, sent, received
+
+
+def parse_ping(output: str) -> PingStats:
+    """
+    Parse ping output into per-packet RTTs.
+
+    Args:
+        output: ping stdout (busybox or iputils).
+
+    Returns:
+        PingStats. If the summary line is missing (e.g. ping was killed),
+        sent is taken from the highest sequence number seen.
+    """
+    replies, sent, received = _parse(output)
+    return PingStats(sent=sent, received=received, rtts=list(replies.values()))
+
+
+def ping_outcomes(output: str) -> Iterator[Tuple[int, Optional[float]]]:
+    """
+    Per-packet outcomes from ping output, in sequence order.
+
+    Args:
+        output: ping stdout (busybox or iputils).
+
+    Yields:
+        (sequence number from 0, RTT in ms or None if the packet was lost)
+        for every packet sent.
+    """
+    replies, sent, _ = _parse(output)
+    for seq in range(max(sent, max(replies, default=-1) + 1)):
+        yield seq, replies.get(seq)
@@ -4,12 +4,52 @@ Output reporters for validation results.
 Available reporters:
 - console: Colored terminal output
 - json: Machine-readable JSON
+- jsonl: JSON Lines, one event per line as the run progresses
+- stream: Unix socket and server-sent-events feeds of the JSON Lines events
+- history: Recorded runs, trends and regressions
+- metrics: Prometheus/OpenMetrics exposition for the exporter
 """
 
-from validate.reporters.console import ConsoleReporter
-from validate.reporters.json import JSONReporter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from validate.reporters.console import ConsoleReporter
+    from validate.reporters.history import HistoryReporter
+    from validate.reporters.json import JSONReporter
+    from validate.reporters.jsonl import JSONLReporter
+    from validate.reporters.metrics import MetricsServer, write_textfile
+    from validate.reporters.stream import SSEStream, UnixSocketStream
+
+# Exported name -> module defining it, imported on first use (the metrics and
+# stream servers pull in http.server, which a console run doesn't need)
+_EXPORTS = {
+    "ConsoleReporter": "validate.reporters.console",
+    "HistoryReporter": "validate.reporters.history",
+    "JSONReporter": "validate.reporters.json",
+    "JSONLReporter": "validate.reporters.jsonl",
+    "MetricsServer": "validate.reporters.metrics",
+    "write_textfile": "validate.reporters.metrics",
+    "SSEStream": "validate.reporters.stream",
+    "UnixSocketStream": "validate.reporters.stream",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name's module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 
 __all__ = [
     "ConsoleReporter",
+    "HistoryReporter",
     "JSONReporter",
+    "JSONLReporter",
+    "MetricsServer",
+    "write_textfile",
+    "SSEStream",
+    "UnixSocketStream",
 ]
@@ -5,9 +5,12 @@ Provides real-time feedback during validation with colored status indicators.
 """
 
 import sys
+import time
 from typing import Optional, TextIO
 
+from validate.core.fleet import FleetResult, SiteResult
 from validate.core.results import CheckResult, CheckStatus, PhaseResult, Tier, ValidationResult
+from validate.core.watch import CRITICAL, WARNING, WatchEvent
 
 
 class Colors:
@@ -62,6 +65,7 @@ class ConsoleReporter:
             CheckStatus.FAIL: self._c(Colors.RED, "✗"),
             CheckStatus.SKIP: self._c(Colors.YELLOW, "○"),
             CheckStatus.ERROR: self._c(Colors.RED, "!"),
+            CheckStatus.TIMEOUT: self._c(Colors.RED, "⧗"),
         }
         return symbols.get(status, "?")
 
@@ -98,6 +102,8 @@ class ConsoleReporter:
         symbol = self._status_symbol(result.status)
         category = result.category.ljust(25)
         message = result.message or result.status.value
+        if result.cached_s is not None:
+            message += f" (unchanged, from {result.cached_s / 60:.0f}m ago)"
 
         self.write(f"  {symbol} {category} {self._c(Colors.DIM, message)}")
 
@@ -136,10 +142,32 @@ class ConsoleReporter:
             duration_str = f"{duration_sec:.1f}s"
         self.write(f" Duration: {duration_str}")
 
+        # Time budget: share of the tier's SLO taken by each phase
+        if result.slo_s:
+            shares = ", ".join(
+                f"phase {p.phase} {p.budget_pct:g}%"
+                for p in result.phases
+                if p.budget_pct is not None
+            )
+            used = f" SLO: {duration_sec:.1f}s of {result.slo_s:g}s ({shares})"
+            if result.slo_exceeded:
+                used = self._c(Colors.RED + Colors.BOLD, f"{used} - EXCEEDED")
+            self.write(used)
+
+        # Incremental runs: how many results were reused
+        cached = sum(1 for check in result.all_checks if check.cached_s is not None)
+        if cached:
+            self.write(f" Reused: {cached} unchanged check(s)")
+
         # Show abort reason if aborted
         if result.aborted:
             self.write(self._c(Colors.YELLOW, f" Aborted: {result.abort_reason}"))
 
+        # Show nodes that were short-circuited as unreachable
+        if result.circuit_open_s:
+            nodes = ", ".join(f"{n} ({s:.0f}s)" for n, s in result.circuit_open_s.items())
+            self.write(self._c(Colors.YELLOW, f" Unreachable (circuit open): {nodes}"))
+
         # Show failed checks summary
         if result.failed_checks > 0:
             self.write()
@@ -150,6 +178,73 @@ class ConsoleReporter:
         self.write(self._c(Colors.BOLD, line))
         self.write()
 
+    def watch_event(self, event: WatchEvent) -> None:
+        """Print one change seen in watch mode."""
+        colors = {CRITICAL: Colors.RED + Colors.BOLD, WARNING: Colors.YELLOW}
+        stamp = time.strftime("%H:%M:%S", time.localtime(event.timestamp))
+        severity = self._c(colors.get(event.severity, Colors.DIM), event.severity.upper().ljust(8))
+        self.write(f"{stamp} {severity} {event.node.ljust(8)} {event.message}")
+
+    def fleet_header(self, tier: Tier, sites: int, workers: int) -> None:
+        """Print the fleet run header."""
+        line = "═" * 60
+        self.write()
+        self.write(self._c(Colors.BOLD, line))
+        self.write(self._c(Colors.BOLD, f" MESH FLEET VALIDATION - {self._tier_name(tier)}"))
+        self.write(f" {sites} site(s), {workers} at a time")
+        self.write(self._c(Colors.BOLD, line))
+        self.write()
+
+    def fleet_site(self, site: SiteResult) -> None:
+        """Print one site's outcome as it finishes."""
+        symbol = self._status_symbol(site.status)
+        checks = f"{site.passed_checks}/{site.total_checks}" if site.total_checks else "-"
+        timing = f"{site.duration_ms / 1000:.1f}s"
+        self.write(
+            f"  {symbol} {site.site.ljust(20)} {checks.rjust(7)} {timing.rjust(7)}  "
+            f"{self._c(Colors.DIM, site.message)}"
+        )
+        if self.verbose:
+            for check in site.failed_checks:
+                self.write(f"      - {check['category']}: {check['message']}")
+
+    def fleet_footer(self, result: FleetResult) -> None:
+        """Print the fleet rollup."""
+        line = "═" * 60
+        self.write()
+        self.write(self._c(Colors.BOLD, line))
+        if result.passed:
+            status_text = self._c(Colors.GREEN + Colors.BOLD, "PASS")
+        else:
+            status_text = self._c(Colors.RED + Colors.BOLD, "FAIL")
+        passed = result.count(CheckStatus.PASS)
+        self.write(f" RESULT: {status_text} ({passed}/{len(result.sites)} sites passed)")
+        self.write(f" Duration: {result.duration_ms / 1000:.1f}s with {result.workers} worker(s)")
+        peak = max((site.peak_rss_kb for site in result.sites), default=0)
+        if peak:
+            self.write(f" Peak worker memory: {peak / 1024:.0f} MB")
+
+        # Checks failing across the fleet, most widespread first
+        failing = result.failing_checks()
+        if failing:
+            self.write()
+            self.write(self._c(Colors.RED, " Failing checks:"))
+            for category, sites in failing.items():
+                shown = ", ".join(sites[:5]) + (
+                    f" and {len(sites) - 5} more" if len(sites) > 5 else ""
+                )
+                self.write(f"   - {category}: {len(sites)} site(s) ({shown})")
+
+        errors = [site for site in result.sites if site.status == CheckStatus.ERROR]
+        if errors:
+            self.write()
+            self.write(self._c(Colors.YELLOW, " Not validated:"))
+            for site in errors:
+                self.write(f"   - {site.site}: {site.message}")
+
+        self.write(self._c(Colors.BOLD, line))
+        self.write()
+
     def report(self, result: ValidationResult) -> None:
         """
         Print complete validation report.
@@ -0,0 +1,115 @@
+"""
+Console output for the validation history (python -m validate history).
+
+Shows recent runs, per-metric trends as sparklines of bucket averages, and
+regressions of the latest run against its rolling baseline.
+"""
+
+import math
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, TextIO
+
+from validate.core.history import Regression
+from validate.reporters.console import Colors
+
+_SPARKS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values: List[float]) -> str:
+    """
+    Render values as a row of block characters scaled to their range.
+
+    Args:
+        values: Values in time order.
+
+    Returns:
+        One character per value.
+    """
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if math.isclose(high, low):
+        return _SPARKS[0] * len(values)
+    scale = (len(_SPARKS) - 1) / (high - low)
+    return "".join(_SPARKS[round((v - low) * scale)] for v in values)
+
+
+def _when(ts: float) -> str:
+    """Format a run time."""
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+
+
+class HistoryReporter:
+    """Reporter that prints history queries to the console."""
+
+    def __init__(self, output: TextIO = sys.stdout, color: bool = True):
+        """
+        Initialize history reporter.
+
+        Args:
+            output: Output stream (default: stdout).
+            color: Enable colored output.
+        """
+        self.output = output
+        self.color = color and output.isatty()
+
+    def _c(self, color: str, text: str) -> str:
+        """Apply color to text if colors enabled."""
+        return f"{color}{text}{Colors.RESET}" if self.color else text
+
+    def write(self, text: str = "") -> None:
+        """Write a line to output."""
+        self.output.write(text + "\n")
+
+    def runs(self, runs: List[Dict[str, Any]]) -> None:
+        """Print recent runs, newest first."""
+        self.write(self._c(Colors.BOLD, "Recent runs"))
+        if not runs:
+            self.write("  (none recorded)")
+        for run in runs:
+            result = self._c(Colors.GREEN if run["result"] == "PASS" else Colors.RED, run["result"])
+            self.write(
+                f"  {_when(run['ts'])}  {run['tier']:<14} {result}  "
+                f"{run['passed']}/{run['total']} passed  {run['duration_ms'] / 1000:.1f}s"
+            )
+        self.write()
+
+    def trends(self, trends: List[Dict[str, Any]], bucket: str) -> None:
+        """
+        Print one sparkline per metric series.
+
+        Args:
+            trends: Dicts with category, node, metric and buckets (from
+                HistoryStore.trend()).
+            bucket: Bucket description for the heading (e.g. "daily").
+        """
+        self.write(self._c(Colors.BOLD, f"Trends ({bucket} averages)"))
+        if not trends:
+            self.write("  (no matching series)")
+        for trend in trends:
+            averages = [b["avg"] for b in trend["buckets"]]
+            if not averages:
+                continue
+            name = f"{trend['category']} {trend['node']} {trend['metric']}".replace("  ", " ")
+            self.write(
+                f"  {name:<52} {sparkline(averages)}  "
+                f"{min(averages):.2f}..{max(averages):.2f}, last {averages[-1]:.2f}"
+            )
+        self.write()
+
+    def regressions(self, regressions: List[Regression], baseline_runs: int) -> None:
+        """Print regressions of the latest run."""
+        self.write(
+            self._c(Colors.BOLD, f"Regressions in latest run (vs last {baseline_runs} runs)")
+        )
+        if not regressions:
+            self.write(self._c(Colors.GREEN, "  none"))
+        for r in regressions:
+            where = f"{r.category} {r.node}".strip()
+            change = f" ({r.change_pct:+.0f}%)" if r.change_pct is not None else ""
+            self.write(
+                self._c(Colors.RED, "  ✗ ") + f"{where} {r.metric}: {r.value:g}{change}, "
+                f"baseline {r.baseline:g} ±{r.spread:g} (z={r.z:g}, n={r.samples})"
+            )
+        self.write()
@@ -6,8 +6,9 @@ Outputs validation results as JSON for monitoring systems and CI/CD.
 
 import json
 import sys
-from typing import Optional, TextIO
+from typing import Optional, TextIO, Union
 
+from validate.core.fleet import FleetResult
 from validate.core.results import ValidationResult
 
 
@@ -31,12 +32,12 @@ class JSONReporter:
         self.output = output
         self.indent = None if compact else indent
 
-    def report(self, result: ValidationResult) -> None:
+    def report(self, result: Union[ValidationResult, FleetResult]) -> None:
         """
         Output validation result as JSON.
 
         Args:
-            result: ValidationResult to output.
+            result: ValidationResult (or FleetResult) to output.
         """
         data = result.to_dict()
         json.dump(data, self.output, indent=self.indent, default=str)
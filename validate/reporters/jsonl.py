@@ -0,0 +1,125 @@
+"""
+JSON Lines reporter for live, machine-readable output.
+
+Writes one JSON object per line as each event happens, flushing after every
+line, so automation can react to a failing phase while the run continues:
+
+- ``run_start``: tier
+- ``phase_start``: phase number and name
+- ``check``: one CheckResult (same fields as in the JSON report)
+- ``phase_end``: phase duration and pass/fail counts
+- ``summary``: the final result without the per-check detail
+- ``change``: one change seen in watch mode (node, kind, severity, message
+  and data)
+
+Every line carries ``event``, a sequence number ``seq`` and a Unix
+timestamp ``time``. The same lines can be fed to any number of sinks (see
+validate.reporters.stream for a Unix socket and server-sent events).
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, TextIO
+
+from validate.core.results import CheckResult, PhaseResult, Tier, ValidationResult
+from validate.core.watch import WatchEvent
+
+# Receives each serialized event line (without trailing newline)
+EventSink = Callable[[str], None]
+
+
+class JSONLReporter:
+    """Reporter that streams results as JSON Lines."""
+
+    def __init__(self, output: Optional[TextIO] = sys.stdout, sinks: Sequence[EventSink] = ()):
+        """
+        Initialize JSON Lines reporter.
+
+        Args:
+            output: Output stream (None to feed the sinks only).
+            sinks: Further receivers of every event line.
+        """
+        self.output = output
+        self.sinks = list(sinks)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, data: Dict[str, Any]) -> None:
+        """
+        Write one event line and pass it to every sink.
+
+        Args:
+            event: Event name.
+            data: Event fields.
+        """
+        with self._lock:
+            self._seq += 1
+            line = json.dumps(
+                {"event": event, "seq": self._seq, "time": round(time.time(), 3), **data},
+                default=str,
+                separators=(",", ":"),
+            )
+            if self.output is not None:
+                self.output.write(line + "\n")
+                self.output.flush()
+            for sink in self.sinks:
+                sink(line)
+
+    def header(self, tier: Tier) -> None:
+        """Emit the start of the run."""
+        self.emit("run_start", {"tier": tier.name.lower()})
+
+    def phase_start(self, phase: int, name: str) -> None:
+        """Emit the start of a phase."""
+        self.emit("phase_start", {"phase": phase, "name": name})
+
+    def check_result(self, result: CheckResult) -> None:
+        """Emit one check result."""
+        self.emit("check", result.to_dict())
+
+    def phase_end(self, result: PhaseResult) -> None:
+        """Emit a phase summary."""
+        self.emit("phase_end", result.to_dict(include_checks=False))
+
+    def footer(self, result: ValidationResult) -> None:
+        """Emit the final summary."""
+        summary = result.to_dict()
+        del summary["phases"]
+        self.emit("summary", summary)
+
+    def watch_event(self, event: WatchEvent) -> None:
+        """Emit one change seen in watch mode."""
+        self.emit("change", event.to_dict())
+
+    def report(self, result: ValidationResult) -> None:
+        """
+        Emit every event of a finished run at once.
+
+        For live output, use the individual methods as the run progresses.
+        """
+        self.header(result.tier)
+        for phase in result.phases:
+            self.phase_start(phase.phase, phase.name)
+            for check in phase.checks:
+                self.check_result(check)
+            self.phase_end(phase)
+        self.footer(result)
+
+
+def create_reporter(
+    output: Optional[TextIO] = None,
+    sinks: Sequence[EventSink] = (),
+) -> JSONLReporter:
+    """
+    Create a JSON Lines reporter.
+
+    Args:
+        output: Output stream (default: stdout).
+        sinks: Further receivers of every event line.
+
+    Returns:
+        Configured JSONLReporter.
+    """
+    return JSONLReporter(output=output or sys.stdout, sinks=sinks)
@@ -0,0 +1,352 @@
+"""
+Prometheus / OpenMetrics exposition of validation results.
+
+Renders the exporter's state (validate.core.exporter) as metrics:
+
+- per tier: last run time, duration, pass/fail, check counts, runs and
+  failed runs
+- per check: status (a stateset) and duration
+- per node and check: pass/fail and the numeric mesh metrics of
+  validate.core.history.METRICS (latency, percentiles, jitter and outage
+  in seconds, loss as a ratio, neighbor/originator/gateway counts)
+- per node: time its circuit was open in the last run, and the executor's
+  command duration histogram and failed connections (process lifetime)
+
+Both the OpenMetrics text format and the classic Prometheus text format
+(0.0.4, as read by node_exporter's textfile collector) are supported.
+MetricsServer serves the last rendering over HTTP, choosing the format from
+the Accept header; write_textfile() replaces a .prom file atomically.
+"""
+
+import math
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from validate.core.exporter import TierState
+from validate.core.history import METRICS
+from validate.core.results import CheckResult, CheckStatus
+from validate.core.timing import COMMAND_BUCKETS_S, CommandTiming
+
+PREFIX = "mesh_validate"
+
+CONTENT_TYPE_OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Dict[str, str]
+
+
+@dataclass
+class MetricFamily:
+    """One metric and its samples."""
+
+    name: str  # Without PREFIX
+    type: str  # gauge, counter, stateset or histogram
+    help: str
+    unit: str = ""
+    # (sample name suffix, labels, value)
+    samples: List[Tuple[str, Labels, float]] = field(default_factory=list)
+
+    def add(self, labels: Labels, value: float, suffix: str = "") -> None:
+        """Add one sample."""
+        self.samples.append((suffix, labels, value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _value(value: float) -> str:
+    """Format a sample value."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render(families: Sequence[MetricFamily], openmetrics: bool = True) -> str:
+    """
+    Render metric families in the exposition format.
+
+    Args:
+        families: Families to render (empty ones are left out).
+        openmetrics: OpenMetrics text format if True, else Prometheus 0.0.4.
+
+    Returns:
+        Exposition text.
+    """
+    lines: List[str] = []
+    for family in families:
+        if not family.samples:
+            continue
+        name = f"{PREFIX}_{family.name}"
+        kind = family.type
+        if not openmetrics:
+            # No statesets, and counters are declared under their sample name
+            kind = "gauge" if kind == "stateset" else kind
+            name = f"{name}_total" if kind == "counter" else name
+        lines.append(f"# TYPE {name} {kind}")
+        if openmetrics and family.unit:
+            lines.append(f"# UNIT {name} {family.unit}")
+        lines.append(f"# HELP {name} {family.help}")
+        for suffix, labels, value in family.samples:
+            if openmetrics and kind == "counter":
+                suffix = "_total"
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{name}{suffix}{label_text} {_value(value)}")
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _node_metric(name: str) -> Tuple[str, str, float]:
+    """
+    Exported name, unit and scale of a node metric from NodeResult.data.
+
+    Milliseconds become seconds and percentages ratios, as the exposition
+    formats expect base units.
+    """
+    if name.endswith("_ms"):
+        return f"node_{name[:-3]}_seconds", "seconds", 0.001
+    if name.endswith("_pct"):
+        return f"node_{name[:-4]}_ratio", "ratio", 0.01
+    return f"node_{name}", "", 1.0
+
+
+class _TierFamilies:
+    """Families filled from the tiers' latest results."""
+
+    def __init__(self) -> None:
+        """Create the (empty) families."""
+        self.runs = MetricFamily("runs", "counter", "Scheduled validation runs")
+        self.errors = MetricFamily("run_errors", "counter", "Scheduled runs that raised an error")
+        self.last = MetricFamily(
+            "last_run_timestamp_seconds", "gauge", "Start time of the last run", "seconds"
+        )
+        self.duration = MetricFamily(
+            "run_duration_seconds", "gauge", "Duration of the last run", "seconds"
+        )
+        self.passed = MetricFamily("run_passed", "gauge", "Whether the last run passed")
+        self.checks = MetricFamily("checks", "gauge", "Checks in the last run by status")
+        self.status = MetricFamily(
+            "check_status", "stateset", "Status of each check in the last run"
+        )
+        self.check_duration = MetricFamily(
+            "check_duration_seconds", "gauge", "Duration of each check in the last run", "seconds"
+        )
+        self.node_passed = MetricFamily(
+            "node_passed", "gauge", "Whether the node passed the check in the last run"
+        )
+        self.node_metrics: Dict[str, MetricFamily] = {}
+        for metric in METRICS:
+            name, unit, _ = _node_metric(metric.name)
+            description = name[len("node_") :].replace("_", " ")
+            self.node_metrics[metric.name] = MetricFamily(
+                name, "gauge", f"Node {description} measured by the check", unit
+            )
+        self.circuit = MetricFamily(
+            "circuit_open_seconds",
+            "gauge",
+            "Time the node's circuit was open in the last run",
+            "seconds",
+        )
+
+    def families(self) -> List[MetricFamily]:
+        """All families, in exposition order."""
+        return [
+            self.runs,
+            self.errors,
+            self.last,
+            self.duration,
+            self.passed,
+            self.checks,
+            self.status,
+            self.check_duration,
+            self.node_passed,
+            *self.node_metrics.values(),
+            self.circuit,
+        ]
+
+    def add_tier(self, state: TierState) -> None:
+        """Add one tier's counters and latest result."""
+        tier = {"tier": state.tier.name.lower()}
+        self.runs.add(tier, state.runs)
+        self.errors.add(tier, state.errors)
+        result = state.result
+        if result is None:
+            return
+        self.last.add(tier, round(result.timestamp.timestamp(), 3))
+        self.duration.add(tier, result.duration_ms / 1000)
+        self.passed.add(tier, int(result.passed))
+        counts = {s: 0 for s in CheckStatus}
+        for check in result.all_checks:
+            counts[check.status] += 1
+            self.add_check(tier, check)
+        for s, count in counts.items():
+            self.checks.add({**tier, "status": s.value.lower()}, count)
+        for node, open_s in result.circuit_open_s.items():
+            self.circuit.add({**tier, "node": node}, open_s)
+
+    def add_check(self, tier: Labels, check: CheckResult) -> None:
+        """Add one check's status, duration and node results."""
+        labels = {**tier, "check": check.category}
+        # A stateset's state label is named after the metric itself
+        state_label = f"{PREFIX}_{self.status.name}"
+        for s in CheckStatus:
+            self.status.add({**labels, state_label: s.value.lower()}, int(check.status == s))
+        self.check_duration.add(labels, check.duration_ms / 1000)
+        for node, node_result in check.nodes.items():
+            node_labels = {**labels, "node": node}
+            if node_result.status != CheckStatus.SKIP:
+                ok = node_result.status in (CheckStatus.PASS, CheckStatus.WARN)
+                self.node_passed.add(node_labels, int(ok))
+            for metric in METRICS:
+                value = node_result.data.get(metric.name)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    _, _, scale = _node_metric(metric.name)
+                    self.node_metrics[metric.name].add(node_labels, round(value * scale, 9))
+
+
+def tier_families(states: Sequence[TierState]) -> List[MetricFamily]:
+    """
+    Metric families for the latest result of every tier.
+
+    Args:
+        states: Tier states (from Exporter.states()).
+
+    Returns:
+        Run, check and node metric families.
+    """
+    families = _TierFamilies()
+    for state in states:
+        families.add_tier(state)
+    return families.families()
+
+
+def timing_families(timings: Mapping[str, CommandTiming]) -> List[MetricFamily]:
+    """
+    Metric families for the executor's per-node command timings.
+
+    Args:
+        timings: Node to timings (from timing.command_timings()).
+
+    Returns:
+        Command duration histogram and connection failure counter.
+    """
+    histogram = MetricFamily(
+        "command_duration_seconds", "histogram", "Duration of remote commands", "seconds"
+    )
+    failures = MetricFamily(
+        "command_connection_failures", "counter", "Remote commands that could not reach the node"
+    )
+    bounds = [_value(b) for b in COMMAND_BUCKETS_S] + ["+Inf"]
+    for node, timing in sorted(timings.items()):
+        labels = {"node": node}
+        for bound, count in zip(bounds, timing.cumulative()):
+            histogram.add({**labels, "le": bound}, count, "_bucket")
+        histogram.add(labels, timing.count, "_count")
+        histogram.add(labels, round(timing.sum_s, 6), "_sum")
+        failures.add(labels, timing.failures)
+    return [histogram, failures]
+
+
+class MetricsServer:
+    """Serves the latest rendering at /metrics."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Start the HTTP server.
+
+        Args:
+            host: Address to listen on (default: local only).
+            port: Port (0 picks a free one; see url).
+
+        Raises:
+            OSError: If the port cannot be bound.
+        """
+        self._pages = {
+            True: render([], openmetrics=True).encode(),
+            False: render([], openmetrics=False).encode(),
+        }
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = server._pages[openmetrics]
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type",
+                    CONTENT_TYPE_OPENMETRICS if openmetrics else CONTENT_TYPE_PROMETHEUS,
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass  # Scrapes every few seconds would flood the log
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="validate-metrics", daemon=True
+        ).start()
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/metrics"
+
+    def update(self, families: Sequence[MetricFamily]) -> None:
+        """
+        Render families once per format; later scrapes return these pages.
+
+        Args:
+            families: Metric families to serve.
+        """
+        self._pages = {
+            True: render(families, openmetrics=True).encode(),
+            False: render(families, openmetrics=False).encode(),
+        }
+
+    def close(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def write_textfile(path: str, families: Sequence[MetricFamily]) -> None:
+    """
+    Write families for node_exporter's textfile collector.
+
+    The file is written next to its destination and renamed into place, so
+    the collector never reads a partial file.
+
+    Args:
+        path: Destination (should end in .prom).
+        families: Metric families to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".mesh-validate-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(render(families, openmetrics=False))
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
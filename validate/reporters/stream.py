@@ -0,0 +1,219 @@
+"""
+Live event streams for dashboards.
+
+Both streams are JSONLReporter sinks: every event line published to them is
+sent to each connected client. A client connecting mid-run first receives
+the events it missed, so it always sees the whole run.
+
+- UnixSocketStream: clients connect to a Unix socket and read JSON Lines
+  (e.g. ``socat - UNIX-CONNECT:/tmp/mesh.sock``).
+- SSEStream: a local HTTP server; ``GET /events`` returns the events as
+  server-sent events (``text/event-stream``), one ``data:`` per line with
+  the event's seq as its id, ending with an ``end`` event.
+
+Publishing never blocks the run: each client has its own queue drained by
+its own thread.
+"""
+
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+# Queue item telling a client the stream has ended
+_END = None
+
+
+class EventBroadcaster:
+    """Fans event lines out to subscribers, replaying history to late joiners."""
+
+    def __init__(self) -> None:
+        """Create a broadcaster with no subscribers."""
+        self._history: List[str] = []
+        self._clients: List["queue.Queue[Optional[str]]"] = []
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def __call__(self, line: str) -> None:
+        """Publish one event line (the JSONLReporter sink interface)."""
+        self.publish(line)
+
+    def publish(self, line: str) -> None:
+        """
+        Send an event line to every subscriber.
+
+        Args:
+            line: Serialized event.
+        """
+        with self._cond:
+            self._history.append(line)
+            for client in self._clients:
+                client.put(line)
+
+    def subscribe(self) -> "queue.Queue[Optional[str]]":
+        """
+        Add a subscriber.
+
+        Returns:
+            Queue yielding every event so far, then live events, then None
+            once the stream is closed.
+        """
+        client: "queue.Queue[Optional[str]]" = queue.Queue()
+        with self._cond:
+            for line in self._history:
+                client.put(line)
+            if self._closed:
+                client.put(_END)
+            self._clients.append(client)
+        return client
+
+    def unsubscribe(self, client: "queue.Queue[Optional[str]]") -> None:
+        """Remove a subscriber."""
+        with self._cond:
+            if client in self._clients:
+                self._clients.remove(client)
+            self._cond.notify_all()
+
+    def close(self, timeout: float = 2.0) -> None:
+        """
+        End the stream, giving connected clients time to receive the rest.
+
+        Args:
+            timeout: Seconds to wait for clients to drain their queues.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if not self._closed:
+                self._closed = True
+                for client in self._clients:
+                    client.put(_END)
+            while self._clients and time.monotonic() < deadline:
+                self._cond.wait(deadline - time.monotonic())
+
+
+class UnixSocketStream(EventBroadcaster):
+    """Streams JSON Lines to clients of a Unix socket."""
+
+    def __init__(self, path: str):
+        """
+        Listen on a Unix socket.
+
+        Args:
+            path: Socket path (an existing socket file is replaced).
+
+        Raises:
+            OSError: If the socket cannot be created.
+        """
+        super().__init__()
+        self.path = path
+        if os.path.exists(path):
+            os.unlink(path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        threading.Thread(target=self._accept, name="validate-stream", daemon=True).start()
+
+    def _accept(self) -> None:
+        """Accept clients until the server socket is closed."""
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(
+                target=self._serve, args=(conn,), name="validate-stream-client", daemon=True
+            ).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        """Send events to one client until the stream ends or it disconnects."""
+        client = self.subscribe()
+        try:
+            with conn:
+                while True:
+                    line = client.get()
+                    if line is _END:
+                        return
+                    conn.sendall((line + "\n").encode())
+        except OSError:
+            pass
+        finally:
+            self.unsubscribe(client)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """End the stream and remove the socket."""
+        super().close(timeout)
+        self._server.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class SSEStream(EventBroadcaster):
+    """Serves events over HTTP as server-sent events."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Start the HTTP server.
+
+        Args:
+            host: Address to listen on (default: local only).
+            port: Port (0 picks a free one; see url).
+
+        Raises:
+            OSError: If the port cannot be bound.
+        """
+        super().__init__()
+        stream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/events":
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                stream._serve(self)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass  # Keep request logging off the console report
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="validate-sse", daemon=True
+        ).start()
+
+    @property
+    def url(self) -> str:
+        """URL of the event stream."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/events"
+
+    def _serve(self, handler: BaseHTTPRequestHandler) -> None:
+        """Send events to one client until the stream ends or it disconnects."""
+        client = self.subscribe()
+        try:
+            while True:
+                line = client.get()
+                if line is _END:
+                    handler.wfile.write(b"event: end\ndata: {}\n\n")
+                    handler.wfile.flush()
+                    return
+                seq = json.loads(line).get("seq", "")
+                handler.wfile.write(f"id: {seq}\ndata: {line}\n\n".encode())
+                handler.wfile.flush()
+        except OSError:
+            pass
+        finally:
+            self.unsubscribe(client)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """End the stream and stop the server."""
+        super().close(timeout)
+        self._server.shutdown()
+        self._server.server_close()